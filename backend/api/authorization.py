@@ -15,6 +15,7 @@ easily-stale path list.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from collections.abc import Callable, Iterable, Iterator
 from typing import Any, TypeVar
@@ -35,6 +36,7 @@ from backend.auth.store import utcnow
 from backend.config.settings import Settings
 from backend.quotas.contracts import QuotaExceededError
 from backend.quotas.service import QuotaService
+from backend.quotas.store import get_quota_store
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -274,9 +276,11 @@ async def enforce_control_plane_access(request: Request) -> None:
     allowed or denied — is durably audited before the caller sees the
     result; a required-audit failure for an about-to-be-allowed request
     denies it (``503``) rather than letting an unauditable allow through
-    (ADR-018). A failed *authentication* attempt (no principal resolved)
-    is not durably audited — there is no tenant/subject to scope a durable
-    row to — but still publishes a best-effort denial event. A rate-limit
+    (ADR-018). The audit write runs on a worker thread, so the event loop
+    keeps admitting requests whose rows join the same group commit. A
+    failed *authentication* attempt (no principal resolved) is not durably
+    audited — there is no tenant/subject to scope a durable row to — but
+    still publishes a best-effort denial event. A rate-limit
     denial (:meth:`~backend.quotas.service.QuotaService.check_rate_limit`)
     is neither durably audited nor event-published — it is not a scope
     decision, and a durable write per rejected request would itself amplify
@@ -323,7 +327,7 @@ async def enforce_control_plane_access(request: Request) -> None:
         ) from exc
     request.state.principal = principal
     try:
-        QuotaService().check_rate_limit(
+        QuotaService(store=get_quota_store()).check_rate_limit(
             tenant_id=principal.tenant_id,
             credential_id=principal.credential_id or principal.subject,
         )
@@ -361,7 +365,7 @@ async def enforce_control_plane_access(request: Request) -> None:
         if settings.autodev_profile == "prod":
             record = _audit(decision="denied", reason="policy_missing")
             try:
-                get_audit_writer().record(record, required=False)
+                await asyncio.to_thread(get_audit_writer().record, record, required=False)
             except Exception:  # noqa: BLE001 - denial stands regardless of audit outcome
                 pass
             else:
@@ -379,7 +383,7 @@ async def enforce_control_plane_access(request: Request) -> None:
     if requirement.scope not in effective:
         record = _audit(decision="denied", reason="scope_missing")
         try:
-            get_audit_writer().record(record, required=False)
+            await asyncio.to_thread(get_audit_writer().record, record, required=False)
         except Exception:  # noqa: BLE001 - denial stands regardless of audit outcome
             pass
         else:
@@ -394,7 +398,7 @@ async def enforce_control_plane_access(request: Request) -> None:
 
     record = _audit(decision="allowed", reason="ok")
     try:
-        get_audit_writer().record(record, required=True)
+        await asyncio.to_thread(get_audit_writer().record, record, required=True)
     except Exception as exc:
         raise HTTPException(
             status_code=503,
@@ -45,10 +45,12 @@ from backend.config import (
 )
 from backend.config.settings import get_settings
 from backend.coordination import get_cache, get_lock_manager
+from backend.events.runtime import shutdown_event_store
 from backend.jobs.queue import AbstractJobQueue, _reset_queue_singleton, get_queue
 from backend.llm.composition import reset_model_composition_cache
 from backend.llm.factory import get_chat_model
 from backend.observability.backup_metrics import register_backup_observables
+from backend.observability.db_pool_metrics import register_db_pool_observables
 from backend.observability.quota_metrics import register_quota_observables
 from backend.quotas.service import QuotaService
 from backend.observability.runtime import (
@@ -69,6 +71,7 @@ from backend.orchestrator.service import (
     SessionSummary,
 )
 from backend.persistence.backup_status import BackupStatusStore
+from backend.persistence.database import get_store
 from backend.api.routers import include_all_routers
 from backend.repository import RepositoryContext, RepositoryIntelligenceService
 
@@ -222,6 +225,12 @@ def get_repository_intelligence() -> RepositoryIntelligenceService:
     return RepositoryIntelligenceService(project_root=Path(runtime_config.repository.project_root))
 
 
+def _store_pools() -> list[Any]:
+    """Return the process-wide store's connection pool, if it pools."""
+    pool = getattr(get_store(), "pool", None)
+    return [pool] if pool is not None else []
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     """Initialize application services and always shut down observability."""
@@ -232,6 +241,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         status_store=BackupStatusStore(Path(settings.autodev_backup_status_path)),
     )
     register_quota_observables(meter=get_meter("backend.quotas"), quota_service=QuotaService())
+    register_db_pool_observables(meter=get_meter("backend.persistence.pool"), pools=_store_pools)
     queue: AbstractJobQueue | None = None
     try:
         if settings.autodev_profile == "prod":
@@ -255,6 +265,7 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
             # (e.g. a subsequent ``TestClient(app)`` in the same test process)
             # builds a fresh queue rather than reusing this now-closed one.
             _reset_queue_singleton()
+        shutdown_event_store()
         shutdown_observability()
 
 
@@ -18,7 +18,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from backend.api.authorization import require_v2_principal, requires_scope
 from backend.auth.contracts import PrincipalV2
+from backend.config.settings import get_settings
 from backend.persistence.database import get_store
+from backend.repository.embeddings.pipeline import get_embedding_pipeline
+from backend.repository.retrieval.cache import get_retrieval_cache
 from backend.repository.retrieval.fusion import DEFAULT_RRF_K
 from backend.repository.retrieval.retriever import RetrievalFilters, retrieve
 
@@ -42,6 +45,9 @@ def retrieve_context(
     mode: str = Query(default="hybrid", description="One of: lexical, vector, hybrid"),
     path_prefix: str | None = Query(default=None, description="Restrict results to this file path prefix"),
     symbol: str | None = Query(default=None, description="Restrict results to this exact symbol name"),
+    language: str | None = Query(
+        default=None, description="Restrict results to this language (e.g. python, go, typescript)"
+    ),
     budget: int | None = Query(default=None, ge=1, description="Max total estimated tokens across results"),
     limit: int = Query(default=20, ge=1, le=100, description="Max chunk ids considered per retrieval mode"),
     fusion_k: int = Query(
@@ -65,6 +71,7 @@ def retrieve_context(
         mode: ``"lexical"``, ``"vector"``, or ``"hybrid"`` (default).
         path_prefix: Optional file path prefix filter.
         symbol: Optional exact symbol name filter.
+        language: Optional language filter (``code_chunks.language``).
         budget: Optional maximum total estimated token count across results;
             results are truncated in relevance order (least relevant
             dropped first) rather than arbitrarily cut off.
@@ -89,14 +96,14 @@ def retrieve_context(
 
     Raises:
         HTTPException: 422 for an unrecognized *mode*; 501 when the active
-            store is not PostgreSQL (hybrid retrieval requires pgvector and
-            full-text search, both Postgres-only — see ADR-011).
+            store is neither PostgreSQL nor SQLite (see
+            :func:`_require_retrieval_store`).
     """
     if mode not in ("lexical", "vector", "hybrid"):
         raise HTTPException(status_code=422, detail=f"invalid mode: {mode!r}")
-    _require_postgres_store(store)
+    _require_retrieval_store(store)
 
-    filters = RetrievalFilters(path_prefix=path_prefix, symbol=symbol)
+    filters = RetrievalFilters(path_prefix=path_prefix, symbol=symbol, language=language)
     fusion_weights = (lexical_weight, vector_weight)
     with store.connect() as conn:
         snippets = retrieve(
@@ -109,6 +116,10 @@ def retrieve_context(
             limit=limit,
             fusion_k=fusion_k,
             fusion_weights=fusion_weights,
+            embedding_provider=get_embedding_pipeline(),
+            cache=get_retrieval_cache(),
+            connect=store.connect,
+            leg_timeout=_leg_timeout_seconds(),
         )
 
     return {
@@ -139,23 +150,36 @@ def retrieve_context(
     }
 
 
-def _require_postgres_store(store: Any) -> None:
-    """Raise a clear 501 if *store* is not PostgreSQL-backed.
+def _leg_timeout_seconds() -> float | None:
+    """Return the hybrid per-leg deadline from ``Settings.autodev_retrieval_leg_timeout_ms``.
+
+    Returns:
+        Seconds, or ``None`` (wait for both legs) when the setting is ``0``.
+    """
+    milliseconds = get_settings().autodev_retrieval_leg_timeout_ms
+    return milliseconds / 1000 if milliseconds > 0 else None
+
+
+def _require_retrieval_store(store: Any) -> None:
+    """Raise a clear 501 if *store* has no retrieval backend.
+
+    PostgreSQL serves retrieval with full-text search and pgvector; SQLite
+    with FTS5 and the embedded local vector index.
 
     Args:
         store: Durable store instance to check.
 
     Raises:
-        HTTPException: 501 if *store*'s ``database_url`` is not a
-            ``postgresql://``/``postgres://`` URL.
+        HTTPException: 501 if *store*'s ``database_url`` is neither a
+            PostgreSQL nor a SQLite URL.
     """
     url = str(getattr(store, "database_url", ""))
-    if not url.startswith(("postgresql://", "postgres://")):
+    if not url.startswith(("postgresql://", "postgres://", "sqlite://")):
         raise HTTPException(
             status_code=501,
             detail=(
-                "Hybrid retrieval requires PostgreSQL with the pgvector extension; "
-                "the active store is not PostgreSQL-backed."
+                "Hybrid retrieval requires a PostgreSQL (pgvector) or SQLite store; "
+                "the active store is neither."
             ),
         )
 
@@ -29,17 +29,18 @@ Design notes:
   ``replay_from`` issues a synchronous ``XRANGE``, and no async Redis client
   exists anywhere in this codebase yet — offloading is the smallest safe
   fix that keeps the event loop responsive without introducing one.
-* **Live tail without polling storms.** The handler subscribes to
-  :data:`~backend.events.bus.WILDCARD` purely as a wake-up signal — the
-  subscriber callback only flips an :class:`asyncio.Event`, marshaled onto
-  the request's event loop with ``call_soon_threadsafe`` since publishers
-  may run on a worker thread (FastAPI's threadpool for ``def`` handlers).
-  The authoritative ``(cursor, envelope)`` pairs actually sent to the client
-  always come from a follow-up :meth:`~backend.events.bus.EventBus.replay_from`
-  call, so a missed or coalesced wake-up never drops an event. The
-  generator unsubscribes in a ``finally`` block (E45-S3) covering both
-  client disconnect and ``CancelledError``, so a closed connection frees
-  its subscriber instead of leaking into the bus registry.
+* **Live tail through a per-run hub.** After its own backlog, a connection
+  takes live events from the shared :class:`~backend.events.fanout.RunEventHub`,
+  which holds one partition subscription and one ``replay_from`` reader per
+  watched run and copies each new event into every client's bounded buffer
+  — so an event wakes only its own run's streams, and is read once however
+  many dashboards watch it. Unless the bus runs with a cross-process
+  listener, the hub also re-reads each watched run every second, so events
+  a worker published reach the stream without one. A client that falls a full buffer behind is
+  disconnected with a ``: slow consumer`` comment and resumes by
+  ``Last-Event-ID`` like any reconnect. The generator leaves the hub in a
+  ``finally`` block (E45-S3) covering both client disconnect and
+  ``CancelledError``; the run's bus subscription goes with its last client.
 * **Tenant scoping (E9-S2-T3, tightened E11-S3/ADR-019).** The authenticated
   ``PrincipalV2.tenant_id`` is the only source of the enforced tenant —
   never the run's own record and never a caller-supplied value. A stream
@@ -65,8 +66,9 @@ from starlette.responses import StreamingResponse
 from backend.api.authorization import requires_scope
 from backend.api.rbac_v2 import PrincipalV2, require_v2_principal
 from backend.api.v2_common import SCHEMA_VERSION_V2, v2_error
-from backend.events.bus import EventBus, WILDCARD
+from backend.events.bus import EventBus
 from backend.events.catalog import EVENT_CATALOG, EventEnvelope
+from backend.events.fanout import SLOW_CONSUMER, get_run_event_hub
 from backend.events.runtime import get_event_bus, get_event_store
 from backend.events.store import EventStore
 
@@ -160,7 +162,8 @@ async def _stream_events(
 
     Args:
         request: The originating request, polled for client disconnect.
-        bus: Event bus to replay from and subscribe to.
+        bus: Event bus to replay the backlog from; live events come from its
+            :func:`~backend.events.fanout.get_run_event_hub` hub.
         run_id: Run whose partition is streamed.
         start_cursor: Exclusive-start cursor (``None`` streams from the
             beginning of the run's history).
@@ -172,38 +175,39 @@ async def _stream_events(
         so a closed connection is noticed well before the next heartbeat
         would otherwise be due.
     """
-    loop = asyncio.get_running_loop()
-    wake = asyncio.Event()
-
-    def _on_event(_envelope: EventEnvelope) -> None:
-        loop.call_soon_threadsafe(wake.set)
-
-    unsubscribe = bus.subscribe(WILDCARD, _on_event)
-
+    subscription = get_run_event_hub(bus).join(run_id)
     cursor = start_cursor
     idle_elapsed = 0.0
     try:
+        if await request.is_disconnected():
+            return
+        backlog = await asyncio.to_thread(bus.replay_from, run_id, cursor)
+        for next_cursor, envelope in backlog:
+            cursor = next_cursor
+            if types is None or envelope.type in types:
+                yield _format_sse_event(next_cursor, envelope)
+        subscription.start(cursor)
         while True:
             if await request.is_disconnected():
                 return
-            batch = await asyncio.to_thread(bus.replay_from, run_id, cursor)
-            for next_cursor, envelope in batch:
-                cursor = next_cursor
-                idle_elapsed = 0.0
-                if types is None or envelope.type in types:
-                    yield _format_sse_event(next_cursor, envelope)
-            wake.clear()
-            try:
-                await asyncio.wait_for(wake.wait(), timeout=DISCONNECT_POLL_INTERVAL_SEC)
-            except asyncio.TimeoutError:
+            item = await subscription.next(timeout=DISCONNECT_POLL_INTERVAL_SEC)
+            if item is SLOW_CONSUMER:
+                yield ": slow consumer, reconnect with Last-Event-ID to resume\n\n"
+                return
+            if item is None:
                 idle_elapsed += DISCONNECT_POLL_INTERVAL_SEC
                 if idle_elapsed >= HEARTBEAT_INTERVAL_SEC:
                     idle_elapsed = 0.0
                     yield ": ping\n\n"
+                continue
+            next_cursor, envelope = item  # type: ignore[misc]
+            idle_elapsed = 0.0
+            if types is None or envelope.type in types:
+                yield _format_sse_event(next_cursor, envelope)
     except asyncio.CancelledError:  # pragma: no cover - depends on server-side disconnect timing
         return
     finally:
-        unsubscribe()
+        subscription.close()
 
 
 @requires_scope("run:read")
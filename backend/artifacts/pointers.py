@@ -15,9 +15,10 @@ shim — no changes to the persistence adapters themselves.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 import json
-import threading
 from typing import Any
 import uuid
 
@@ -28,6 +29,7 @@ from backend.artifacts.store import (
 )
 from backend.events.records import utcnow_iso
 from backend.persistence.database import get_store
+from backend.persistence.pool import apply_sqlite_pragmas
 from backend.persistence.tenancy import DEFAULT_TENANT_ID
 from backend.quotas.contracts import QuotaDenialReason, QuotaExceededError, QuotaResource
 from backend.quotas.service import QuotaService
@@ -119,7 +121,6 @@ class ArtifactPointerStore:
                 from :func:`backend.persistence.database.get_store`.
         """
         self._store = store or get_store()
-        self._local = threading.local()
         self._ensure_schema()
 
     @property
@@ -153,8 +154,7 @@ class ArtifactPointerStore:
         record_id = str(uuid.uuid4())
         created_at = utcnow_iso()
         context_json = json.dumps(context or {})
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             conn.execute(
                 self._sql(
                     """
@@ -186,12 +186,6 @@ class ArtifactPointerStore:
                 ),
             )
             conn.commit()
-        except Exception:
-            try:
-                conn.rollback()
-            finally:
-                self._drop_connection()
-            raise
         stored = self.find_by_key(pointer.bucket, pointer.object_key, tenant_id=tenant_id)
         if stored is None:  # pragma: no cover - defensive; row was just written
             raise RuntimeError("artifact row vanished after insert")
@@ -208,14 +202,15 @@ class ArtifactPointerStore:
             The matching record, or ``None`` when absent or owned by
             another tenant.
         """
-        row = self._connect().execute(
-            self._sql(
-                "SELECT id, tenant_id, kind, bucket, object_key, sha256, size_bytes, "
-                "content_type, created_at, context FROM artifacts "
-                "WHERE id = {p} AND tenant_id = {p}"
-            ),
-            (artifact_id, tenant_id),
-        ).fetchone()
+        with self._connection() as conn:
+            row = conn.execute(
+                self._sql(
+                    "SELECT id, tenant_id, kind, bucket, object_key, sha256, size_bytes, "
+                    "content_type, created_at, context FROM artifacts "
+                    "WHERE id = {p} AND tenant_id = {p}"
+                ),
+                (artifact_id, tenant_id),
+            ).fetchone()
         return self._decode(row) if row is not None else None
 
     def find_by_key(
@@ -236,14 +231,15 @@ class ArtifactPointerStore:
             The matching record, or ``None`` when absent or owned by
             another tenant.
         """
-        row = self._connect().execute(
-            self._sql(
-                "SELECT id, tenant_id, kind, bucket, object_key, sha256, size_bytes, "
-                "content_type, created_at, context FROM artifacts "
-                "WHERE bucket = {p} AND object_key = {p} AND tenant_id = {p}"
-            ),
-            (bucket, object_key, tenant_id),
-        ).fetchone()
+        with self._connection() as conn:
+            row = conn.execute(
+                self._sql(
+                    "SELECT id, tenant_id, kind, bucket, object_key, sha256, size_bytes, "
+                    "content_type, created_at, context FROM artifacts "
+                    "WHERE bucket = {p} AND object_key = {p} AND tenant_id = {p}"
+                ),
+                (bucket, object_key, tenant_id),
+            ).fetchone()
         return self._decode(row) if row is not None else None
 
     def list(
@@ -273,7 +269,8 @@ class ArtifactPointerStore:
             params.append(str(kind))
         sql += " ORDER BY created_at DESC LIMIT {p}"
         params.append(int(limit))
-        rows = self._connect().execute(self._sql(sql), tuple(params)).fetchall()
+        with self._connection() as conn:
+            rows = conn.execute(self._sql(sql), tuple(params)).fetchall()
         return [self._decode(row) for row in rows]
 
     def delete(self, artifact_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> bool:
@@ -289,19 +286,12 @@ class ArtifactPointerStore:
         Returns:
             ``True`` when a row was deleted, ``False`` otherwise.
         """
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
                 self._sql("DELETE FROM artifacts WHERE id = {p} AND tenant_id = {p}"),
                 (artifact_id, tenant_id),
             )
             conn.commit()
-        except Exception:
-            try:
-                conn.rollback()
-            finally:
-                self._drop_connection()
-            raise
         return bool(cursor.rowcount)
 
     def referenced_object_keys(self, *, bucket: str | None = None) -> set[str]:
@@ -324,7 +314,8 @@ class ArtifactPointerStore:
         if bucket is not None:
             sql += " WHERE bucket = {p}"
             params = (bucket,)
-        rows = self._connect().execute(self._sql(sql), params).fetchall()
+        with self._connection() as conn:
+            rows = conn.execute(self._sql(sql), params).fetchall()
         return {str(row[0] if not hasattr(row, "keys") else list(row)[0]) for row in rows}
 
     def _decode(self, row: Any) -> StoredArtifact:
@@ -371,41 +362,38 @@ class ArtifactPointerStore:
         """
         return template.format(p="%s" if self._is_postgres else "?")
 
-    def _connect(self) -> Any:
-        """Return this thread's cached store connection, creating it once.
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Check out a pooled store connection for one operation, rolling back on failure.
 
-        Mirrors :class:`backend.events.store.EventStore`: SQLite connections
-        are not shareable across threads, so the cache is per-thread.
+        Mirrors :class:`backend.events.store.EventStore`: the connection goes
+        back to the store's pool (:mod:`backend.persistence.pool`) as soon as
+        the operation ends instead of staying pinned to the calling thread.
 
-        Returns:
+        Yields:
             A DB-API connection from the underlying store.
         """
-        conn = getattr(self._local, "conn", None)
-        if conn is None:
-            conn = self._store.connect()
+        checkout = self._store.connect()
+        conn = checkout.connection
+        try:
             if not self._is_postgres:
-                conn.execute("PRAGMA busy_timeout=15000")
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-            self._local.conn = conn
-        return conn
-
-    def _drop_connection(self) -> None:
-        """Discard this thread's cached connection after a failure."""
-        conn = getattr(self._local, "conn", None)
-        self._local.conn = None
-        if conn is not None:
+                apply_sqlite_pragmas(conn)
+            yield conn
+        except BaseException:
             try:
-                conn.close()
-            except Exception:  # noqa: BLE001 - already discarding
+                conn.rollback()
+            except Exception:  # noqa: BLE001 - the original error matters more
                 pass
+            raise
+        finally:
+            checkout.close()
 
     def _ensure_schema(self) -> None:
         """Create the artifact-pointer table if it does not exist."""
-        conn = self._connect()
-        for statement in artifact_pointer_statements(self._is_postgres):
-            conn.execute(statement)
-        conn.commit()
+        with self._connection() as conn:
+            for statement in artifact_pointer_statements(self._is_postgres):
+                conn.execute(statement)
+            conn.commit()
 
 
 def persist_artifact(
@@ -6,15 +6,32 @@ canonical ``access.request.allowed``/``access.request.denied`` events
 published after a successful write are best-effort, for existing
 event-driven consumers (dashboards, future audit sinks) — never the source
 of truth.
+
+Concurrent :meth:`AuditWriter.record` calls are group-committed: while one
+caller's transaction is in flight, the rows of every caller that arrives
+meanwhile are collected and written together by the next one, so a burst of
+requests pays for one commit instead of one each. Every caller still
+returns only once its own row is durable. If the store rejects a group, the
+writer can fall back to an :class:`AuditSpool` — a bounded, fsynced local
+file that is replayed into the store on a later successful write. Only
+when the spool is absent, full, or itself unwritable does the failure reach
+the caller (and an about-to-be-allowed request is denied with ``503``).
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import threading
 import uuid
+import weakref
+from collections.abc import Callable, Sequence
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
-from backend.auth.contracts import AccessAuditRecord
+from backend.auth.contracts import AccessAuditRecord, AuthMethod, Role
 from backend.auth.store import AuthStore
 
 logger = logging.getLogger(__name__)
@@ -25,20 +42,150 @@ def new_audit_id() -> str:
     return str(uuid.uuid4())
 
 
+def _spool_line(record: AccessAuditRecord) -> str:
+    """Serialize one audit row to a spool-file line."""
+    return json.dumps(
+        {
+            "audit_id": record.audit_id,
+            "occurred_at": record.occurred_at.isoformat(),
+            "tenant_id": record.tenant_id,
+            "subject": record.subject,
+            "auth_method": record.auth_method.value,
+            "credential_id": record.credential_id,
+            "roles": [role.value for role in record.roles],
+            "required_scope": record.required_scope,
+            "resource_type": record.resource_type,
+            "resource_id": record.resource_id,
+            "method": record.method,
+            "route_template": record.route_template,
+            "decision": record.decision,
+            "reason": record.reason,
+            "request_id": record.request_id,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _from_spool_line(line: str) -> AccessAuditRecord:
+    """Parse a spool-file line back into an audit row."""
+    data: dict[str, Any] = json.loads(line)
+    data["occurred_at"] = datetime.fromisoformat(data["occurred_at"])
+    data["auth_method"] = AuthMethod(data["auth_method"])
+    data["roles"] = tuple(Role(role) for role in data["roles"])
+    return AccessAuditRecord(**data)
+
+
+class AuditSpool:
+    """Bounded, append-only local file of audit rows the durable store refused.
+
+    Each append is fsynced before it returns, so a spooled row is as durable
+    as a committed one on this host. One spool file belongs to one writer
+    process; point replicas at distinct paths.
+    """
+
+    def __init__(self, path: Path, *, max_records: int) -> None:
+        """Open (or adopt a leftover) spool file.
+
+        Args:
+            path: Spool file location; rows left by a previous process are
+                replayed by the next successful write.
+            max_records: Most rows the spool holds before appends fail.
+        """
+        self._path = path
+        self._max_records = max_records
+        self._lock = threading.Lock()
+        try:
+            with path.open(encoding="utf-8") as handle:
+                self._pending = sum(1 for line in handle if line.strip())
+        except FileNotFoundError:
+            self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be replayed into the store."""
+        return self._pending
+
+    def append(self, records: Sequence[AccessAuditRecord]) -> None:
+        """Durably append *records* to the spool file.
+
+        Args:
+            records: Rows the store could not take.
+
+        Raises:
+            RuntimeError: If the rows would exceed ``max_records``.
+            OSError: If the file cannot be written or synced.
+        """
+        with self._lock:
+            if self._pending + len(records) > self._max_records:
+                raise RuntimeError(
+                    f"access-audit spool is full ({self._pending}/{self._max_records} rows)"
+                )
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as handle:
+                handle.write("".join(_spool_line(record) + "\n" for record in records))
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._pending += len(records)
+
+    def drain(self, write: Callable[[list[AccessAuditRecord]], None]) -> int:
+        """Hand every spooled row to *write*, then empty the spool.
+
+        The file is removed only after *write* returns, so a crash in
+        between replays the rows again; the store skips rows it already has.
+
+        Args:
+            write: Durable bulk write, e.g.
+                :meth:`~backend.auth.store.AuthStore.append_access_audits`.
+
+        Returns:
+            Number of rows replayed.
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            with self._path.open(encoding="utf-8") as handle:
+                records = [_from_spool_line(line) for line in handle if line.strip()]
+            write(records)
+            self._path.unlink(missing_ok=True)
+            self._pending = 0
+            return len(records)
+
+
+class _AuditGroup:
+    """Rows collected for one shared commit, and that commit's outcome."""
+
+    __slots__ = ("done", "error", "records")
+
+    def __init__(self) -> None:
+        """Start an open group with no rows and no outcome yet."""
+        self.records: list[AccessAuditRecord] = []
+        self.done = False
+        self.error: BaseException | None = None
+
+
 class AuditWriter:
     """Writes and queries the durable, tenant-scoped access-audit trail."""
 
-    def __init__(self, store: AuthStore | None = None) -> None:
+    def __init__(self, store: AuthStore | None = None, *, spool: AuditSpool | None = None) -> None:
         """Build an audit writer bound to a durable Auth Store.
 
         Args:
             store: Durable Auth Store; defaults to a new :class:`AuthStore`.
+            spool: Local fallback for groups the store rejects; ``None``
+                surfaces every store failure to the caller.
         """
         self._store = store or AuthStore()
+        self._spool = spool
+        self._group_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._open_group = _AuditGroup()
 
     def record(self, record: AccessAuditRecord, *, required: bool) -> None:
         """Durably persist one access-decision audit row.
 
+        Blocks until the row is committed together with any rows recorded
+        concurrently, or spooled if the store failed and a spool is set.
+
         Args:
             record: The decision to persist.
             required: Whether the caller treats a write failure as fatal to
@@ -50,11 +197,21 @@ class AuditWriter:
                 observability.
 
         Raises:
-            Exception: Any underlying store failure.
+            Exception: Any underlying store failure that could not be
+                spooled.
         """
-        try:
-            self._store.append_access_audit(record)
-        except Exception:
+        with self._group_lock:
+            group = self._open_group
+            group.records.append(record)
+        with self._commit_lock:
+            # A caller that held the commit lock meanwhile may have written
+            # this group already; otherwise this caller writes it, with every
+            # row that joined while it waited.
+            if not group.done:
+                with self._group_lock:
+                    self._open_group = _AuditGroup()
+                self._commit(group)
+        if group.error is not None:
             logger.critical(
                 "access audit write failed",
                 extra={
@@ -65,15 +222,47 @@ class AuditWriter:
                     "route_template": record.route_template,
                     "request_id": record.request_id,
                 },
-                exc_info=True,
+                exc_info=group.error,
             )
-            raise
+            raise group.error
+
+    def _commit(self, group: _AuditGroup) -> None:
+        """Write *group* in one transaction, spooling it if the store fails."""
+        try:
+            if self._spool is not None and self._spool.pending:
+                try:
+                    replayed = self._spool.drain(self._store.append_access_audits)
+                except Exception:
+                    # The spool keeps its rows for the next successful write.
+                    logger.warning("access audit spool replay failed", exc_info=True)
+                else:
+                    logger.info("replayed %d spooled access audit rows", replayed)
+            self._store.append_access_audits(group.records)
+        except Exception as exc:  # noqa: BLE001 - spooled, or reported to every caller
+            if self._spool is None:
+                group.error = exc
+            else:
+                try:
+                    self._spool.append(group.records)
+                except Exception as spool_exc:  # noqa: BLE001 - reported to every caller
+                    spool_exc.__cause__ = exc
+                    group.error = spool_exc
+                else:
+                    logger.warning(
+                        "access audit store unavailable; spooled %d rows",
+                        len(group.records),
+                        exc_info=True,
+                    )
+        finally:
+            group.done = True
 
     def list(
         self, *, tenant_id: str, limit: int, before: datetime | None
     ) -> list[AccessAuditRecord]:
         """List a tenant's access-audit rows, most recent first.
 
+        Rows still in the spool are not listed until they are replayed.
+
         Args:
             tenant_id: Tenant to scope the listing to.
             limit: Maximum rows to return.
@@ -86,6 +275,9 @@ class AuditWriter:
 
 
 _audit_writer_override: AuditWriter | None = None
+# One writer per durable store, so concurrent requests share its commit groups.
+_audit_writers: weakref.WeakKeyDictionary[Any, AuditWriter] = weakref.WeakKeyDictionary()
+_audit_writers_lock = threading.Lock()
 
 
 def get_audit_writer() -> AuditWriter:
@@ -93,11 +285,29 @@ def get_audit_writer() -> AuditWriter:
 
     Returns:
         The test-installed override, if any (see :func:`override_audit_writer`),
-        otherwise a fresh :class:`AuditWriter`.
+        otherwise the shared :class:`AuditWriter` of the current durable
+        store, spooling to ``AUTODEV_AUDIT_SPOOL_PATH`` when that is set.
     """
     if _audit_writer_override is not None:
         return _audit_writer_override
-    return AuditWriter()
+    from backend.config.settings import Settings  # noqa: PLC0415
+    from backend.persistence.database import get_store  # noqa: PLC0415
+
+    durable = get_store()
+    with _audit_writers_lock:
+        writer = _audit_writers.get(durable)
+        if writer is None:
+            settings = Settings()
+            spool_path = settings.autodev_audit_spool_path.strip()
+            spool = (
+                AuditSpool(
+                    Path(spool_path), max_records=settings.autodev_audit_spool_max_records
+                )
+                if spool_path
+                else None
+            )
+            writer = _audit_writers[durable] = AuditWriter(AuthStore(durable), spool=spool)
+        return writer
 
 
 def override_audit_writer(writer: AuditWriter | None) -> None:
@@ -105,7 +315,7 @@ def override_audit_writer(writer: AuditWriter | None) -> None:
 
     Args:
         writer: The writer to install, or ``None`` to clear the override
-            and resume constructing a fresh :class:`AuditWriter` per call.
+            and resume using the shared per-store :class:`AuditWriter`.
     """
     global _audit_writer_override
     _audit_writer_override = writer
@@ -150,6 +360,7 @@ def publish_access_event(record: AccessAuditRecord) -> None:
 
 
 __all__ = [
+    "AuditSpool",
     "AuditWriter",
     "get_audit_writer",
     "new_audit_id",
@@ -10,9 +10,12 @@ this module rather than folded into it.
 
 from __future__ import annotations
 
+import hashlib
 import hmac
 import secrets
 import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
 from typing import Any
 
@@ -77,6 +80,70 @@ def _reset_ephemeral_session_key() -> None:
     _ephemeral_session_key = None
 
 
+_PRINCIPAL_CACHE_MAX_ENTRIES = 10_000
+
+
+class _PrincipalCache:
+    """Recently authenticated service-key principals, keyed by the presented key's hash.
+
+    Module-level for the same reason as :func:`_local_ephemeral_session_key`:
+    :class:`AuthService` is built per request, and the cache must outlive it.
+    The raw key is never held, only its SHA-256 digest.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Start an empty cache.
+
+        Args:
+            max_entries: Most principals kept; the least recently used is
+                evicted beyond it.
+        """
+        self._max_entries = max_entries
+        # digest -> (principal, monotonic time it was cached)
+        self._entries: OrderedDict[str, tuple[PrincipalV2, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str, ttl_seconds: float) -> PrincipalV2 | None:
+        """Return the cached principal for *digest* if it is fresh and unexpired."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            principal, cached_at = entry
+            if time.monotonic() - cached_at < ttl_seconds and (
+                principal.expires_at is None or principal.expires_at > utcnow()
+            ):
+                return principal
+            del self._entries[digest]
+            return None
+
+    def put(self, digest: str, principal: PrincipalV2) -> None:
+        """Cache *principal*, evicting the oldest entry past the size bound."""
+        with self._lock:
+            self._entries[digest] = (principal, time.monotonic())
+            self._entries.move_to_end(digest)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, credential_id: str) -> None:
+        """Drop every cached principal of *credential_id*."""
+        with self._lock:
+            for digest in [
+                digest
+                for digest, (principal, _cached_at) in self._entries.items()
+                if principal.credential_id == credential_id
+            ]:
+                del self._entries[digest]
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        with self._lock:
+            self._entries.clear()
+
+
+_principal_cache = _PrincipalCache(_PRINCIPAL_CACHE_MAX_ENTRIES)
+
+
 class AuthService:
     """Authenticates requests and manages service-credential/session lifecycle."""
 
@@ -156,6 +223,12 @@ class AuthService:
     def authenticate_service_key(self, presented: str) -> PrincipalV2:
         """Authenticate a presented ``adk_live_<key-id>_<secret>`` service key.
 
+        A successful lookup is cached for ``autodev_auth_principal_cache_seconds``
+        (never past the key's expiry), so repeated requests with one key skip
+        the store read and secret check. :meth:`revoke_service_key` drops the
+        key's cached principal at once; a revocation made by another process
+        takes effect here within the cache TTL.
+
         Args:
             presented: The full presented service key.
 
@@ -166,6 +239,12 @@ class AuthService:
             InvalidCredentialError: If the key is malformed, unknown,
                 revoked, expired, or the secret does not match.
         """
+        cache_seconds = self._settings.autodev_auth_principal_cache_seconds
+        digest = hashlib.sha256(presented.encode("utf-8")).hexdigest() if cache_seconds else ""
+        if digest:
+            cached = _principal_cache.get(digest, cache_seconds)
+            if cached is not None:
+                return cached
         parsed = parse_service_key(presented)
         if parsed is None:
             raise InvalidCredentialError("malformed service key")
@@ -175,7 +254,7 @@ class AuthService:
             raise InvalidCredentialError("unknown or inactive service key")
         if not verify_secret(secret, record.secret_hash):
             raise InvalidCredentialError("invalid service key secret")
-        return PrincipalV2(
+        principal = PrincipalV2(
             subject=record.subject,
             tenant_id=record.tenant_id,
             roles=record.roles,
@@ -184,6 +263,9 @@ class AuthService:
             credential_id=record.key_id,
             expires_at=record.expires_at,
         )
+        if digest:
+            _principal_cache.put(digest, principal)
+        return principal
 
     def authenticate_oidc_bearer(self, token: str) -> PrincipalV2:
         """Authenticate a presented OIDC bearer JWT.
@@ -331,7 +413,10 @@ class AuthService:
         Returns:
             ``True`` if an active credential was revoked.
         """
-        return self._store.revoke_service_credential(tenant_id=tenant_id, key_id=key_id)
+        revoked = self._store.revoke_service_credential(tenant_id=tenant_id, key_id=key_id)
+        if revoked:
+            _principal_cache.invalidate(key_id)
+        return revoked
 
     def list_service_keys(self, *, tenant_id: str) -> list[ServiceCredentialRecord]:
         """List every service credential belonging to one tenant.
@@ -469,11 +554,12 @@ def reset_auth_service_cache() -> None:
     """Clear auth-service-adjacent process caches — for use in tests.
 
     ``get_auth_service()`` itself is no longer cached, but the local
-    ephemeral session-encryption key is; this resets that, so a test that
-    wants a truly clean slate (e.g. asserting session behavior in
-    isolation) can get one.
+    ephemeral session-encryption key and the service-key principal cache
+    are; this resets both, so a test that wants a truly clean slate (e.g.
+    asserting session behavior in isolation) can get one.
     """
     _reset_ephemeral_session_key()
+    _principal_cache.clear()
 
 
 __all__ = [
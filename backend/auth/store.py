@@ -3,19 +3,29 @@
 Follows the same store/dialect conventions as
 :class:`backend.events.store.EventStore`: a shared durable store
 (:func:`backend.persistence.database.get_store`), ``{p}`` placeholder
-substitution, and one lazily-opened connection per thread.
+substitution, and one pooled connection checkout per operation.
 """
 
 from __future__ import annotations
 
 import threading
+import weakref
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any
 
-from backend.auth.contracts import AccessAuditRecord, AuthMethod, AuthSessionRecord, Role, ServiceCredentialRecord
+from backend.auth.contracts import (
+    AccessAuditRecord,
+    AuthMethod,
+    AuthSessionRecord,
+    Role,
+    ServiceCredentialRecord,
+)
 from backend.auth.migrations import auth_store_statements
 from backend.auth.roles import normalize_scopes
 from backend.persistence.database import get_store
+from backend.persistence.pool import apply_sqlite_pragmas
 
 
 def utcnow() -> datetime:
@@ -49,12 +59,20 @@ def _encode_scopes(scopes: frozenset[str]) -> str:
     return " ".join(sorted(scopes))
 
 
+# Durable stores whose Auth Store schema has been created by this process.
+_schema_ready: weakref.WeakSet[Any] = weakref.WeakSet()
+_schema_ready_lock = threading.Lock()
+
+
 class AuthStore:
     """Durable service-credential and session persistence (E11-S2)."""
 
     def __init__(self, store: Any | None = None) -> None:
         """Initialize the store, ensuring its backing schema exists.
 
+        The schema statements run once per durable store and process, not
+        on every construction (a service is built per request).
+
         Args:
             store: Durable store to use; defaults to the process-wide store
                 from :func:`backend.persistence.database.get_store`.
@@ -65,8 +83,11 @@ class AuthStore:
         self._store = store or get_store()
         if not hasattr(self._store, "connect"):
             raise TypeError("AuthStore requires a durable store with connect()")
-        self._local = threading.local()
-        self._ensure_schema()
+        with _schema_ready_lock:
+            if self._store in _schema_ready:
+                return
+            self._ensure_schema()
+            _schema_ready.add(self._store)
 
     # ------------------------------------------------------- service keys
 
@@ -77,8 +98,7 @@ class AuthStore:
             record: The credential to persist. Its ``secret_hash`` is the
                 only representation of the secret ever stored.
         """
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             self._begin_write(conn)
             conn.execute(
                 self._sql(
@@ -100,9 +120,6 @@ class AuthStore:
                 ),
             )
             conn.commit()
-        except Exception:
-            self._drop_connection()
-            raise
 
     def get_service_credential(self, key_id: str) -> ServiceCredentialRecord | None:
         """Fetch one service credential by its non-secret id.
@@ -113,14 +130,15 @@ class AuthStore:
         Returns:
             The credential, or ``None`` if unknown.
         """
-        row = self._connect().execute(
-            self._sql(
-                "SELECT key_id, tenant_id, subject, secret_hash, roles, scopes, "
-                "created_at, expires_at, revoked_at FROM service_credentials "
-                "WHERE key_id = {p}"
-            ),
-            (key_id,),
-        ).fetchone()
+        with self._connection() as conn:
+            row = conn.execute(
+                self._sql(
+                    "SELECT key_id, tenant_id, subject, secret_hash, roles, scopes, "
+                    "created_at, expires_at, revoked_at FROM service_credentials "
+                    "WHERE key_id = {p}"
+                ),
+                (key_id,),
+            ).fetchone()
         return self._decode_credential(row) if row is not None else None
 
     def list_service_credentials(self, *, tenant_id: str) -> list[ServiceCredentialRecord]:
@@ -132,14 +150,15 @@ class AuthStore:
         Returns:
             The tenant's credentials, most recently created first.
         """
-        rows = self._connect().execute(
-            self._sql(
-                "SELECT key_id, tenant_id, subject, secret_hash, roles, scopes, "
-                "created_at, expires_at, revoked_at FROM service_credentials "
-                "WHERE tenant_id = {p} ORDER BY created_at DESC"
-            ),
-            (tenant_id,),
-        ).fetchall()
+        with self._connection() as conn:
+            rows = conn.execute(
+                self._sql(
+                    "SELECT key_id, tenant_id, subject, secret_hash, roles, scopes, "
+                    "created_at, expires_at, revoked_at FROM service_credentials "
+                    "WHERE tenant_id = {p} ORDER BY created_at DESC"
+                ),
+                (tenant_id,),
+            ).fetchall()
         return [self._decode_credential(row) for row in rows]
 
     def revoke_service_credential(self, *, tenant_id: str, key_id: str) -> bool:
@@ -153,8 +172,7 @@ class AuthStore:
             ``True`` if an active credential was revoked; ``False`` if it did
             not exist, belonged to another tenant, or was already revoked.
         """
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             self._begin_write(conn)
             cursor = conn.execute(
                 self._sql(
@@ -165,9 +183,6 @@ class AuthStore:
             )
             conn.commit()
             return (cursor.rowcount or 0) > 0
-        except Exception:
-            self._drop_connection()
-            raise
 
     def has_active_service_credential(self) -> bool:
         """Return whether any tenant has at least one active service credential.
@@ -178,13 +193,14 @@ class AuthStore:
         Returns:
             ``True`` if at least one unrevoked, unexpired credential exists.
         """
-        row = self._connect().execute(
-            self._sql(
-                "SELECT 1 FROM service_credentials "
-                "WHERE revoked_at IS NULL AND expires_at > {p} LIMIT 1"
-            ),
-            (_iso(utcnow()),),
-        ).fetchone()
+        with self._connection() as conn:
+            row = conn.execute(
+                self._sql(
+                    "SELECT 1 FROM service_credentials "
+                    "WHERE revoked_at IS NULL AND expires_at > {p} LIMIT 1"
+                ),
+                (_iso(utcnow()),),
+            ).fetchone()
         return row is not None
 
     def _decode_credential(self, row: Any) -> ServiceCredentialRecord:
@@ -211,8 +227,7 @@ class AuthStore:
             record: The session to persist, with its refresh token already
                 Fernet-encrypted.
         """
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             self._begin_write(conn)
             conn.execute(
                 self._sql(
@@ -233,9 +248,6 @@ class AuthStore:
                 ),
             )
             conn.commit()
-        except Exception:
-            self._drop_connection()
-            raise
 
     def get_session(self, session_id: str) -> AuthSessionRecord | None:
         """Fetch one browser session by its opaque id.
@@ -246,14 +258,15 @@ class AuthStore:
         Returns:
             The session, or ``None`` if unknown.
         """
-        row = self._connect().execute(
-            self._sql(
-                "SELECT session_id, tenant_id, subject, roles, "
-                "encrypted_refresh_token, created_at, expires_at, revoked_at "
-                "FROM auth_sessions WHERE session_id = {p}"
-            ),
-            (session_id,),
-        ).fetchone()
+        with self._connection() as conn:
+            row = conn.execute(
+                self._sql(
+                    "SELECT session_id, tenant_id, subject, roles, "
+                    "encrypted_refresh_token, created_at, expires_at, revoked_at "
+                    "FROM auth_sessions WHERE session_id = {p}"
+                ),
+                (session_id,),
+            ).fetchone()
         if row is None:
             return None
         values = list(row)
@@ -277,8 +290,7 @@ class AuthStore:
         Returns:
             ``True`` if an active session was revoked.
         """
-        conn = self._connect()
-        try:
+        with self._connection() as conn:
             self._begin_write(conn)
             cursor = conn.execute(
                 self._sql(
@@ -289,9 +301,6 @@ class AuthStore:
             )
             conn.commit()
             return (cursor.rowcount or 0) > 0
-        except Exception:
-            self._drop_connection()
-            raise
 
     # ------------------------------------------------------- access audit
 
@@ -308,10 +317,28 @@ class AuthStore:
                 allowed request as a hard denial (``503``), so silently
                 swallowing it here would defeat that guarantee.
         """
-        conn = self._connect()
-        try:
+        self.append_access_audits([record])
+
+    def append_access_audits(self, records: Sequence[AccessAuditRecord]) -> None:
+        """Durably append several access-decision audit rows in one transaction.
+
+        Either every row is committed or none is, so a group of concurrent
+        decisions shares one commit (and one fsync) without weakening any
+        single decision's durability. A row whose ``audit_id`` is already
+        stored is skipped, so replaying a spooled group is harmless.
+
+        Args:
+            records: The audit rows to persist.
+
+        Raises:
+            Exception: Any persistence failure, re-raised uncaught as for
+                :meth:`append_access_audit`.
+        """
+        if not records:
+            return
+        with self._connection() as conn:
             self._begin_write(conn)
-            conn.execute(
+            conn.executemany(
                 self._sql(
                     "INSERT INTO access_audit "
                     "(audit_id, occurred_at, tenant_id, subject, auth_method, "
@@ -319,30 +346,31 @@ class AuthStore:
                     "resource_id, method, route_template, decision, reason, "
                     "request_id) "
                     "VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, "
-                    "{p}, {p}, {p}, {p}, {p})"
-                ),
-                (
-                    record.audit_id,
-                    _iso(record.occurred_at),
-                    record.tenant_id,
-                    record.subject,
-                    record.auth_method.value,
-                    record.credential_id,
-                    _encode_roles(record.roles),
-                    record.required_scope,
-                    record.resource_type,
-                    record.resource_id,
-                    record.method,
-                    record.route_template,
-                    record.decision,
-                    record.reason,
-                    record.request_id,
+                    "{p}, {p}, {p}, {p}, {p}) "
+                    "ON CONFLICT (audit_id) DO NOTHING"
                 ),
+                [
+                    (
+                        record.audit_id,
+                        _iso(record.occurred_at),
+                        record.tenant_id,
+                        record.subject,
+                        record.auth_method.value,
+                        record.credential_id,
+                        _encode_roles(record.roles),
+                        record.required_scope,
+                        record.resource_type,
+                        record.resource_id,
+                        record.method,
+                        record.route_template,
+                        record.decision,
+                        record.reason,
+                        record.request_id,
+                    )
+                    for record in records
+                ],
             )
             conn.commit()
-        except Exception:
-            self._drop_connection()
-            raise
 
     def list_access_audit(
         self, *, tenant_id: str, limit: int, before: datetime | None
@@ -358,29 +386,31 @@ class AuthStore:
             The tenant's audit rows, most recently occurred first.
         """
         if before is not None:
-            rows = self._connect().execute(
-                self._sql(
-                    "SELECT audit_id, occurred_at, tenant_id, subject, auth_method, "
-                    "credential_id, roles, required_scope, resource_type, "
-                    "resource_id, method, route_template, decision, reason, "
-                    "request_id FROM access_audit "
-                    "WHERE tenant_id = {p} AND occurred_at < {p} "
-                    "ORDER BY occurred_at DESC LIMIT {p}"
-                ),
-                (tenant_id, _iso(before), limit),
-            ).fetchall()
+            with self._connection() as conn:
+                rows = conn.execute(
+                    self._sql(
+                        "SELECT audit_id, occurred_at, tenant_id, subject, auth_method, "
+                        "credential_id, roles, required_scope, resource_type, "
+                        "resource_id, method, route_template, decision, reason, "
+                        "request_id FROM access_audit "
+                        "WHERE tenant_id = {p} AND occurred_at < {p} "
+                        "ORDER BY occurred_at DESC LIMIT {p}"
+                    ),
+                    (tenant_id, _iso(before), limit),
+                ).fetchall()
         else:
-            rows = self._connect().execute(
-                self._sql(
-                    "SELECT audit_id, occurred_at, tenant_id, subject, auth_method, "
-                    "credential_id, roles, required_scope, resource_type, "
-                    "resource_id, method, route_template, decision, reason, "
-                    "request_id FROM access_audit "
-                    "WHERE tenant_id = {p} "
-                    "ORDER BY occurred_at DESC LIMIT {p}"
-                ),
-                (tenant_id, limit),
-            ).fetchall()
+            with self._connection() as conn:
+                rows = conn.execute(
+                    self._sql(
+                        "SELECT audit_id, occurred_at, tenant_id, subject, auth_method, "
+                        "credential_id, roles, required_scope, resource_type, "
+                        "resource_id, method, route_template, decision, reason, "
+                        "request_id FROM access_audit "
+                        "WHERE tenant_id = {p} "
+                        "ORDER BY occurred_at DESC LIMIT {p}"
+                    ),
+                    (tenant_id, limit),
+                ).fetchall()
         return [self._decode_audit(row) for row in rows]
 
     def _decode_audit(self, row: Any) -> AccessAuditRecord:
@@ -416,27 +446,23 @@ class AuthStore:
         """Substitute the dialect placeholder into a SQL template."""
         return template.format(p="%s" if self._is_postgres else "?")
 
-    def _connect(self) -> Any:
-        """Return this thread's cached store connection, creating it once."""
-        conn = getattr(self._local, "conn", None)
-        if conn is None:
-            conn = self._store.connect()
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Check out a pooled store connection for one operation, rolling back on failure."""
+        checkout = self._store.connect()
+        conn = checkout.connection
+        try:
             if not self._is_postgres:
-                conn.execute("PRAGMA busy_timeout=15000")
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-            self._local.conn = conn
-        return conn
-
-    def _drop_connection(self) -> None:
-        """Discard this thread's cached connection after a failure."""
-        conn = getattr(self._local, "conn", None)
-        self._local.conn = None
-        if conn is not None:
+                apply_sqlite_pragmas(conn)
+            yield conn
+        except BaseException:
             try:
-                conn.close()
-            except Exception:  # noqa: BLE001 - already discarding
+                conn.rollback()
+            except Exception:  # noqa: BLE001 - the original error matters more
                 pass
+            raise
+        finally:
+            checkout.close()
 
     def _begin_write(self, conn: Any) -> None:
         """Start a write transaction eagerly on SQLite."""
@@ -445,10 +471,10 @@ class AuthStore:
 
     def _ensure_schema(self) -> None:
         """Create the Auth Store tables if they do not exist."""
-        conn = self._connect()
-        for statement in auth_store_statements(self._is_postgres):
-            conn.execute(statement)
-        conn.commit()
+        with self._connection() as conn:
+            for statement in auth_store_statements(self._is_postgres):
+                conn.execute(statement)
+            conn.commit()
 
 
 __all__ = ["AuthStore", "utcnow"]
@@ -82,6 +82,11 @@ class Settings(BaseSettings):
 
     # --- persistence ---
     database_url: str = "sqlite:///./autodev.db"
+    # Connection pools behind ``store.connect()`` (``backend.persistence.pool``);
+    # read by ``pool_settings``. ``0`` disables pooling.
+    autodev_db_pool_size: int = Field(default=10, ge=0)
+    autodev_db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    autodev_db_pool_max_lifetime_seconds: float = Field(default=1800.0, gt=0)
 
     # --- LLM ---
     llm_provider: str = "stub"
@@ -125,6 +130,11 @@ class Settings(BaseSettings):
     autodev_sandbox_timeout_seconds: int = Field(default=300, ge=1, le=3600)
     autodev_dynamic_orch: bool = False
     autodev_repo_provider: str = "lexical"
+    autodev_index_workers: int = Field(default=1, ge=1)
+    autodev_vector_index_dir: str = ""
+    autodev_retrieval_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    autodev_retrieval_cache_max_entries: int = Field(default=10_000, ge=1)
+    autodev_retrieval_leg_timeout_ms: int = Field(default=250, ge=0)
 
     # --- plugin security (E11-S4) ---
     autodev_trusted_in_process_plugins: str = ""
@@ -133,14 +143,28 @@ class Settings(BaseSettings):
     autodev_job_backend: Literal["inprocess", "redis"] = "inprocess"
     autodev_redis_url: str = ""
     autodev_job_retention_seconds: int = Field(default=3600, ge=-1)
+    # Redis job workers: pool size, leases, retries (``backend.jobs.queue``).
+    autodev_job_workers: int = Field(default=4, ge=0)
+    autodev_job_visibility_timeout_seconds: float = Field(default=300.0, gt=0)
+    autodev_job_max_attempts: int = Field(default=3, ge=1)
+    autodev_job_retry_backoff_seconds: float = Field(default=1.0, ge=0)
 
     # --- event bus (E9-S2-T2) ---
     autodev_event_bus: Literal["inmemory", "redis"] = "inmemory"
     autodev_event_stream_maxlen: int = Field(default=10_000, ge=-1)
+    # Live delivery across replicas (``backend.events.stream_consumer``).
+    autodev_event_bus_cross_process: bool = False
+    autodev_event_bus_block_ms: int = Field(default=1_000, ge=1)
 
     # --- event store (E8-S2) ---
     autodev_event_store_enabled: bool = True
     autodev_event_retention_days: int = Field(default=30, ge=-1)
+    # Opt-in batching background writer (``backend.events.appender``).
+    autodev_event_store_write_behind: bool = False
+    autodev_event_store_queue_size: int = Field(default=10_000, ge=1)
+    autodev_event_store_batch_size: int = Field(default=500, ge=1)
+    autodev_event_store_flush_interval_ms: int = Field(default=50, ge=1)
+    autodev_event_store_overflow: Literal["block", "drop"] = "block"
 
     # --- artifacts ---
     storage_backend: Literal["local", "s3"] = "local"
@@ -220,6 +244,32 @@ class Settings(BaseSettings):
     #: Production requires an explicit, durably-stored policy per tenant;
     #: local mode falls back to the finite defaults above.
     autodev_quota_production_requires_policy: bool = True
+    #: Where per-credential request-rate token buckets live: this process
+    #: (``memory``) or Redis, shared by every replica (``redis``).
+    autodev_rate_limit_backend: Literal["memory", "redis"] = "memory"
+    #: Least seconds between writes of admitted-request counts to the
+    #: durable store.
+    autodev_rate_limit_reconcile_seconds: float = Field(default=5.0, gt=0)
+    #: Seconds a tenant's resolved quota policy is reused by request-rate
+    #: checks; ``0`` disables the cache. A policy written through this
+    #: process applies at once, through another within this TTL.
+    autodev_quota_policy_cache_seconds: float = Field(default=2.0, ge=0)
+    #: Seconds an authenticated service-key principal is reused without
+    #: re-reading its credential; ``0`` disables the cache. Revocation
+    #: through this process applies at once, through another within this TTL.
+    autodev_auth_principal_cache_seconds: float = Field(default=5.0, ge=0)
+    #: Seconds a resolved agent/skill/flow version is reused without
+    #: re-reading its registry; ``0`` disables the cache. Registrations
+    #: through this process apply at once, through another within this TTL.
+    autodev_registry_resolve_cache_seconds: float = Field(default=5.0, ge=0)
+    #: Local file that access-audit rows are spooled to (fsynced) while the
+    #: durable store rejects writes, and replayed from once it recovers.
+    #: Empty disables the spool: a failed audit write then denies the
+    #: request (``503``) as before. Use one path per replica.
+    autodev_audit_spool_path: str = ""
+    #: Most rows the access-audit spool holds; past it, allowed requests
+    #: fail closed with ``503``.
+    autodev_audit_spool_max_records: int = Field(default=10_000, ge=1)
     #: Wall-clock seconds a pending execution-action decision (E14-S3,
     #: approval/hybrid modes) may stay unanswered before it self-expires
     #: into its configurable fallback (default: deny and stop the run).
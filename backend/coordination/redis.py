@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 import threading
 import time
@@ -54,9 +55,15 @@ def _lock_key(name: str) -> str:
 class LocalCache:
     """In-process cache used when no Redis backend is configured."""
 
-    def __init__(self) -> None:
-        """Initialize an empty, thread-safe in-memory cache."""
-        self._values: dict[str, tuple[bytes, float | None]] = {}
+    def __init__(self, *, max_entries: int | None = None) -> None:
+        """Initialize an empty, thread-safe in-memory cache.
+
+        Args:
+            max_entries: Bound on stored values; beyond it the least recently
+                used value is evicted. ``None`` means unbounded.
+        """
+        self._values: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._max_entries = max_entries
         self._lock = threading.Lock()
 
     def set(self, namespace: str, key: str, value: bytes, *, ttl_seconds: float | None = None) -> None:
@@ -69,8 +76,13 @@ class LocalCache:
             ttl_seconds: Time-to-live in seconds; ``None`` means no expiry.
         """
         expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+        namespaced = _cache_key(namespace, key)
         with self._lock:
-            self._values[_cache_key(namespace, key)] = (value, expires_at)
+            self._values[namespaced] = (value, expires_at)
+            self._values.move_to_end(namespaced)
+            if self._max_entries is not None:
+                while len(self._values) > self._max_entries:
+                    self._values.popitem(last=False)
 
     def get(self, namespace: str, key: str) -> bytes | None:
         """Retrieve a stored value if present and not expired.
@@ -91,6 +103,7 @@ class LocalCache:
             if expires_at is not None and expires_at <= time.monotonic():
                 self._values.pop(namespaced, None)
                 return None
+            self._values.move_to_end(namespaced)
             return value
 
     def delete(self, namespace: str, key: str) -> None:
@@ -351,11 +364,15 @@ def _redis_client_from_url(url: str) -> Any:
     return redis.from_url(url)
 
 
-def get_cache(settings: Settings | None = None) -> LocalCache | RedisCache:
+def get_cache(
+    settings: Settings | None = None, *, max_entries: int | None = None
+) -> LocalCache | RedisCache:
     """Build the configured cache backend.
 
     Args:
         settings: Settings override; falls back to :func:`get_settings`.
+        max_entries: LRU bound for the in-process fallback; Redis evicts by
+            its own ``maxmemory-policy``.
 
     Returns:
         A :class:`RedisCache` if ``autodev_job_backend`` is ``"redis"``, else :class:`LocalCache`.
@@ -363,7 +380,7 @@ def get_cache(settings: Settings | None = None) -> LocalCache | RedisCache:
     active = settings or get_settings()
     if active.autodev_job_backend == "redis":
         return RedisCache(url=active.autodev_redis_url)
-    return LocalCache()
+    return LocalCache(max_entries=max_entries)
 
 
 def get_lock_manager(settings: Settings | None = None) -> LocalLockManager | RedisLockManager:
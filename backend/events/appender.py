@@ -0,0 +1,230 @@
+"""Write-behind batching for :meth:`backend.events.store.EventStore.append` (opt-in).
+
+The Event Store subscriber normally appends each published envelope in the
+publisher's thread — one transaction per event. Under fan-out map flows that
+makes eventing the dominant cost of a step. :class:`WriteBehindAppender`
+moves the write off the publisher: :meth:`~WriteBehindAppender.submit`
+queues the envelope and returns, and one background thread drains the queue
+in batches through :meth:`~backend.events.store.EventStore.append_many`
+(sequences assigned in memory per partition, one multi-row transaction per
+batch).
+
+Guarantees kept from the synchronous path:
+
+* **Order** — one writer drains a FIFO queue, so each partition's sequences
+  follow publish order.
+* **Read-your-writes** — the Event Store's reads (``list_events``,
+  ``get_projection``, ``list_projections``, ``reconstruct_run``) call
+  :meth:`~WriteBehindAppender.flush` first, so a reader never sees a log or
+  projection that is missing an event already published in this process.
+* **Durability on shutdown** — :meth:`~WriteBehindAppender.close` (also
+  registered with :mod:`atexit`) drains everything still queued.
+
+The queue is bounded. When it is full, ``overflow="block"`` makes the
+publisher wait for the writer (back-pressure); ``overflow="drop"`` discards
+the envelope with a warning, trading durability for never stalling a run.
+A batch that fails to commit is retried one event at a time so a single bad
+envelope cannot take its neighbours down with it.
+
+Enabled with ``AUTODEV_EVENT_STORE_WRITE_BEHIND`` (see
+:func:`backend.events.runtime.get_event_store`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Literal
+
+from backend.events.catalog import EventEnvelope
+
+if TYPE_CHECKING:
+    from backend.events.store import EventStore
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop"]
+
+
+class WriteBehindAppender:
+    """Bounded queue plus one background writer in front of an :class:`EventStore`."""
+
+    def __init__(
+        self,
+        store: EventStore,
+        *,
+        queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.05,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            store: Event Store the batches are appended to.
+            queue_size: Most envelopes waiting to be written.
+            batch_size: Most envelopes written per transaction.
+            flush_interval_seconds: Longest a queued envelope waits for its
+                batch to fill before it is written anyway.
+            overflow: What :meth:`submit` does when the queue is full.
+
+        Raises:
+            ValueError: If a size or the interval is not positive, or
+                ``overflow`` is unknown.
+        """
+        if queue_size <= 0 or batch_size <= 0 or flush_interval_seconds <= 0:
+            raise ValueError("queue_size, batch_size and flush_interval_seconds must be positive")
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+        self._store = store
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._overflow = overflow
+        self._pending: deque[EventEnvelope] = deque()
+        self._condition = threading.Condition()
+        # Envelopes accepted / settled (written or given up on) so far;
+        # ``flush`` waits for ``_settled`` to reach the ``_accepted`` it saw.
+        self._accepted = 0
+        self._settled = 0
+        self._flush_requests = 0
+        self._dropped = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="event-store-write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Envelopes discarded because the queue was full (``overflow="drop"``)."""
+        return self._dropped
+
+    def submit(self, envelope: EventEnvelope) -> bool:
+        """Queue *envelope* for the next batch.
+
+        After :meth:`close` the envelope is appended synchronously instead.
+
+        Args:
+            envelope: Validated envelope to persist.
+
+        Returns:
+            ``False`` if the envelope was dropped because the queue was full;
+            ``True`` otherwise.
+        """
+        with self._condition:
+            while not self._closed and len(self._pending) >= self._queue_size:
+                if self._overflow == "drop":
+                    self._dropped += 1
+                    logger.warning(
+                        "Event Store write-behind queue full; dropped %s for partition %s",
+                        envelope.type,
+                        envelope.partitionKey,
+                    )
+                    return False
+                self._condition.wait()
+            if not self._closed:
+                self._pending.append(envelope)
+                self._accepted += 1
+                self._condition.notify_all()
+                return True
+        self._store.append(envelope)
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every envelope submitted so far has been written.
+
+        Args:
+            timeout: Longest to wait, in seconds; ``None`` waits indefinitely.
+
+        Returns:
+            ``True`` if the queue drained in time, ``False`` on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            target = self._accepted
+            if self._settled >= target:
+                return True
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._settled < target:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write everything still queued and stop the writer; idempotent.
+
+        Args:
+            timeout: Longest to wait for the writer, in seconds; ``None``
+                waits until the queue is drained.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        """Writer loop: wait for a full batch, the interval, a flush, or close."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                deadline = time.monotonic() + self._flush_interval_seconds
+                while (
+                    len(self._pending) < self._batch_size
+                    and not self._closed
+                    and not self._flush_requests
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self._batch_size, len(self._pending)))
+                ]
+                # Room in the queue for publishers blocked by back-pressure.
+                self._condition.notify_all()
+            self._write(batch)
+            with self._condition:
+                self._settled += len(batch)
+                self._condition.notify_all()
+
+    def _write(self, batch: list[EventEnvelope]) -> None:
+        """Append *batch* in one transaction, falling back to one at a time."""
+        try:
+            self._store.append_many(batch)
+            return
+        except Exception:  # noqa: BLE001 - isolate the failing envelope below
+            logger.warning(
+                "Event Store batch append of %d events failed; retrying one by one",
+                len(batch),
+                exc_info=True,
+            )
+        for envelope in batch:
+            try:
+                self._store.append(envelope)
+            except Exception:  # noqa: BLE001 - a persistence failure never reaches the run
+                logger.exception(
+                    "Failed to persist event %s for partition %s",
+                    envelope.type,
+                    envelope.partitionKey,
+                )
+
+
+__all__ = ["OverflowPolicy", "WriteBehindAppender"]
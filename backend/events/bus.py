@@ -10,6 +10,16 @@ delivery to the remaining subscribers (resilient delivery, E9-S3 CNF).
 backend-specific cursor, and accepts an ``after_cursor`` exclusive-start
 position so a consumer (e.g. the ``/v2/runs/{run_id}/events/stream`` SSE
 endpoint) can resume exactly where it left off after a reconnect.
+
+:meth:`EventBus.subscribe_partition` registers a callback for one partition
+only, so a consumer interested in a single run (the SSE fan-out hub,
+:mod:`backend.events.fanout`) is not woken by every other run's events.
+
+With ``cross_process=True`` the Redis bus delivers events published by other
+replicas and workers too (:mod:`backend.events.stream_consumer`): partition
+subscribers are fed by a blocking ``XREAD`` listener and
+:meth:`RedisEventBus.consume_group` reads a shared feed stream through a
+Redis consumer group.
 """
 
 from __future__ import annotations
@@ -17,17 +27,15 @@ from __future__ import annotations
 from collections import defaultdict
 import json
 import logging
-from typing import Any, Callable, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from backend.events.catalog import EventEnvelope
+from backend.events.subscribers import WILDCARD, Subscriber, Unsubscribe, _SubscriberRegistry
 
-logger = logging.getLogger(__name__)
-
-Subscriber = Callable[[EventEnvelope], None]
-"""Callback invoked synchronously with each published envelope."""
+if TYPE_CHECKING:
+    from backend.events.stream_consumer import PartitionStreamListener, StreamGroupConsumer
 
-WILDCARD = "*"
-"""Subscription key matching every event type."""
+logger = logging.getLogger(__name__)
 
 
 def _stream_key(partition_key: str) -> str:
@@ -42,8 +50,23 @@ def _stream_key(partition_key: str) -> str:
     return f"autodev:events:{partition_key}"
 
 
-Unsubscribe = Callable[[], None]
-"""Cancellation token returned by :meth:`EventBus.subscribe` (E45-S3)."""
+def cursor_position(cursor: str) -> tuple[int, ...] | None:
+    """Return a sortable position for a :meth:`EventBus.replay_from` cursor.
+
+    Both backends' cursors are dash-separated integers — ``"41"`` in memory,
+    ``"1699999999999-0"`` for Redis stream ids — that order as integer
+    tuples within a partition.
+
+    Args:
+        cursor: A cursor returned by ``replay_from``.
+
+    Returns:
+        The cursor's position, or ``None`` if it is not in either format.
+    """
+    try:
+        return tuple(int(part) for part in cursor.split("-"))
+    except ValueError:
+        return None
 
 
 class EventBus(Protocol):
@@ -63,6 +86,14 @@ class EventBus(Protocol):
         """
         ...
 
+    def subscribe_partition(self, partition_key: str, subscriber: Subscriber) -> Unsubscribe:
+        """Register a callback for every event of one partition.
+
+        Returns:
+            An idempotent callable that removes this subscription.
+        """
+        ...
+
     def replay(self, partition_key: str) -> list[EventEnvelope]:
         """Return every stored envelope of a partition, in publish order."""
         ...
@@ -74,46 +105,6 @@ class EventBus(Protocol):
         ...
 
 
-class _SubscriberRegistry:
-    """Shared subscriber bookkeeping and fault-isolated dispatch."""
-
-    def __init__(self) -> None:
-        """Initialize an empty type-to-subscribers index."""
-        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
-
-    def subscribe(self, type_: str, subscriber: Subscriber) -> Unsubscribe:
-        """Register a callback for an event type.
-
-        Args:
-            type_: Catalog event type, or :data:`WILDCARD` for all types.
-            subscriber: Callback receiving each matching envelope.
-
-        Returns:
-            An idempotent callable that removes this subscription.
-        """
-        self._subscribers[type_].append(subscriber)
-
-        def _unsubscribe() -> None:
-            try:
-                self._subscribers[type_].remove(subscriber)
-            except ValueError:
-                pass
-
-        return _unsubscribe
-
-    def dispatch(self, envelope: EventEnvelope) -> None:
-        """Invoke matching subscribers, isolating individual failures.
-
-        Args:
-            envelope: The envelope being delivered.
-        """
-        for subscriber in self._subscribers[envelope.type] + self._subscribers[WILDCARD]:
-            try:
-                subscriber(envelope)
-            except Exception:  # noqa: BLE001 - resilient delivery (E9-S3 CNF)
-                logger.exception("Event subscriber failed for %s", envelope.eventId)
-
-
 _DEFAULT_MAX_PARTITION_SIZE = 10_000
 """Default cap on retained envelopes per in-memory partition (E45-S4)."""
 
@@ -163,6 +154,10 @@ class InMemoryEventBus:
         """Register a callback for a type (or :data:`WILDCARD`)."""
         return self._registry.subscribe(type_, subscriber)
 
+    def subscribe_partition(self, partition_key: str, subscriber: Subscriber) -> Unsubscribe:
+        """Register a callback for one partition's events."""
+        return self._registry.subscribe_partition(partition_key, subscriber)
+
     def replay(self, partition_key: str) -> list[EventEnvelope]:
         """Return the partition's envelopes in publish order.
 
@@ -215,6 +210,8 @@ class RedisEventBus:
         client: Any | None = None,
         url: str = "",
         stream_maxlen: int | None = _DEFAULT_STREAM_MAXLEN,
+        cross_process: bool = False,
+        block_ms: int = 1_000,
     ) -> None:
         """Initialize the bus, connecting to Redis and verifying reachability.
 
@@ -227,6 +224,13 @@ class RedisEventBus:
                 record, so trimming the bus stream loses nothing durable —
                 replay older than the retained window degrades explicitly
                 (fewer/no entries returned).
+            cross_process: Deliver events published by any process: partition
+                subscribers are fed by a
+                :class:`~backend.events.stream_consumer.PartitionStreamListener`
+                instead of the local publish, and every envelope is also
+                appended to the shared feed stream read by
+                :meth:`consume_group`.
+            block_ms: Longest one blocking stream read waits.
 
         Raises:
             RuntimeError: If the ``redis`` package is not installed.
@@ -240,6 +244,20 @@ class RedisEventBus:
         self._client.ping()
         self._registry = _SubscriberRegistry()
         self._stream_maxlen = stream_maxlen
+        self._block_ms = block_ms
+        self._listener: PartitionStreamListener | None = None
+        self._consumers: list[StreamGroupConsumer] = []
+        if cross_process:
+            from backend.events.stream_consumer import PartitionStreamListener
+
+            self._listener = PartitionStreamListener(
+                client, self._registry.dispatch_partition, block_ms=block_ms
+            )
+
+    @property
+    def cross_process(self) -> bool:
+        """Whether partition subscribers also see other processes' events."""
+        return self._listener is not None
 
     def publish(self, envelope: EventEnvelope) -> str:
         """Append the envelope to its partition stream and dispatch locally.
@@ -253,25 +271,103 @@ class RedisEventBus:
         Returns:
             The envelope's ``eventId``.
         """
+        fields = {"envelope": envelope.model_dump_json()}
+        self._append(_stream_key(envelope.partitionKey), fields)
+        if self._listener is not None:
+            from backend.events.stream_consumer import FEED_STREAM_KEY
+
+            self._append(FEED_STREAM_KEY, fields)
+        self._registry.dispatch(envelope, partitions=self._listener is None)
+        return envelope.eventId
+
+    def _append(self, key: str, fields: dict[str, str]) -> None:
+        """``XADD`` *fields* to stream *key*, trimmed to the configured maxlen if any."""
         if self._stream_maxlen is not None:
-            self._client.xadd(
-                _stream_key(envelope.partitionKey),
-                {"envelope": envelope.model_dump_json()},
-                maxlen=self._stream_maxlen,
-                approximate=True,
-            )
+            self._client.xadd(key, fields, maxlen=self._stream_maxlen, approximate=True)
         else:
-            self._client.xadd(
-                _stream_key(envelope.partitionKey),
-                {"envelope": envelope.model_dump_json()},
-            )
-        self._registry.dispatch(envelope)
-        return envelope.eventId
+            self._client.xadd(key, fields)
 
     def subscribe(self, type_: str, subscriber: Subscriber) -> Unsubscribe:
         """Register a callback for a type (or :data:`WILDCARD`)."""
         return self._registry.subscribe(type_, subscriber)
 
+    def subscribe_partition(self, partition_key: str, subscriber: Subscriber) -> Unsubscribe:
+        """Register a callback for one partition's events.
+
+        With cross-process delivery the partition joins the listener's
+        blocking read, so the callback also sees other processes' events;
+        the partition leaves it with its last subscriber.
+        """
+        unsubscribe = self._registry.subscribe_partition(partition_key, subscriber)
+        listener = self._listener
+        if listener is None:
+            return unsubscribe
+        listener.watch(partition_key)
+        listener.start()
+
+        def _unsubscribe() -> None:
+            """Drop the callback, and the partition from the listener with its last one."""
+            unsubscribe()
+            if not self._registry.has_partition_subscribers(partition_key):
+                listener.unwatch(partition_key)
+
+        return _unsubscribe
+
+    def consume_group(
+        self,
+        group: str,
+        consumer: str,
+        handler: Subscriber,
+        *,
+        min_idle_ms: int = 60_000,
+        max_deliveries: int = 5,
+    ) -> StreamGroupConsumer:
+        """Start a competing consumer on the feed stream (cross-process mode).
+
+        Each envelope published by any process goes to one consumer of
+        *group*, and is acknowledged once *handler* returns.
+
+        Args:
+            group: Consumer group name.
+            consumer: This consumer's name, unique within the group.
+            handler: Called with each envelope; must be idempotent by
+                ``eventId`` (reclaimed entries may be handled twice).
+            min_idle_ms: How long an unacknowledged entry stays with a
+                consumer before another reclaims it.
+            max_deliveries: Deliveries after which an entry *handler* keeps
+                failing on is moved to the feed's dead-letter stream.
+
+        Returns:
+            The running consumer; :meth:`close` stops it.
+
+        Raises:
+            RuntimeError: If the bus was built without ``cross_process``.
+        """
+        if self._listener is None:
+            raise RuntimeError("consume_group requires a cross_process RedisEventBus")
+        from backend.events.stream_consumer import StreamGroupConsumer
+
+        group_consumer = StreamGroupConsumer(
+            self._client,
+            group=group,
+            consumer=consumer,
+            handler=handler,
+            block_ms=self._block_ms,
+            min_idle_ms=min_idle_ms,
+            max_deliveries=max_deliveries,
+        )
+        group_consumer.start()
+        self._consumers.append(group_consumer)
+        return group_consumer
+
+    def close(self) -> None:
+        """Stop the background stream readers; publishing keeps working."""
+        if self._listener is not None:
+            self._listener.stop()
+        for group_consumer in self._consumers:
+            group_consumer.stop()
+        self._consumers.clear()
+
     def replay(self, partition_key: str) -> list[EventEnvelope]:
         """Read back a partition's stream, oldest first.
 
@@ -338,4 +434,5 @@ __all__ = [
     "Subscriber",
     "Unsubscribe",
     "WILDCARD",
+    "cursor_position",
 ]
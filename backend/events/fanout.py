@@ -0,0 +1,328 @@
+"""Per-run fan-out of live bus events to many SSE clients (E9-S2 live tail).
+
+Each ``/v2/runs/{run_id}/events/stream`` connection used to subscribe to
+:data:`~backend.events.bus.WILDCARD` and run its own
+:meth:`~backend.events.bus.EventBus.replay_from` on every wake-up, so one
+event of any run woke every open stream and cost one replay per stream.
+:class:`RunEventHub` replaces that with one *channel* per run being watched:
+
+* the channel subscribes to its run only
+  (:meth:`~backend.events.bus.EventBus.subscribe_partition`), so other runs'
+  events never wake it;
+* on a wake-up it reads the run's new events **once** (off the event loop,
+  since the Redis ``replay_from`` is a blocking ``XRANGE``) and copies each
+  ``(cursor, envelope)`` pair into every client's buffer;
+* each client's buffer is bounded. A client that falls
+  ``client_buffer`` events behind is disconnected (:data:`SLOW_CONSUMER`)
+  rather than letting the hub buffer without limit; the SSE client resumes
+  with ``Last-Event-ID`` and catches up from the bus like any reconnect.
+
+A client joins *before* reading its own backlog and then tells the hub the
+cursor its backlog ended at (:meth:`RunSubscription.start`); the first
+client's cursor is where the channel starts reading. Events published while
+the backlog was being read therefore arrive through the hub too and never go
+missing; :meth:`RunSubscription.next` skips any at or before the client's
+cursor (:func:`~backend.events.bus.cursor_position`), so none is sent twice.
+
+Without a cross-process listener (the default: ``cross_process`` is off on
+the Redis bus, and the in-memory bus never has one) events published by a
+worker or another replica wake no subscriber here, so each channel also
+re-reads its run every ``poll_interval`` seconds; the live tail then lags a
+worker's event by at most that interval instead of never showing it.
+
+Hubs are per event loop (:func:`get_run_event_hub`): the asyncio primitives
+they use cannot cross loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import weakref
+from typing import Final
+
+from backend.events.bus import EventBus, Unsubscribe, cursor_position
+from backend.events.catalog import EventEnvelope
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT_BUFFER = 1_000
+"""Events a client may fall behind before it is disconnected as too slow."""
+
+SLOW_CONSUMER: Final = object()
+"""Returned by :meth:`RunSubscription.next` once the client overflowed its buffer."""
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+"""Longest a channel waits between re-reads when no cross-process listener wakes it."""
+
+CursorEvent = tuple[str, EventEnvelope]
+
+
+class RunSubscription:
+    """One SSE client's bounded view of a run's live events."""
+
+    def __init__(self, channel: _RunChannel, buffer_size: int) -> None:
+        """Initialize an empty subscription on *channel*.
+
+        Args:
+            channel: Run channel that feeds this client.
+            buffer_size: Events the client may fall behind before it is
+                marked slow and disconnected.
+        """
+        self._channel = channel
+        self._queue: asyncio.Queue[CursorEvent | object] = asyncio.Queue(maxsize=buffer_size)
+        self._overflowed = False
+        self._closed = False
+        self._position: tuple[int, ...] | None = None
+
+    @property
+    def overflowed(self) -> bool:
+        """Whether the client was dropped for falling too far behind."""
+        return self._overflowed
+
+    def start(self, cursor: str | None) -> None:
+        """Report where this client's own backlog ended.
+
+        Live events at or before *cursor* are skipped from then on. The
+        first call on a channel also sets where the channel starts reading.
+
+        Args:
+            cursor: Last cursor of the client's backlog, or ``None`` if the
+                partition had no events yet.
+        """
+        self._position = None if cursor is None else cursor_position(cursor)
+        self._channel.start(cursor)
+
+    async def next(self, timeout: float) -> CursorEvent | object | None:
+        """Wait for the next live event.
+
+        Args:
+            timeout: Longest to wait, in seconds.
+
+        Returns:
+            The next ``(cursor, envelope)`` pair, :data:`SLOW_CONSUMER` once
+            the client overflowed, or ``None`` on timeout.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            remaining = deadline - asyncio.get_running_loop().time()
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=max(remaining, 0))
+            except TimeoutError:
+                return None
+            if item is SLOW_CONSUMER:
+                return item
+            position = cursor_position(item[0])  # type: ignore[index]
+            if self._position is not None and position is not None:
+                if position <= self._position:
+                    continue  # already in the client's backlog
+                self._position = position
+            return item
+
+    def close(self) -> None:
+        """Leave the channel; the channel stops once its last client leaves."""
+        if not self._closed:
+            self._closed = True
+            self._channel.leave(self)
+
+    def _offer(self, item: CursorEvent) -> None:
+        """Buffer *item*, or mark the client slow and wake it to disconnect."""
+        if self._overflowed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(SLOW_CONSUMER)
+            logger.warning(
+                "SSE client of run %s fell behind; disconnecting it", self._channel.run_id
+            )
+            self.close()
+
+
+class _RunChannel:
+    """One run's single bus subscription and reader, shared by its clients."""
+
+    def __init__(self, hub: RunEventHub, run_id: str) -> None:
+        """Subscribe to *run_id* on the hub's bus and start the channel's reader.
+
+        Must be called on the hub's event loop.
+
+        Args:
+            hub: Hub that owns the channel.
+            run_id: Run (partition) the channel follows.
+        """
+        self.run_id = run_id
+        self._hub = hub
+        self._clients: list[RunSubscription] = []
+        self._cursor: str | None = None
+        self._started = False
+        self._wake = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def _on_event(_envelope: EventEnvelope) -> None:
+            """Wake the reader; publishers may run on any thread, so defer to our loop."""
+            loop.call_soon_threadsafe(self._wake.set)
+
+        self._unsubscribe: Unsubscribe = hub.bus.subscribe_partition(run_id, _on_event)
+        self._task = loop.create_task(self._run(), name=f"run-event-hub:{run_id}")
+
+    def join(self, buffer_size: int) -> RunSubscription:
+        """Add a client to the channel.
+
+        Args:
+            buffer_size: Events the client may fall behind.
+
+        Returns:
+            The client's subscription.
+        """
+        subscription = RunSubscription(self, buffer_size)
+        self._clients.append(subscription)
+        return subscription
+
+    def start(self, cursor: str | None) -> None:
+        """Start reading after *cursor*; only the first client's call has an effect.
+
+        Args:
+            cursor: Last cursor of that client's backlog, or ``None`` to
+                read the partition from its beginning.
+        """
+        if not self._started:
+            self._started = True
+            self._cursor = cursor
+            self._wake.set()
+
+    def leave(self, subscription: RunSubscription) -> None:
+        """Remove a client; the last one to leave unsubscribes and stops the reader.
+
+        Args:
+            subscription: The departing client's subscription.
+        """
+        if subscription in self._clients:
+            self._clients.remove(subscription)
+        if not self._clients:
+            self._hub._drop(self)
+            self._unsubscribe()
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        """Read new events once per wake-up and copy them to every client.
+
+        Without a cross-process listener the channel also wakes itself every
+        :attr:`RunEventHub.poll_interval` seconds to pick up events other
+        processes published.
+        """
+        poll_interval = self._hub.poll_interval
+        while True:
+            if poll_interval is None:
+                await self._wake.wait()
+            else:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=poll_interval)
+            self._wake.clear()
+            if not self._started:
+                continue
+            try:
+                batch = await asyncio.to_thread(
+                    self._hub.bus.replay_from, self.run_id, self._cursor
+                )
+            except Exception:  # noqa: BLE001 - a failed read is retried on the next wake-up
+                logger.exception("Live replay of run %s failed", self.run_id)
+                continue
+            for item in batch:
+                self._cursor = item[0]
+                for client in list(self._clients):
+                    client._offer(item)
+
+
+class RunEventHub:
+    """Shares one bus subscription and one reader per watched run across its clients."""
+
+    def __init__(
+        self,
+        bus: EventBus,
+        *,
+        client_buffer: int = DEFAULT_CLIENT_BUFFER,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize an empty hub on the running event loop.
+
+        Args:
+            bus: Bus the runs' events are published on.
+            client_buffer: Events a client may fall behind before it is
+                disconnected.
+            poll_interval: Seconds between a channel's periodic re-reads;
+                ignored when *bus* delivers other processes' events itself
+                (its ``cross_process`` is true).
+        """
+        self.bus = bus
+        self.poll_interval: float | None = (
+            None if getattr(bus, "cross_process", False) else poll_interval
+        )
+        self._client_buffer = client_buffer
+        self._channels: dict[str, _RunChannel] = {}
+
+    def join(self, run_id: str) -> RunSubscription:
+        """Subscribe one client to *run_id*'s live events.
+
+        Must be called on the hub's event loop. Call
+        :meth:`RunSubscription.start` once the client's backlog is sent and
+        :meth:`RunSubscription.close` when it disconnects.
+
+        Args:
+            run_id: Run (partition) to follow.
+
+        Returns:
+            The client's subscription.
+        """
+        channel = self._channels.get(run_id)
+        if channel is None:
+            channel = self._channels[run_id] = _RunChannel(self, run_id)
+        return channel.join(self._client_buffer)
+
+    def watched_runs(self) -> int:
+        """Number of runs with at least one connected client."""
+        return len(self._channels)
+
+    def _drop(self, channel: _RunChannel) -> None:
+        """Forget *channel* once its last client left, unless it was already replaced.
+
+        Args:
+            channel: The channel that is shutting down.
+        """
+        if self._channels.get(channel.run_id) is channel:
+            del self._channels[channel.run_id]
+
+
+_hubs: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, RunEventHub]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_run_event_hub(bus: EventBus) -> RunEventHub:
+    """Return the running loop's hub for *bus*, creating it on first use.
+
+    Args:
+        bus: Bus the hub reads from.
+
+    Returns:
+        The shared :class:`RunEventHub`.
+    """
+    per_loop = _hubs.setdefault(asyncio.get_running_loop(), {})
+    hub = per_loop.get(id(bus))
+    if hub is None or hub.bus is not bus:
+        hub = per_loop[id(bus)] = RunEventHub(bus)
+    return hub
+
+
+__all__ = [
+    "DEFAULT_CLIENT_BUFFER",
+    "DEFAULT_POLL_INTERVAL_SECONDS",
+    "SLOW_CONSUMER",
+    "RunEventHub",
+    "RunSubscription",
+    "get_run_event_hub",
+]
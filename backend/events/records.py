@@ -82,6 +82,14 @@ def event_store_statements(is_postgres: bool) -> tuple[str, ...]:
             updated_at {time_type} NOT NULL
         )
         """,
+        """
+        CREATE TABLE IF NOT EXISTS event_type_counts (
+            partition_key TEXT NOT NULL,
+            type TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (partition_key, type)
+        )
+        """,
         "CREATE INDEX IF NOT EXISTS idx_events_tenant ON events(tenant_id)",
         "CREATE INDEX IF NOT EXISTS idx_events_stored ON events(stored_at)",
         (
@@ -49,7 +49,12 @@ def get_event_store() -> EventStore:
 
     The instance is rebound automatically whenever the process durable store
     changes (e.g. after ``reset_store_cache()`` re-reads ``DATABASE_URL`` in
-    tests), so a cached Event Store never outlives its backing database.
+    tests), so a cached Event Store never outlives its backing database; the
+    replaced instance's write-behind queue is drained first.
+
+    With ``autodev_event_store_write_behind`` on, the instance is built with
+    a batching background writer (:mod:`backend.events.appender`) sized by
+    the ``autodev_event_store_*`` settings.
 
     Returns:
         The shared Event Store bound to the current process durable store.
@@ -62,23 +67,43 @@ def get_event_store() -> EventStore:
         _event_store_instance is None
         or _event_store_instance.backing_store is not store
     ):
+        if _event_store_instance is not None:
+            _event_store_instance.close()
         _event_store_instance = EventStore(store)
+        settings = get_settings()
+        if settings.autodev_event_store_write_behind:
+            _event_store_instance.start_write_behind(
+                queue_size=settings.autodev_event_store_queue_size,
+                batch_size=settings.autodev_event_store_batch_size,
+                flush_interval_seconds=settings.autodev_event_store_flush_interval_ms / 1000,
+                overflow=settings.autodev_event_store_overflow,
+            )
     return _event_store_instance
 
 
+def shutdown_event_store() -> None:
+    """Drain the cached Event Store's write-behind queue, if it has one."""
+    if _event_store_instance is not None:
+        _event_store_instance.close()
+
+
 def reset_event_store_for_tests() -> None:
     """Clear the cached Event Store singleton — for use in test fixtures."""
     global _event_store_instance
+    shutdown_event_store()
     _event_store_instance = None
 
 
 def _persist_envelope(envelope: EventEnvelope) -> None:
     """Bus subscriber durably appending each published envelope (E8-S2-T1).
 
+    Goes through :meth:`EventStore.enqueue`, which returns immediately when
+    write-behind is enabled.
+
     Args:
         envelope: The envelope being delivered by the bus.
     """
-    get_event_store().append(envelope)
+    get_event_store().enqueue(envelope)
 
 
 def get_event_bus(settings: Settings | None = None) -> EventBus:
@@ -101,7 +126,10 @@ def get_event_bus(settings: Settings | None = None) -> EventBus:
         maxlen_or_none = maxlen if maxlen >= 0 else None
         if active.autodev_event_bus == "redis":
             _bus_instance = RedisEventBus(
-                url=active.autodev_redis_url, stream_maxlen=maxlen_or_none
+                url=active.autodev_redis_url,
+                stream_maxlen=maxlen_or_none,
+                cross_process=active.autodev_event_bus_cross_process,
+                block_ms=active.autodev_event_bus_block_ms,
             )
         else:
             _bus_instance = InMemoryEventBus(max_partition_size=maxlen_or_none)
@@ -113,6 +141,8 @@ def get_event_bus(settings: Settings | None = None) -> EventBus:
 def reset_event_bus_for_tests() -> None:
     """Clear the cached Event Bus singleton — for use in test fixtures."""
     global _bus_instance
+    if isinstance(_bus_instance, RedisEventBus):
+        _bus_instance.close()
     _bus_instance = None
 
 
@@ -172,4 +202,5 @@ __all__ = [
     "get_event_store",
     "reset_event_bus_for_tests",
     "reset_event_store_for_tests",
+    "shutdown_event_store",
 ]
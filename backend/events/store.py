@@ -14,25 +14,35 @@ State Store (SQLite locally, PostgreSQL in production), ordered per partition
   flow-state checkpoint replay of :mod:`backend.flows.checkpoint`;
 * current status is answerable in O(1) from the ``event_projections``
   materialization, updated in the same transaction as each append
-  (E8-S2-T3);
+  (E8-S2-T3) — its ``last_sequence`` is also the partition's sequence
+  counter, and per-type counts live in ``event_type_counts``, so an append
+  never reads the partition back;
 * storage is bounded by a configurable retention window
   (:func:`EventStore.purge_expired`, E8-S2-T4): events of *terminal*
   partitions older than the window are compacted away while their
   projection row is kept as the durable summary.
 
-Writes are intentionally small (one INSERT + one UPSERT per event) so the
+Writes are intentionally small (one projection UPSERT, one INSERT and one
+count UPSERT per event, none reading the partition back) so the
 append never becomes a bottleneck for the run itself; the store is attached
 to the bus as a regular subscriber, and subscriber failures are isolated by
 the bus (a persistence hiccup never blocks delivery or the run — E8-S2 CNF).
+Where even that is too much, :meth:`EventStore.start_write_behind` moves the
+appends onto a batching background writer (:mod:`backend.events.appender`);
+reads flush it first, so they stay consistent with everything published.
 """
 
 from __future__ import annotations
 
 import json
-import threading
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from backend.events.appender import OverflowPolicy, WriteBehindAppender
 from backend.events.catalog import EventEnvelope
 from backend.events.records import (
     STATUS_BY_EVENT,
@@ -45,6 +55,11 @@ from backend.events.records import (
     utcnow_iso,
 )
 from backend.persistence.database import get_store
+from backend.persistence.pool import apply_sqlite_pragmas
+
+#: Partition keys per ``IN (...)`` when reading counts, well under the
+#: bound-parameter limits of SQLite and PostgreSQL.
+_IN_CHUNK = 500
 
 
 class EventStore:
@@ -68,7 +83,7 @@ class EventStore:
         self._store = store or get_store()
         if not hasattr(self._store, "connect"):
             raise TypeError("EventStore requires a durable store with connect()")
-        self._local = threading.local()
+        self._appender: WriteBehindAppender | None = None
         self._ensure_schema()
 
     @property
@@ -78,6 +93,68 @@ class EventStore:
 
     # --------------------------------------------------------------- append
 
+    def start_write_behind(
+        self,
+        *,
+        queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.05,
+        overflow: OverflowPolicy = "block",
+    ) -> WriteBehindAppender:
+        """Route :meth:`enqueue` through a batching background writer.
+
+        See :mod:`backend.events.appender`. Calling it again returns the
+        running appender unchanged.
+
+        Args:
+            queue_size: Most envelopes waiting to be written.
+            batch_size: Most envelopes written per transaction.
+            flush_interval_seconds: Longest a queued envelope waits for its
+                batch to fill.
+            overflow: ``"block"`` to make publishers wait on a full queue,
+                ``"drop"`` to discard the envelope instead.
+
+        Returns:
+            The store's :class:`~backend.events.appender.WriteBehindAppender`.
+        """
+        if self._appender is None:
+            self._appender = WriteBehindAppender(
+                self,
+                queue_size=queue_size,
+                batch_size=batch_size,
+                flush_interval_seconds=flush_interval_seconds,
+                overflow=overflow,
+            )
+        return self._appender
+
+    def enqueue(self, envelope: EventEnvelope) -> None:
+        """Persist *envelope* through the write-behind queue, or now if there is none.
+
+        Args:
+            envelope: Validated envelope to persist.
+        """
+        if self._appender is None:
+            self.append(envelope)
+        else:
+            self._appender.submit(envelope)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every envelope passed to :meth:`enqueue` is durable.
+
+        Args:
+            timeout: Longest to wait, in seconds; ``None`` waits indefinitely.
+
+        Returns:
+            ``False`` if queued envelopes were still unwritten at the timeout.
+        """
+        return self._appender is None or self._appender.flush(timeout)
+
+    def close(self) -> None:
+        """Drain and stop the write-behind writer, if one was started."""
+        appender, self._appender = self._appender, None
+        if appender is not None:
+            appender.close()
+
     def append(self, envelope: EventEnvelope) -> StoredEvent:
         """Durably append an envelope to its partition, updating projections.
 
@@ -91,19 +168,49 @@ class EventStore:
         Returns:
             The :class:`StoredEvent` with its assigned sequence.
         """
+        return self.append_many([envelope])[0]
+
+    def append_many(self, envelopes: Sequence[EventEnvelope]) -> list[StoredEvent]:
+        """Durably append a batch of envelopes in one transaction.
+
+        Nothing is read before it is written: each touched partition's
+        projection row is advanced by its share of the batch with one
+        ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING last_sequence``
+        (the projection row doubles as the partition's sequence counter),
+        the events go in as one ``executemany``, and per-type counts are
+        incremented in ``event_type_counts`` rather than re-serialized. The
+        cost of an append therefore does not grow with the partition's
+        length. Per-partition order is the order of ``envelopes``.
+
+        Args:
+            envelopes: Validated envelopes, in publish order.
+
+        Returns:
+            The stored events, in the order given.
+        """
+        if not envelopes:
+            return []
         stored_at = utcnow_iso()
-        conn = self._connect()
-        try:
+        batches: dict[str, list[EventEnvelope]] = {}
+        for envelope in envelopes:
+            batches.setdefault(envelope.partitionKey, []).append(envelope)
+        with self._connection() as conn:
             self._begin_write(conn)
-            row = conn.execute(
-                self._sql(
-                    "SELECT COALESCE(MAX(sequence), 0) FROM events "
-                    "WHERE partition_key = {p}"
-                ),
-                (envelope.partitionKey,),
-            ).fetchone()
-            sequence = int(row[0] if not hasattr(row, "keys") else list(row)[0]) + 1
-            conn.execute(
+            next_sequence = {
+                partition_key: self._advance_projection(conn, batch, stored_at) - len(batch)
+                for partition_key, batch in batches.items()
+            }
+            stored: list[StoredEvent] = []
+            for envelope in envelopes:
+                next_sequence[envelope.partitionKey] += 1
+                stored.append(
+                    StoredEvent(
+                        sequence=next_sequence[envelope.partitionKey],
+                        envelope=envelope,
+                        stored_at=stored_at,
+                    )
+                )
+            conn.cursor().executemany(
                 self._sql(
                     """
                     INSERT INTO events (
@@ -113,92 +220,126 @@ class EventStore:
                     ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
                     """
                 ),
-                (
-                    envelope.eventId,
-                    envelope.tenantId,
-                    envelope.partitionKey,
-                    sequence,
-                    envelope.type,
-                    envelope.occurredAt.isoformat(),
-                    envelope.traceId,
-                    json.dumps(envelope.subject),
-                    json.dumps(envelope.data),
-                    envelope.schemaVersion,
-                    stored_at,
+                [
+                    (
+                        event.envelope.eventId,
+                        event.envelope.tenantId,
+                        event.envelope.partitionKey,
+                        event.sequence,
+                        event.envelope.type,
+                        event.envelope.occurredAt.isoformat(),
+                        event.envelope.traceId,
+                        json.dumps(event.envelope.subject),
+                        json.dumps(event.envelope.data),
+                        event.envelope.schemaVersion,
+                        stored_at,
+                    )
+                    for event in stored
+                ],
+            )
+            counts = Counter((envelope.partitionKey, envelope.type) for envelope in envelopes)
+            conn.cursor().executemany(
+                self._sql(
+                    """
+                    INSERT INTO event_type_counts (partition_key, type, count)
+                    VALUES ({p}, {p}, {p})
+                    ON CONFLICT (partition_key, type) DO UPDATE SET
+                        count = event_type_counts.count + excluded.count
+                    """
                 ),
+                [(partition_key, type_, count) for (partition_key, type_), count in counts.items()],
             )
-            self._upsert_projection(conn, envelope, sequence, stored_at)
             conn.commit()
-        except Exception:
-            try:
-                conn.rollback()
-            finally:
-                self._drop_connection()
-            raise
-        return StoredEvent(sequence=sequence, envelope=envelope, stored_at=stored_at)
+        return stored
 
-    def _upsert_projection(
-        self, conn: Any, envelope: EventEnvelope, sequence: int, updated_at: str
-    ) -> None:
-        """Fold one appended envelope into its partition's projection row.
+    def _advance_projection(
+        self, conn: Any, batch: list[EventEnvelope], updated_at: str
+    ) -> int:
+        """Fold one partition's share of a batch into its projection row.
+
+        Inserts the row for a new partition or moves ``last_sequence``
+        forward by ``len(batch)``; the status only changes when the batch
+        contains a status-bearing event (:data:`STATUS_BY_EVENT`).
 
         Args:
             conn: Open connection of the append transaction.
-            envelope: The envelope just inserted.
-            sequence: The sequence assigned to the envelope.
-            updated_at: Timestamp shared with the event's ``stored_at``.
+            batch: The partition's envelopes, in append order.
+            updated_at: Timestamp shared with the events' ``stored_at``.
+
+        Returns:
+            The partition's ``last_sequence`` after the batch.
         """
+        status = ""
+        for envelope in batch:
+            status = STATUS_BY_EVENT.get(envelope.type, status)
+        last = batch[-1]
         row = conn.execute(
             self._sql(
-                "SELECT status, counts_json FROM event_projections "
-                "WHERE partition_key = {p}"
+                """
+                INSERT INTO event_projections (
+                    partition_key, tenant_id, status, last_sequence,
+                    last_event_type, last_event_at, counts_json, updated_at
+                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, '{{}}', {p})
+                ON CONFLICT (partition_key) DO UPDATE SET
+                    tenant_id = excluded.tenant_id,
+                    status = COALESCE(NULLIF(excluded.status, ''), event_projections.status),
+                    last_sequence = event_projections.last_sequence + excluded.last_sequence,
+                    last_event_type = excluded.last_event_type,
+                    last_event_at = excluded.last_event_at,
+                    updated_at = excluded.updated_at
+                RETURNING last_sequence
+                """
+            ),
+            (
+                last.partitionKey,
+                last.tenantId,
+                status,
+                len(batch),
+                last.type,
+                last.occurredAt.isoformat(),
+                updated_at,
             ),
-            (envelope.partitionKey,),
         ).fetchone()
-        counts: dict[str, int] = {}
-        if row is None:
-            status = ""
-        else:
-            values = list(row)
-            status = str(values[0] or "")
-            counts = json.loads(values[1]) if values[1] else {}
-        status = STATUS_BY_EVENT.get(envelope.type, status)
-        counts[envelope.type] = int(counts.get(envelope.type, 0)) + 1
-        params = (
-            envelope.tenantId,
-            status,
-            sequence,
-            envelope.type,
-            envelope.occurredAt.isoformat(),
-            json.dumps(counts),
-            updated_at,
-            envelope.partitionKey,
-        )
-        if row is None:
-            conn.execute(
-                self._sql(
-                    """
-                    INSERT INTO event_projections (
-                        tenant_id, status, last_sequence, last_event_type,
-                        last_event_at, counts_json, updated_at, partition_key
-                    ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                    """
-                ),
-                params,
-            )
-        else:
-            conn.execute(
+        return int(list(row)[0])
+
+    def _with_counts(
+        self, conn: Any, projections: list[EventProjection]
+    ) -> list[EventProjection]:
+        """Attach each projection's per-type counts from ``event_type_counts``.
+
+        Rows written before the counts table existed carry their counts in
+        ``counts_json``; those are kept as the base the table's increments
+        add to.
+
+        Args:
+            conn: Open connection.
+            projections: Projections decoded from ``event_projections``.
+
+        Returns:
+            The projections with complete ``counts``.
+        """
+        increments: dict[str, dict[str, int]] = {}
+        keys = [projection.partition_key for projection in projections]
+        for start in range(0, len(keys), _IN_CHUNK):
+            chunk = keys[start : start + _IN_CHUNK]
+            placeholders = ", ".join("{p}" for _ in chunk)
+            rows = conn.execute(
                 self._sql(
-                    """
-                    UPDATE event_projections
-                    SET tenant_id = {p}, status = {p}, last_sequence = {p},
-                        last_event_type = {p}, last_event_at = {p},
-                        counts_json = {p}, updated_at = {p}
-                    WHERE partition_key = {p}
-                    """
+                    "SELECT partition_key, type, count FROM event_type_counts "
+                    f"WHERE partition_key IN ({placeholders})"
                 ),
-                params,
-            )
+                tuple(chunk),
+            ).fetchall()
+            for row in rows:
+                partition_key, type_, count = list(row)
+                increments.setdefault(str(partition_key), {})[str(type_)] = int(count)
+        merged: list[EventProjection] = []
+        for projection in projections:
+            counts = dict(projection.counts)
+            for type_, count in increments.get(projection.partition_key, {}).items():
+                counts[type_] = int(counts.get(type_, 0)) + count
+            merged.append(replace(projection, counts=counts))
+        return merged
 
     # ---------------------------------------------------------------- reads
 
@@ -234,7 +375,9 @@ class EventStore:
         params: tuple[Any, ...] = (partition_key, after_sequence or 0)
         if tenant_id is not None:
             params = (*params, tenant_id)
-        rows = self._connect().execute(sql, params).fetchall()
+        self.flush()
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [decode_event(row) for row in rows]
 
     def get_projection(self, partition_key: str) -> EventProjection | None:
@@ -251,8 +394,12 @@ class EventStore:
             "last_event_type, last_event_at, counts_json, updated_at "
             "FROM event_projections WHERE partition_key = {p}"
         )
-        row = self._connect().execute(sql, (partition_key,)).fetchone()
-        return decode_projection(row) if row is not None else None
+        self.flush()
+        with self._connection() as conn:
+            row = conn.execute(sql, (partition_key,)).fetchone()
+            if row is None:
+                return None
+            return self._with_counts(conn, [decode_projection(row)])[0]
 
     def list_projections(
         self, *, tenant_id: str | None = None, status: str | None = None
@@ -281,8 +428,10 @@ class EventStore:
             f"FROM event_projections{where} "
             "ORDER BY updated_at DESC, partition_key"
         )
-        rows = self._connect().execute(sql, tuple(params)).fetchall()
-        return [decode_projection(row) for row in rows]
+        self.flush()
+        with self._connection() as conn:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+            return self._with_counts(conn, [decode_projection(row) for row in rows])
 
     # -------------------------------------------------------- reconstruction
 
@@ -402,18 +551,12 @@ class EventStore:
                 "{terminal}", ", ".join("{p}" for _ in sorted(TERMINAL_STATUSES))
             )
         )
-        conn = self._connect()
-        try:
+        self.flush()
+        with self._connection() as conn:
             self._begin_write(conn)
             cursor = conn.execute(sql, (cutoff_iso, *sorted(TERMINAL_STATUSES)))
             deleted = int(cursor.rowcount if cursor.rowcount is not None else 0)
             conn.commit()
-        except Exception:
-            try:
-                conn.rollback()
-            finally:
-                self._drop_connection()
-            raise
         return deleted
 
     # --------------------------------------------------------------- helpers
@@ -435,44 +578,33 @@ class EventStore:
         """
         return template.format(p="%s" if self._is_postgres else "?")
 
-    def _connect(self) -> Any:
-        """Return this thread's cached store connection, creating it once.
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Check out a store connection for one operation.
 
-        Appends happen on every published event, so paying a connection
-        open (plus SQLite's WAL pragma, a write) per event would dominate
-        the append cost by orders of magnitude and violate the story's
-        fast-append CNF. Each thread therefore opens one connection lazily
-        and reuses it; SQLite connections are not shareable across threads
-        (``check_same_thread``), which is why the cache is per-thread
-        rather than per-store.
+        Appends happen on every published event, so the connection comes
+        from the store's pool (:mod:`backend.persistence.pool`), already
+        tuned on SQLite, rather than being opened per event; only a
+        non-pooled SQLite connection gets the PRAGMAs here. A failed
+        operation is rolled back, and the pool drops a connection that broke.
 
-        Returns:
+        Yields:
             A DB-API connection from the underlying store.
         """
-        conn = getattr(self._local, "conn", None)
-        if conn is None:
-            conn = self._store.connect()
+        checkout = self._store.connect()
+        conn = checkout.connection
+        try:
             if not self._is_postgres:
-                conn.execute("PRAGMA busy_timeout=15000")
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-            self._local.conn = conn
-        return conn
-
-    def _drop_connection(self) -> None:
-        """Discard this thread's cached connection after a failure.
-
-        The next operation reconnects lazily, so a broken connection (a
-        rolled-over Postgres session, a deleted SQLite file in tests) heals
-        instead of poisoning every subsequent append.
-        """
-        conn = getattr(self._local, "conn", None)
-        self._local.conn = None
-        if conn is not None:
+                apply_sqlite_pragmas(conn)
+            yield conn
+        except BaseException:
             try:
-                conn.close()
-            except Exception:  # noqa: BLE001 - already discarding
+                conn.rollback()
+            except Exception:  # noqa: BLE001 - the original error matters more
                 pass
+            raise
+        finally:
+            checkout.close()
 
     def _begin_write(self, conn: Any) -> None:
         """Start a write transaction eagerly on SQLite.
@@ -483,17 +615,17 @@ class EventStore:
         :class:`backend.flows.state.FlowRunStore`.
 
         Args:
-            conn: Connection returned by :meth:`_connect`.
+            conn: Connection yielded by :meth:`_connection`.
         """
         if not self._is_postgres:
             conn.execute("BEGIN IMMEDIATE")
 
     def _ensure_schema(self) -> None:
         """Create the event-store tables if they do not exist."""
-        conn = self._connect()
-        for statement in event_store_statements(self._is_postgres):
-            conn.execute(statement)
-        conn.commit()
+        with self._connection() as conn:
+            for statement in event_store_statements(self._is_postgres):
+                conn.execute(statement)
+            conn.commit()
 
 
 __all__ = [
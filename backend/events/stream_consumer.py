@@ -0,0 +1,342 @@
+"""Cross-process consumption of the Redis Streams Event Bus (E9-S3, §14.5).
+
+:class:`~backend.events.bus.RedisEventBus` appends every envelope to its
+partition stream, but on its own only dispatches to subscribers in the
+publishing process. This module adds the two readers a multi-replica
+deployment needs:
+
+* :class:`PartitionStreamListener` — one background ``XREAD BLOCK`` over the
+  partition streams that have local
+  :meth:`~backend.events.bus.EventBus.subscribe_partition` subscribers, with
+  one cursor per partition. Every replica sees every event of the runs it
+  watches, whichever process published them, and a watcher (the SSE fan-out
+  hub) is woken by Redis as soon as an entry lands instead of polling.
+* :class:`StreamGroupConsumer` — a competing consumer on the shared feed
+  stream (:data:`FEED_STREAM_KEY`, written by the bus when cross-process
+  delivery is on). Each entry goes to one consumer of the group
+  (``XREADGROUP``), is acknowledged (``XACK``) once its handler returns, and
+  is reclaimed (``XAUTOCLAIM``) from a consumer that died or failed before
+  acknowledging it, once it has been pending for ``min_idle_ms``. An entry
+  whose handler has failed on ``max_deliveries`` deliveries is copied to a
+  dead-letter stream (``<stream>:dead``, like ``autodev:jobs:dead`` for
+  jobs) and acknowledged, so a poison event cannot stay pending forever.
+
+Delivery stays at-least-once: a reclaimed entry may already have been
+handled, so handlers must be idempotent by ``eventId``. Both readers work
+against any client exposing the redis-py stream commands, so tests run them
+against an in-memory stand-in.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from backend.events.bus import Subscriber, _decode_entry, _stream_key
+from backend.events.catalog import EventEnvelope
+
+logger = logging.getLogger(__name__)
+
+FEED_STREAM_KEY = "autodev:events-feed"
+"""Stream every envelope is also appended to when cross-process delivery is on."""
+
+_STREAM_PREFIX = _stream_key("")
+_ERROR_BACKOFF_SECONDS = 1.0
+_DEAD_LETTER_MAXLEN = 10_000
+
+
+def _text(value: Any) -> str:
+    """Decode a Redis reply value (entry id, stream name) to ``str``."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class _PollingThread(ABC):
+    """Runs ``poll_once`` on a daemon thread until stopped, backing off on errors."""
+
+    _name = "event-stream-reader"
+
+    def __init__(self) -> None:
+        """Create the stop signal; the thread itself is started by :meth:`start`."""
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @abstractmethod
+    def poll_once(self) -> int:
+        """Run one blocking read and handle what it returns.
+
+        Returns:
+            Number of entries handled.
+        """
+
+    def start(self) -> None:
+        """Start the background reader; a no-op if it is already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the reader after its current blocking read returns.
+
+        Args:
+            timeout: Longest to wait for the thread, in seconds.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Call :meth:`poll_once` until stopped, pausing after a failed read."""
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:  # noqa: BLE001 - a broken read is retried after a pause
+                logger.exception("%s read failed; retrying", self._name)
+                self._stop.wait(_ERROR_BACKOFF_SECONDS)
+
+
+class PartitionStreamListener(_PollingThread):
+    """Blocking ``XREAD`` over the watched partition streams, one cursor each."""
+
+    _name = "event-partition-listener"
+
+    def __init__(
+        self,
+        client: Any,
+        deliver: Callable[[EventEnvelope], None],
+        *,
+        block_ms: int = 1_000,
+        count: int = 100,
+    ) -> None:
+        """Create a stopped listener.
+
+        Args:
+            client: Redis client.
+            deliver: Called with each new envelope of a watched partition.
+            block_ms: Longest one ``XREAD`` waits for new entries; also the
+                longest before a newly watched partition joins the read.
+            count: Most entries read per partition per call.
+        """
+        super().__init__()
+        self._client = client
+        self._deliver = deliver
+        self._block_ms = block_ms
+        self._count = count
+        self._cursors: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, partition_key: str) -> None:
+        """Follow *partition_key* from its current end; idempotent.
+
+        The cursor is the stream's last entry at this call, so entries
+        appended after it are delivered even if they land before the next
+        ``XREAD`` includes the partition.
+
+        Args:
+            partition_key: Partition to follow.
+        """
+        with self._lock:
+            if partition_key in self._cursors:
+                return
+        latest = self._client.xrevrange(_stream_key(partition_key), count=1)
+        cursor = _text(latest[0][0]) if latest else "0-0"
+        with self._lock:
+            self._cursors.setdefault(partition_key, cursor)
+
+    def unwatch(self, partition_key: str) -> None:
+        """Stop following *partition_key*.
+
+        Args:
+            partition_key: Partition to drop.
+        """
+        with self._lock:
+            self._cursors.pop(partition_key, None)
+
+    def watched(self) -> list[str]:
+        """Partitions currently followed."""
+        with self._lock:
+            return list(self._cursors)
+
+    def poll_once(self) -> int:
+        """Run one blocking ``XREAD`` and deliver what it returns.
+
+        Returns:
+            Number of envelopes delivered.
+        """
+        with self._lock:
+            streams = {_stream_key(key): cursor for key, cursor in self._cursors.items()}
+        if not streams:
+            self._stop.wait(self._block_ms / 1000)
+            return 0
+        delivered = 0
+        for stream, entries in self._client.xread(
+            streams, count=self._count, block=self._block_ms
+        ) or []:
+            partition_key = _text(stream)[len(_STREAM_PREFIX) :]
+            for entry_id, fields in entries:
+                with self._lock:
+                    if partition_key not in self._cursors:
+                        break  # unwatched while the read was blocked
+                    self._cursors[partition_key] = _text(entry_id)
+                try:
+                    envelope = _decode_entry(fields)
+                except ValueError:
+                    logger.warning("Skipping undecodable entry %s on %s", entry_id, stream)
+                    continue
+                self._deliver(envelope)
+                delivered += 1
+        return delivered
+
+
+class StreamGroupConsumer(_PollingThread):
+    """One consumer of a Redis consumer group over the shared feed stream."""
+
+    _name = "event-group-consumer"
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        group: str,
+        consumer: str,
+        handler: Subscriber,
+        stream: str = FEED_STREAM_KEY,
+        block_ms: int = 1_000,
+        count: int = 100,
+        min_idle_ms: int = 60_000,
+        max_deliveries: int = 5,
+        dead_letter_stream: str | None = None,
+    ) -> None:
+        """Create the group if needed; the consumer starts stopped.
+
+        Args:
+            client: Redis client.
+            group: Consumer group name; every entry goes to one of its consumers.
+            consumer: This consumer's name, unique within the group (e.g. host
+                and pid).
+            handler: Called with each envelope; the entry is acknowledged
+                only if it returns without raising.
+            stream: Stream the group reads.
+            block_ms: Longest one ``XREADGROUP`` waits for new entries.
+            count: Most entries read or reclaimed per call.
+            min_idle_ms: How long an entry stays pending with another
+                consumer before this one reclaims it.
+            max_deliveries: Deliveries after which an entry whose handler
+                still fails is dead-lettered and acknowledged.
+            dead_letter_stream: Stream failed entries are copied to;
+                defaults to ``<stream>:dead``.
+
+        Raises:
+            ValueError: If ``max_deliveries`` is not positive.
+        """
+        if max_deliveries < 1:
+            raise ValueError("max_deliveries must be positive")
+        super().__init__()
+        self._client = client
+        self.group = group
+        self.consumer = consumer
+        self._handler = handler
+        self._stream = stream
+        self._block_ms = block_ms
+        self._count = count
+        self._min_idle_ms = min_idle_ms
+        self._max_deliveries = max_deliveries
+        self.dead_letter_stream = dead_letter_stream or f"{stream}:dead"
+        try:
+            client.xgroup_create(stream, group, id="$", mkstream=True)
+        except Exception as exc:  # noqa: BLE001 - redis is an optional dependency
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def reclaim(self) -> int:
+        """Take over and handle entries left pending too long by any consumer.
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        result = self._client.xautoclaim(
+            self._stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self._min_idle_ms,
+            start_id="0-0",
+            count=self._count,
+        )
+        return self._handle(result[1] if result else [])
+
+    def poll_once(self) -> int:
+        """Reclaim stale entries, then run one blocking ``XREADGROUP``.
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        acked = self.reclaim()
+        response = self._client.xreadgroup(
+            self.group,
+            self.consumer,
+            {self._stream: ">"},
+            count=self._count,
+            block=self._block_ms,
+        )
+        for _stream, entries in response or []:
+            acked += self._handle(entries)
+        return acked
+
+    def _handle(self, entries: list[tuple[Any, Any]]) -> int:
+        """Run the handler per entry; acknowledge the ones that succeeded or were dead-lettered."""
+        done: list[str] = []
+        for entry_id, fields in entries:
+            entry_id = _text(entry_id)
+            if not fields:  # trimmed from the stream while pending
+                done.append(entry_id)
+                continue
+            try:
+                envelope = _decode_entry(fields)
+            except ValueError:
+                logger.warning("Acknowledging undecodable entry %s", entry_id)
+                done.append(entry_id)
+                continue
+            try:
+                self._handler(envelope)
+            except Exception as exc:  # noqa: BLE001 - left pending, reclaimed after min_idle_ms
+                logger.exception("Group %s failed to handle %s", self.group, envelope.eventId)
+                if self._delivery_count(entry_id) < self._max_deliveries:
+                    continue
+                self._dead_letter(entry_id, fields, exc)
+            done.append(entry_id)
+        if done:
+            self._client.xack(self._stream, self.group, *done)
+        return len(done)
+
+    def _delivery_count(self, entry_id: str) -> int:
+        """Return how many times *entry_id* has been delivered to this group (``XPENDING``)."""
+        pending = self._client.xpending_range(
+            self._stream, self.group, min=entry_id, max=entry_id, count=1
+        )
+        return int(pending[0]["times_delivered"]) if pending else 0
+
+    def _dead_letter(self, entry_id: str, fields: Any, exc: Exception) -> None:
+        """Copy a failed entry to :attr:`dead_letter_stream`, with where and why it failed."""
+        logger.error(
+            "Group %s dead-lettering %s after %d deliveries",
+            self.group, entry_id, self._max_deliveries,
+        )
+        self._client.xadd(
+            self.dead_letter_stream,
+            {
+                **{_text(key): value for key, value in fields.items()},
+                "dead_entry_id": entry_id,
+                "dead_group": self.group,
+                "dead_error": type(exc).__name__,
+            },
+            maxlen=_DEAD_LETTER_MAXLEN,
+            approximate=True,
+        )
+
+
+__all__ = ["FEED_STREAM_KEY", "PartitionStreamListener", "StreamGroupConsumer"]
@@ -0,0 +1,113 @@
+"""Subscriber bookkeeping and fault-isolated dispatch shared by the Event Bus backends."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+
+from backend.events.catalog import EventEnvelope
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[EventEnvelope], None]
+"""Callback invoked synchronously with each published envelope."""
+
+Unsubscribe = Callable[[], None]
+"""Cancellation token returned by :meth:`~backend.events.bus.EventBus.subscribe` (E45-S3)."""
+
+WILDCARD = "*"
+"""Subscription key matching every event type."""
+
+
+class _SubscriberRegistry:
+    """Shared subscriber bookkeeping and fault-isolated dispatch."""
+
+    def __init__(self) -> None:
+        """Initialize empty type- and partition-to-subscribers indexes."""
+        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+        self._partition_subscribers: dict[str, list[Subscriber]] = {}
+
+    def subscribe(self, type_: str, subscriber: Subscriber) -> Unsubscribe:
+        """Register a callback for an event type.
+
+        Args:
+            type_: Catalog event type, or :data:`WILDCARD` for all types.
+            subscriber: Callback receiving each matching envelope.
+
+        Returns:
+            An idempotent callable that removes this subscription.
+        """
+        self._subscribers[type_].append(subscriber)
+
+        def _unsubscribe() -> None:
+            """Remove the type subscription; a no-op once removed."""
+            try:
+                self._subscribers[type_].remove(subscriber)
+            except ValueError:
+                pass
+
+        return _unsubscribe
+
+    def subscribe_partition(self, partition_key: str, subscriber: Subscriber) -> Unsubscribe:
+        """Register a callback for one partition's events.
+
+        The partition's entry is dropped with its last subscriber, so
+        short-lived per-run subscriptions do not accumulate.
+
+        Args:
+            partition_key: Partition (typically a run id) to follow.
+            subscriber: Callback receiving each of the partition's envelopes.
+
+        Returns:
+            An idempotent callable that removes this subscription.
+        """
+        self._partition_subscribers.setdefault(partition_key, []).append(subscriber)
+
+        def _unsubscribe() -> None:
+            """Remove the partition subscription, dropping the partition with its last one."""
+            subscribers = self._partition_subscribers.get(partition_key)
+            if subscribers is None or subscriber not in subscribers:
+                return
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._partition_subscribers[partition_key]
+
+        return _unsubscribe
+
+    def has_partition_subscribers(self, partition_key: str) -> bool:
+        """Whether any callback follows *partition_key*."""
+        return partition_key in self._partition_subscribers
+
+    def dispatch(self, envelope: EventEnvelope, *, partitions: bool = True) -> None:
+        """Invoke matching subscribers, isolating individual failures.
+
+        Args:
+            envelope: The envelope being delivered.
+            partitions: Also invoke the partition's subscribers; ``False``
+                when those are fed by a stream listener instead.
+        """
+        subscribers = self._subscribers[envelope.type] + self._subscribers[WILDCARD]
+        if partitions:
+            subscribers += self._partition_subscribers.get(envelope.partitionKey, [])
+        self._invoke(subscribers, envelope)
+
+    def dispatch_partition(self, envelope: EventEnvelope) -> None:
+        """Invoke only the envelope's partition subscribers.
+
+        Args:
+            envelope: The envelope being delivered.
+        """
+        self._invoke(list(self._partition_subscribers.get(envelope.partitionKey, [])), envelope)
+
+    @staticmethod
+    def _invoke(subscribers: list[Subscriber], envelope: EventEnvelope) -> None:
+        """Call each subscriber with *envelope*, logging rather than raising failures."""
+        for subscriber in subscribers:
+            try:
+                subscriber(envelope)
+            except Exception:  # noqa: BLE001 - resilient delivery (E9-S3 CNF)
+                logger.exception("Event subscriber failed for %s", envelope.eventId)
+
+
+__all__ = ["WILDCARD", "Subscriber", "Unsubscribe", "_SubscriberRegistry"]
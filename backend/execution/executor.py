@@ -24,7 +24,7 @@ from backend.execution.contracts import (
     ExecutionFailureKind,
     ExecutionResult,
 )
-from backend.execution.policy import PolicyEvaluator
+from backend.execution.policy import PolicyDecision, PolicyEvaluator
 from backend.execution.runner import ActionRunner
 
 if TYPE_CHECKING:
@@ -141,6 +141,9 @@ class TaskExecutor:
     ) -> TaskExecutionOutcome:
         """Run already-derived *actions* and report the aggregate outcome.
 
+        Every action that is not pre-approved is gated by the policy before
+        any of them runs, in one batch when the policy offers ``evaluate_many``.
+
         Args:
             actions: Actions to run, in order.
             run_id: Orchestrator run this execution belongs to (event partition key).
@@ -156,43 +159,56 @@ class TaskExecutor:
         Returns:
             The aggregate outcome across every action.
         """
+        gated = [
+            index
+            for index, action in enumerate(actions)
+            if self._policy is not None and action.action_id not in pre_approved_action_ids
+        ]
+        decisions = dict(
+            zip(
+                gated,
+                self._evaluate_policy(
+                    [actions[index] for index in gated],
+                    run_id=run_id,
+                    tenant_id=tenant_id,
+                    actor=actor,
+                ),
+            )
+        )
         results: list[ExecutionResult] = []
         failed = False
-        for action in actions:
-            if self._policy is not None and action.action_id not in pre_approved_action_ids:
-                decision = self._policy.evaluate(
-                    tenant_id=tenant_id, action=action, run_id=run_id, actor=actor
+        for index, action in enumerate(actions):
+            decision = decisions.get(index)
+            if decision is not None and not decision.allowed:
+                failed = True
+                now = _timestamp()
+                result = ExecutionResult(
+                    action_id=action.action_id,
+                    task_id=action.task_id,
+                    step_key=action.step_key,
+                    status="failed",
+                    started_at=now,
+                    completed_at=now,
+                    error=f"policy denied: {decision.reason}",
+                    failure_kind=ExecutionFailureKind.POLICY_DENIED,
                 )
-                if not decision.allowed:
-                    failed = True
-                    now = _timestamp()
-                    result = ExecutionResult(
-                        action_id=action.action_id,
-                        task_id=action.task_id,
-                        step_key=action.step_key,
-                        status="failed",
-                        started_at=now,
-                        completed_at=now,
-                        error=f"policy denied: {decision.reason}",
-                        failure_kind=ExecutionFailureKind.POLICY_DENIED,
-                    )
-                    results.append(result)
-                    emit_event(
-                        "execution.action.failed",
-                        tenant_id=tenant_id,
-                        partition_key=run_id,
-                        data={
-                            "actionId": action.action_id,
-                            "taskId": action.task_id,
-                            "error": result.error or "",
-                            "command": list(action.command) if action.command else None,
-                            "path": _action_path(action),
-                            "stepLabel": action.step_label,
-                            "failureKind": ExecutionFailureKind.POLICY_DENIED.value,
-                        },
-                        subject={"runId": run_id, "taskId": action.task_id},
-                    )
-                    continue
+                results.append(result)
+                emit_event(
+                    "execution.action.failed",
+                    tenant_id=tenant_id,
+                    partition_key=run_id,
+                    data={
+                        "actionId": action.action_id,
+                        "taskId": action.task_id,
+                        "error": result.error or "",
+                        "command": list(action.command) if action.command else None,
+                        "path": _action_path(action),
+                        "stepLabel": action.step_label,
+                        "failureKind": ExecutionFailureKind.POLICY_DENIED.value,
+                    },
+                    subject={"runId": run_id, "taskId": action.task_id},
+                )
+                continue
             emit_event(
                 "execution.action.started",
                 tenant_id=tenant_id,
@@ -248,6 +264,20 @@ class TaskExecutor:
                 )
         return TaskExecutionOutcome(status="failed" if failed else "completed", results=results)
 
+    def _evaluate_policy(
+        self, actions: list[ExecutionAction], *, run_id: str, tenant_id: str, actor: str
+    ) -> list[PolicyDecision]:
+        """Gate every action of a task up front, in one batch when the policy supports it."""
+        if not actions or self._policy is None:
+            return []
+        evaluate_many = getattr(self._policy, "evaluate_many", None)
+        if evaluate_many is not None:
+            return evaluate_many(tenant_id=tenant_id, actions=actions, run_id=run_id, actor=actor)
+        return [
+            self._policy.evaluate(tenant_id=tenant_id, action=action, run_id=run_id, actor=actor)
+            for action in actions
+        ]
+
     def deny_all(
         self,
         actions: list[ExecutionAction],
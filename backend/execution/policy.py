@@ -4,13 +4,24 @@ Mirrors :mod:`backend.quotas.service` / :mod:`backend.quotas.store` (ADR-019):
 a tenant with any stored rule is governed by exactly those rules; a tenant
 with none fails closed in production and falls back to a permissive default
 outside production, preserving the platform's Local-first guarantee.
+
+Decisions are made against a compiled, per-tenant :class:`_PolicyIndex`
+(rules grouped by category, glob patterns compiled to regular expressions,
+specificity tiers precomputed) and cached in process. Every rule or
+dynamic-permission write bumps the tenant's durable policy generation in the
+same transaction, and a cached index is only reused while the generation it
+was built at is still current, so a write made by any process applies to the
+next decision.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import os
+import re
 import sqlite3
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -224,12 +235,14 @@ class PolicyStore:
             conn.commit()
 
     def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the policy database with ``Row`` results."""
         conn = sqlite3.connect(str(self._db_path), timeout=30)
         conn.row_factory = sqlite3.Row
         return conn
 
     @staticmethod
     def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create the policy, permission, audit, pending-decision and generation tables."""
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS execution_policy_rules (
@@ -288,9 +301,39 @@ class PolicyStore:
                 ON pending_action_decisions(run_id, task_id);
             CREATE INDEX IF NOT EXISTS idx_pending_action_decisions_tenant
                 ON pending_action_decisions(tenant_id, status);
+            CREATE TABLE IF NOT EXISTS execution_policy_generations (
+                tenant_id TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            );
             """
         )
 
+    @staticmethod
+    def _bump_generation(conn: sqlite3.Connection, tenant_id: str) -> None:
+        """Increment *tenant_id*'s policy generation on *conn* (not committed here)."""
+        conn.execute(
+            "INSERT INTO execution_policy_generations (tenant_id, generation, updated_at) "
+            "VALUES (?, 1, ?) "
+            "ON CONFLICT(tenant_id) DO UPDATE SET "
+            "generation = execution_policy_generations.generation + 1, "
+            "updated_at = excluded.updated_at",
+            (tenant_id, _now()),
+        )
+
+    def policy_generation(self, tenant_id: str) -> int:
+        """Return *tenant_id*'s policy generation, ``0`` if its policy was never written.
+
+        Every rule and dynamic-permission write bumps it before committing,
+        so a compiled index built at an older generation is stale.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT generation FROM execution_policy_generations WHERE tenant_id = ?",
+                (tenant_id,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
     def has_any_rules(self, tenant_id: str) -> bool:
         """Return whether *tenant_id* has at least one stored policy rule."""
         with self._connect() as conn:
@@ -338,6 +381,7 @@ class PolicyStore:
                     _now(),
                 ),
             )
+            self._bump_generation(conn, tenant_id)
             conn.commit()
         return rule_id
 
@@ -382,6 +426,7 @@ class PolicyStore:
                     actor,
                 ),
             )
+            self._bump_generation(conn, tenant_id)
             conn.commit()
         return permission_id
 
@@ -393,9 +438,16 @@ class PolicyStore:
                 "WHERE tenant_id = ? AND permission_id = ?",
                 (tenant_id, permission_id),
             )
+            if cursor.rowcount > 0:
+                self._bump_generation(conn, tenant_id)
             conn.commit()
         return cursor.rowcount > 0
 
+    @property
+    def db_path(self) -> Path:
+        """The SQLite file this store reads and writes."""
+        return self._db_path
+
     def record_decision(
         self,
         *,
@@ -408,22 +460,49 @@ class PolicyStore:
         actor: str,
     ) -> None:
         """Durably record one policy decision for audit."""
+        self.record_decisions(
+            tenant_id=tenant_id,
+            run_id=run_id,
+            actor=actor,
+            decisions=[(action_id, category, allowed, reason)],
+        )
+
+    def record_decisions(
+        self,
+        *,
+        tenant_id: str,
+        run_id: str,
+        actor: str,
+        decisions: Sequence[tuple[str, PolicyCategory, bool, str]],
+    ) -> None:
+        """Durably record several policy decisions of one run in a single transaction.
+
+        Args:
+            tenant_id: Tenant the run belongs to.
+            run_id: Orchestrator run the decisions belong to.
+            actor: Who/what triggered the evaluations.
+            decisions: ``(action_id, category, allowed, reason)`` per action.
+        """
+        decided_at = _now()
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO execution_policy_decisions "
                 "(decision_id, tenant_id, run_id, action_id, category, allowed, reason, actor, decided_at) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    str(uuid4()),
-                    tenant_id,
-                    run_id,
-                    action_id,
-                    category.value,
-                    1 if allowed else 0,
-                    reason,
-                    actor,
-                    _now(),
-                ),
+                [
+                    (
+                        str(uuid4()),
+                        tenant_id,
+                        run_id,
+                        action_id,
+                        category.value,
+                        1 if allowed else 0,
+                        reason,
+                        actor,
+                        decided_at,
+                    )
+                    for action_id, category, allowed, reason in decisions
+                ],
             )
             conn.commit()
 
@@ -528,6 +607,7 @@ class PolicyStore:
 
     @staticmethod
     def _row_to_decision(row: sqlite3.Row) -> PendingDecision:
+        """Build a :class:`PendingDecision` from a ``pending_action_decisions`` row."""
         return PendingDecision(
             decision_id=row["decision_id"],
             tenant_id=row["tenant_id"],
@@ -545,6 +625,121 @@ class PolicyStore:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _CompiledRule:
+    """A rule reduced to what a decision needs: its effect and compiled pattern."""
+
+    effect: PolicyEffect
+    matcher: Optional[re.Pattern[str]]
+
+    def matches(self, target: str) -> bool:
+        """Return whether the rule applies to *target* (a rule without a pattern always does)."""
+        return self.matcher is None or self.matcher.match(target) is not None
+
+
+def _specificity(rule: PolicyRule, *, dynamic: bool) -> int:
+    """Rank a rule: dynamic above static, pattern-specific above category-wide."""
+    return (2 if dynamic else 0) + (1 if rule.pattern is not None else 0)
+
+
+@dataclass(frozen=True, slots=True)
+class _PolicyIndex:
+    """One tenant's effective rules, compiled for repeated decisions.
+
+    Attributes:
+        tiers: Per category, ``(specificity, rules)`` pairs from the most to
+            the least specific tier; empty tiers are omitted.
+        policy_missing: The tenant has no stored rule in production, so
+            every decision raises :class:`PolicyMissingError`.
+    """
+
+    tiers: dict[PolicyCategory, tuple[tuple[int, tuple[_CompiledRule, ...]], ...]]
+    policy_missing: bool = False
+
+    @classmethod
+    def compile(cls, rules: list[PolicyRule], dynamic: list[PolicyRule]) -> _PolicyIndex:
+        """Group *rules* and *dynamic* permissions by category and specificity tier."""
+        grouped: dict[PolicyCategory, dict[int, list[_CompiledRule]]] = {}
+        for rule, is_dynamic in [(rule, True) for rule in dynamic] + [(rule, False) for rule in rules]:
+            matcher = (
+                re.compile(fnmatch.translate(os.path.normcase(rule.pattern)))
+                if rule.pattern is not None
+                else None
+            )
+            grouped.setdefault(rule.category, {}).setdefault(
+                _specificity(rule, dynamic=is_dynamic), []
+            ).append(_CompiledRule(effect=rule.effect, matcher=matcher))
+        return cls(
+            tiers={
+                category: tuple(
+                    (score, tuple(by_score[score])) for score in sorted(by_score, reverse=True)
+                )
+                for category, by_score in grouped.items()
+            }
+        )
+
+    def decide(self, tenant_id: str, category: PolicyCategory, target: str) -> PolicyDecision:
+        """Decide one action of *category* whose match target is *target*."""
+        if self.policy_missing:
+            raise PolicyMissingError(tenant_id)
+        target = os.path.normcase(target)
+        for _score, rules in self.tiers.get(category, ()):
+            effects = {rule.effect for rule in rules if rule.matches(target)}
+            if effects:
+                # Within the most specific matching tier, deny wins (fail-closed).
+                effect = PolicyEffect.DENY if PolicyEffect.DENY in effects else PolicyEffect.ALLOW
+                return PolicyDecision(
+                    allowed=effect is PolicyEffect.ALLOW,
+                    matched=True,
+                    reason=f"{effect.value} rule for {category.value}",
+                )
+        return PolicyDecision(allowed=False, matched=False, reason="no matching policy rule")
+
+
+class _PolicyIndexCache:
+    """Compiled indexes keyed by ``(db path, tenant id, profile)``.
+
+    Each entry is tagged with the durable policy generation
+    (:meth:`PolicyStore.policy_generation`) read before its rules were
+    queried, and :meth:`get` only returns it while that generation is still
+    current. An index compiled across a concurrent write, from this process
+    or any other, is therefore tagged with the older generation and rebuilt
+    on the next lookup.
+    """
+
+    def __init__(self) -> None:
+        """Start empty; entries are added by :meth:`put`."""
+        # key -> (index, policy generation it was built at)
+        self._entries: dict[tuple[str, str, str], tuple[_PolicyIndex, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str, str], generation: int) -> _PolicyIndex | None:
+        """Return the cached index of *key* if it was built at *generation*."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[1] != generation:
+            return None
+        return entry[0]
+
+    def put(self, key: tuple[str, str, str], index: _PolicyIndex, generation: int) -> None:
+        """Cache *index*, built from rules read at policy *generation*."""
+        with self._lock:
+            self._entries[key] = (index, generation)
+
+    def clear(self) -> None:
+        """Drop every cached index."""
+        with self._lock:
+            self._entries.clear()
+
+
+_policy_indexes = _PolicyIndexCache()
+
+
+def reset_policy_index_cache() -> None:
+    """Drop every cached policy index — for use in tests."""
+    _policy_indexes.clear()
+
+
 def match_target(action: ExecutionAction) -> str:
     """Return the string a rule's ``pattern`` glob is matched against."""
     if action.command:
@@ -648,66 +843,100 @@ class PolicyService:
             The decision. Always durably recorded and always emits
             ``execution.policy.allowed``/``.denied`` before returning.
         """
-        category, decision = self._decide(tenant_id=tenant_id, action=action)
-        self._store.record_decision(
+        return self.evaluate_many(
+            tenant_id=tenant_id, actions=[action], run_id=run_id, actor=actor
+        )[0]
+
+    def evaluate_many(
+        self,
+        *,
+        tenant_id: str,
+        actions: Sequence[ExecutionAction],
+        run_id: str,
+        actor: str = "system",
+    ) -> list[PolicyDecision]:
+        """Evaluate every action of a task against one resolution of the tenant's policy.
+
+        Equivalent to calling :meth:`evaluate` per action, except that the
+        audit rows are written in a single transaction.
+
+        Args:
+            tenant_id: Tenant the run belongs to.
+            actions: The actions about to be dispatched, in order.
+            run_id: Orchestrator run these evaluations belong to.
+            actor: Who/what triggered these evaluations.
+
+        Returns:
+            One decision per action, in order. Every decision is durably
+            recorded and emits its event before this returns.
+
+        Raises:
+            PolicyMissingError: In production, when the tenant has no
+                stored rule; nothing is recorded.
+        """
+        if not actions:
+            return []
+        index = self._policy_index(tenant_id)
+        decided = [
+            self._decide(tenant_id=tenant_id, action=action, index=index) for action in actions
+        ]
+        self._store.record_decisions(
             tenant_id=tenant_id,
             run_id=run_id,
-            action_id=action.action_id,
-            category=category,
-            allowed=decision.allowed,
-            reason=decision.reason,
             actor=actor,
+            decisions=[
+                (action.action_id, category, decision.allowed, decision.reason)
+                for action, (category, decision) in zip(actions, decided)
+            ],
         )
-        emit_event(
-            "execution.policy.allowed" if decision.allowed else "execution.policy.denied",
-            tenant_id=tenant_id,
-            partition_key=run_id,
-            data={"actionId": action.action_id, "category": category.value, "reason": decision.reason},
-            subject={"runId": run_id, "taskId": action.task_id},
-        )
-        return decision
+        for action, (category, decision) in zip(actions, decided):
+            emit_event(
+                "execution.policy.allowed" if decision.allowed else "execution.policy.denied",
+                tenant_id=tenant_id,
+                partition_key=run_id,
+                data={"actionId": action.action_id, "category": category.value, "reason": decision.reason},
+                subject={"runId": run_id, "taskId": action.task_id},
+            )
+        return [decision for _category, decision in decided]
+
+    def _policy_index(self, tenant_id: str) -> _PolicyIndex:
+        """Return the tenant's compiled index, rebuilding it once its policy generation moved."""
+        key = (str(self._store.db_path), tenant_id, self._settings.autodev_profile)
+        generation = self._store.policy_generation(tenant_id)
+        cached = _policy_indexes.get(key, generation)
+        if cached is not None:
+            return cached
+        rules = self._store.list_rules(tenant_id)
+        if rules:
+            dynamic = [rule for _id, rule in self._store.list_dynamic_permissions(tenant_id)]
+            index = _PolicyIndex.compile(rules, dynamic)
+        elif self._settings.autodev_profile == "prod":
+            index = _PolicyIndex(tiers={}, policy_missing=True)
+        else:
+            dynamic = [rule for _id, rule in self._store.list_dynamic_permissions(tenant_id)]
+            index = _PolicyIndex.compile(self._local_default_rules(), dynamic)
+        _policy_indexes.put(key, index, generation)
+        return index
 
     def _decide(
-        self, *, tenant_id: str, action: ExecutionAction
+        self, *, tenant_id: str, action: ExecutionAction, index: _PolicyIndex | None = None
     ) -> tuple[PolicyCategory, PolicyDecision]:
-        """Pure decision logic shared by :meth:`evaluate` and :meth:`preview`."""
+        """Pure decision logic shared by :meth:`evaluate` and :meth:`preview`.
+
+        Specificity beats scope: a dynamic (human-granted, one-off)
+        permission outranks a static rule, and a pattern-specific rule
+        outranks a category-wide one — so a hybrid-mode "always" grant for
+        one command can carve an exception out of a broader static deny,
+        and a specific static deny can still override a broad static allow.
+        Within the most specific matching tier, an explicit deny wins over
+        an allow (fail-closed tie-break). *index* lets a batch decide every
+        action against one lookup; by default the tenant's current index is
+        used.
+        """
         category = ACTION_TYPE_TO_POLICY_CATEGORY[action.type]
-        rules = self.resolve_rules(tenant_id)
-        dynamic = [rule for _id, rule in self._store.list_dynamic_permissions(tenant_id)]
-        target = match_target(action)
-
-        def _matches(rule: PolicyRule) -> bool:
-            return rule.category is category and (
-                rule.pattern is None or fnmatch.fnmatch(target, rule.pattern)
-            )
-
-        # Specificity beats scope: a dynamic (human-granted, one-off)
-        # permission outranks a static rule, and a pattern-specific rule
-        # outranks a category-wide one — so a hybrid-mode "always" grant for
-        # one command can carve an exception out of a broader static deny,
-        # and a specific static deny can still override a broad static
-        # allow. Within the most specific matching tier, an explicit deny
-        # wins over an allow (fail-closed tie-break).
-        scored: list[tuple[int, PolicyRule]] = [
-            (2 + (1 if rule.pattern is not None else 0), rule) for rule in dynamic if _matches(rule)
-        ] + [(0 + (1 if rule.pattern is not None else 0), rule) for rule in rules if _matches(rule)]
-
-        matched_rule: PolicyRule | None = None
-        if scored:
-            top_score = max(score for score, _rule in scored)
-            top = [rule for score, rule in scored if score == top_score]
-            denies = [rule for rule in top if rule.effect is PolicyEffect.DENY]
-            matched_rule = denies[0] if denies else top[0]
-
-        if matched_rule is None:
-            decision = PolicyDecision(allowed=False, matched=False, reason="no matching policy rule")
-        else:
-            allowed = matched_rule.effect is PolicyEffect.ALLOW
-            decision = PolicyDecision(
-                allowed=allowed, matched=True, reason=f"{matched_rule.effect.value} rule for {category.value}"
-            )
-
-        return category, decision
+        if index is None:
+            index = self._policy_index(tenant_id)
+        return category, index.decide(tenant_id, category, match_target(action))
 
 
 __all__ = [
@@ -724,4 +953,5 @@ __all__ = [
     "PolicyService",
     "PolicyStore",
     "match_target",
+    "reset_policy_index_cache",
 ]
@@ -31,6 +31,7 @@ from backend.flows.manifest import (
     FlowBudgets,
     FlowDefaults,
     FlowEdge,
+    FlowExecution,
     FlowManifest,
     FlowManifestValidationResult,
     FlowNode,
@@ -42,6 +43,7 @@ from backend.flows.manifest import (
 )
 from backend.flows.registry import FlowRegistry
 from backend.flows.state import FlowRunStore
+from backend.flows.templates import FlowRenderPlan, TemplatePlan, compile_template
 
 __all__ = [
     "AgentNodeHandler",
@@ -55,11 +57,13 @@ __all__ = [
     "FlowHumanService",
     "FlowHumanStateError",
     "FlowRegistry",
+    "FlowRenderPlan",
     "FlowRunError",
     "FlowRunStore",
     "NodeContext",
     "NodeOutcome",
     "PendingHumanRequest",
+    "TemplatePlan",
     "build_default_handlers",
     "DEFAULT_FLOW_RETRIES",
     "ExpressionError",
@@ -68,6 +72,7 @@ __all__ = [
     "FlowBudgets",
     "FlowDefaults",
     "FlowEdge",
+    "FlowExecution",
     "FlowManifest",
     "FlowManifestValidationResult",
     "FlowNode",
@@ -75,6 +80,7 @@ __all__ = [
     "FlowRetryPolicy",
     "FlowTrigger",
     "compile_expression",
+    "compile_template",
     "evaluate_expression",
     "load_flow_manifest",
     "render_template",
@@ -6,11 +6,15 @@ repository's 500-line file cap. :class:`NodeActivationMixin` implements
 through its registered handler with the manifest's retry policy, checkpoints
 its output, and advances the run cursor; :class:`~backend.flows.engine.FlowEngine`
 inherits it and supplies the collaborators (``runs``, ``handlers``, clock,
-sleeper) plus ``_fail_run``.
+sleeper) plus ``_fail_run``. The attempt loop itself
+(:meth:`NodeActivationMixin._attempt_node`) reports a failure instead of
+failing the run, so the parallel scheduler (:mod:`backend.flows.parallel`)
+can run it on worker threads and fail the run from its coordinator.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Callable
 
 from backend.events.runtime import emit_event
@@ -20,7 +24,7 @@ from backend.flows.checkpoint import (
     canonical_output,
     select_next_node,
 )
-from backend.flows.expressions import ExpressionError, render_template
+from backend.flows.expressions import ExpressionError
 from backend.flows.handlers import (
     FlowBudgetExceededError,
     FlowHandlerRegistry,
@@ -31,10 +35,25 @@ from backend.flows.handlers import (
 )
 from backend.flows.model import FlowBudgets, FlowManifest, FlowNode
 from backend.flows.pause import pause_run
+from backend.flows.records import FlowStepRecord
 from backend.flows.state import FlowRunRecord, FlowRunStore
+from backend.flows.templates import render_node_input
 from backend.observability.tracing import trace_run_step
 
 
+@dataclass(frozen=True)
+class NodeAttemptFailure:
+    """Why a node's attempts ended without an outcome.
+
+    Attributes:
+        reason: Machine-readable stop reason for the run.
+        detail: Human-readable failure detail.
+    """
+
+    reason: str
+    detail: str
+
+
 class NodeActivationMixin:
     """Mixin implementing single-node activation for :class:`FlowEngine`.
 
@@ -106,23 +125,145 @@ class NodeActivationMixin:
         Returns:
             A terminal run record when the run failed; ``None`` to continue.
         """
+        try:
+            step_input = self._render_step_input(run, manifest, node, state)
+        except ExpressionError as exc:
+            return self._fail_run(
+                run.run_id,
+                state,
+                "binding_error",
+                f"node {node.id!r}: {exc}",
+            )
+        attempted = self._attempt_node(
+            run, manifest, node, state, step_input, budgets=budgets, deadline=deadline
+        )
+        if isinstance(attempted, NodeAttemptFailure):
+            return self._fail_run(
+                run.run_id, state, attempted.reason, attempted.detail
+            )
+        step, outcome = attempted
+
+        if outcome.status == "waiting_human":
+            return pause_run(self.runs, run, node, step, state, outcome)
+
+        try:
+            output = canonical_output(outcome.output)
+        except FlowNodeError as exc:
+            self.runs.complete_step(step.step_id, status="failed", error=str(exc))
+            return self._fail_run(
+                run.run_id, state, "node_failed", f"node {node.id!r}: {exc}"
+            )
+        self.runs.complete_step(step.step_id, status="completed", output=output)
+        nodes_state = state["nodes"]
+        nodes_state[node.id] = {"output": output}
+        metrics = state["metrics"]
+        metrics["tokens"] = float(metrics.get("tokens", 0.0)) + float(
+            outcome.metrics.get("tokens", 0.0)
+        )
+        metrics["cost_usd"] = float(metrics.get("cost_usd", 0.0)) + float(
+            outcome.metrics.get("cost_usd", 0.0)
+        )
+
+        try:
+            next_node = select_next_node(
+                manifest, node, build_eval_state(run.input, state.get("nodes", {}))
+            )
+        except ExpressionError as exc:
+            return self._fail_run(
+                run.run_id,
+                state,
+                "predicate_error",
+                f"routing after node {node.id!r}: {exc}",
+            )
+        except FlowNodeError as exc:
+            return self._fail_run(run.run_id, state, "no_route", str(exc))
+
+        state["cursor"] = next_node
+        self.runs.update_run(run.run_id, state=state)
+        self.runs.append_event(
+            run_id=run.run_id,
+            name="run.step.completed",
+            payload={
+                "nodeId": node.id,
+                "stepId": step.step_id,
+                "attempt": step.attempt,
+                "nextNodeId": next_node,
+            },
+        )
+        emit_event(
+            "run.step.completed",
+            tenant_id=run.tenant_id,
+            partition_key=run.run_id,
+            data={
+                "stepKey": node.id,
+                "status": "completed",
+                "attempt": step.attempt,
+            },
+            subject={"runId": run.run_id, "stepId": step.step_id},
+        )
+        return None
+
+
+    def _render_step_input(
+        self,
+        run: FlowRunRecord,
+        manifest: FlowManifest,
+        node: FlowNode,
+        state: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Render a node's input bindings against the run state.
+
+        Args:
+            run: The run being executed.
+            manifest: The flow definition, carrying the compiled bindings.
+            node: The node about to be activated.
+            state: The run state its bindings read.
+
+        Returns:
+            The step input; always empty for ``map`` nodes.
+
+        Raises:
+            ExpressionError: If a binding fails to render.
+        """
         if node.type == "map":
             # Map bindings reference the per-item ``item`` root, which only
             # exists inside the handler's fan-out — pre-rendering here would
             # fail closed on expressions that are valid per item.
-            step_input: dict[str, Any] = {}
-        else:
-            eval_state = build_eval_state(run.input, state.get("nodes", {}))
-            try:
-                rendered = render_template(dict(node.input_bindings), eval_state)
-            except ExpressionError as exc:
-                return self._fail_run(
-                    run.run_id,
-                    state,
-                    "binding_error",
-                    f"node {node.id!r}: {exc}",
-                )
-            step_input = rendered if isinstance(rendered, dict) else {"value": rendered}
+            return {}
+        eval_state = build_eval_state(run.input, state.get("nodes", {}))
+        rendered = render_node_input(manifest, node, eval_state)
+        return rendered if isinstance(rendered, dict) else {"value": rendered}
+
+    def _attempt_node(
+        self,
+        run: FlowRunRecord,
+        manifest: FlowManifest,
+        node: FlowNode,
+        state: dict[str, Any],
+        step_input: dict[str, Any],
+        *,
+        budgets: FlowBudgets,
+        deadline: float,
+    ) -> tuple[FlowStepRecord, NodeOutcome] | NodeAttemptFailure:
+        """Run a node's handler through its retry policy.
+
+        Persists one step row and its ``run.step.started`` /
+        ``run.step.failed`` events per attempt but never touches the run
+        record, so it is safe to call from a worker thread.
+
+        Args:
+            run: The run being executed.
+            manifest: The flow definition.
+            node: The node being activated.
+            state: Run state exposed to the handler (not modified here).
+            step_input: The rendered step input.
+            budgets: Effective budgets exposed to the handler.
+            deadline: Monotonic timestamp when the wall-clock budget expires.
+
+        Returns:
+            The last attempt's step and outcome, or the failure that ended
+            the attempts.
+        """
         policy = node.retries or manifest.defaults.retries
 
         step = None
@@ -231,12 +372,10 @@ class NodeActivationMixin:
                     subject={"runId": run.run_id, "stepId": step.step_id},
                 )
                 if not will_retry:
-                    return self._fail_run(run.run_id, state, reason, str(exc))
+                    return NodeAttemptFailure(reason, str(exc))
                 delay = backoff_delay(policy, attempt)
                 if self._clock() + delay > deadline:
-                    return self._fail_run(
-                        run.run_id,
-                        state,
+                    return NodeAttemptFailure(
                         "budget_exhausted",
                         f"retry backoff of node {node.id!r} ({delay:.1f}s) "
                         "would breach the run's wall-clock budget "
@@ -247,66 +386,7 @@ class NodeActivationMixin:
             from backend.flows.engine import FlowRunError
 
             raise FlowRunError(f"node {node.id!r} produced no attempt")
-
-        if outcome.status == "waiting_human":
-            return pause_run(self.runs, run, node, step, state, outcome)
-
-        try:
-            output = canonical_output(outcome.output)
-        except FlowNodeError as exc:
-            self.runs.complete_step(step.step_id, status="failed", error=str(exc))
-            return self._fail_run(
-                run.run_id, state, "node_failed", f"node {node.id!r}: {exc}"
-            )
-        self.runs.complete_step(step.step_id, status="completed", output=output)
-        nodes_state = state["nodes"]
-        nodes_state[node.id] = {"output": output}
-        metrics = state["metrics"]
-        metrics["tokens"] = float(metrics.get("tokens", 0.0)) + float(
-            outcome.metrics.get("tokens", 0.0)
-        )
-        metrics["cost_usd"] = float(metrics.get("cost_usd", 0.0)) + float(
-            outcome.metrics.get("cost_usd", 0.0)
-        )
-
-        try:
-            next_node = select_next_node(
-                manifest, node, build_eval_state(run.input, state.get("nodes", {}))
-            )
-        except ExpressionError as exc:
-            return self._fail_run(
-                run.run_id,
-                state,
-                "predicate_error",
-                f"routing after node {node.id!r}: {exc}",
-            )
-        except FlowNodeError as exc:
-            return self._fail_run(run.run_id, state, "no_route", str(exc))
-
-        state["cursor"] = next_node
-        self.runs.update_run(run.run_id, state=state)
-        self.runs.append_event(
-            run_id=run.run_id,
-            name="run.step.completed",
-            payload={
-                "nodeId": node.id,
-                "stepId": step.step_id,
-                "attempt": step.attempt,
-                "nextNodeId": next_node,
-            },
-        )
-        emit_event(
-            "run.step.completed",
-            tenant_id=run.tenant_id,
-            partition_key=run.run_id,
-            data={
-                "stepKey": node.id,
-                "status": "completed",
-                "attempt": step.attempt,
-            },
-            subject={"runId": run.run_id, "stepId": step.step_id},
-        )
-        return None
+        return step, outcome
 
 
-__all__ = ["NodeActivationMixin"]
+__all__ = ["NodeActivationMixin", "NodeAttemptFailure"]
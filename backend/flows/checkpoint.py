@@ -16,14 +16,11 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
-from backend.flows.expressions import (
-    ExpressionError,
-    evaluate_expression,
-    render_template,
-)
+from backend.flows.expressions import ExpressionError
 from backend.flows.handlers import FlowNodeError
 from backend.flows.model import FlowManifest, FlowNode, FlowRetryPolicy
 from backend.flows.records import FlowRunRecord, FlowStepRecord
+from backend.flows.templates import guard_holds, render_node_input
 
 MAX_BACKOFF_DELAY_SEC = 3600.0
 """Ceiling for engine-derived exponential backoff delays (one hour).
@@ -175,10 +172,7 @@ def select_next_node(
     for edge in edges:
         if edge.when is None:
             continue
-        predicate = edge.when.strip()
-        if predicate.startswith("{{") and predicate.endswith("}}"):
-            predicate = predicate[2:-2]
-        if bool(evaluate_expression(predicate, eval_state)):
+        if guard_holds(manifest, edge, eval_state):
             return edge.target
     for edge in edges:
         if not edge.guarded:
@@ -277,7 +271,7 @@ def replay_decision_path(
         else:
             eval_doc = build_eval_state(run.input, nodes_state)
             try:
-                rendered = render_template(dict(node.input_bindings), eval_doc)
+                rendered = render_node_input(manifest, node, eval_doc)
             except ExpressionError as exc:
                 divergences.append(
                     f"position {index}: bindings of node {node.id!r} failed to "
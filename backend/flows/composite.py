@@ -25,17 +25,31 @@ Conventions (documented in ``docs/flows/engine.md`` and ADR-006):
 
 from __future__ import annotations
 
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import replace
 from typing import Any
 
-from backend.flows.expressions import ExpressionError, render_template
+from backend.flows.expressions import ExpressionError
 from backend.flows.handlers import (
     FlowBudgetExceededError,
     FlowNodeError,
     NodeContext,
     NodeOutcome,
 )
+from backend.flows.map_process import (
+    ChildRunSpec,
+    child_run_template,
+    process_pool,
+    run_child,
+)
 from backend.flows.model import FlowBudgets, FlowManifest
+from backend.flows.templates import render_node_input, render_node_over
 
 MAX_COMPOSITE_DEPTH = 16
 DEFAULT_MAP_PARALLELISM = 4
@@ -336,7 +350,9 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
     Evaluates ``over`` against the run state (must yield a list), renders the
     node's raw input bindings per item with the ``item`` root bound to the
     current element, and executes one child run per item on a thread pool
-    bounded by ``maxParallel`` (default :data:`DEFAULT_MAP_PARALLELISM`).
+    bounded by ``maxParallel`` (default :data:`DEFAULT_MAP_PARALLELISM`) —
+    or, for ``executor: process``, on a process pool of the same size
+    (:mod:`backend.flows.map_process`).
     Branches launch lazily: before each launch (and after each completion)
     the aggregate consumption is checked against the parent's remaining
     budget, so a breach stops launching, skips the remaining branches, and
@@ -356,8 +372,9 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
             parent's remaining budget, or a child stops on
             ``budget_exhausted``.
         FlowNodeError: If ``over`` does not yield a list, a binding fails to
-            render, the ref is unknown, the depth cap is exceeded, or any
-            child run fails (fails closed).
+            render, the ref is unknown, the depth cap is exceeded, any
+            child run fails, or ``executor: process`` cannot reach the
+            store from a worker (fails closed).
     """
     engine = _engine(ctx)
     _ensure_depth(engine, ctx)
@@ -373,7 +390,7 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
         )
     base_state = _base_eval_state(engine, ctx)
     try:
-        items = render_template(node.over, base_state)
+        items = render_node_over(ctx.manifest, node, base_state)
     except ExpressionError as exc:
         raise FlowNodeError(
             f"map node {node.id!r}: 'over' failed to render: {exc}"
@@ -411,8 +428,16 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
             )
         return None
 
+    template: ChildRunSpec | None = None
+    pool: Executor
+    if node.executor == "process":
+        template = child_run_template(engine, ctx, child_manifest.id, ref.version_range)
+        pool = process_pool(workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
     next_index = 0
-    with ThreadPoolExecutor(max_workers=workers) as pool:
+    with pool:
         pending: dict[Future[Any], int] = {}
         while pending or next_index < len(items):
             while next_index < len(items) and len(pending) < workers:
@@ -424,9 +449,8 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
                 index = next_index
                 next_index += 1
                 try:
-                    rendered = render_template(
-                        dict(node.input_bindings),
-                        {**base_state, "item": items[index]},
+                    rendered = render_node_input(
+                        ctx.manifest, node, {**base_state, "item": items[index]}
                     )
                 except ExpressionError as exc:
                     raise FlowNodeError(
@@ -459,21 +483,31 @@ def map_handler(ctx: NodeContext) -> NodeOutcome:
                 granted[index] = (float(cap.max_tokens), cap.max_cost_usd)
                 reserved_tokens += float(cap.max_tokens)
                 reserved_cost += cap.max_cost_usd
-                future = pool.submit(
-                    _start_child,
-                    engine,
-                    ctx,
-                    child_manifest.id,
-                    ref.version_range,
-                    child_input,
-                    {
-                        "type": "map",
-                        "parentRunId": ctx.run_id,
-                        "nodeId": node.id,
-                        "index": index,
-                    },
-                    cap,
-                )
+                trigger = {
+                    "type": "map",
+                    "parentRunId": ctx.run_id,
+                    "nodeId": node.id,
+                    "index": index,
+                }
+                future: Future[Any]
+                if template is not None:
+                    future = pool.submit(
+                        run_child,
+                        replace(
+                            template, input=child_input, trigger=trigger, budget_cap=cap
+                        ),
+                    )
+                else:
+                    future = pool.submit(
+                        _start_child,
+                        engine,
+                        ctx,
+                        child_manifest.id,
+                        ref.version_range,
+                        child_input,
+                        trigger,
+                        cap,
+                    )
                 pending[future] = index
             if not pending:
                 break
@@ -0,0 +1,274 @@
+"""Pure scheduling and replay helpers for parallel flows.
+
+A flow declaring ``execution.mode: parallel`` is walked as a dependency DAG
+instead of along a single cursor. Its checkpoint keeps, next to
+``state.nodes``, a ``state.routes`` document mapping every completed node to
+the targets of the edges it took. Everything else — which nodes are ready,
+which were skipped, where the run stands — is derived from those two
+documents by the functions here, so live scheduling
+(:mod:`backend.flows.parallel`), resume, and replay agree on it (ADR-005).
+
+Join semantics: a node becomes ready once each of its predecessors has
+either completed or been skipped and at least one incoming edge was taken;
+when every predecessor has settled without taking an edge to it, it is
+skipped, and the skip propagates downstream.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from backend.flows.checkpoint import FlowReplayReport, build_eval_state
+from backend.flows.expressions import ExpressionError
+from backend.flows.handlers import FlowNodeError
+from backend.flows.model import FlowManifest, FlowNode
+from backend.flows.records import FlowRunRecord, FlowStepRecord
+from backend.flows.templates import guard_holds, render_node_input
+
+
+def select_next_nodes(
+    manifest: FlowManifest,
+    node: FlowNode,
+    eval_state: dict[str, Any],
+) -> tuple[str, ...]:
+    """Pick every edge a completed node takes in a parallel flow.
+
+    A ``conditional`` node keeps first-match-wins routing. Any other node
+    takes all of its unguarded edges plus every ``when`` edge whose
+    predicate holds, in declaration order. ``on``-signal edges are never
+    taken by normal completion. When edges exist but none is taken, routing
+    fails closed, as in :func:`~backend.flows.checkpoint.select_next_node`.
+
+    Args:
+        manifest: The flow definition.
+        node: The node whose outgoing edges to evaluate.
+        eval_state: State document predicates are evaluated against.
+
+    Returns:
+        Target node ids of the taken edges; empty when the node is terminal.
+
+    Raises:
+        ExpressionError: If a predicate fails to evaluate.
+        FlowNodeError: If edges exist but none is taken (fails closed).
+    """
+    edges = manifest.edges_from(node.id)
+    taken: list[str] = []
+    for edge in edges:
+        if edge.on is not None:
+            continue
+        if edge.when is not None and not guard_holds(manifest, edge, eval_state):
+            continue
+        if edge.target not in taken:
+            taken.append(edge.target)
+        if node.type == "conditional":
+            break
+    if taken or all(edge.on is not None for edge in edges):
+        return tuple(taken)
+    raise FlowNodeError(
+        f"no outgoing edge of node {node.id!r} matched the run state"
+    )
+
+
+def _topological_order(manifest: FlowManifest) -> list[str]:
+    """Order an acyclic manifest's nodes so every edge points forward.
+
+    Ties are broken by declaration order, so the result is stable.
+    """
+    position = {node.id: index for index, node in enumerate(manifest.nodes)}
+    indegree = {node.id: 0 for node in manifest.nodes}
+    for edge in manifest.edges:
+        indegree[edge.target] += 1
+    order: list[str] = []
+    available = sorted((n for n, d in indegree.items() if d == 0), key=position.__getitem__)
+    while available:
+        node_id = available.pop(0)
+        order.append(node_id)
+        for edge in manifest.edges_from(node_id):
+            indegree[edge.target] -= 1
+            if indegree[edge.target] == 0:
+                available.append(edge.target)
+        available.sort(key=position.__getitem__)
+    return order
+
+
+def parallel_frontier(
+    manifest: FlowManifest, routes: dict[str, Any]
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Derive the ready and skipped nodes of a parallel run.
+
+    Args:
+        manifest: The (acyclic) flow definition.
+        routes: The run's ``state.routes`` document.
+
+    Returns:
+        The ready node ids, in declaration order, and the skipped node ids.
+        Ready nodes include any that are currently executing: a node leaves
+        the frontier only once its routes are recorded.
+    """
+    predecessors: dict[str, list[str]] = {node.id: [] for node in manifest.nodes}
+    for edge in manifest.edges:
+        predecessors[edge.target].append(edge.source)
+    ready: list[str] = []
+    skipped: set[str] = set()
+    for node_id in _topological_order(manifest):
+        if node_id in routes:
+            continue
+        sources = predecessors[node_id]
+        if any(source not in routes and source not in skipped for source in sources):
+            continue
+        if not sources or any(
+            node_id in routes[source] for source in sources if source in routes
+        ):
+            ready.append(node_id)
+        else:
+            skipped.add(node_id)
+    position = {node.id: index for index, node in enumerate(manifest.nodes)}
+    return tuple(sorted(ready, key=position.__getitem__)), frozenset(skipped)
+
+
+def in_declaration_order(
+    manifest: FlowManifest, document: dict[str, Any]
+) -> dict[str, Any]:
+    """Re-key a per-node document in manifest declaration order.
+
+    Concurrent nodes finish in any order; checkpointing ``state.nodes`` and
+    ``state.routes`` in declaration order keeps the persisted state
+    independent of that timing.
+
+    Args:
+        manifest: The flow definition.
+        document: A mapping keyed by node id.
+
+    Returns:
+        The same entries, ordered by declaration.
+    """
+    return {node.id: document[node.id] for node in manifest.nodes if node.id in document}
+
+
+def replay_parallel_decision_path(
+    manifest: FlowManifest,
+    run: FlowRunRecord,
+    steps: list[FlowStepRecord],
+) -> FlowReplayReport:
+    """Re-derive a parallel run's schedule purely from persisted state.
+
+    The parallel counterpart of
+    :func:`~backend.flows.checkpoint.replay_decision_path`. Recorded outputs
+    are folded in frontier by frontier, each in declaration order, while
+    input bindings and routing are re-derived. Activation order across
+    concurrent nodes is timing, not a decision, so the recorded and replayed
+    sequences are compared as sets of nodes, and the replayed routes must
+    equal the checkpointed ``state.routes``. A failed run may stop short of
+    nodes replay finds ready; a completed run may not.
+
+    Args:
+        manifest: The flow definition the run executed.
+        run: The terminal run record.
+        steps: The run's persisted steps, in activation order.
+
+    Returns:
+        A :class:`~backend.flows.checkpoint.FlowReplayReport`.
+    """
+    recorded = [step for step in steps if step.status == "completed"]
+    recorded_sequence = tuple(step.node_id for step in recorded)
+    divergences = [
+        f"node {node_id!r} completed {count} times; a parallel flow activates "
+        "each node at most once"
+        for node_id, count in Counter(recorded_sequence).items()
+        if count > 1
+    ]
+    by_node = {step.node_id: step for step in recorded}
+    replayed: list[str] = []
+    nodes_state: dict[str, Any] = {}
+    routes: dict[str, list[str]] = {}
+    stalled: set[str] = set()
+    while not divergences:
+        ready = [
+            node_id
+            for node_id in parallel_frontier(manifest, routes)[0]
+            if node_id not in stalled
+        ]
+        if not ready:
+            break
+        for node_id in ready:
+            step = by_node.get(node_id)
+            if step is None:
+                stalled.add(node_id)
+                continue
+            replayed.append(node_id)
+            node = manifest.node(node_id)
+            if node.type != "map":
+                try:
+                    rendered = render_node_input(
+                        manifest, node, build_eval_state(run.input, nodes_state)
+                    )
+                except ExpressionError as exc:
+                    divergences.append(
+                        f"bindings of node {node_id!r} failed to render on "
+                        f"replay: {exc}"
+                    )
+                    break
+                rendered_input = (
+                    rendered if isinstance(rendered, dict) else {"value": rendered}
+                )
+                if rendered_input != step.input:
+                    divergences.append(
+                        f"replayed input of node {node_id!r} differs from the "
+                        "recorded step input"
+                    )
+            nodes_state[node_id] = {
+                "output": step.output if isinstance(step.output, dict) else {}
+            }
+            try:
+                routes[node_id] = list(
+                    select_next_nodes(
+                        manifest, node, build_eval_state(run.input, nodes_state)
+                    )
+                )
+            except (ExpressionError, FlowNodeError) as exc:
+                if not (
+                    run.stop_reason in ("predicate_error", "no_route")
+                    and node_id == run.state.get("cursor")
+                ):
+                    divergences.append(
+                        f"routing after node {node_id!r} failed on replay: {exc}"
+                    )
+                # The recorded run failed at this routing decision; nothing
+                # downstream of it can become ready.
+                stalled.add(node_id)
+
+    if not divergences:
+        divergences.extend(
+            f"the trace records node {node_id!r}, which replay never reached"
+            for node_id in recorded_sequence
+            if node_id not in replayed
+        )
+    if not divergences and run.status == "completed":
+        divergences.extend(
+            f"replay derived node {node_id!r} but the completed run never "
+            "activated it"
+            for node_id in sorted(stalled)
+            if node_id not in by_node
+        )
+        if routes != run.state.get("routes"):
+            divergences.append(
+                "replayed routes differ from the checkpointed state.routes"
+            )
+
+    return FlowReplayReport(
+        run_id=run.run_id,
+        flow_id=run.flow_id,
+        deterministic=not divergences,
+        recorded_sequence=recorded_sequence,
+        replayed_sequence=tuple(replayed),
+        divergences=tuple(divergences),
+    )
+
+
+__all__ = [
+    "in_declaration_order",
+    "parallel_frontier",
+    "replay_parallel_decision_path",
+    "select_next_nodes",
+]
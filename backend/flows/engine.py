@@ -17,6 +17,10 @@ determinism boundary.
 E3-S4 adds human-in-the-loop pauses: a ``human`` node stops the loop as
 ``waiting_human`` (with ``flow.run.paused``) until :mod:`backend.flows.human`
 resumes the run.
+
+Flows declaring ``execution.mode: parallel`` are scheduled as a dependency
+DAG instead, activating independent nodes concurrently
+(:mod:`backend.flows.parallel`).
 """
 
 from __future__ import annotations
@@ -25,7 +29,6 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Callable
 
-from backend.flows.activation import NodeActivationMixin
 from backend.flows.budgets import (
     budget_cap_document,
     budget_violation,
@@ -39,6 +42,7 @@ from backend.flows.checkpoint import (
     select_next_node,
 )
 from backend.events.runtime import emit_event
+from backend.flows.dag import replay_parallel_decision_path
 from backend.flows.expressions import ExpressionError
 from backend.flows.handlers import (
     FlowHandlerRegistry,
@@ -47,6 +51,7 @@ from backend.flows.handlers import (
 )
 from backend.flows.manifest import validate_run_input
 from backend.flows.model import FlowBudgets
+from backend.flows.parallel import ParallelSchedulerMixin
 from backend.flows.records import TERMINAL_RUN_STATUSES
 from backend.flows.registry import FlowRegistry
 from backend.flows.state import FlowRunRecord, FlowRunStore
@@ -58,7 +63,7 @@ class FlowRunError(RuntimeError):
     """Raised when a run cannot be started (unknown flow, invalid input)."""
 
 
-class FlowEngine(NodeActivationMixin):
+class FlowEngine(ParallelSchedulerMixin):
     """Executes registered flows with durable, observable Run/Step state."""
 
     def __init__(
@@ -72,6 +77,7 @@ class FlowEngine(NodeActivationMixin):
         sleeper: Callable[[float], None] | None = None,
         now: Callable[[], datetime] | None = None,
         max_steps_per_run: int = 1000,
+        process_engine_factory: Callable[[str], Any] | None = None,
     ) -> None:
         """Initialize the engine and its collaborators.
 
@@ -93,6 +99,10 @@ class FlowEngine(NodeActivationMixin):
             max_steps_per_run: Engine safety cap on node activations per run
                 (fails closed); complements, and never replaces, manifest
                 budgets.
+            process_engine_factory: Module-level callable building, inside a
+                worker process, the engine that runs ``executor: process``
+                map branches from the store's database URL; defaults to
+                :func:`backend.flows.map_process.default_engine_factory`.
         """
         self._store = store or get_store()
         self.registry = registry or FlowRegistry(self._store)
@@ -102,6 +112,7 @@ class FlowEngine(NodeActivationMixin):
         self._sleeper = sleeper or time.sleep
         self.now: Callable[[], datetime] = now or (lambda: datetime.now(timezone.utc))
         self._max_steps = max_steps_per_run
+        self.process_engine_factory = process_engine_factory
 
     # ------------------------------------------------------------------ API
 
@@ -273,7 +284,10 @@ class FlowEngine(NodeActivationMixin):
                     status="failed",
                     error="interrupted: attempt superseded by resume",
                 )
-        run = self._reconcile_crash_window(run)
+        if self.registry.resolve(run.flow_id, run.flow_version).execution.parallel:
+            run = self._reconcile_parallel(run)
+        else:
+            run = self._reconcile_crash_window(run)
         if run.status in TERMINAL_RUN_STATUSES:
             return run
         self.runs.append_event(
@@ -317,7 +331,10 @@ class FlowEngine(NodeActivationMixin):
             )
         manifest = self.registry.resolve(run.flow_id, run.flow_version)
         steps = self.runs.list_steps(run_id)
-        report = replay_decision_path(manifest, run, steps)
+        if manifest.execution.parallel:
+            report = replay_parallel_decision_path(manifest, run, steps)
+        else:
+            report = replay_decision_path(manifest, run, steps)
         self.runs.append_event(
             run_id=run_id, name="flow.run.replayed", payload=report.to_document()
         )
@@ -434,6 +451,17 @@ class FlowEngine(NodeActivationMixin):
         deadline = started + budgets.max_wall_clock_sec
         activations = 0
 
+        if manifest.execution.parallel:
+            stopped = self._run_parallel(
+                run,
+                manifest,
+                state,
+                budgets=budgets,
+                started=started,
+                deadline=deadline,
+            )
+            if stopped is not None:
+                return stopped
         while state.get("cursor"):
             budget_error = budget_violation(
                 budgets, state, self._clock() - started, activations, self._max_steps
@@ -7,12 +7,18 @@ implements a deliberately small, side-effect-free language: path lookups over a
 state mapping, literals, comparisons, and boolean operators. There is no
 attribute access, no function calls, and no ``eval`` — expressions cannot touch
 anything outside the state document they are evaluated against.
+
+Parsing is memoized: :func:`compile_expression` keeps a bounded LRU of
+compiled expressions keyed by source text, so the same guard or binding
+evaluated for every activation (or every ``map`` item) is tokenized once.
+Compiled expressions are immutable and safe to share across threads.
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping, Union
 
 _TEMPLATE_RE = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
@@ -28,6 +34,9 @@ _TOKEN_RE = re.compile(
     re.VERBOSE,
 )
 
+COMPILE_CACHE_SIZE = 4096
+"""Distinct expression sources :func:`compile_expression` keeps compiled."""
+
 _KEYWORDS = frozenset({"and", "or", "not", "true", "false", "null"})
 _COMPARISON_OPS = frozenset({"==", "!=", "<", "<=", ">", ">="})
 
@@ -183,6 +192,9 @@ class _Tokenizer:
 def compile_expression(source: str) -> CompiledExpression:
     """Parse an expression into a reusable compiled form.
 
+    Results are cached per source text (see :data:`COMPILE_CACHE_SIZE`);
+    invalid sources are not cached and raise on every call.
+
     Args:
         source: Expression text, without the surrounding ``{{ }}`` braces.
 
@@ -192,6 +204,12 @@ def compile_expression(source: str) -> CompiledExpression:
     Raises:
         ExpressionError: If the expression has invalid syntax.
     """
+    return _compile_cached(source)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_cached(source: str) -> CompiledExpression:
+    """Parse *source*; memoized behind :func:`compile_expression`."""
     text = source.strip()
     if not text:
         raise ExpressionError("expression is empty")
@@ -461,6 +479,7 @@ def extract_template_paths(value: Any) -> set[tuple[str, ...]]:
 
 
 __all__ = [
+    "COMPILE_CACHE_SIZE",
     "CompiledExpression",
     "ExpressionError",
     "compile_expression",
@@ -4,6 +4,11 @@ Field-level parsing lives in :mod:`backend.flows.manifest`; this module checks
 the graph shape: duplicate ids, dangling edges, entry/terminal structure,
 reachability, unconditional cycles, guard consistency per node type, and the
 state paths referenced by input bindings and edge predicates.
+
+A ``parallel`` flow is scheduled as a dependency DAG, so it may fan out
+along several unguarded edges, but it must be acyclic, has no human nodes,
+and may only read the outputs of upstream nodes — otherwise a node's input
+would depend on which concurrent sibling happened to finish first.
 """
 
 from __future__ import annotations
@@ -27,6 +32,7 @@ def validate_graph(
     nodes: list["FlowNode"],
     edges: list["FlowEdge"],
     input_schema: dict[str, Any] | None,
+    parallel: bool = False,
 ) -> list[str]:
     """Validate the structural rules of a flow graph.
 
@@ -34,6 +40,7 @@ def validate_graph(
         nodes: Parsed flow nodes.
         edges: Parsed flow edges.
         input_schema: The flow's declared input JSON Schema, when present.
+        parallel: Whether the flow declares ``execution.mode: parallel``.
 
     Returns:
         A list of error messages; empty when the graph is valid.
@@ -60,9 +67,23 @@ def validate_graph(
         return errors
 
     errors.extend(_validate_entry_and_reachability(nodes, edges))
-    errors.extend(_validate_guards(by_id, edges))
+    errors.extend(_validate_guards(by_id, edges, parallel=parallel))
     errors.extend(_validate_unconditional_cycles(edges))
-    errors.extend(_validate_expressions(by_id, edges, input_schema))
+    upstream: dict[str, set[str]] | None = None
+    if parallel:
+        errors.extend(
+            f"human node {node.id!r} is not supported in a parallel flow"
+            for node in nodes
+            if node.type == "human"
+        )
+        cycle = _find_cycle(edges)
+        if cycle is not None:
+            errors.append(
+                "parallel flows must be acyclic: " + " -> ".join(cycle)
+            )
+            return errors
+        upstream = _upstream_nodes(edges)
+    errors.extend(_validate_expressions(by_id, edges, input_schema, upstream))
     return errors
 
 
@@ -101,12 +122,13 @@ def _validate_entry_and_reachability(
 
 
 def _validate_guards(
-    by_id: dict[str, "FlowNode"], edges: list["FlowEdge"]
+    by_id: dict[str, "FlowNode"], edges: list["FlowEdge"], *, parallel: bool = False
 ) -> list[str]:
     """Check guard rules per node type.
 
     Conditional nodes need at least two guarded out-edges and nothing
-    unguarded. Other nodes may have at most one unguarded out-edge. ``on``
+    unguarded. Other nodes may have at most one unguarded out-edge, unless
+    the flow is parallel (every unguarded edge is then taken). ``on``
     signals are restricted to a known vocabulary, and ``timeout`` edges are
     only valid leaving human nodes with a consistent ``onTimeout``/``timeoutSec``.
     """
@@ -140,7 +162,7 @@ def _validate_guards(
                     f"conditional node {node_id!r} must guard every outgoing edge "
                     "with 'when' or 'on'"
                 )
-        elif len(unguarded) > 1:
+        elif len(unguarded) > 1 and not parallel:
             errors.append(
                 f"node {node_id!r} has {len(unguarded)} unguarded outgoing edges; "
                 "at most one is allowed"
@@ -174,10 +196,21 @@ def _validate_unconditional_cycles(edges: list["FlowEdge"]) -> list[str]:
     Guarded loops (rework paths) are legal because a predicate can break them;
     a cycle of unconditional edges can never terminate.
     """
+    cycle = _find_cycle([edge for edge in edges if not edge.guarded])
+    if cycle is None:
+        return []
+    return [
+        "unconditional cycle detected: "
+        + " -> ".join(cycle)
+        + "; loops must include a 'when' or 'on' guarded edge"
+    ]
+
+
+def _find_cycle(edges: list["FlowEdge"]) -> list[str] | None:
+    """Return one cycle formed by *edges* as a closed node path, or ``None``."""
     adjacency: dict[str, list[str]] = {}
     for edge in edges:
-        if not edge.guarded:
-            adjacency.setdefault(edge.source, []).append(edge.target)
+        adjacency.setdefault(edge.source, []).append(edge.target)
 
     WHITE, GRAY, BLACK = 0, 1, 2
     color: dict[str, int] = {}
@@ -202,20 +235,44 @@ def _validate_unconditional_cycles(edges: list["FlowEdge"]) -> list[str]:
         if color.get(start, WHITE) == WHITE:
             cycle = visit(start, [])
             if cycle is not None:
-                return [
-                    "unconditional cycle detected: "
-                    + " -> ".join(cycle)
-                    + "; loops must include a 'when' or 'on' guarded edge"
-                ]
-    return []
+                return cycle
+    return None
+
+
+def _upstream_nodes(edges: list["FlowEdge"]) -> dict[str, set[str]]:
+    """Map every node of an acyclic graph to the nodes it transitively depends on."""
+    predecessors: dict[str, set[str]] = {}
+    for edge in edges:
+        predecessors.setdefault(edge.target, set()).add(edge.source)
+        predecessors.setdefault(edge.source, set())
+    upstream: dict[str, set[str]] = {}
+
+    def collect(node_id: str) -> set[str]:
+        if node_id not in upstream:
+            found: set[str] = set()
+            for source in predecessors.get(node_id, ()):
+                found.add(source)
+                found |= collect(source)
+            upstream[node_id] = found
+        return upstream[node_id]
+
+    for node_id in predecessors:
+        collect(node_id)
+    return upstream
 
 
 def _validate_expressions(
     by_id: dict[str, "FlowNode"],
     edges: list["FlowEdge"],
     input_schema: dict[str, Any] | None,
+    upstream: dict[str, set[str]] | None = None,
 ) -> list[str]:
-    """Compile every predicate/binding and check the state paths they reference."""
+    """Compile every predicate/binding and check the state paths they reference.
+
+    When *upstream* is given (parallel flows), a binding may only read the
+    outputs of the node's upstream nodes, and an edge predicate those of its
+    source node and the source's upstream nodes.
+    """
     errors: list[str] = []
     declared_inputs: set[str] | None = None
     if input_schema is not None and isinstance(input_schema.get("properties"), dict):
@@ -231,7 +288,18 @@ def _validate_expressions(
             errors.append(f"{location}: invalid 'when' expression: {exc}")
             continue
         errors.extend(
-            _check_paths(paths, location, by_id, declared_inputs, allow_item=False)
+            _check_paths(
+                paths,
+                location,
+                by_id,
+                declared_inputs,
+                allow_item=False,
+                readable=(
+                    None
+                    if upstream is None
+                    else upstream.get(edge.source, set()) | {edge.source}
+                ),
+            )
         )
 
     for node in by_id.values():
@@ -251,6 +319,7 @@ def _validate_expressions(
                 declared_inputs,
                 allow_item=node.type == "map",
                 self_id=node.id,
+                readable=None if upstream is None else upstream.get(node.id, set()),
             )
         )
     return errors
@@ -272,6 +341,7 @@ def _check_paths(
     *,
     allow_item: bool,
     self_id: str | None = None,
+    readable: set[str] | None = None,
 ) -> list[str]:
     """Validate that referenced state paths point at known roots.
 
@@ -283,6 +353,8 @@ def _check_paths(
             it declares any.
         allow_item: Whether the ``item`` root is legal (map-node bindings).
         self_id: Id of the node owning the binding, to reject self-references.
+        readable: Nodes whose outputs may be read (parallel flows); ``None``
+            allows every node.
 
     Returns:
         A list of error messages.
@@ -307,6 +379,11 @@ def _check_paths(
                 errors.append(f"{location}: references unknown node {referenced!r}")
             elif path[1] == self_id:
                 errors.append(f"{location}: node cannot reference its own output")
+            elif readable is not None and path[1] not in readable:
+                errors.append(
+                    f"{location}: node {path[1]!r} is not upstream; a parallel "
+                    "flow may only read the outputs of upstream nodes"
+                )
             elif len(path) >= 3 and path[2] != "output":
                 errors.append(
                     f"{location}: only node outputs are addressable "
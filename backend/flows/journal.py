@@ -0,0 +1,272 @@
+"""Incremental run-state checkpoints: per-step deltas plus periodic snapshots.
+
+``flow_runs.state_json`` holds a *snapshot* of a run's state; every
+checkpoint after it is appended to ``flow_state_journal`` as a *delta* — the
+top-level keys and the entries of top-level mappings (``nodes.<id>``,
+``metrics.tokens``, ``routes.<id>``) that changed. A run whose ``state.nodes``
+accumulates large outputs therefore writes each output once instead of once
+per later step. Every ``snapshot_every`` deltas, and whenever a run reaches a
+terminal status, the full state is written back to ``state_json`` and the
+journal is compacted.
+
+Journal sequences are monotonic per run and never reused: compaction deletes
+the folded deltas but leaves a *snapshot marker* row (``delta_json`` null) at
+the next sequence. A writer only appends a delta when the journal head is
+still the sequence it last wrote, so two stores checkpointing the same run
+(an engine and the human-decision service, say) can never apply a delta to
+the wrong base; on a mismatch the writer falls back to a snapshot.
+
+:mod:`backend.flows.state` owns the ``flow_runs`` SQL and calls the journal
+helpers here inside its own transactions.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.flows.records import _utcnow, load_json
+
+DEFAULT_SNAPSHOT_EVERY = 32
+"""Deltas appended to a run's journal before it is compacted into a snapshot."""
+
+_MAX_CACHED_RUNS = 1024
+
+
+def state_delta(previous: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Compute the operations turning *previous* into *current*.
+
+    Mappings at the top level are diffed one level deep, so a new node
+    output is one ``set`` of ``["nodes", <id>]`` rather than a rewrite of
+    every output so far. Deeper values are compared and replaced whole.
+    :func:`apply_delta` appends new entries, so a mapping whose existing
+    keys moved, or whose new keys do not all come last, is set whole:
+    replaying the journal must rebuild the key order too (parallel runs
+    checkpoint ``nodes`` and ``routes`` in declaration order).
+
+    Args:
+        previous: The state as of the last checkpoint.
+        current: The state to checkpoint.
+
+    Returns:
+        ``set``/``unset`` operations, in application order; empty when the
+        states are equal.
+    """
+    ops: list[dict[str, Any]] = [
+        {"op": "unset", "path": [key]} for key in previous if key not in current
+    ]
+    for key, value in current.items():
+        if key not in previous:
+            ops.append({"op": "set", "path": [key], "value": value})
+            continue
+        old = previous[key]
+        if isinstance(old, dict) and isinstance(value, dict):
+            rebuilt = [sub for sub in old if sub in value]
+            rebuilt.extend(sub for sub in value if sub not in old)
+            if rebuilt != list(value):
+                ops.append({"op": "set", "path": [key], "value": value})
+                continue
+            ops.extend(
+                {"op": "unset", "path": [key, sub]} for sub in old if sub not in value
+            )
+            ops.extend(
+                {"op": "set", "path": [key, sub], "value": item}
+                for sub, item in value.items()
+                if sub not in old or old[sub] != item
+            )
+        elif old != value:
+            ops.append({"op": "set", "path": [key], "value": value})
+    return ops
+
+
+def apply_delta(state: dict[str, Any], ops: Iterable[dict[str, Any]]) -> None:
+    """Apply :func:`state_delta` operations to *state* in place.
+
+    Args:
+        state: The state to update.
+        ops: Operations to apply, in order.
+    """
+    for op in ops:
+        *parents, leaf = op["path"]
+        target = state
+        for key in parents:
+            child = target.get(key)
+            if not isinstance(child, dict):
+                child = target[key] = {}
+            target = child
+        if op["op"] == "unset":
+            target.pop(leaf, None)
+        else:
+            target[leaf] = op["value"]
+
+
+def journal_head(conn: Any, sql: Callable[[str], str], run_id: str) -> int:
+    """Return the highest journal sequence of a run, or ``0`` without one.
+
+    Args:
+        conn: Open connection, inside the caller's write transaction.
+        sql: Dialect placeholder formatter of the owning store.
+        run_id: Run whose journal to inspect.
+
+    Returns:
+        The journal head sequence.
+    """
+    row = conn.execute(
+        sql("SELECT COALESCE(MAX(sequence), 0) FROM flow_state_journal WHERE run_id = {p}"),
+        (run_id,),
+    ).fetchone()
+    return int(row[0] if not hasattr(row, "keys") else list(row)[0])
+
+
+def append_delta(
+    conn: Any, sql: Callable[[str], str], run_id: str, sequence: int, delta_json: str
+) -> None:
+    """Append one delta to a run's journal.
+
+    Args:
+        conn: Open connection, inside the caller's write transaction.
+        sql: Dialect placeholder formatter of the owning store.
+        run_id: Run the delta belongs to.
+        sequence: The delta's sequence (the journal head plus one).
+        delta_json: Serialized :func:`state_delta` operations.
+    """
+    conn.execute(
+        sql(
+            "INSERT INTO flow_state_journal (run_id, sequence, delta_json, created_at) "
+            "VALUES ({p}, {p}, {p}, {p})"
+        ),
+        (run_id, sequence, delta_json, _utcnow()),
+    )
+
+
+def compact_journal(
+    conn: Any, sql: Callable[[str], str], run_id: str, sequence: int
+) -> None:
+    """Drop a run's folded deltas and leave a snapshot marker at *sequence*.
+
+    Args:
+        conn: Open connection, inside the transaction writing the snapshot.
+        sql: Dialect placeholder formatter of the owning store.
+        run_id: Run whose journal to compact.
+        sequence: The marker's sequence (the journal head plus one).
+    """
+    conn.execute(sql("DELETE FROM flow_state_journal WHERE run_id = {p}"), (run_id,))
+    conn.execute(
+        sql(
+            "INSERT INTO flow_state_journal (run_id, sequence, delta_json, created_at) "
+            "VALUES ({p}, {p}, NULL, {p})"
+        ),
+        (run_id, sequence, _utcnow()),
+    )
+
+
+def load_deltas(
+    conn: Any, sql: Callable[[str], str], runs_query: str, params: tuple[Any, ...]
+) -> dict[str, list[list[dict[str, Any]]]]:
+    """Read the pending deltas of every run selected by *runs_query*.
+
+    Args:
+        conn: Open connection.
+        sql: Dialect placeholder formatter of the owning store.
+        runs_query: ``SELECT run_id FROM flow_runs ...`` choosing the runs.
+        params: Parameters of *runs_query*.
+
+    Returns:
+        Each run's delta operation lists in sequence order; runs without
+        pending deltas are absent.
+    """
+    rows = conn.execute(
+        sql(
+            "SELECT run_id, delta_json FROM flow_state_journal "
+            f"WHERE delta_json IS NOT NULL AND run_id IN ({runs_query}) "
+            "ORDER BY run_id, sequence"
+        ),
+        params,
+    ).fetchall()
+    deltas: dict[str, list[list[dict[str, Any]]]] = {}
+    for row in rows:
+        run_id, delta = (row["run_id"], row["delta_json"]) if hasattr(row, "keys") else row
+        deltas.setdefault(run_id, []).append(load_json(delta) or [])
+    return deltas
+
+
+@dataclass
+class RunCheckpoint:
+    """What one store last checkpointed for a run.
+
+    Attributes:
+        sequence: Journal sequence of that checkpoint (``0`` for the state
+            written by ``create_run``).
+        state: JSON-canonical copy of the checkpointed state.
+        deltas: Deltas appended since the last snapshot.
+        bytes_written: State bytes this store has written for the run.
+    """
+
+    sequence: int
+    state: dict[str, Any]
+    deltas: int = 0
+    bytes_written: int = 0
+
+
+class CheckpointCache:
+    """Bounded, thread-safe map of run id to :class:`RunCheckpoint`."""
+
+    def __init__(self, max_runs: int = _MAX_CACHED_RUNS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_runs: Runs kept before the least recently written is dropped;
+                a dropped run's next checkpoint is simply a snapshot.
+        """
+        self._entries: OrderedDict[str, RunCheckpoint] = OrderedDict()
+        self._max_runs = max_runs
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str) -> RunCheckpoint | None:
+        """Return the run's last checkpoint, if this store wrote one."""
+        with self._lock:
+            return self._entries.get(run_id)
+
+    def put(self, run_id: str, checkpoint: RunCheckpoint) -> None:
+        """Record the run's latest checkpoint."""
+        with self._lock:
+            self._entries[run_id] = checkpoint
+            self._entries.move_to_end(run_id)
+            while len(self._entries) > self._max_runs:
+                self._entries.popitem(last=False)
+
+    def pop(self, run_id: str) -> RunCheckpoint | None:
+        """Forget a run, returning its last checkpoint."""
+        with self._lock:
+            return self._entries.pop(run_id, None)
+
+
+def canonical_copy(encoded: str) -> dict[str, Any]:
+    """Decode a just-written state document into an independent copy.
+
+    Args:
+        encoded: The serialized state.
+
+    Returns:
+        A copy that later in-place mutations of the live state cannot reach.
+    """
+    decoded: dict[str, Any] = json.loads(encoded)
+    return decoded
+
+
+__all__ = [
+    "DEFAULT_SNAPSHOT_EVERY",
+    "CheckpointCache",
+    "RunCheckpoint",
+    "append_delta",
+    "apply_delta",
+    "canonical_copy",
+    "compact_journal",
+    "journal_head",
+    "load_deltas",
+    "state_delta",
+]
@@ -26,10 +26,14 @@ from backend.flows.graph import validate_graph
 from backend.flows.model import (
     BACKOFF_MODES,
     DEFAULT_FLOW_BUDGETS,
+    DEFAULT_FLOW_EXECUTION,
     DEFAULT_FLOW_RETRIES,
+    DEFAULT_MAX_CONCURRENCY,
+    EXECUTION_MODES,
     FLOW_ID_RE,
     FLOW_NODE_TYPES,
     FLOW_SCHEMA_VERSION,
+    MAP_EXECUTORS,
     NODE_ID_RE,
     REDUCE_MODES,
     REF_NODE_TYPES,
@@ -37,6 +41,7 @@ from backend.flows.model import (
     FlowBudgets,
     FlowDefaults,
     FlowEdge,
+    FlowExecution,
     FlowIO,
     FlowManifest,
     FlowManifestValidationResult,
@@ -48,6 +53,7 @@ from backend.flows.model import (
     _is_supported_range,
     version_in_range,
 )
+from backend.flows.templates import compile_render_plan
 
 def _parse_triggers(value: Any, errors: list[str]) -> list[FlowTrigger]:
     """Parse the ``triggers`` list.
@@ -124,6 +130,32 @@ def _parse_budgets(value: Any, errors: list[str]) -> FlowBudgets:
     )
 
 
+def _parse_execution(value: Any, errors: list[str]) -> FlowExecution:
+    """Parse the ``execution`` block, falling back to sequential scheduling.
+
+    Args:
+        value: Raw execution mapping.
+        errors: Accumulator for validation errors.
+
+    Returns:
+        The parsed scheduling mode; the default on absence.
+    """
+    if value is None:
+        return DEFAULT_FLOW_EXECUTION
+    if not isinstance(value, dict):
+        errors.append("execution must be an object")
+        return DEFAULT_FLOW_EXECUTION
+    mode = _string(value.get("mode")) or "sequential"
+    if mode not in EXECUTION_MODES:
+        errors.append(f"execution.mode must be one of {sorted(EXECUTION_MODES)}")
+        return DEFAULT_FLOW_EXECUTION
+    concurrency = value.get("maxConcurrency", DEFAULT_MAX_CONCURRENCY)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+        errors.append("execution.maxConcurrency must be an integer >= 1")
+        return DEFAULT_FLOW_EXECUTION
+    return FlowExecution(mode=mode, max_concurrency=concurrency)
+
+
 def _parse_node(item: Any, index: int, errors: list[str]) -> FlowNode | None:
     """Parse one entry of the ``nodes`` list.
 
@@ -186,6 +218,15 @@ def _parse_node(item: Any, index: int, errors: list[str]) -> FlowNode | None:
         errors.append(f"nodes.{node_id}.maxParallel must be an integer >= 1")
         max_parallel = None
 
+    executor = _string(item.get("executor")) or "thread"
+    if executor not in MAP_EXECUTORS:
+        errors.append(
+            f"nodes.{node_id}.executor must be one of {sorted(MAP_EXECUTORS)}"
+        )
+        executor = "thread"
+    if node_type != "map" and item.get("executor") is not None:
+        errors.append(f"nodes.{node_id}.executor is only allowed on map nodes")
+
     return FlowNode(
         id=node_id,
         type=node_type,
@@ -203,6 +244,7 @@ def _parse_node(item: Any, index: int, errors: list[str]) -> FlowNode | None:
         over=over,
         reduce=reduce_mode,
         max_parallel=max_parallel,
+        executor=executor,
         raw=dict(item),
     )
 
@@ -247,7 +289,8 @@ def validate_flow_manifest(raw: dict[str, Any]) -> FlowManifestValidationResult:
     Performs field-level validation, then structural graph validation
     (via :func:`backend.flows.graph.validate_graph`): duplicate ids, unknown
     edge endpoints, entry/terminal shape, unconditional cycles, guard
-    consistency, and template-binding references.
+    consistency, and template-binding references. A valid manifest carries
+    its compiled :attr:`~backend.flows.model.FlowManifest.render_plan`.
 
     Args:
         raw: Parsed ``flow.yaml`` document, keyed by camelCase field names.
@@ -279,6 +322,7 @@ def validate_flow_manifest(raw: dict[str, Any]) -> FlowManifestValidationResult:
     flow_input = _parse_io(raw.get("input"), "input", errors)
     flow_output = _parse_io(raw.get("output"), "output", errors)
     budgets = _parse_budgets(raw.get("budgets"), errors)
+    execution = _parse_execution(raw.get("execution"), errors)
 
     defaults_raw = raw.get("defaults")
     defaults = FlowDefaults()
@@ -314,6 +358,7 @@ def validate_flow_manifest(raw: dict[str, Any]) -> FlowManifestValidationResult:
                 nodes=nodes,
                 edges=edges,
                 input_schema=flow_input.schema if flow_input else None,
+                parallel=execution.parallel,
             )
         )
 
@@ -337,7 +382,9 @@ def validate_flow_manifest(raw: dict[str, Any]) -> FlowManifestValidationResult:
             nodes=tuple(nodes),
             edges=tuple(edges),
             budgets=budgets,
+            execution=execution,
             raw=dict(raw),
+            render_plan=compile_render_plan(nodes, edges),
         ),
     )
 
@@ -405,6 +452,7 @@ __all__ = [
     "FlowBudgets",
     "FlowDefaults",
     "FlowEdge",
+    "FlowExecution",
     "FlowIO",
     "FlowManifest",
     "FlowManifestValidationResult",
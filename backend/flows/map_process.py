@@ -0,0 +1,287 @@
+"""Process-pool execution of ``map`` branches (``executor: process``).
+
+By default :func:`backend.flows.composite.map_handler` runs each branch's
+child flow on a thread, which suits I/O-bound children (LLM and tool calls)
+but serializes CPU-bound ones — diff summarization, chunking, deterministic
+evaluators — on the GIL. A ``map`` node declaring ``executor: process`` runs
+its branches in worker processes instead.
+
+A worker cannot share the parent's engine, so each branch travels as a
+picklable :class:`ChildRunSpec`: the database URL, a module-level engine
+factory, the child flow reference, the rendered input, and the budget cap the
+parent reserved for it. The worker builds (once per process) an engine from
+the factory over the same database and executes the child run there; the
+parent reads back the terminal run record exactly as the thread executor
+does, so budget reservation, aggregate accounting, ordering and failure
+handling are unchanged (ADR-006).
+
+Workers are started with the ``spawn`` method rather than ``fork``: the
+engine process is multi-threaded (API workers, parallel flows, sibling map
+branches), and forking it could copy a lock some other thread holds.
+Handlers the children need — skills backed by in-process callables, local
+agent handlers — must therefore be installed by the factory, not by the
+parent: see :attr:`backend.flows.engine.FlowEngine.process_engine_factory`.
+
+Spawning a worker costs an interpreter start and the engine imports, so the
+pools are shared: one per worker count, built on first use and kept for the
+life of the process. Each activation borrows its pool through a
+:class:`PoolLease`, whose shutdown waits for that activation's branches only.
+
+A child run publishes its ``run.*`` events on the worker's own event bus, so
+they only reach the parent's subscribers (the SSE stream, projections)
+through the cross-process Redis bus; without it ``executor: process`` fails
+closed rather than running children nobody can watch.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import multiprocessing
+import pickle
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.config.settings import get_settings
+from backend.flows.handlers import FlowNodeError, NodeContext
+from backend.flows.model import FlowBudgets
+from backend.flows.records import FlowRunRecord
+from backend.persistence.sqlite_adapter import SQLiteStore
+
+# Engines built inside this (worker) process, by (factory, database URL).
+_worker_engines: dict[tuple[Callable[[str], Any], str], Any] = {}
+_worker_engines_lock = threading.Lock()
+
+# Shared spawn pools of this (parent) process, by worker count.
+_pools: dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def default_engine_factory(database_url: str) -> Any:
+    """Build a worker engine with the default handlers over *database_url*.
+
+    Args:
+        database_url: ``DATABASE_URL`` of the parent engine's store.
+
+    Returns:
+        A :class:`~backend.flows.engine.FlowEngine`.
+    """
+    from backend.flows.engine import FlowEngine  # deferred: avoid module cycle
+
+    if database_url.startswith(("postgresql://", "postgres://")):
+        from backend.persistence.postgres_adapter import PostgresStore  # noqa: PLC0415
+        return FlowEngine(store=PostgresStore(database_url))
+    return FlowEngine(store=SQLiteStore(database_url))
+
+
+@dataclass(frozen=True)
+class ChildRunSpec:
+    """Everything a worker process needs to execute one ``map`` branch.
+
+    Attributes:
+        database_url: Store the parent run lives in.
+        engine_factory: Module-level callable building an engine from
+            ``database_url`` inside the worker.
+        node_id: The parent ``map`` node, for error messages.
+        flow_id: Resolved child flow id.
+        version_range: SemVer range from the node ref.
+        tenant_id: Tenant of the parent run.
+        parent_run_id: Id of the parent run.
+        input: Rendered input of this branch's child run.
+        trigger: Trigger document recording the composite origin.
+        budget_cap: Budget reserved for this branch by the parent.
+    """
+
+    database_url: str
+    engine_factory: Callable[[str], Any]
+    node_id: str
+    flow_id: str
+    version_range: str
+    tenant_id: str
+    parent_run_id: str
+    input: dict[str, Any] = field(default_factory=dict)
+    trigger: dict[str, Any] = field(default_factory=dict)
+    budget_cap: FlowBudgets | None = None
+
+
+def child_run_template(
+    engine: Any, ctx: NodeContext, flow_id: str, version_range: str
+) -> ChildRunSpec:
+    """Build the branch-independent part of a ``map`` node's child run specs.
+
+    Args:
+        engine: The parent flow engine.
+        ctx: Activation context of the ``map`` node.
+        flow_id: Resolved child flow id.
+        version_range: SemVer range from the node ref.
+
+    Returns:
+        A spec to complete per branch with ``input``, ``trigger`` and
+        ``budget_cap`` (:func:`dataclasses.replace`).
+
+    Raises:
+        FlowNodeError: If the event bus does not deliver across processes,
+            the parent's store cannot be opened from another process, or the
+            engine factory cannot be pickled (fails closed).
+    """
+    settings = get_settings()
+    if settings.autodev_event_bus != "redis" or not settings.autodev_event_bus_cross_process:
+        raise FlowNodeError(
+            f"map node {ctx.node.id!r}: executor 'process' needs the cross-process "
+            "event bus (AUTODEV_EVENT_BUS=redis, AUTODEV_EVENT_BUS_CROSS_PROCESS=true) "
+            "so child run events reach the parent's subscribers"
+        )
+    database_url = str(getattr(getattr(engine, "_store", None), "database_url", ""))
+    if not database_url or ":memory:" in database_url:
+        raise FlowNodeError(
+            f"map node {ctx.node.id!r}: executor 'process' needs a database "
+            "that worker processes can open"
+        )
+    factory = getattr(engine, "process_engine_factory", None) or default_engine_factory
+    try:
+        pickle.dumps(factory)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        raise FlowNodeError(
+            f"map node {ctx.node.id!r}: the process engine factory must be a "
+            f"module-level callable: {exc}"
+        ) from exc
+    return ChildRunSpec(
+        database_url=database_url,
+        engine_factory=factory,
+        node_id=ctx.node.id,
+        flow_id=flow_id,
+        version_range=version_range,
+        tenant_id=ctx.tenant_id,
+        parent_run_id=ctx.run_id,
+    )
+
+
+def _shared_pool(
+    max_workers: int, *, broken: ProcessPoolExecutor | None = None
+) -> ProcessPoolExecutor:
+    """Return the shared pool of *max_workers* workers, building it on first use.
+
+    Args:
+        max_workers: Worker count of the pool.
+        broken: A pool that lost a worker; it is replaced if still shared.
+
+    Returns:
+        A ``spawn``-context :class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None or pool is broken:
+            pool = _pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+    if broken is not None:
+        broken.shutdown(wait=False, cancel_futures=True)
+    return pool
+
+
+class PoolLease(Executor):
+    """One ``map`` activation's use of a shared worker pool.
+
+    Submissions go to the shared pool; :meth:`shutdown` waits for (or
+    cancels) this lease's branches only and leaves the pool running.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Borrow the shared pool of *max_workers* workers.
+
+        Args:
+            max_workers: The node's ``maxParallel``.
+        """
+        self._max_workers = max_workers
+        self._pool = _shared_pool(max_workers)
+        self._futures: list[Future[Any]] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        """Schedule *fn* on the shared pool, replacing it once if it broke."""
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            self._pool = _shared_pool(self._max_workers, broken=self._pool)
+            future = self._pool.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Release the lease: cancel and/or wait for this lease's branches."""
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(self._futures)
+        self._futures = []
+
+
+def process_pool(max_workers: int) -> PoolLease:
+    """Lease the shared worker pool for one ``map`` activation.
+
+    Args:
+        max_workers: The node's ``maxParallel``.
+
+    Returns:
+        A :class:`PoolLease` on the shared ``spawn``-context pool of that size.
+    """
+    return PoolLease(max_workers)
+
+
+def shutdown_process_pools() -> None:
+    """Stop every shared worker pool, e.g. on engine shutdown or in tests."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_child(spec: ChildRunSpec) -> FlowRunRecord:
+    """Execute one ``map`` branch's child run; the worker-process entry point.
+
+    Args:
+        spec: The branch to run.
+
+    Returns:
+        The child's terminal run record.
+
+    Raises:
+        FlowNodeError: If the child run cannot be started.
+    """
+    from backend.flows.engine import FlowRunError  # deferred: avoid module cycle
+
+    key = (spec.engine_factory, spec.database_url)
+    with _worker_engines_lock:
+        engine = _worker_engines.get(key)
+        if engine is None:
+            engine = _worker_engines[key] = spec.engine_factory(spec.database_url)
+    try:
+        record: FlowRunRecord = engine.start_run(
+            spec.flow_id,
+            version_range=spec.version_range,
+            input=spec.input,
+            trigger=spec.trigger,
+            tenant_id=spec.tenant_id,
+            parent_run_id=spec.parent_run_id,
+            budget_cap=spec.budget_cap,
+        )
+    except FlowRunError as exc:
+        raise FlowNodeError(
+            f"node {spec.node_id!r}: failed to start child flow {spec.flow_id!r}: {exc}"
+        ) from exc
+    return record
+
+
+__all__ = [
+    "ChildRunSpec",
+    "PoolLease",
+    "child_run_template",
+    "default_engine_factory",
+    "process_pool",
+    "run_child",
+    "shutdown_process_pools",
+]
@@ -9,11 +9,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 from packaging.version import InvalidVersion, Version
 
+if TYPE_CHECKING:
+    from backend.flows.templates import FlowRenderPlan
+
 FLOW_SCHEMA_VERSION = "1"
 FLOW_ID_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*/[a-z0-9]+(?:-[a-z0-9]+)*$")
 NODE_ID_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
@@ -26,6 +29,9 @@ REF_NODE_TYPES = frozenset({"agent", "skill", "tool", "subflow", "map"})
 TRIGGER_TYPES = frozenset({"message", "webhook", "cron", "event"})
 BACKOFF_MODES = frozenset({"fixed", "exponential"})
 REDUCE_MODES = frozenset({"collect"})
+MAP_EXECUTORS = frozenset({"thread", "process"})
+EXECUTION_MODES = frozenset({"sequential", "parallel"})
+DEFAULT_MAX_CONCURRENCY = 4
 
 
 @dataclass(frozen=True)
@@ -108,6 +114,32 @@ class FlowBudgets:
 DEFAULT_FLOW_BUDGETS = FlowBudgets()
 
 
+@dataclass(frozen=True)
+class FlowExecution:
+    """How the engine schedules a run's node activations.
+
+    Attributes:
+        mode: ``"sequential"`` follows one cursor along the first matching
+            edge of each node. ``"parallel"`` treats the edges as a
+            dependency DAG: every matching out-edge is taken, a node runs once
+            all of its predecessors are resolved, and independent nodes run
+            concurrently.
+        max_concurrency: Most node activations of one run in flight at once
+            in ``parallel`` mode.
+    """
+
+    mode: str = "sequential"
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+    @property
+    def parallel(self) -> bool:
+        """Whether the run is scheduled as a dependency DAG."""
+        return self.mode == "parallel"
+
+
+DEFAULT_FLOW_EXECUTION = FlowExecution()
+
+
 @dataclass(frozen=True)
 class FlowTrigger:
     """A declaration of what starts the flow.
@@ -164,6 +196,8 @@ class FlowNode:
             out over.
         reduce: Aggregation mode for ``map`` nodes.
         max_parallel: Maximum parallel branches for ``map`` nodes.
+        executor: Where a ``map`` node runs its branches, one of
+            :data:`MAP_EXECUTORS` (threads by default).
         raw: Original manifest document for this node.
     """
 
@@ -179,6 +213,7 @@ class FlowNode:
     over: str | None = None
     reduce: str = "collect"
     max_parallel: int | None = None
+    executor: str = "thread"
     raw: dict[str, Any] = field(default_factory=dict)
 
 
@@ -235,7 +270,10 @@ class FlowManifest:
         nodes: Flow nodes, in declaration order.
         edges: Flow edges, in declaration order.
         budgets: Fail-closed run budgets.
+        execution: Node scheduling mode.
         raw: Original manifest document.
+        render_plan: Compiled bindings, ``over`` expressions and guards, set
+            by :func:`~backend.flows.manifest.validate_flow_manifest`.
     """
 
     schema_version: str
@@ -251,7 +289,11 @@ class FlowManifest:
     nodes: tuple[FlowNode, ...] = ()
     edges: tuple[FlowEdge, ...] = ()
     budgets: FlowBudgets = DEFAULT_FLOW_BUDGETS
+    execution: FlowExecution = DEFAULT_FLOW_EXECUTION
     raw: dict[str, Any] = field(default_factory=dict)
+    render_plan: FlowRenderPlan | None = field(
+        default=None, compare=False, repr=False
+    )
 
     def node(self, node_id: str) -> FlowNode:
         """Return the node with the given id.
@@ -360,13 +402,17 @@ def version_in_range(version: str, version_range: str) -> bool:
 __all__ = [
     "BACKOFF_MODES",
     "DEFAULT_FLOW_BUDGETS",
+    "DEFAULT_FLOW_EXECUTION",
     "DEFAULT_FLOW_RETRIES",
+    "DEFAULT_MAX_CONCURRENCY",
+    "EXECUTION_MODES",
     "FLOW_ID_RE",
     "FLOW_NODE_TYPES",
     "FLOW_SCHEMA_VERSION",
     "FlowBudgets",
     "FlowDefaults",
     "FlowEdge",
+    "FlowExecution",
     "FlowIO",
     "FlowManifest",
     "FlowManifestValidationResult",
@@ -374,6 +420,7 @@ __all__ = [
     "FlowNodeRef",
     "FlowRetryPolicy",
     "FlowTrigger",
+    "MAP_EXECUTORS",
     "NODE_ID_RE",
     "REDUCE_MODES",
     "REF_NODE_TYPES",
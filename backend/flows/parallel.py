@@ -0,0 +1,330 @@
+"""Parallel DAG scheduling of flow runs (``execution.mode: parallel``).
+
+The sequential engine follows one ``state.cursor``, so independent branches —
+lint, security scan and docs after a checkout, say — run one after another.
+:class:`ParallelSchedulerMixin` instead activates every ready node (see
+:func:`~backend.flows.dag.parallel_frontier`) on a thread pool capped at the
+manifest's ``execution.maxConcurrency``.
+
+Worker threads only run a node's attempts
+(:meth:`~backend.flows.activation.NodeActivationMixin._attempt_node`); the
+coordinating thread renders inputs, merges outputs into ``state.nodes``,
+records routes in ``state.routes``, checkpoints, and fails the run. Node and
+route documents are checkpointed in declaration order, so the persisted state
+does not depend on which branch finished first, and
+:meth:`~backend.flows.engine.FlowEngine.resume_run` and
+:meth:`~backend.flows.engine.FlowEngine.replay_run` keep working from it.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any
+
+from backend.events.runtime import emit_event
+from backend.flows.activation import NodeActivationMixin, NodeAttemptFailure
+from backend.flows.budgets import budget_violation
+from backend.flows.checkpoint import build_eval_state, canonical_output
+from backend.flows.dag import in_declaration_order, parallel_frontier, select_next_nodes
+from backend.flows.expressions import ExpressionError
+from backend.flows.handlers import FlowNodeError, NodeOutcome
+from backend.flows.model import FlowBudgets, FlowManifest, FlowNode
+from backend.flows.records import FlowStepRecord
+from backend.flows.registry import FlowRegistry
+from backend.flows.state import FlowRunRecord
+
+
+class ParallelSchedulerMixin(NodeActivationMixin):
+    """Mixin running parallel flows for :class:`~backend.flows.engine.FlowEngine`."""
+
+    registry: FlowRegistry
+    _max_steps: int
+
+    def _run_parallel(
+        self,
+        run: FlowRunRecord,
+        manifest: FlowManifest,
+        state: dict[str, Any],
+        *,
+        budgets: FlowBudgets,
+        started: float,
+        deadline: float,
+    ) -> FlowRunRecord | None:
+        """Activate ready nodes concurrently until the DAG is exhausted.
+
+        Budgets are checked before every launch. After the first failure no
+        further node is launched; in-flight nodes are drained (their
+        completed outputs are still checkpointed) and the run then fails
+        with the cursor on the failing node.
+
+        Args:
+            run: The run being executed.
+            manifest: The (parallel) flow definition.
+            state: The mutable run state (updated in place and persisted).
+            budgets: Effective budgets enforced for this execution.
+            started: Monotonic timestamp this execution session began.
+            deadline: Monotonic timestamp when the wall-clock budget expires.
+
+        Returns:
+            A terminal run record when the run failed; ``None`` when every
+            reachable node has completed and the run can be finalized.
+        """
+        state.setdefault("routes", {})
+        workers = manifest.execution.max_concurrency
+        failure: tuple[str, NodeAttemptFailure] | None = None
+        activations = 0
+        position = {node.id: index for index, node in enumerate(manifest.nodes)}
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"flow-{run.run_id[:8]}"
+        ) as pool:
+            pending: dict[Future[Any], FlowNode] = {}
+            while True:
+                if failure is None:
+                    running = {node.id for node in pending.values()}
+                    for node_id in parallel_frontier(manifest, state["routes"])[0]:
+                        if len(pending) >= workers:
+                            break
+                        if node_id in running:
+                            continue
+                        node = manifest.node(node_id)
+                        budget_error = budget_violation(
+                            budgets,
+                            state,
+                            self._clock() - started,
+                            activations,
+                            self._max_steps,
+                        )
+                        if budget_error is not None:
+                            failure = (
+                                node_id,
+                                NodeAttemptFailure("budget_exhausted", budget_error),
+                            )
+                            break
+                        try:
+                            step_input = self._render_step_input(
+                                run, manifest, node, state
+                            )
+                        except ExpressionError as exc:
+                            failure = (
+                                node_id,
+                                NodeAttemptFailure(
+                                    "binding_error", f"node {node.id!r}: {exc}"
+                                ),
+                            )
+                            break
+                        # Handlers see the state as of their launch; siblings
+                        # finishing meanwhile must not change it under them.
+                        snapshot = {
+                            **state,
+                            "nodes": dict(state["nodes"]),
+                            "metrics": dict(state["metrics"]),
+                        }
+                        future = pool.submit(
+                            copy_context().run,
+                            self._attempt_node,
+                            run,
+                            manifest,
+                            node,
+                            snapshot,
+                            step_input,
+                            budgets=budgets,
+                            deadline=deadline,
+                        )
+                        pending[future] = node
+                        activations += 1
+                if not pending:
+                    break
+                done, _ = wait(set(pending), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[pending[f].id]):
+                    node = pending.pop(future)
+                    attempted = future.result()
+                    node_failure: NodeAttemptFailure | None
+                    if isinstance(attempted, NodeAttemptFailure):
+                        node_failure = attempted
+                    else:
+                        step, outcome = attempted
+                        node_failure = self._commit_parallel_step(
+                            run, manifest, node, state, step, outcome
+                        )
+                    if node_failure is not None and failure is None:
+                        failure = (node.id, node_failure)
+
+        if failure is not None:
+            node_id, detail = failure
+            state["cursor"] = node_id
+            return self._fail_run(run.run_id, state, detail.reason, detail.detail)
+        state["cursor"] = None
+        return None
+
+    def _commit_parallel_step(
+        self,
+        run: FlowRunRecord,
+        manifest: FlowManifest,
+        node: FlowNode,
+        state: dict[str, Any],
+        step: FlowStepRecord,
+        outcome: NodeOutcome,
+    ) -> NodeAttemptFailure | None:
+        """Record a finished node, route it, and checkpoint the run state.
+
+        Args:
+            run: The run being executed.
+            manifest: The flow definition.
+            node: The node whose attempt succeeded.
+            state: The mutable run state.
+            step: The node's final step.
+            outcome: The handler outcome of that step.
+
+        Returns:
+            The failure to stop the run with, or ``None``.
+        """
+        if outcome.status == "waiting_human":
+            detail = (
+                f"node {node.id!r} requested a human decision, which a "
+                "parallel flow cannot wait for"
+            )
+            self.runs.complete_step(step.step_id, status="failed", error=detail)
+            return NodeAttemptFailure("node_failed", detail)
+        try:
+            output = canonical_output(outcome.output)
+        except FlowNodeError as exc:
+            self.runs.complete_step(step.step_id, status="failed", error=str(exc))
+            return NodeAttemptFailure("node_failed", f"node {node.id!r}: {exc}")
+        self.runs.complete_step(step.step_id, status="completed", output=output)
+        state["nodes"] = in_declaration_order(
+            manifest, {**state["nodes"], node.id: {"output": output}}
+        )
+        metrics = state["metrics"]
+        for key in ("tokens", "cost_usd"):
+            metrics[key] = float(metrics.get(key, 0.0)) + float(
+                outcome.metrics.get(key, 0.0)
+            )
+
+        failure = self._route_parallel_node(run, manifest, node, state)
+        if failure is not None:
+            return failure
+        self.runs.update_run(run.run_id, state=state)
+        self.runs.append_event(
+            run_id=run.run_id,
+            name="run.step.completed",
+            payload={
+                "nodeId": node.id,
+                "stepId": step.step_id,
+                "attempt": step.attempt,
+                "nextNodeIds": state["routes"][node.id],
+            },
+        )
+        emit_event(
+            "run.step.completed",
+            tenant_id=run.tenant_id,
+            partition_key=run.run_id,
+            data={
+                "stepKey": node.id,
+                "status": "completed",
+                "attempt": step.attempt,
+            },
+            subject={"runId": run.run_id, "stepId": step.step_id},
+        )
+        return None
+
+    def _route_parallel_node(
+        self,
+        run: FlowRunRecord,
+        manifest: FlowManifest,
+        node: FlowNode,
+        state: dict[str, Any],
+    ) -> NodeAttemptFailure | None:
+        """Record the edges a completed node takes and move the cursor.
+
+        In a parallel run the cursor is informational: the first ready node
+        in declaration order, or ``None`` once nothing is left to run.
+
+        Args:
+            run: The run being executed.
+            manifest: The flow definition.
+            node: The completed node, whose output is already in ``state``.
+            state: The mutable run state.
+
+        Returns:
+            The routing failure, or ``None``.
+        """
+        try:
+            next_nodes = select_next_nodes(
+                manifest, node, build_eval_state(run.input, state["nodes"])
+            )
+        except ExpressionError as exc:
+            return NodeAttemptFailure(
+                "predicate_error", f"routing after node {node.id!r}: {exc}"
+            )
+        except FlowNodeError as exc:
+            return NodeAttemptFailure("no_route", str(exc))
+        state["routes"] = in_declaration_order(
+            manifest, {**state.get("routes", {}), node.id: list(next_nodes)}
+        )
+        ready = parallel_frontier(manifest, state["routes"])[0]
+        state["cursor"] = ready[0] if ready else None
+        return None
+
+    def _reconcile_parallel(self, run: FlowRunRecord) -> FlowRunRecord:
+        """Fold completed-but-unrouted steps of a parallel run back into its state.
+
+        The parallel counterpart of
+        :meth:`~backend.flows.engine.FlowEngine._reconcile_crash_window`:
+        with several nodes in flight a crash can leave more than one
+        completed step whose output never reached the checkpoint. Each is
+        folded in, routed, and announced with a ``reconciled``
+        ``run.step.completed`` event, so resuming never re-executes it.
+
+        Args:
+            run: The non-terminal run being resumed.
+
+        Returns:
+            The (possibly updated) run record; a terminal record when
+            re-derived routing fails closed.
+        """
+        state = dict(run.state)
+        routes = state.get("routes", {})
+        unrouted = [
+            step
+            for step in self.runs.list_steps(run.run_id)
+            if step.status == "completed" and step.node_id not in routes
+        ]
+        if not unrouted:
+            return run
+        manifest = self.registry.resolve(run.flow_id, run.flow_version)
+        state.setdefault("metrics", {"tokens": 0.0, "cost_usd": 0.0})
+        for step in unrouted:
+            node = manifest.node(step.node_id)
+            state["nodes"] = in_declaration_order(
+                manifest,
+                {**state.get("nodes", {}), node.id: {"output": step.output}},
+            )
+            failure = self._route_parallel_node(run, manifest, node, state)
+            if failure is not None:
+                state["cursor"] = node.id
+                return self._fail_run(
+                    run.run_id, state, failure.reason, failure.detail
+                )
+        self.runs.update_run(run.run_id, state=state)
+        for step in unrouted:
+            self.runs.append_event(
+                run_id=run.run_id,
+                name="run.step.completed",
+                payload={
+                    "nodeId": step.node_id,
+                    "stepId": step.step_id,
+                    "attempt": step.attempt,
+                    "nextNodeIds": state["routes"][step.node_id],
+                    "reconciled": True,
+                },
+            )
+        record = self.runs.get_run(run.run_id)
+        if record is None:  # pragma: no cover - the run was just persisted
+            from backend.flows.engine import FlowRunError
+
+            raise FlowRunError(f"run {run.run_id!r} vanished while reconciling")
+        return record
+
+
+__all__ = ["ParallelSchedulerMixin"]
@@ -3,7 +3,8 @@
 Stores every registered ``flow.yaml`` manifest keyed by ``(flow_id, version)``
 in the platform state store (SQLite locally, PostgreSQL in production), and
 resolves SemVer ranges to the highest matching registered version — the same
-conventions as the Agent Registry (E2-S2).
+conventions as the Agent Registry (E2-S2), including its process-wide
+resolution cache (:class:`~backend.plugins.registry_core.ResolutionCache`).
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from packaging.version import Version
 from backend.flows.manifest import validate_flow_manifest
 from backend.flows.model import FlowManifest, version_in_range
 from backend.persistence.database import get_store
+from backend.plugins.registry_core import resolution_cache, resolve_cache_seconds
 
 
 class FlowRegistry:
@@ -34,6 +36,7 @@ class FlowRegistry:
         self._store = store or get_store()
         if not hasattr(self._store, "connect"):
             raise TypeError("FlowRegistry requires a durable store with connect()")
+        self._resolutions = resolution_cache(self._store, "flow_registry")
         self._ensure_schema()
 
     def register(self, manifest: FlowManifest) -> FlowManifest:
@@ -64,6 +67,7 @@ class FlowRegistry:
         with self._store.connect() as conn:
             conn.execute(sql, (manifest.id, manifest.version, json.dumps(manifest.raw)))
             conn.commit()
+        self._resolutions.invalidate()
         return manifest
 
     def register_raw(self, raw: dict[str, Any]) -> FlowManifest:
@@ -86,6 +90,10 @@ class FlowRegistry:
     def resolve(self, flow_id: str, version_range: str = "*") -> FlowManifest:
         """Resolve the highest registered version of a flow matching a range.
 
+        Served from the shared resolution cache when possible, so the hot
+        path (every run start, resume, and sub-flow or ``map`` child) does
+        not re-read and re-validate every stored version.
+
         Args:
             flow_id: Fully qualified flow id in ``namespace/name`` format.
             version_range: SemVer range expression, or ``"*"`` for any version.
@@ -96,6 +104,12 @@ class FlowRegistry:
         Raises:
             KeyError: If no registered version satisfies the range.
         """
+        key = (flow_id, version_range)
+        ttl = resolve_cache_seconds()
+        cached = self._resolutions.get(key, ttl) if ttl > 0 else None
+        if cached is not None:
+            return cached
+        generation = self._resolutions.generation
         matches = [
             manifest
             for manifest in self.list_flows(flow_id=flow_id)
@@ -103,7 +117,10 @@ class FlowRegistry:
         ]
         if not matches:
             raise KeyError(f"No flow {flow_id!r} matches {version_range!r}")
-        return sorted(matches, key=lambda m: Version(m.version), reverse=True)[0]
+        resolved = sorted(matches, key=lambda m: Version(m.version), reverse=True)[0]
+        if ttl > 0:
+            self._resolutions.put(key, resolved, generation)
+        return resolved
 
     def list_flows(self, *, flow_id: str | None = None) -> list[FlowManifest]:
         """List registered flow definitions.
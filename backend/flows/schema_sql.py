@@ -1,4 +1,4 @@
-"""DDL for the flow run/step/event tables (SQLite and PostgreSQL)."""
+"""DDL for the flow run/step/event/state-journal tables (SQLite and PostgreSQL)."""
 
 from __future__ import annotations
 
@@ -60,6 +60,15 @@ def flow_state_statements(is_postgres: bool) -> tuple[str, ...]:
             created_at {time_type} NOT NULL
         )
         """,
+        f"""
+        CREATE TABLE IF NOT EXISTS flow_state_journal (
+            run_id TEXT NOT NULL,
+            sequence INTEGER NOT NULL,
+            delta_json {json_type},
+            created_at {time_type} NOT NULL,
+            PRIMARY KEY (run_id, sequence)
+        )
+        """,
         "CREATE INDEX IF NOT EXISTS idx_flow_runs_flow ON flow_runs(flow_id, status)",
         "CREATE INDEX IF NOT EXISTS idx_flow_steps_run ON flow_steps(run_id, sequence)",
         "CREATE INDEX IF NOT EXISTS idx_flow_events_run ON flow_events(run_id, sequence)",
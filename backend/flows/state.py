@@ -4,19 +4,36 @@ Record types live in :mod:`backend.flows.records`; this module owns the SQL.
 Every flow run, step activation, and lifecycle event persists in the platform
 state store (SQLite locally, PostgreSQL in production). The ordered
 ``flow_events`` table doubles as the event store that deterministic replay
-(E3-S3) reads back.
+(E3-S3) reads back. Run state is checkpointed incrementally through the
+``flow_state_journal`` table (:mod:`backend.flows.journal`); reads fold the
+pending deltas back in, so callers always see the full state.
 """
 
 from __future__ import annotations
 
 import json
 import uuid
-from contextlib import closing
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 from typing import Any
 
+from backend.flows.journal import (
+    DEFAULT_SNAPSHOT_EVERY,
+    CheckpointCache,
+    RunCheckpoint,
+    append_delta,
+    apply_delta,
+    canonical_copy,
+    compact_journal,
+    journal_head,
+    load_deltas,
+    state_delta,
+)
 from backend.flows.records import (
     RUN_STATUSES,
     STEP_STATUSES,
+    TERMINAL_RUN_STATUSES,
     FlowEventRecord,
     FlowRunRecord,
     FlowStepRecord,
@@ -26,17 +43,23 @@ from backend.flows.records import (
     decode_step,
 )
 from backend.flows.schema_sql import flow_state_statements
+from backend.observability.metrics import get_metric_sink
 from backend.persistence.database import get_store
+from backend.persistence.pool import apply_sqlite_pragmas
 
 class FlowRunStore:
     """Durable store for flow runs, steps, and ordered events."""
 
-    def __init__(self, store: Any | None = None) -> None:
+    def __init__(
+        self, store: Any | None = None, *, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY
+    ) -> None:
         """Initialize the store, ensuring its backing schema exists.
 
         Args:
             store: Durable store to use; defaults to the process-wide store
                 from :func:`backend.persistence.database.get_store`.
+            snapshot_every: State deltas journaled per run before the state
+                is compacted into a full ``state_json`` snapshot.
 
         Raises:
             TypeError: If ``store`` does not expose a ``connect()`` method.
@@ -44,23 +67,31 @@ class FlowRunStore:
         self._store = store or get_store()
         if not hasattr(self._store, "connect"):
             raise TypeError("FlowRunStore requires a durable store with connect()")
+        self._snapshot_every = max(1, snapshot_every)
+        self._checkpoints = CheckpointCache()
         self._ensure_schema()
 
-    def _connect(self) -> Any:
-        """Open a store connection tuned for concurrent flow writers.
+    @contextmanager
+    def _connect(self) -> Iterator[Any]:
+        """Check out a store connection tuned for concurrent flow writers.
 
-        On SQLite, sets a generous busy timeout so concurrent runs queue on
-        the write lock instead of failing with ``database is locked``.
+        On SQLite, a generous busy timeout makes concurrent runs queue on the
+        write lock instead of failing with ``database is locked``. Pooled
+        connections already carry it (:data:`~backend.persistence.pool.SQLITE_PRAGMAS`);
+        only a non-pooled connection gets the PRAGMAs here. The connection
+        goes back to the store on exit; work left uncommitted is rolled back.
 
-        Returns:
+        Yields:
             A DB-API connection from the underlying store.
         """
-        conn = self._store.connect()
-        if not self._is_postgres:
-            conn.execute("PRAGMA busy_timeout=15000")
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-        return conn
+        checkout = self._store.connect()
+        try:
+            conn = checkout.connection
+            if not self._is_postgres:
+                apply_sqlite_pragmas(conn)
+            yield conn
+        finally:
+            checkout.close()
 
     def _begin_write(self, conn: Any) -> None:
         """Start a write transaction eagerly on SQLite.
@@ -76,6 +107,24 @@ class FlowRunStore:
         if not self._is_postgres:
             conn.execute("BEGIN IMMEDIATE")
 
+    def _begin_read(self, conn: Any) -> None:
+        """Start a transaction whose reads all see one snapshot.
+
+        A run's ``state_json`` and its journal are read by separate
+        statements; a checkpoint committed between them could otherwise
+        pair an old snapshot with an already compacted journal, or a new
+        snapshot with deltas it already contains. SQLite holds one read
+        snapshot for a whole explicit transaction; PostgreSQL needs
+        ``REPEATABLE READ`` for that.
+
+        Args:
+            conn: Connection returned by :meth:`_connect`.
+        """
+        if self._is_postgres:
+            conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        else:
+            conn.execute("BEGIN")
+
     # ------------------------------------------------------------------ runs
 
     def create_run(
@@ -127,7 +176,8 @@ class FlowRunStore:
             ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
             """
         )
-        with closing(self._connect()) as conn:
+        encoded_state = json.dumps(record.state)
+        with self._connect() as conn:
             conn.execute(
                 sql,
                 (
@@ -139,7 +189,7 @@ class FlowRunStore:
                     record.stop_reason,
                     json.dumps(record.trigger),
                     json.dumps(record.input),
-                    json.dumps(record.state),
+                    encoded_state,
                     json.dumps(None),
                     record.parent_run_id,
                     record.created_at,
@@ -147,6 +197,17 @@ class FlowRunStore:
                 ),
             )
             conn.commit()
+        self._checkpoints.put(
+            record.run_id,
+            RunCheckpoint(
+                sequence=0,
+                state=canonical_copy(encoded_state),
+                bytes_written=len(encoded_state),
+            ),
+        )
+        get_metric_sink().record_flow_checkpoint(
+            kind="snapshot", size_bytes=len(encoded_state)
+        )
         return record
 
     def update_run(
@@ -160,6 +221,12 @@ class FlowRunStore:
     ) -> None:
         """Update mutable fields of a run.
 
+        A new ``state`` is checkpointed as a delta against the state this
+        store last wrote for the run, appended to ``flow_state_journal``; it
+        is written whole to ``state_json`` (compacting the journal) instead
+        when this store has no usable base, after ``snapshot_every`` deltas,
+        or when ``status`` is terminal.
+
         Args:
             run_id: Id of the run to update.
             status: New status, when changing; must be in :data:`RUN_STATUSES`.
@@ -180,19 +247,110 @@ class FlowRunStore:
         if stop_reason is not None:
             assignments.append("stop_reason = {p}")
             params.append(stop_reason)
-        if state is not None:
-            assignments.append("state_json = {p}")
-            params.append(json.dumps(state))
         if output is not None:
             assignments.append("output_json = {p}")
             params.append(json.dumps(output))
-        sql = self._sql(
-            "UPDATE flow_runs SET " + ", ".join(assignments) + " WHERE run_id = {p}"
+        terminal = status in TERMINAL_RUN_STATUSES
+        checkpoint: RunCheckpoint | None = None
+        written = 0
+        with self._connect() as conn:
+            try:
+                if state is not None:
+                    self._begin_write(conn)
+                    snapshot, checkpoint, written = self._checkpoint_state(
+                        conn, run_id, state, compact=terminal
+                    )
+                    if snapshot is not None:
+                        assignments.append("state_json = {p}")
+                        params.append(snapshot)
+                sql = self._sql(
+                    "UPDATE flow_runs SET "
+                    + ", ".join(assignments)
+                    + " WHERE run_id = {p}"
+                )
+                conn.execute(sql, (*params, run_id))
+                conn.commit()
+            except BaseException:
+                # A delta may already be folded into the cached base.
+                self._checkpoints.pop(run_id)
+                raise
+        if checkpoint is None:
+            return
+        if written:
+            get_metric_sink().record_flow_checkpoint(
+                kind="delta" if checkpoint.deltas else "snapshot", size_bytes=written
+            )
+        if terminal:
+            self._checkpoints.pop(run_id)
+            get_metric_sink().record_flow_run_checkpoints(
+                status=str(status), size_bytes=checkpoint.bytes_written
+            )
+        else:
+            self._checkpoints.put(run_id, checkpoint)
+
+    def _checkpoint_state(
+        self, conn: Any, run_id: str, state: dict[str, Any], *, compact: bool
+    ) -> tuple[str | None, RunCheckpoint, int]:
+        """Journal *state* as a delta, or prepare a snapshot of it.
+
+        Runs inside :meth:`update_run`'s write transaction. A delta is only
+        appended when the journal head is still the sequence this store last
+        wrote; otherwise another writer has moved the run on and the base is
+        stale. On PostgreSQL the run row is locked first, so concurrent
+        checkpoints of one run read the head and write in turn; on SQLite
+        ``BEGIN IMMEDIATE`` already serializes them.
+
+        Args:
+            conn: Connection holding the write transaction.
+            run_id: Run being checkpointed.
+            state: The state to checkpoint.
+            compact: Whether to snapshot regardless of the journal.
+
+        Returns:
+            The serialized snapshot for ``state_json`` (``None`` when a delta
+            was journaled), the run's new checkpoint, and the bytes written.
+        """
+        if self._is_postgres:
+            conn.execute(
+                self._sql("SELECT run_id FROM flow_runs WHERE run_id = {p} FOR UPDATE"),
+                (run_id,),
+            )
+        head = journal_head(conn, self._sql, run_id)
+        cached = self._checkpoints.get(run_id)
+        if (
+            not compact
+            and cached is not None
+            and cached.sequence == head
+            and cached.deltas < self._snapshot_every
+        ):
+            ops = state_delta(cached.state, state)
+            if not ops:
+                return None, cached, 0
+            encoded = json.dumps(ops)
+            append_delta(conn, self._sql, run_id, head + 1, encoded)
+            # Decoded again so the base never aliases the caller's live state.
+            apply_delta(cached.state, json.loads(encoded))
+            return (
+                None,
+                RunCheckpoint(
+                    sequence=head + 1,
+                    state=cached.state,
+                    deltas=cached.deltas + 1,
+                    bytes_written=cached.bytes_written + len(encoded),
+                ),
+                len(encoded),
+            )
+        encoded = json.dumps(state)
+        compact_journal(conn, self._sql, run_id, head + 1)
+        return (
+            encoded,
+            RunCheckpoint(
+                sequence=head + 1,
+                state=canonical_copy(encoded),
+                bytes_written=(cached.bytes_written if cached else 0) + len(encoded),
+            ),
+            len(encoded),
         )
-        params.append(run_id)
-        with closing(self._connect()) as conn:
-            conn.execute(sql, tuple(params))
-            conn.commit()
 
     def get_run(
         self, run_id: str, *, tenant_id: str | None = None
@@ -219,9 +377,19 @@ class FlowRunStore:
                 "SELECT * FROM flow_runs WHERE run_id = {p} AND tenant_id = {p}"
             )
             params = (run_id, tenant_id)
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
+            self._begin_read(conn)
             row = conn.execute(sql, params).fetchone()
-        return decode_run(row) if row is not None else None
+            if row is None:
+                return None
+            deltas = load_deltas(
+                conn,
+                self._sql,
+                "SELECT run_id FROM flow_runs WHERE run_id = {p}",
+                (run_id,),
+            )
+            conn.commit()
+        return self._with_deltas(decode_run(row), deltas)
 
     def list_runs(
         self,
@@ -256,9 +424,31 @@ class FlowRunStore:
         sql = self._sql(
             f"SELECT * FROM flow_runs{where} ORDER BY created_at DESC, run_id"
         )
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
+            self._begin_read(conn)
             rows = conn.execute(sql, tuple(params)).fetchall()
-        return [decode_run(row) for row in rows]
+            deltas = (
+                load_deltas(
+                    conn, self._sql, f"SELECT run_id FROM flow_runs{where}", tuple(params)
+                )
+                if rows
+                else {}
+            )
+            conn.commit()
+        return [self._with_deltas(decode_run(row), deltas) for row in rows]
+
+    @staticmethod
+    def _with_deltas(
+        record: FlowRunRecord, deltas: dict[str, list[list[dict[str, Any]]]]
+    ) -> FlowRunRecord:
+        """Fold a run's pending journal deltas into its snapshot state."""
+        pending = deltas.get(record.run_id)
+        if not pending:
+            return record
+        state = record.state
+        for ops in pending:
+            apply_delta(state, ops)
+        return replace(record, state=state)
 
     # ----------------------------------------------------------------- steps
 
@@ -283,7 +473,7 @@ class FlowRunStore:
         Returns:
             The persisted :class:`FlowStepRecord`.
         """
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             self._begin_write(conn)
             row = conn.execute(
                 self._sql(
@@ -359,7 +549,7 @@ class FlowRunStore:
             WHERE step_id = {p}
             """
         )
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             conn.execute(
                 sql, (status, json.dumps(output), error, _utcnow(), step_id)
             )
@@ -377,7 +567,7 @@ class FlowRunStore:
         sql = self._sql(
             "SELECT * FROM flow_steps WHERE run_id = {p} ORDER BY sequence"
         )
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, (run_id,)).fetchall()
         return [decode_step(row) for row in rows]
 
@@ -396,7 +586,7 @@ class FlowRunStore:
         Returns:
             The persisted :class:`FlowEventRecord`.
         """
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             self._begin_write(conn)
             row = conn.execute(
                 self._sql(
@@ -445,7 +635,7 @@ class FlowRunStore:
         sql = self._sql(
             "SELECT * FROM flow_events WHERE run_id = {p} ORDER BY sequence"
         )
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, (run_id,)).fetchall()
         return [decode_event(row) for row in rows]
 
@@ -470,7 +660,7 @@ class FlowRunStore:
 
     def _ensure_schema(self) -> None:
         """Create the flow run/step/event tables if they do not exist."""
-        with closing(self._connect()) as conn:
+        with self._connect() as conn:
             for statement in flow_state_statements(self._is_postgres):
                 conn.execute(statement)
             conn.commit()
@@ -0,0 +1,283 @@
+"""Pre-compiled render plans for manifest bindings, ``over`` and edge guards.
+
+:func:`~backend.flows.expressions.render_template` walks a binding value and
+scans every string for ``{{ }}`` templates each time it renders. The engine
+renders the same bindings for every activation, replay, and ``map`` item, so
+:func:`~backend.flows.manifest.validate_flow_manifest` compiles each valid
+manifest once into a :class:`FlowRenderPlan` (stored on
+:attr:`~backend.flows.model.FlowManifest.render_plan`): template text is
+split, every expression is compiled, and rendering only evaluates.
+
+The helpers at the bottom take the manifest and fall back to compiling on
+the fly for a manifest built without a plan (or a node it does not know), so
+callers never need to check. Rendering a plan yields exactly what
+:func:`~backend.flows.expressions.render_template` yields for the same value.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from backend.flows.expressions import (
+    _TEMPLATE_RE,
+    CompiledExpression,
+    compile_expression,
+    evaluate_expression,
+)
+
+if TYPE_CHECKING:
+    from backend.flows.model import FlowEdge, FlowManifest, FlowNode
+
+
+@dataclass(frozen=True)
+class _Const:
+    """A binding value without templates, returned as-is."""
+
+    value: Any
+
+
+@dataclass(frozen=True)
+class _Value:
+    """A string that is exactly one template; renders to the typed value."""
+
+    expression: CompiledExpression
+
+
+@dataclass(frozen=True)
+class _Text:
+    """A string with embedded templates; renders to interpolated text."""
+
+    parts: tuple[str | CompiledExpression, ...]
+
+
+@dataclass(frozen=True)
+class _Map:
+    """A mapping whose values render recursively."""
+
+    items: tuple[tuple[Any, _Part], ...]
+
+
+@dataclass(frozen=True)
+class _List:
+    """A list whose items render recursively."""
+
+    items: tuple[_Part, ...]
+
+
+_Part = _Const | _Value | _Text | _Map | _List
+
+
+@dataclass(frozen=True)
+class TemplatePlan:
+    """A binding value with every embedded template compiled.
+
+    Attributes:
+        root: Root of the compiled value tree.
+    """
+
+    root: _Part
+
+    def render(self, state: Mapping[str, Any]) -> Any:
+        """Render the value against *state*, as ``render_template`` would.
+
+        Args:
+            state: State document to evaluate templates against.
+
+        Returns:
+            The rendered value; mappings and lists are fresh copies.
+
+        Raises:
+            ExpressionError: If an expression fails to evaluate.
+        """
+        return _render(self.root, state)
+
+
+def compile_template(value: Any) -> TemplatePlan:
+    """Compile a manifest binding value into a :class:`TemplatePlan`.
+
+    Args:
+        value: Binding value (string, mapping, list, or scalar).
+
+    Returns:
+        The compiled plan.
+
+    Raises:
+        ExpressionError: If an embedded expression is invalid.
+    """
+    return TemplatePlan(root=_compile_part(value))
+
+
+def _compile_part(value: Any) -> _Part:
+    """Compile one binding value (see :func:`compile_template`)."""
+    if isinstance(value, str):
+        match = _TEMPLATE_RE.fullmatch(value.strip())
+        if match is not None:
+            return _Value(compile_expression(match.group(1)))
+        parts: list[str | CompiledExpression] = []
+        position = 0
+        for match in _TEMPLATE_RE.finditer(value):
+            parts.append(value[position : match.start()])
+            parts.append(compile_expression(match.group(1)))
+            position = match.end()
+        if not parts:
+            return _Const(value)
+        parts.append(value[position:])
+        return _Text(tuple(part for part in parts if part != ""))
+    if isinstance(value, Mapping):
+        return _Map(tuple((key, _compile_part(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return _List(tuple(_compile_part(item) for item in value))
+    return _Const(value)
+
+
+def _render(part: _Part, state: Mapping[str, Any]) -> Any:
+    """Render one compiled part against *state*."""
+    if isinstance(part, _Const):
+        return part.value
+    if isinstance(part, _Value):
+        return evaluate_expression(part.expression, state)
+    if isinstance(part, _Text):
+        return "".join(
+            piece if isinstance(piece, str) else str(evaluate_expression(piece, state))
+            for piece in part.parts
+        )
+    if isinstance(part, _Map):
+        return {key: _render(item, state) for key, item in part.items}
+    return [_render(item, state) for item in part.items]
+
+
+def _guard_source(when: str) -> str:
+    """Strip one layer of ``{{ }}`` braces from an edge predicate."""
+    predicate = when.strip()
+    if predicate.startswith("{{") and predicate.endswith("}}"):
+        predicate = predicate[2:-2]
+    return predicate
+
+
+@dataclass(frozen=True)
+class FlowRenderPlan:
+    """Every template of one manifest, compiled.
+
+    Attributes:
+        inputs: Compiled ``input`` bindings, by node id.
+        over: Compiled ``over`` expressions of ``map`` nodes, by node id.
+        guards: Compiled edge predicates, by their ``when`` text.
+    """
+
+    inputs: dict[str, TemplatePlan] = field(default_factory=dict)
+    over: dict[str, TemplatePlan] = field(default_factory=dict)
+    guards: dict[str, CompiledExpression] = field(default_factory=dict)
+
+
+def compile_render_plan(
+    nodes: tuple[FlowNode, ...] | list[FlowNode],
+    edges: tuple[FlowEdge, ...] | list[FlowEdge],
+) -> FlowRenderPlan:
+    """Compile the bindings, ``over`` expressions and guards of a flow.
+
+    Args:
+        nodes: The flow's nodes.
+        edges: The flow's edges.
+
+    Returns:
+        The flow's render plan.
+
+    Raises:
+        ExpressionError: If any template or predicate is invalid.
+    """
+    return FlowRenderPlan(
+        inputs={node.id: compile_template(dict(node.input_bindings)) for node in nodes},
+        over={
+            node.id: compile_template(node.over)
+            for node in nodes
+            if node.over is not None
+        },
+        guards={
+            edge.when: compile_expression(_guard_source(edge.when))
+            for edge in edges
+            if edge.when is not None
+        },
+    )
+
+
+def render_node_input(
+    manifest: FlowManifest, node: FlowNode, state: Mapping[str, Any]
+) -> Any:
+    """Render a node's ``input`` bindings against *state*.
+
+    Args:
+        manifest: The flow definition the node belongs to.
+        node: The node whose bindings to render.
+        state: State document to evaluate templates against.
+
+    Returns:
+        The rendered bindings.
+
+    Raises:
+        ExpressionError: If a binding fails to render.
+    """
+    plan = manifest.render_plan
+    compiled = plan.inputs.get(node.id) if plan is not None else None
+    if compiled is None:
+        compiled = compile_template(dict(node.input_bindings))
+    return compiled.render(state)
+
+
+def render_node_over(
+    manifest: FlowManifest, node: FlowNode, state: Mapping[str, Any]
+) -> Any:
+    """Render a ``map`` node's ``over`` expression against *state*.
+
+    Args:
+        manifest: The flow definition the node belongs to.
+        node: The ``map`` node (its ``over`` must be set).
+        state: State document to evaluate templates against.
+
+    Returns:
+        The rendered collection.
+
+    Raises:
+        ExpressionError: If the expression fails to render.
+    """
+    plan = manifest.render_plan
+    compiled = plan.over.get(node.id) if plan is not None else None
+    if compiled is None:
+        compiled = compile_template(node.over)
+    return compiled.render(state)
+
+
+def guard_holds(
+    manifest: FlowManifest, edge: FlowEdge, state: Mapping[str, Any]
+) -> bool:
+    """Evaluate an edge's ``when`` predicate against *state*.
+
+    Args:
+        manifest: The flow definition the edge belongs to.
+        edge: An edge with a ``when`` predicate.
+        state: State document to evaluate the predicate against.
+
+    Returns:
+        Whether the predicate holds.
+
+    Raises:
+        ExpressionError: If the predicate fails to evaluate.
+    """
+    when = edge.when or ""
+    plan = manifest.render_plan
+    compiled = plan.guards.get(when) if plan is not None else None
+    if compiled is None:
+        compiled = compile_expression(_guard_source(when))
+    return bool(evaluate_expression(compiled, state))
+
+
+__all__ = [
+    "FlowRenderPlan",
+    "TemplatePlan",
+    "compile_render_plan",
+    "compile_template",
+    "guard_holds",
+    "render_node_input",
+    "render_node_over",
+]
@@ -1,6 +1,7 @@
 """Jobs package — async job-queue abstraction with in-process default."""
 
 from backend.jobs.queue import (
+    JOB_LANES,
     AbstractJobQueue,
     InProcessJobQueue,
     RedisJobQueue,
@@ -9,6 +10,7 @@ from backend.jobs.queue import (
 )
 
 __all__ = [
+    "JOB_LANES",
     "AbstractJobQueue",
     "InProcessJobQueue",
     "RedisJobQueue",
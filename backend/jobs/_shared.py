@@ -0,0 +1,185 @@
+"""Lanes, statuses, the handler registry and Redis helpers shared by the queue modules."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from backend.observability.metrics import QueueSnapshot
+
+_DEFAULT_JOB_RETENTION_SECONDS = 3600
+_DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 300.0
+_MAINTENANCE_INTERVAL_SECONDS = 1.0
+
+JOB_LANES = ("high", "normal", "low")
+"""Priority lanes, highest first; a worker always drains a higher lane first."""
+
+_STATUS_PENDING = "pending"
+_STATUS_RUNNING = "running"
+_STATUS_DONE = "done"
+_STATUS_ERROR = "error"
+
+_JobHandler = Callable[[Any], Any]
+_HANDLERS: dict[str, _JobHandler] = {}
+
+
+class AbstractJobQueue(ABC):
+    """Minimal async-job-queue interface."""
+
+    @abstractmethod
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        *,
+        priority: str = "normal",
+        dedup_key: str | None = None,
+    ) -> str:
+        """Submit a job to a :data:`JOB_LANES` lane and return its unique *job_id*.
+
+        While a job enqueued with the same *dedup_key* has not started, the
+        existing job's id is returned instead of queuing another one.
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> dict:
+        """Return the five-field public state record for *job_id*."""
+
+    @abstractmethod
+    def stats(self) -> QueueSnapshot:
+        """Return a bounded snapshot of queue and worker state."""
+
+
+class _RedisQueueOwner:
+    """Typing base for ``RedisJobQueue``'s mixins: the client, settings and key builders they share.
+
+    ``RedisJobQueue`` (in :mod:`backend.jobs.redis_queue`) sets the attributes and
+    provides :meth:`_submit`; this base exists so each mixin can be read,
+    and type-checked, on its own without depending on the composed class.
+    """
+
+    _pending_key = "autodev:jobs:pending"
+
+    _client: Any
+    _job_retention_seconds: int
+    _visibility_timeout_seconds: float
+    _max_attempts: int
+    _retry_backoff_seconds: float
+
+    @classmethod
+    def lane_key(cls, lane: str) -> str:
+        """Return the Redis list holding *lane*'s waiting job ids.
+
+        The ``normal`` lane keeps the original single-list key so jobs queued
+        before lanes existed are still picked up.
+
+        Args:
+            lane: One of :data:`JOB_LANES`.
+
+        Returns:
+            The list key.
+        """
+        return cls._pending_key if lane == "normal" else f"{cls._pending_key}:{lane}"
+
+    def _job_key(self, job_id: str) -> str:
+        """Build the Redis hash key storing ``job_id``."""
+        return f"autodev:jobs:{job_id}"
+
+    def _submit(
+        self,
+        job_type: str,
+        payload: dict,
+        priority: str,
+        *,
+        dedup_key: str | None = None,
+        delay: float = 0.0,
+        batch: bool = False,
+    ) -> str:  # pragma: no cover - overridden by RedisJobQueue
+        """Write a job's record and queue its id; see :meth:`RedisJobQueue._submit`."""
+        raise NotImplementedError
+
+
+def _check_lane(lane: str) -> None:
+    """Reject a priority that is not one of :data:`JOB_LANES`."""
+    if lane not in JOB_LANES:
+        raise ValueError(f"unknown job priority {lane!r}; expected one of {JOB_LANES}")
+
+
+def _record_lane(record: Mapping[str, str]) -> str:
+    """Return a job hash's lane, treating records from before lanes as ``normal``."""
+    lane = record.get("lane") or "normal"
+    return lane if lane in JOB_LANES else "normal"
+
+
+def _decode_value(value: Any) -> str:
+    """Decode a Redis response value to a ``str``.
+
+    Args:
+        value: Raw value returned by the Redis client, bytes or otherwise.
+
+    Returns:
+        The decoded string.
+    """
+    if isinstance(value, bytes):
+        return value.decode()
+    return str(value)
+
+
+def _decode_hash(record: dict[Any, Any]) -> dict[str, str]:
+    """Decode a Redis hash response into a plain ``str``-keyed/valued dict.
+
+    Args:
+        record: Raw hash mapping returned by the Redis client.
+
+    Returns:
+        The decoded mapping.
+    """
+    return {_decode_value(key): _decode_value(value) for key, value in record.items()}
+
+
+_REDIS_EXECUTION_CONTEXT_FIELDS = (
+    "otel_traceparent",
+    "otel_tracestate",
+    "otel_baggage",
+    "correlation_request_id",
+    "correlation_run_id",
+    "correlation_tenant_id",
+)
+
+
+def _correlation_span_attributes(carrier: Mapping[str, str]) -> dict[str, str]:
+    """Build content-free span attributes from a sanitized execution carrier."""
+    keys = {
+        "correlation_request_id": "autodev.request_id",
+        "correlation_run_id": "autodev.run_id",
+        "correlation_step_id": "autodev.step_id",
+        "correlation_tenant_id": "autodev.tenant_id",
+    }
+    return {
+        attribute: carrier[key]
+        for key, attribute in keys.items()
+        if carrier.get(key)
+    }
+
+
+__all__ = [
+    "JOB_LANES",
+    "_DEFAULT_JOB_RETENTION_SECONDS",
+    "_DEFAULT_VISIBILITY_TIMEOUT_SECONDS",
+    "_HANDLERS",
+    "_MAINTENANCE_INTERVAL_SECONDS",
+    "_REDIS_EXECUTION_CONTEXT_FIELDS",
+    "_STATUS_DONE",
+    "_STATUS_ERROR",
+    "_STATUS_PENDING",
+    "_STATUS_RUNNING",
+    "AbstractJobQueue",
+    "_JobHandler",
+    "_RedisQueueOwner",
+    "_check_lane",
+    "_correlation_span_attributes",
+    "_decode_hash",
+    "_decode_value",
+    "_record_lane",
+]
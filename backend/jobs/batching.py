@@ -0,0 +1,163 @@
+"""Handler registration, batch coalescing and ``dedup_key`` claims for the job queues."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.jobs._shared import (
+    _HANDLERS,
+    _decode_value,
+    _JobHandler,
+    _record_lane,
+    _RedisQueueOwner,
+)
+
+_DEDUP_TTL_SECONDS = 3600
+_DEFAULT_BATCH_WINDOW_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class _BatchPolicy:
+    """How many payloads a batch-capable handler takes, and how long they gather."""
+
+    max_size: int
+    window_seconds: float
+
+
+_BATCH_POLICIES: dict[str, _BatchPolicy] = {}
+
+
+def register_handler(
+    job_type: str,
+    *,
+    batch_size: int | None = None,
+    batch_window_seconds: float = _DEFAULT_BATCH_WINDOW_SECONDS,
+) -> Callable[[_JobHandler], _JobHandler]:
+    """Decorator: register a callable as the handler for *job_type*.
+
+    With *batch_size*, the handler is batch-capable: jobs of *job_type*
+    enqueued within *batch_window_seconds* of each other are coalesced into
+    one job whose handler receives the list of their payloads (at most
+    *batch_size*), so a burst of small jobs costs a handful of handler calls.
+
+    Args:
+        job_type: Job type the handler runs.
+        batch_size: Most payloads per handler call; ``None`` registers a
+            plain one-payload handler.
+        batch_window_seconds: How long the first payload of a batch waits
+            for others to join it.
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive or the window is negative.
+    """
+    if batch_size is not None and (batch_size < 1 or batch_window_seconds < 0):
+        raise ValueError("batch_size must be positive and batch_window_seconds >= 0")
+
+    def _decorator(fn: _JobHandler) -> _JobHandler:
+        """Register the wrapped callable as the handler for the enclosing ``job_type``."""
+        _HANDLERS[job_type] = fn
+        if batch_size is None:
+            _BATCH_POLICIES.pop(job_type, None)
+        else:
+            _BATCH_POLICIES[job_type] = _BatchPolicy(batch_size, batch_window_seconds)
+        return fn
+
+    return _decorator
+
+
+@dataclass(eq=False)
+class _OpenBatch:
+    """An in-process batch job still accepting payloads."""
+
+    job_id: str
+    job_type: str
+    payloads: list[dict] = field(default_factory=list)
+    timer: threading.Timer | None = None
+    submitted: bool = False
+
+
+class _RedisBatchMixin(_RedisQueueOwner):
+    """``dedup_key`` claims and batch draining for ``RedisJobQueue``.
+
+    A ``dedup_key`` is claimed with ``SET NX`` until its job starts. Payloads
+    of a batch-capable job type wait in one list per type and are drained by
+    one deduplicated, delayed job at a time.
+    """
+
+    def _schedule_drain(self, job_type: str, lane: str, delay: float) -> str:
+        """Ensure one drain job is pending for *job_type*'s queued batch payloads."""
+        return self._submit(
+            job_type, {}, lane, dedup_key=f"batch:{job_type}", delay=delay, batch=True
+        )
+
+    def _reserve_dedup(self, dedup_key: str, job_id: str) -> str | None:
+        """Claim *dedup_key* for *job_id* (``SET NX``).
+
+        Returns:
+            ``None`` if the key was claimed, else the pending job holding it.
+        """
+        flag = self._dedup_flag_key(dedup_key)
+        for _ in range(2):
+            if self._client.set(flag, job_id, nx=True, ex=_DEDUP_TTL_SECONDS):
+                return None
+            holder = self._client.get(flag)
+            if holder is not None:
+                return _decode_value(holder)
+        return None  # the holder kept vanishing; queue a duplicate rather than spin
+
+    def _release_dedup(self, dedup_key: str, job_id: str) -> None:
+        """Drop *dedup_key*'s claim if *job_id* still holds it."""
+        flag = self._dedup_flag_key(dedup_key)
+        holder = self._client.get(flag)
+        if holder is not None and _decode_value(holder) == job_id:
+            self._client.delete(flag)
+
+    def _run_batch(self, job_id: str, record: dict[str, str], handler: _JobHandler) -> Any:
+        """Run a drain job: claim up to ``batch_size`` queued payloads and handle them at once.
+
+        Payloads are moved into a list owned by the job before the handler
+        runs, so a retry of the job (after a failure or an expired lease)
+        handles the same payloads rather than losing them.
+        """
+        job_type = record["job_type"]
+        policy = _BATCH_POLICIES.get(job_type)
+        items_key = self._batch_items_key(job_type)
+        claimed_key = self._batch_claimed_key(job_id)
+        if not int(self._client.llen(claimed_key)):
+            for _ in range(policy.max_size if policy is not None else 1):
+                if self._client.lmove(items_key, claimed_key, "LEFT", "RIGHT") is None:
+                    break
+        payloads = [
+            json.loads(_decode_value(raw)) for raw in self._client.lrange(claimed_key, 0, -1)
+        ]
+        result = handler(payloads) if payloads else None
+        self._client.delete(claimed_key)
+        if int(self._client.llen(items_key)):
+            self._schedule_drain(job_type, _record_lane(record), 0.0)
+        return result
+
+    def _dedup_flag_key(self, dedup_key: str) -> str:
+        """Build the key naming the pending job that holds ``dedup_key``."""
+        return f"autodev:jobs:dedup:{dedup_key}"
+
+    def _batch_items_key(self, job_type: str) -> str:
+        """Build the list of payloads queued for batch-capable ``job_type``."""
+        return f"autodev:jobs:batch:{job_type}"
+
+    def _batch_claimed_key(self, job_id: str) -> str:
+        """Build the list of payloads drain job ``job_id`` has claimed."""
+        return f"autodev:jobs:{job_id}:batch"
+
+
+__all__ = [
+    "_BATCH_POLICIES",
+    "_DEDUP_TTL_SECONDS",
+    "_BatchPolicy",
+    "_OpenBatch",
+    "_RedisBatchMixin",
+    "register_handler",
+]
@@ -0,0 +1,304 @@
+"""Thread-pool-backed in-process job queue, the default backend."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from opentelemetry.trace import SpanKind
+
+from backend.jobs._shared import (
+    _DEFAULT_JOB_RETENTION_SECONDS,
+    _HANDLERS,
+    _STATUS_DONE,
+    _STATUS_ERROR,
+    _STATUS_PENDING,
+    _STATUS_RUNNING,
+    AbstractJobQueue,
+    _check_lane,
+    _correlation_span_attributes,
+)
+from backend.jobs.batching import _BATCH_POLICIES, _BatchPolicy, _OpenBatch
+from backend.observability.context import (
+    attach_execution_context,
+    capture_execution_context,
+)
+from backend.observability.metrics import QueueSnapshot
+from backend.observability.tracing import get_tracer
+
+
+class InProcessJobQueue(AbstractJobQueue):
+    """Thread-pool-backed in-process job queue."""
+
+    def __init__(
+        self, max_workers: int = 4, *, retention_seconds: int = _DEFAULT_JOB_RETENTION_SECONDS
+    ) -> None:
+        """Initialize the queue with a bounded thread pool.
+
+        Args:
+            max_workers: Maximum number of jobs to run concurrently.
+            retention_seconds: How long a completed (done/error) record is
+                kept before it is evicted; negative disables eviction.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_workers = max_workers
+        self._store: dict[str, dict] = {}
+        self._execution_contexts: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._retention_seconds = retention_seconds
+        self._pending_count = 0
+        self._running_count = 0
+        # Completion order queue: bounds eviction sweep cost to the number of
+        # records actually expired, not the total store size (O(1) stats()).
+        self._completed_order: deque[tuple[float, str]] = deque()
+        self._dedup: dict[str, str] = {}
+        self._dedup_keys: dict[str, str] = {}
+        self._open_batches: dict[str, _OpenBatch] = {}
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        *,
+        priority: str = "normal",
+        dedup_key: str | None = None,
+    ) -> str:
+        """Submit a job to the thread pool for asynchronous execution.
+
+        A payload for a batch-capable job type joins the type's open batch
+        if there is one; the batch is submitted once it is full or its
+        window has elapsed.
+
+        Args:
+            job_type: Registered job type identifying the handler to run.
+            payload: Arguments passed to the handler.
+            priority: Validated for parity with :class:`RedisJobQueue`; the
+                thread pool runs jobs in submission order.
+            dedup_key: Return the id of the not-yet-started job enqueued
+                with this key, if any, instead of submitting another.
+
+        Returns:
+            The generated (or existing) job id.
+
+        Raises:
+            ValueError: If ``priority`` is not a known lane.
+        """
+        _check_lane(priority)
+        policy = _BATCH_POLICIES.get(job_type)
+        full: _OpenBatch | None = None
+        with self._lock:
+            if dedup_key is not None and dedup_key in self._dedup:
+                return self._dedup[dedup_key]
+            batch = self._open_batches.get(job_type) if policy is not None else None
+            if batch is not None:
+                batch.payloads.append(payload)
+                if len(batch.payloads) >= policy.max_size:  # type: ignore[union-attr]
+                    full = batch
+        if batch is not None:
+            if full is not None:
+                self._submit_batch(full)
+            return batch.job_id
+        with get_tracer().start_as_current_span(
+            "autodev.job.enqueue",
+            kind=SpanKind.PRODUCER,
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            carrier = capture_execution_context()
+            for name, value in _correlation_span_attributes(carrier).items():
+                span.set_attribute(name, value)
+            job_id = str(uuid.uuid4())
+            record: dict = {
+                "job_id": job_id, "job_type": job_type,
+                "status": _STATUS_PENDING,
+                "result": None, "error": None,
+            }
+            with self._lock:
+                self._sweep_expired_locked()
+                self._store[job_id] = record
+                self._execution_contexts[job_id] = carrier
+                self._pending_count += 1
+                if dedup_key is not None:
+                    self._dedup[dedup_key] = job_id
+                    self._dedup_keys[job_id] = dedup_key
+                if policy is not None:
+                    batch = self._open_batch_locked(job_id, job_type, payload, policy)
+            if policy is not None:
+                if policy.max_size == 1 and batch is not None:
+                    self._submit_batch(batch)
+                return job_id
+            try:
+                self._executor.submit(self._run, job_id, job_type, payload)
+            except Exception:
+                with self._lock:
+                    self._store.pop(job_id, None)
+                    self._execution_contexts.pop(job_id, None)
+                    self._pending_count -= 1
+                    self._release_dedup_locked(job_id)
+                raise
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        """Return the current state of a submitted job.
+
+        Args:
+            job_id: Identifier returned by :meth:`enqueue`.
+
+        Returns:
+            The job's status record; an error record if ``job_id`` is unknown.
+        """
+        with self._lock:
+            record = self._store.get(job_id)
+        if record is None:
+            return {
+                "job_id": job_id, "job_type": "unknown",
+                "status": _STATUS_ERROR,
+                "result": None, "error": f"Unknown job_id: {job_id!r}",
+            }
+        return dict(record)
+
+    def stats(self) -> QueueSnapshot:
+        """Return pending/running counts and in-process worker utilization.
+
+        Returns:
+            A snapshot built from incremental counters (O(1); does not scan
+            every job ever enqueued).
+        """
+        with self._lock:
+            pending = self._pending_count
+            running = self._running_count
+        return QueueSnapshot(pending, running, self._max_workers, running)
+
+    def close(self, *, wait: bool = True) -> None:
+        """Shut down the thread pool.
+
+        Mirrors :meth:`RedisJobQueue.close`. By default (``wait=True``,
+        matching :meth:`ThreadPoolExecutor.shutdown`'s own default) this
+        blocks until every already-submitted job finishes running, so no
+        job from this queue can still be executing after this call
+        returns and touch state (e.g. a durable store swapped out by a
+        test's next fixture) that belongs to whatever comes next. Once
+        closed, this queue instance must not be reused: further
+        :meth:`enqueue` calls raise ``RuntimeError``.
+
+        Open batches are submitted first rather than waiting out their window.
+
+        Args:
+            wait: Whether to block until in-flight jobs finish.
+        """
+        with self._lock:
+            batches = list(self._open_batches.values())
+        for batch in batches:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            self._submit_batch(batch)
+        self._executor.shutdown(wait=wait)
+
+    def _open_batch_locked(
+        self, job_id: str, job_type: str, payload: dict, policy: _BatchPolicy
+    ) -> _OpenBatch:
+        """Start collecting payloads for a new batch job. Must hold :attr:`_lock`."""
+        batch = _OpenBatch(job_id, job_type, [payload])
+        self._open_batches[job_type] = batch
+        batch.timer = threading.Timer(policy.window_seconds, self._submit_batch, (batch,))
+        batch.timer.daemon = True
+        batch.timer.start()
+        return batch
+
+    def _submit_batch(self, batch: _OpenBatch) -> None:
+        """Close *batch* to new payloads and hand it to the thread pool, once."""
+        with self._lock:
+            if batch.submitted:
+                return
+            batch.submitted = True
+            if self._open_batches.get(batch.job_type) is batch:
+                del self._open_batches[batch.job_type]
+        try:
+            self._executor.submit(self._run, batch.job_id, batch.job_type, batch.payloads)
+        except RuntimeError as exc:  # the pool was shut down under the batch's timer
+            with self._lock:
+                self._store[batch.job_id].update(status=_STATUS_ERROR, error=str(exc))
+                self._pending_count -= 1
+                self._completed_order.append((time.monotonic(), batch.job_id))
+                self._execution_contexts.pop(batch.job_id, None)
+                self._release_dedup_locked(batch.job_id)
+
+    def _release_dedup_locked(self, job_id: str) -> None:
+        """Let later enqueues with *job_id*'s dedup key queue a new job. Must hold :attr:`_lock`."""
+        dedup_key = self._dedup_keys.pop(job_id, None)
+        if dedup_key is not None and self._dedup.get(dedup_key) == job_id:
+            del self._dedup[dedup_key]
+
+    def _sweep_expired_locked(self) -> None:
+        """Evict completed records older than the retention window.
+
+        Must be called while holding :attr:`_lock`. Cost is proportional to
+        the number of records actually expired, not to the store's total
+        size, since :attr:`_completed_order` is consumed in completion
+        order (oldest first).
+        """
+        if self._retention_seconds < 0:
+            return
+        cutoff = time.monotonic() - self._retention_seconds
+        while self._completed_order and self._completed_order[0][0] < cutoff:
+            _completed_at, job_id = self._completed_order.popleft()
+            self._store.pop(job_id, None)
+
+    def _finish_locked(self, job_id: str) -> None:
+        """Record a terminal (done/error) transition. Must be called under :attr:`_lock`."""
+        self._running_count -= 1
+        self._completed_order.append((time.monotonic(), job_id))
+
+    def _run(self, job_id: str, job_type: str, payload: dict | list[dict]) -> None:
+        """Execute a job's handler in the worker thread and record its outcome.
+
+        Args:
+            job_id: Identifier of the job being run.
+            job_type: Registered job type identifying the handler to run.
+            payload: Arguments passed to the handler; a batch's payload list
+                for a batch-capable job type.
+        """
+        with self._lock:
+            self._release_dedup_locked(job_id)
+            self._store[job_id]["status"] = _STATUS_RUNNING
+            self._pending_count -= 1
+            self._running_count += 1
+            carrier = self._execution_contexts[job_id]
+        try:
+            with attach_execution_context(carrier):
+                with get_tracer().start_as_current_span(
+                    "autodev.job.execute",
+                    kind=SpanKind.CONSUMER,
+                    attributes=_correlation_span_attributes(carrier),
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    handler = _HANDLERS.get(job_type)
+                    if handler is None:
+                        with self._lock:
+                            self._store[job_id]["status"] = _STATUS_ERROR
+                            self._store[job_id]["error"] = (
+                                "No handler registered for job_type "
+                                f"{job_type!r}."
+                            )
+                            self._finish_locked(job_id)
+                        return
+                    result = handler(payload)
+            with self._lock:
+                self._store[job_id]["status"] = _STATUS_DONE
+                self._store[job_id]["result"] = result
+                self._finish_locked(job_id)
+        except Exception as exc:  # noqa: BLE001
+            with self._lock:
+                self._store[job_id]["status"] = _STATUS_ERROR
+                self._store[job_id]["error"] = str(exc)
+                self._finish_locked(job_id)
+        finally:
+            with self._lock:
+                self._execution_contexts.pop(job_id, None)
+
+
+__all__ = ["InProcessJobQueue"]
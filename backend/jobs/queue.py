@@ -1,60 +1,30 @@
-"""Async in-process and Redis job-queue implementations."""
+"""Async job-queue backends and the process-wide queue singleton.
+
+:class:`InProcessJobQueue` lives in :mod:`backend.jobs.inprocess` and
+:class:`RedisJobQueue` in :mod:`backend.jobs.redis_queue`, whose lease,
+retry and dead-letter machinery is in :mod:`backend.jobs.redis_leases`;
+handler registration, batching and ``dedup_key`` claims are in
+:mod:`backend.jobs.batching`. Their public names are re-exported here.
+"""
 
 from __future__ import annotations
 
-import json
 import os
 import threading
-import time
-import uuid
-from abc import ABC, abstractmethod
-from collections import deque
-from collections.abc import Mapping
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable
-
-from opentelemetry.trace import SpanKind
+from typing import Any
 
 from backend.config.settings import Settings
-from backend.observability.context import (
-    attach_execution_context,
-    capture_execution_context,
+from backend.jobs._shared import (
+    _DEFAULT_JOB_RETENTION_SECONDS,
+    _DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+    _HANDLERS,
+    JOB_LANES,
+    AbstractJobQueue,
+    _decode_value,
 )
-from backend.observability.metrics import QueueSnapshot
-from backend.observability.tracing import get_tracer
-
-_DEFAULT_JOB_RETENTION_SECONDS = 3600
-
-
-class AbstractJobQueue(ABC):
-    """Minimal async-job-queue interface."""
-
-    @abstractmethod
-    def enqueue(self, job_type: str, payload: dict) -> str:
-        """Submit a job and return its unique *job_id*."""
-
-    @abstractmethod
-    def get(self, job_id: str) -> dict:
-        """Return the five-field public state record for *job_id*."""
-
-    @abstractmethod
-    def stats(self) -> QueueSnapshot:
-        """Return a bounded snapshot of queue and worker state."""
-
-
-_JobHandler = Callable[[dict], Any]
-_HANDLERS: dict[str, _JobHandler] = {}
-
-
-def register_handler(job_type: str) -> Callable[[_JobHandler], _JobHandler]:
-    """Decorator: register a callable as the handler for *job_type*."""
-
-    def _decorator(fn: _JobHandler) -> _JobHandler:
-        """Register the wrapped callable as the handler for the enclosing ``job_type``."""
-        _HANDLERS[job_type] = fn
-        return fn
-
-    return _decorator
+from backend.jobs.batching import _BATCH_POLICIES, register_handler
+from backend.jobs.inprocess import InProcessJobQueue
+from backend.jobs.redis_queue import RedisJobQueue
 
 
 @register_handler("echo")
@@ -63,496 +33,6 @@ def _echo(payload: dict) -> dict:
     return {"echoed": payload}
 
 
-_STATUS_PENDING = "pending"
-_STATUS_RUNNING = "running"
-_STATUS_DONE = "done"
-_STATUS_ERROR = "error"
-
-
-class InProcessJobQueue(AbstractJobQueue):
-    """Thread-pool-backed in-process job queue."""
-
-    def __init__(
-        self, max_workers: int = 4, *, retention_seconds: int = _DEFAULT_JOB_RETENTION_SECONDS
-    ) -> None:
-        """Initialize the queue with a bounded thread pool.
-
-        Args:
-            max_workers: Maximum number of jobs to run concurrently.
-            retention_seconds: How long a completed (done/error) record is
-                kept before it is evicted; negative disables eviction.
-        """
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._max_workers = max_workers
-        self._store: dict[str, dict] = {}
-        self._execution_contexts: dict[str, dict[str, str]] = {}
-        self._lock = threading.Lock()
-        self._retention_seconds = retention_seconds
-        self._pending_count = 0
-        self._running_count = 0
-        # Completion order queue: bounds eviction sweep cost to the number of
-        # records actually expired, not the total store size (O(1) stats()).
-        self._completed_order: deque[tuple[float, str]] = deque()
-
-    def enqueue(self, job_type: str, payload: dict) -> str:
-        """Submit a job to the thread pool for asynchronous execution.
-
-        Args:
-            job_type: Registered job type identifying the handler to run.
-            payload: Arguments passed to the handler.
-
-        Returns:
-            The generated job id.
-        """
-        with get_tracer().start_as_current_span(
-            "autodev.job.enqueue",
-            kind=SpanKind.PRODUCER,
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            carrier = capture_execution_context()
-            for name, value in _correlation_span_attributes(carrier).items():
-                span.set_attribute(name, value)
-            job_id = str(uuid.uuid4())
-            record: dict = {
-                "job_id": job_id, "job_type": job_type,
-                "status": _STATUS_PENDING,
-                "result": None, "error": None,
-            }
-            with self._lock:
-                self._sweep_expired_locked()
-                self._store[job_id] = record
-                self._execution_contexts[job_id] = carrier
-                self._pending_count += 1
-            try:
-                self._executor.submit(self._run, job_id, job_type, payload)
-            except Exception:
-                with self._lock:
-                    self._store.pop(job_id, None)
-                    self._execution_contexts.pop(job_id, None)
-                    self._pending_count -= 1
-                raise
-        return job_id
-
-    def get(self, job_id: str) -> dict:
-        """Return the current state of a submitted job.
-
-        Args:
-            job_id: Identifier returned by :meth:`enqueue`.
-
-        Returns:
-            The job's status record; an error record if ``job_id`` is unknown.
-        """
-        with self._lock:
-            record = self._store.get(job_id)
-        if record is None:
-            return {
-                "job_id": job_id, "job_type": "unknown",
-                "status": _STATUS_ERROR,
-                "result": None, "error": f"Unknown job_id: {job_id!r}",
-            }
-        return dict(record)
-
-    def stats(self) -> QueueSnapshot:
-        """Return pending/running counts and in-process worker utilization.
-
-        Returns:
-            A snapshot built from incremental counters (O(1); does not scan
-            every job ever enqueued).
-        """
-        with self._lock:
-            pending = self._pending_count
-            running = self._running_count
-        return QueueSnapshot(pending, running, self._max_workers, running)
-
-    def close(self, *, wait: bool = True) -> None:
-        """Shut down the thread pool.
-
-        Mirrors :meth:`RedisJobQueue.close`. By default (``wait=True``,
-        matching :meth:`ThreadPoolExecutor.shutdown`'s own default) this
-        blocks until every already-submitted job finishes running, so no
-        job from this queue can still be executing after this call
-        returns and touch state (e.g. a durable store swapped out by a
-        test's next fixture) that belongs to whatever comes next. Once
-        closed, this queue instance must not be reused: further
-        :meth:`enqueue` calls raise ``RuntimeError``.
-
-        Args:
-            wait: Whether to block until in-flight jobs finish.
-        """
-        self._executor.shutdown(wait=wait)
-
-    def _sweep_expired_locked(self) -> None:
-        """Evict completed records older than the retention window.
-
-        Must be called while holding :attr:`_lock`. Cost is proportional to
-        the number of records actually expired, not to the store's total
-        size, since :attr:`_completed_order` is consumed in completion
-        order (oldest first).
-        """
-        if self._retention_seconds < 0:
-            return
-        cutoff = time.monotonic() - self._retention_seconds
-        while self._completed_order and self._completed_order[0][0] < cutoff:
-            _completed_at, job_id = self._completed_order.popleft()
-            self._store.pop(job_id, None)
-
-    def _finish_locked(self, job_id: str) -> None:
-        """Record a terminal (done/error) transition. Must be called under :attr:`_lock`."""
-        self._running_count -= 1
-        self._completed_order.append((time.monotonic(), job_id))
-
-    def _run(self, job_id: str, job_type: str, payload: dict) -> None:
-        """Execute a job's handler in the worker thread and record its outcome.
-
-        Args:
-            job_id: Identifier of the job being run.
-            job_type: Registered job type identifying the handler to run.
-            payload: Arguments passed to the handler.
-        """
-        with self._lock:
-            self._store[job_id]["status"] = _STATUS_RUNNING
-            self._pending_count -= 1
-            self._running_count += 1
-            carrier = self._execution_contexts[job_id]
-        try:
-            with attach_execution_context(carrier):
-                with get_tracer().start_as_current_span(
-                    "autodev.job.execute",
-                    kind=SpanKind.CONSUMER,
-                    attributes=_correlation_span_attributes(carrier),
-                    record_exception=False,
-                    set_status_on_exception=False,
-                ):
-                    handler = _HANDLERS.get(job_type)
-                    if handler is None:
-                        with self._lock:
-                            self._store[job_id]["status"] = _STATUS_ERROR
-                            self._store[job_id]["error"] = (
-                                "No handler registered for job_type "
-                                f"{job_type!r}."
-                            )
-                            self._finish_locked(job_id)
-                        return
-                    result = handler(payload)
-            with self._lock:
-                self._store[job_id]["status"] = _STATUS_DONE
-                self._store[job_id]["result"] = result
-                self._finish_locked(job_id)
-        except Exception as exc:  # noqa: BLE001
-            with self._lock:
-                self._store[job_id]["status"] = _STATUS_ERROR
-                self._store[job_id]["error"] = str(exc)
-                self._finish_locked(job_id)
-        finally:
-            with self._lock:
-                self._execution_contexts.pop(job_id, None)
-
-
-class RedisJobQueue(AbstractJobQueue):
-    """Redis-backed queue for production-like deployments."""
-
-    _pending_key = "autodev:jobs:pending"
-
-    def __init__(
-        self,
-        *,
-        client: Any | None = None,
-        url: str | None = None,
-        start_worker: bool = True,
-        blpop_timeout: float = 5.0,
-        job_retention_seconds: int = _DEFAULT_JOB_RETENTION_SECONDS,
-    ) -> None:
-        """Initialize the queue, connecting to Redis and optionally starting a worker.
-
-        Args:
-            client: Pre-built Redis client to reuse; a new one is built if omitted.
-            url: Redis connection URL, used when ``client`` is omitted; falls
-                back to ``AUTODEV_REDIS_URL``.
-            start_worker: Whether to start a background thread processing jobs.
-            blpop_timeout: Bounded ``BLPOP`` timeout in seconds; the worker
-                blocks for at most this long per empty-queue wait, so
-                :meth:`close` never waits longer than this to observe the
-                stop signal.
-            job_retention_seconds: TTL applied to a job's Redis hash once it
-                reaches a terminal (done/error) status; negative disables
-                expiry.
-
-        Raises:
-            RuntimeError: If the ``redis`` package is not installed, or if no
-                Redis URL is configured.
-        """
-        if client is None:
-            try:
-                import redis as _redis  # type: ignore[import-untyped]
-            except ImportError as exc:
-                raise RuntimeError("redis package is not installed.") from exc
-            redis_url = (url or os.environ.get("AUTODEV_REDIS_URL", "")).strip()
-            if not redis_url:
-                raise RuntimeError("AUTODEV_REDIS_URL is required for RedisJobQueue.")
-            client = _redis.from_url(redis_url)
-        self._client = client
-        self._client.ping()
-        self._blpop_timeout = blpop_timeout
-        self._job_retention_seconds = job_retention_seconds
-        self._worker_enabled = start_worker
-        self._busy_workers = 0
-        self._busy_lock = threading.Lock()
-        self._stop_event = threading.Event()
-        self._worker_thread: threading.Thread | None = None
-        if start_worker:
-            self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-            self._worker_thread.start()
-
-    def close(self, *, timeout: float | None = None) -> None:
-        """Signal the worker thread to stop and wait for it to exit.
-
-        Safe to call when no worker was started (a no-op). Idempotent.
-
-        Args:
-            timeout: Maximum seconds to wait for the worker thread to exit;
-                defaults to :attr:`_blpop_timeout` plus a small margin, which
-                bounds the wait since the worker checks the stop signal at
-                most once per ``BLPOP`` timeout.
-        """
-        self._stop_event.set()
-        if self._worker_thread is None:
-            return
-        self._worker_thread.join(timeout=timeout if timeout is not None else self._blpop_timeout + 1.0)
-
-    def enqueue(self, job_type: str, payload: dict) -> str:
-        """Submit a job by writing its record to Redis and queuing its id.
-
-        Args:
-            job_type: Registered job type identifying the handler to run.
-            payload: Arguments passed to the handler.
-
-        Returns:
-            The generated job id.
-        """
-        with get_tracer().start_as_current_span(
-            "autodev.job.enqueue",
-            kind=SpanKind.PRODUCER,
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            carrier = capture_execution_context()
-            for name, value in _correlation_span_attributes(carrier).items():
-                span.set_attribute(name, value)
-            job_id = str(uuid.uuid4())
-            key = self._job_key(job_id)
-            mapping: Mapping[Any, Any] = {
-                "job_id": job_id, "job_type": job_type,
-                "payload": json.dumps(payload),
-                "status": _STATUS_PENDING,
-                "result": "null", "error": "",
-                "otel_traceparent": carrier.get("traceparent", ""),
-                "otel_tracestate": carrier.get("tracestate", ""),
-                "otel_baggage": carrier.get("baggage", ""),
-                "correlation_request_id": carrier.get("correlation_request_id", ""),
-                "correlation_run_id": carrier.get("correlation_run_id", ""),
-                "correlation_tenant_id": carrier.get("correlation_tenant_id", ""),
-            }
-            self._client.hset(key, mapping=mapping)
-            try:
-                self._client.rpush(self._pending_key, job_id)
-            except Exception:
-                try:
-                    self._client.delete(key)
-                except Exception:
-                    self._client.hdel(key, *mapping)
-                raise
-        return job_id
-
-    def get(self, job_id: str) -> dict:
-        """Return the current state of a submitted job from Redis.
-
-        Args:
-            job_id: Identifier returned by :meth:`enqueue`.
-
-        Returns:
-            The job's status record; an error record if ``job_id`` is unknown.
-        """
-        record = _decode_hash(self._client.hgetall(self._job_key(job_id)))
-        if not record:
-            return {
-                "job_id": job_id, "job_type": "unknown",
-                "status": _STATUS_ERROR,
-                "result": None, "error": f"Unknown job_id: {job_id!r}",
-            }
-        return {
-            "job_id": record["job_id"], "job_type": record["job_type"],
-            "status": record["status"],
-            "result": json.loads(record.get("result") or "null"),
-            "error": record.get("error") or None,
-        }
-
-    def stats(self) -> QueueSnapshot:
-        """Return Redis queue depth and worker activity owned by this process.
-
-        Returns:
-            Pending list depth plus current-process worker state.
-        """
-        pending = int(self._client.llen(self._pending_key))
-        with self._busy_lock:
-            busy_workers = self._busy_workers
-        return QueueSnapshot(
-            pending, busy_workers, 1 if self._worker_enabled else 0, busy_workers
-        )
-
-    def run_pending_once(self) -> bool:
-        """Pop and run a single pending job, if any.
-
-        Returns:
-            ``True`` if a job was popped and run, ``False`` if the queue was empty.
-        """
-        raw_job_id = self._client.lpop(self._pending_key)
-        if raw_job_id is None:
-            return False
-        job_id = _decode_value(raw_job_id)
-        self._run_redis_job(job_id)
-        return True
-
-    def _worker_loop(self) -> None:
-        """Block on ``BLPOP`` for pending jobs until :meth:`close` signals stop.
-
-        Each iteration blocks for at most :attr:`_blpop_timeout` seconds, so
-        idle Redis ops are ~0 (one blocked call at a time) and the stop
-        signal is observed within one timeout window.
-        """
-        while not self._stop_event.is_set():
-            try:
-                popped = self._client.blpop([self._pending_key], timeout=self._blpop_timeout)
-            except Exception:
-                if self._stop_event.is_set():
-                    return
-                raise
-            if popped is None:
-                continue
-            _key, raw_job_id = popped
-            job_id = _decode_value(raw_job_id)
-            self._run_redis_job(job_id)
-
-    def _run_redis_job(self, job_id: str) -> None:
-        """Execute a job's handler and persist its outcome back to Redis.
-
-        Args:
-            job_id: Identifier of the job to run.
-        """
-        key = self._job_key(job_id)
-        record = _decode_hash(self._client.hgetall(key))
-        if not record:
-            return
-        carrier = {
-            "traceparent": record.get("otel_traceparent", ""),
-            "tracestate": record.get("otel_tracestate", ""),
-            "baggage": record.get("otel_baggage", ""),
-            "correlation_request_id": record.get("correlation_request_id", ""),
-            "correlation_run_id": record.get("correlation_run_id", ""),
-            "correlation_tenant_id": record.get("correlation_tenant_id", ""),
-        }
-        with self._busy_lock:
-            self._busy_workers += 1
-        try:
-            self._client.hset(key, mapping={"status": _STATUS_RUNNING})
-            with attach_execution_context(carrier):
-                with get_tracer().start_as_current_span(
-                    "autodev.job.execute",
-                    kind=SpanKind.CONSUMER,
-                    attributes=_correlation_span_attributes(carrier),
-                    record_exception=False,
-                    set_status_on_exception=False,
-                ):
-                    handler = _HANDLERS.get(record["job_type"])
-                    if handler is None:
-                        self._client.hset(
-                            key,
-                            mapping={
-                                "status": _STATUS_ERROR,
-                                "error": "No handler registered for job_type "
-                                f"{record['job_type']!r}.",
-                            },
-                        )
-                        return
-                    result = handler(json.loads(record.get("payload") or "{}"))
-            self._client.hset(
-                key,
-                mapping={
-                    "status": _STATUS_DONE,
-                    "result": json.dumps(result),
-                    "error": "",
-                },
-            )
-        except Exception as exc:  # noqa: BLE001
-            self._client.hset(
-                key,
-                mapping={
-                    "status": _STATUS_ERROR, "result": "null", "error": str(exc),
-                },
-            )
-        finally:
-            self._client.hdel(key, *_REDIS_EXECUTION_CONTEXT_FIELDS)
-            if self._job_retention_seconds >= 0:
-                self._client.expire(key, self._job_retention_seconds)
-            with self._busy_lock:
-                self._busy_workers -= 1
-
-    def _job_key(self, job_id: str) -> str:
-        """Build the Redis hash key storing ``job_id``."""
-        return f"autodev:jobs:{job_id}"
-
-
-def _decode_value(value: Any) -> str:
-    """Decode a Redis response value to a ``str``.
-
-    Args:
-        value: Raw value returned by the Redis client, bytes or otherwise.
-
-    Returns:
-        The decoded string.
-    """
-    if isinstance(value, bytes):
-        return value.decode()
-    return str(value)
-
-
-def _decode_hash(record: dict[Any, Any]) -> dict[str, str]:
-    """Decode a Redis hash response into a plain ``str``-keyed/valued dict.
-
-    Args:
-        record: Raw hash mapping returned by the Redis client.
-
-    Returns:
-        The decoded mapping.
-    """
-    return {_decode_value(key): _decode_value(value) for key, value in record.items()}
-
-
-_REDIS_EXECUTION_CONTEXT_FIELDS = (
-    "otel_traceparent",
-    "otel_tracestate",
-    "otel_baggage",
-    "correlation_request_id",
-    "correlation_run_id",
-    "correlation_tenant_id",
-)
-
-
-def _correlation_span_attributes(carrier: Mapping[str, str]) -> dict[str, str]:
-    """Build content-free span attributes from a sanitized execution carrier."""
-    keys = {
-        "correlation_request_id": "autodev.request_id",
-        "correlation_run_id": "autodev.run_id",
-        "correlation_step_id": "autodev.step_id",
-        "correlation_tenant_id": "autodev.tenant_id",
-    }
-    return {
-        attribute: carrier[key]
-        for key, attribute in keys.items()
-        if carrier.get(key)
-    }
-
-
 _queue_singleton: AbstractJobQueue | None = None
 _queue_lock = threading.Lock()
 
@@ -573,12 +53,33 @@ def get_queue(settings: Settings | None = None) -> AbstractJobQueue:
                     "AUTODEV_JOB_RETENTION_SECONDS", str(_DEFAULT_JOB_RETENTION_SECONDS)
                 )
             )
+            redis_options: dict[str, Any] = {
+                "workers": int(os.environ.get("AUTODEV_JOB_WORKERS", "4")),
+                "visibility_timeout_seconds": float(
+                    os.environ.get(
+                        "AUTODEV_JOB_VISIBILITY_TIMEOUT_SECONDS",
+                        str(_DEFAULT_VISIBILITY_TIMEOUT_SECONDS),
+                    )
+                ),
+                "max_attempts": int(os.environ.get("AUTODEV_JOB_MAX_ATTEMPTS", "3")),
+                "retry_backoff_seconds": float(
+                    os.environ.get("AUTODEV_JOB_RETRY_BACKOFF_SECONDS", "1.0")
+                ),
+            }
         else:
             want_redis = settings.autodev_job_backend == "redis"
             redis_url = settings.autodev_redis_url
             retention_seconds = settings.autodev_job_retention_seconds
+            redis_options = {
+                "workers": settings.autodev_job_workers,
+                "visibility_timeout_seconds": settings.autodev_job_visibility_timeout_seconds,
+                "max_attempts": settings.autodev_job_max_attempts,
+                "retry_backoff_seconds": settings.autodev_job_retry_backoff_seconds,
+            }
         if want_redis:
-            _queue_singleton = RedisJobQueue(url=redis_url, job_retention_seconds=retention_seconds)
+            _queue_singleton = RedisJobQueue(
+                url=redis_url, job_retention_seconds=retention_seconds, **redis_options
+            )
             return _queue_singleton
 
         _queue_singleton = InProcessJobQueue(retention_seconds=retention_seconds)
@@ -606,9 +107,13 @@ def _reset_queue_singleton() -> None:
 
 
 __all__ = [
+    "JOB_LANES",
     "AbstractJobQueue",
     "InProcessJobQueue",
     "RedisJobQueue",
+    "_BATCH_POLICIES",
+    "_HANDLERS",
+    "_decode_value",
     "get_queue",
     "register_handler",
     "_reset_queue_singleton",
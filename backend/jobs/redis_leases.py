@@ -0,0 +1,234 @@
+"""Claims, leases, delayed retries and dead-lettering for ``RedisJobQueue``."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from backend.jobs._shared import (
+    _MAINTENANCE_INTERVAL_SECONDS,
+    _REDIS_EXECUTION_CONTEXT_FIELDS,
+    _STATUS_ERROR,
+    _STATUS_PENDING,
+    JOB_LANES,
+    _decode_hash,
+    _decode_value,
+    _record_lane,
+    _RedisQueueOwner,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_BACKOFF_SECONDS = 300.0
+_DEAD_LETTER_MAXLEN = 10_000
+_RECLAIM_BATCH_SIZE = 100
+
+
+class _RedisLeaseMixin(_RedisQueueOwner):
+    """Reliable claims with leases, backoff retries and a dead-letter list.
+
+    A claimed id sits in the processing list while its lease expiry is kept
+    in a sorted set (``autodev:jobs:leases``) scored by ``lease_until``, and
+    retries waiting out their backoff sit in another scored by when they are
+    due. :meth:`reclaim_expired` therefore only reads the entries that are
+    actually due (``ZRANGEBYSCORE -inf now``) instead of scanning every
+    claimed or delayed job on each pass.
+    """
+
+    _processing_key = "autodev:jobs:processing"
+    _leases_key = "autodev:jobs:leases"
+    _delayed_key = "autodev:jobs:scheduled"
+    _dead_key = "autodev:jobs:dead"
+
+    _blpop_timeout: float
+    _maintenance_lock: threading.Lock
+    _next_maintenance: float
+    _next_lease_audit: float
+
+    def reclaim_expired(self) -> int:
+        """Requeue jobs whose lease expired and retries whose backoff elapsed.
+
+        Safe to run from any number of workers and processes at once: a job
+        is only requeued by the caller whose ``ZREM`` removed its entry.
+        Each pass handles at most :data:`_RECLAIM_BATCH_SIZE` entries of
+        each set; the rest wait for the next pass.
+
+        Returns:
+            Number of jobs put back in a lane or dead-lettered.
+        """
+        now = time.time()
+        if time.monotonic() >= self._next_lease_audit:
+            self._next_lease_audit = time.monotonic() + self._visibility_timeout_seconds
+            self._lease_unleased(now)
+        moved = 0
+        for job_id in self._due(self._leases_key, now):
+            if not self._client.lrem(self._processing_key, 1, job_id):
+                continue  # finished meanwhile
+            key = self._job_key(job_id)
+            record = _decode_hash(self._client.hgetall(key))
+            if record:
+                logger.warning("Job %s lease expired; reclaiming it", job_id)
+                if not self._retry_or_bury(job_id, record, "Job lease expired before it finished."):
+                    self._finalize(key)
+                moved += 1
+        for job_id in self._due(self._delayed_key, time.time()):
+            record = _decode_hash(self._client.hgetall(self._job_key(job_id)))
+            if record:
+                self._client.rpush(self.lane_key(_record_lane(record)), job_id)
+                moved += 1
+        return moved
+
+    def _due(self, key: str, now: float) -> list[str]:
+        """Pop the members of sorted set *key* scored at or before *now*.
+
+        A member is returned only to the caller whose ``ZREM`` removed it,
+        so concurrent reclaimers never both act on the same job.
+        """
+        due = self._client.zrangebyscore(key, "-inf", now, start=0, num=_RECLAIM_BATCH_SIZE)
+        return [
+            job_id
+            for job_id in map(_decode_value, due)
+            if self._client.zrem(key, job_id)
+        ]
+
+    def _lease_unleased(self, now: float) -> None:
+        """Start the lease clock on claimed jobs that have no lease entry.
+
+        A worker that dies between claiming a job and recording its lease
+        (or a job claimed before leases were tracked in a sorted set) would
+        otherwise sit in the processing list forever. This scans the whole
+        list, so :meth:`reclaim_expired` runs it once per visibility
+        timeout rather than on every pass.
+        """
+        deadline = now + self._visibility_timeout_seconds
+        for raw_job_id in self._client.lrange(self._processing_key, 0, -1):
+            self._client.zadd(self._leases_key, {_decode_value(raw_job_id): deadline}, nx=True)
+
+    def _maintain_if_due(self) -> None:
+        """Run :meth:`reclaim_expired` from one worker per interval in this process."""
+        if time.monotonic() < self._next_maintenance:
+            return
+        if not self._maintenance_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_maintenance = time.monotonic() + _MAINTENANCE_INTERVAL_SECONDS
+            self.reclaim_expired()
+        finally:
+            self._maintenance_lock.release()
+
+    def _claim(self, *, block: bool) -> str | None:
+        """Move the next job id into the processing list and lease it.
+
+        Args:
+            block: Wait (bounded) on the ``normal`` lane when every lane is empty.
+
+        Returns:
+            The claimed job id, or ``None`` if there was nothing to run.
+        """
+        raw_job_id = None
+        for lane in JOB_LANES:
+            raw_job_id = self._client.lmove(
+                self.lane_key(lane), self._processing_key, "LEFT", "RIGHT"
+            )
+            if raw_job_id is not None:
+                break
+        if raw_job_id is None and block:
+            raw_job_id = self._client.blmove(
+                self.lane_key("normal"),
+                self._processing_key,
+                # BLMOVE takes whole seconds and 0 would block forever.
+                max(1, int(min(self._blpop_timeout, _MAINTENANCE_INTERVAL_SECONDS))),
+                "LEFT",
+                "RIGHT",
+            )
+        if raw_job_id is None:
+            return None
+        job_id = _decode_value(raw_job_id)
+        self._client.zadd(
+            self._leases_key, {job_id: time.time() + self._visibility_timeout_seconds}
+        )
+        return job_id
+
+    def _release_claim(self, job_id: str) -> None:
+        """Drop *job_id* from the processing list and its lease entry."""
+        self._client.lrem(self._processing_key, 1, job_id)
+        self._client.zrem(self._leases_key, job_id)
+
+    def _retry_or_bury(self, job_id: str, record: dict[str, str], error: str) -> bool:
+        """Schedule another attempt with backoff, or dead-letter the job.
+
+        Args:
+            job_id: Job that failed or whose lease expired.
+            record: The job's decoded hash.
+            error: Failure reported if the job is dead-lettered.
+
+        Returns:
+            ``True`` if a retry was scheduled, ``False`` if the job was
+            dead-lettered (terminal ``error`` status).
+        """
+        key = self._job_key(job_id)
+        attempts = int(record.get("attempts") or 0) + 1
+        if attempts < self._max_attempts:
+            delay = min(
+                self._retry_backoff_seconds * 2 ** (attempts - 1), _MAX_RETRY_BACKOFF_SECONDS
+            )
+            self._client.hset(
+                key, mapping={"status": _STATUS_PENDING, "attempts": str(attempts)}
+            )
+            self._client.zadd(self._delayed_key, {job_id: time.time() + delay})
+            return True
+        self._client.hset(
+            key,
+            mapping={
+                "status": _STATUS_ERROR, "result": "null", "error": error,
+                "attempts": str(attempts),
+            },
+        )
+        self._client.rpush(self._dead_key, job_id)
+        self._client.ltrim(self._dead_key, -_DEAD_LETTER_MAXLEN, -1)
+        return False
+
+    def _finalize(self, key: str) -> None:
+        """Drop a terminal job's private carrier and start its retention TTL."""
+        self._client.hdel(key, *_REDIS_EXECUTION_CONTEXT_FIELDS)
+        if self._job_retention_seconds >= 0:
+            self._client.expire(key, self._job_retention_seconds)
+
+    @contextmanager
+    def _lease_heartbeat(self, job_id: str) -> Iterator[None]:
+        """Keep a running job's lease alive until the block exits.
+
+        A background thread pushes the lease a full visibility timeout ahead
+        every third of that timeout, so :meth:`reclaim_expired` only
+        requeues jobs whose worker actually died, however long the handler
+        runs. ``ZADD XX`` only moves an existing entry, so a beat never
+        re-leases a job another worker has already reclaimed.
+
+        Args:
+            job_id: Identifier of the running job.
+        """
+        stop = threading.Event()
+        interval = self._visibility_timeout_seconds / 3
+
+        def _beat() -> None:
+            """Extend the lease every *interval* seconds until *stop* is set."""
+            while not stop.wait(interval):
+                lease_until = time.time() + self._visibility_timeout_seconds
+                try:
+                    self._client.zadd(self._leases_key, {job_id: lease_until}, xx=True)
+                except Exception:  # the next beat retries before the lease lapses
+                    logger.warning("Could not extend the lease of job %s", job_id, exc_info=True)
+
+        thread = threading.Thread(target=_beat, name=f"job-lease:{job_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+
+__all__ = ["_DEAD_LETTER_MAXLEN", "_MAX_RETRY_BACKOFF_SECONDS", "_RedisLeaseMixin"]
@@ -0,0 +1,418 @@
+"""Redis-backed job queue: priority lanes, leased claims, retries and batching."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any
+
+from opentelemetry.trace import SpanKind
+
+from backend.jobs._shared import (
+    _DEFAULT_JOB_RETENTION_SECONDS,
+    _DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+    _HANDLERS,
+    _MAINTENANCE_INTERVAL_SECONDS,
+    _STATUS_DONE,
+    _STATUS_ERROR,
+    _STATUS_PENDING,
+    _STATUS_RUNNING,
+    JOB_LANES,
+    AbstractJobQueue,
+    _check_lane,
+    _correlation_span_attributes,
+    _decode_hash,
+    _decode_value,
+)
+from backend.jobs.batching import _BATCH_POLICIES, _RedisBatchMixin
+from backend.jobs.redis_leases import _RedisLeaseMixin
+from backend.observability.context import (
+    attach_execution_context,
+    capture_execution_context,
+)
+from backend.observability.metrics import QueueLaneSnapshot, QueueSnapshot
+from backend.observability.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobQueue(_RedisLeaseMixin, _RedisBatchMixin, AbstractJobQueue):
+    """Redis-backed queue for production-like deployments.
+
+    Jobs wait in one Redis list per priority lane (:data:`JOB_LANES`). A
+    worker claims a job by atomically moving its id into a shared processing
+    list (``LMOVE``/``BLMOVE``, the reliable-queue pattern) and recording a
+    lease in a sorted set scored by its expiry, so a worker that dies mid-job
+    leaves the id behind instead of losing it. Every worker loop
+    periodically runs :meth:`reclaim_expired`, which hands jobs whose lease
+    ran out back to their lane and moves due retries out of the delayed
+    set (see :class:`~backend.jobs.redis_leases._RedisLeaseMixin`). A
+    failed job is retried with exponential backoff until
+    ``max_attempts`` runs have started, then dead-lettered
+    (``autodev:jobs:dead``). Delivery is therefore at-least-once: a job that
+    outlives its visibility timeout may run twice, so the timeout must
+    exceed the slowest handler.
+
+    ``dedup_key`` claims (``SET NX``) live until the job starts. Payloads of
+    batch-capable job types (see :func:`register_handler`) wait in a list
+    per type, drained by one delayed job at a time; since delayed jobs are
+    promoted by :meth:`reclaim_expired`, a batch runs up to
+    :data:`_MAINTENANCE_INTERVAL_SECONDS` after its window closes.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any | None = None,
+        url: str | None = None,
+        start_worker: bool = True,
+        blpop_timeout: float = 5.0,
+        job_retention_seconds: int = _DEFAULT_JOB_RETENTION_SECONDS,
+        workers: int = 1,
+        visibility_timeout_seconds: float = _DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+        max_attempts: int = 1,
+        retry_backoff_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the queue, connecting to Redis and optionally starting workers.
+
+        Args:
+            client: Pre-built Redis client to reuse; a new one is built if omitted.
+            url: Redis connection URL, used when ``client`` is omitted; falls
+                back to ``AUTODEV_REDIS_URL``.
+            start_worker: Whether to start background threads processing jobs.
+            blpop_timeout: Bounded blocking-claim (``BLMOVE``) timeout in
+                seconds; each wait is further capped at
+                :data:`_MAINTENANCE_INTERVAL_SECONDS` so the other lanes and
+                expired leases are checked at least that often. :meth:`close`
+                never waits longer than one wait to observe the stop signal.
+            job_retention_seconds: TTL applied to a job's Redis hash once it
+                reaches a terminal (done/error) status; negative disables
+                expiry.
+            workers: Worker threads started in this process.
+            visibility_timeout_seconds: How long a claimed job may run before
+                another worker may reclaim it.
+            max_attempts: Runs a job gets (including ones whose worker died)
+                before it is dead-lettered; ``1`` disables retries.
+            retry_backoff_seconds: Delay before the first retry; doubles per
+                attempt, capped at :data:`_MAX_RETRY_BACKOFF_SECONDS`.
+
+        Raises:
+            RuntimeError: If the ``redis`` package is not installed, or if no
+                Redis URL is configured.
+            ValueError: If ``workers`` is negative or ``max_attempts`` or the
+                visibility timeout is not positive.
+        """
+        if workers < 0 or max_attempts < 1 or visibility_timeout_seconds <= 0:
+            raise ValueError(
+                "workers must be >= 0; max_attempts and visibility_timeout_seconds must be positive"
+            )
+        if client is None:
+            try:
+                import redis as _redis  # type: ignore[import-untyped]
+            except ImportError as exc:
+                raise RuntimeError("redis package is not installed.") from exc
+            redis_url = (url or os.environ.get("AUTODEV_REDIS_URL", "")).strip()
+            if not redis_url:
+                raise RuntimeError("AUTODEV_REDIS_URL is required for RedisJobQueue.")
+            client = _redis.from_url(redis_url)
+        self._client = client
+        self._client.ping()
+        self._blpop_timeout = blpop_timeout
+        self._job_retention_seconds = job_retention_seconds
+        self._visibility_timeout_seconds = visibility_timeout_seconds
+        self._max_attempts = max_attempts
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._worker_enabled = start_worker
+        self._worker_count = workers if start_worker else 0
+        self._busy_workers = 0
+        self._busy_lock = threading.Lock()
+        self._maintenance_lock = threading.Lock()
+        self._next_maintenance = 0.0
+        self._next_lease_audit = 0.0
+        self._stop_event = threading.Event()
+        self._worker_threads: list[threading.Thread] = []
+        for _ in range(self._worker_count):
+            thread = threading.Thread(target=self._worker_loop, daemon=True)
+            thread.start()
+            self._worker_threads.append(thread)
+
+    def close(self, *, timeout: float | None = None) -> None:
+        """Signal the worker threads to stop and wait for them to exit.
+
+        Safe to call when no worker was started (a no-op). Idempotent. A
+        job still running when the wait ends keeps its lease and is
+        reclaimed by another worker once the lease expires.
+
+        Args:
+            timeout: Maximum seconds to wait for each worker thread to exit;
+                defaults to :attr:`_blpop_timeout` plus a small margin, which
+                bounds the wait since a worker checks the stop signal at
+                most once per blocking claim.
+        """
+        self._stop_event.set()
+        for thread in self._worker_threads:
+            thread.join(timeout=timeout if timeout is not None else self._blpop_timeout + 1.0)
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict,
+        *,
+        priority: str = "normal",
+        dedup_key: str | None = None,
+    ) -> str:
+        """Submit a job by writing its record to Redis and queuing its id.
+
+        A payload for a batch-capable job type is appended to the type's
+        shared payload list instead, and one *drain* job per type (itself
+        deduplicated) is scheduled ``batch_window_seconds`` out; when it runs
+        it hands up to ``batch_size`` queued payloads to the handler at once.
+
+        Args:
+            job_type: Registered job type identifying the handler to run.
+            payload: Arguments passed to the handler.
+            priority: Lane to queue the job in; see :data:`JOB_LANES`.
+            dedup_key: Return the id of the not-yet-started job enqueued
+                with this key, if any, instead of queuing another. Ignored
+                for batch-capable job types, whose payloads are coalesced.
+
+        Returns:
+            The generated (or existing) job id; for a batch-capable type,
+            the id of the drain job that will run the payload.
+
+        Raises:
+            ValueError: If ``priority`` is not a known lane.
+        """
+        _check_lane(priority)
+        policy = _BATCH_POLICIES.get(job_type)
+        if policy is None:
+            return self._submit(job_type, payload, priority, dedup_key=dedup_key)
+        self._client.rpush(self._batch_items_key(job_type), json.dumps(payload))
+        return self._schedule_drain(job_type, priority, policy.window_seconds)
+
+    def _submit(
+        self,
+        job_type: str,
+        payload: dict,
+        priority: str,
+        *,
+        dedup_key: str | None = None,
+        delay: float = 0.0,
+        batch: bool = False,
+    ) -> str:
+        """Write a job's record and queue its id in its lane, or delayed by *delay*.
+
+        Returns:
+            The new job id, or the id holding *dedup_key* if one is pending.
+        """
+        with get_tracer().start_as_current_span(
+            "autodev.job.enqueue",
+            kind=SpanKind.PRODUCER,
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            carrier = capture_execution_context()
+            for name, value in _correlation_span_attributes(carrier).items():
+                span.set_attribute(name, value)
+            job_id = str(uuid.uuid4())
+            if dedup_key is not None:
+                existing = self._reserve_dedup(dedup_key, job_id)
+                if existing is not None:
+                    return existing
+            key = self._job_key(job_id)
+            mapping: dict[Any, Any] = {
+                "job_id": job_id, "job_type": job_type,
+                "payload": json.dumps(payload),
+                "status": _STATUS_PENDING,
+                "result": "null", "error": "",
+                "lane": priority, "attempts": "0",
+                "enqueued_at": repr(time.time()),
+                "otel_traceparent": carrier.get("traceparent", ""),
+                "otel_tracestate": carrier.get("tracestate", ""),
+                "otel_baggage": carrier.get("baggage", ""),
+                "correlation_request_id": carrier.get("correlation_request_id", ""),
+                "correlation_run_id": carrier.get("correlation_run_id", ""),
+                "correlation_tenant_id": carrier.get("correlation_tenant_id", ""),
+            }
+            if dedup_key is not None:
+                mapping["dedup_key"] = dedup_key
+            if batch:
+                mapping["batch"] = "1"
+            self._client.hset(key, mapping=mapping)
+            try:
+                if delay > 0:
+                    self._client.zadd(self._delayed_key, {job_id: time.time() + delay})
+                else:
+                    self._client.rpush(self.lane_key(priority), job_id)
+            except Exception:
+                try:
+                    self._client.delete(key)
+                except Exception:
+                    self._client.hdel(key, *mapping)
+                if dedup_key is not None:
+                    self._release_dedup(dedup_key, job_id)
+                raise
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        """Return the current state of a submitted job from Redis.
+
+        Args:
+            job_id: Identifier returned by :meth:`enqueue`.
+
+        Returns:
+            The job's status record; an error record if ``job_id`` is unknown.
+        """
+        record = _decode_hash(self._client.hgetall(self._job_key(job_id)))
+        if not record:
+            return {
+                "job_id": job_id, "job_type": "unknown",
+                "status": _STATUS_ERROR,
+                "result": None, "error": f"Unknown job_id: {job_id!r}",
+            }
+        return {
+            "job_id": record["job_id"], "job_type": record["job_type"],
+            "status": record["status"],
+            "result": json.loads(record.get("result") or "null"),
+            "error": record.get("error") or None,
+        }
+
+    def stats(self) -> QueueSnapshot:
+        """Return Redis lane depths and ages plus worker activity owned by this process.
+
+        Returns:
+            Waiting jobs (every lane plus retries waiting out their backoff),
+            current-process worker state, and a per-lane breakdown.
+        """
+        now = time.time()
+        lanes: list[QueueLaneSnapshot] = []
+        for lane in JOB_LANES:
+            key = self.lane_key(lane)
+            depth = int(self._client.llen(key))
+            age = 0.0
+            if depth:
+                head = self._client.lindex(key, 0)
+                enqueued_at = (
+                    self._client.hget(self._job_key(_decode_value(head)), "enqueued_at")
+                    if head is not None
+                    else None
+                )
+                if enqueued_at is not None:
+                    age = max(now - float(_decode_value(enqueued_at)), 0.0)
+            lanes.append(QueueLaneSnapshot(lane, depth, age))
+        pending = sum(lane.depth for lane in lanes) + int(self._client.zcard(self._delayed_key))
+        with self._busy_lock:
+            busy_workers = self._busy_workers
+        return QueueSnapshot(pending, busy_workers, self._worker_count, busy_workers, tuple(lanes))
+
+    def run_pending_once(self) -> bool:
+        """Claim and run a single waiting job, highest-priority lane first.
+
+        Returns:
+            ``True`` if a job was claimed and run, ``False`` if every lane was empty.
+        """
+        job_id = self._claim(block=False)
+        if job_id is None:
+            return False
+        self._run_redis_job(job_id)
+        return True
+
+    def _worker_loop(self) -> None:
+        """Claim and run jobs until :meth:`close` signals stop.
+
+        Each idle iteration blocks on the ``normal`` lane for at most one
+        claim timeout, so idle Redis traffic stays a few calls per worker
+        per :data:`_MAINTENANCE_INTERVAL_SECONDS`, and the stop signal is
+        observed within one timeout window.
+        """
+        while not self._stop_event.is_set():
+            try:
+                self._maintain_if_due()
+                job_id = self._claim(block=True)
+            except Exception:  # noqa: BLE001 - a Redis hiccup must not kill the worker
+                if self._stop_event.is_set():
+                    return
+                logger.exception("Redis job worker failed to claim a job; retrying")
+                self._stop_event.wait(_MAINTENANCE_INTERVAL_SECONDS)
+                continue
+            if job_id is not None:
+                self._run_redis_job(job_id)
+
+    def _run_redis_job(self, job_id: str) -> None:
+        """Execute a claimed job's handler and persist its outcome back to Redis.
+
+        Args:
+            job_id: Identifier of the job to run.
+        """
+        key = self._job_key(job_id)
+        record = _decode_hash(self._client.hgetall(key))
+        if not record.get("job_type"):
+            # Expired or never persisted: drop the id and the lease recorded on claim.
+            self._release_claim(job_id)
+            return
+        if record.get("dedup_key"):
+            # Started: a later enqueue with the same key needs a job of its own.
+            self._release_dedup(record["dedup_key"], job_id)
+        carrier = {
+            "traceparent": record.get("otel_traceparent", ""),
+            "tracestate": record.get("otel_tracestate", ""),
+            "baggage": record.get("otel_baggage", ""),
+            "correlation_request_id": record.get("correlation_request_id", ""),
+            "correlation_run_id": record.get("correlation_run_id", ""),
+            "correlation_tenant_id": record.get("correlation_tenant_id", ""),
+        }
+        terminal = True
+        with self._busy_lock:
+            self._busy_workers += 1
+        try:
+            self._client.hset(key, mapping={"status": _STATUS_RUNNING})
+            with self._lease_heartbeat(job_id), attach_execution_context(carrier):
+                with get_tracer().start_as_current_span(
+                    "autodev.job.execute",
+                    kind=SpanKind.CONSUMER,
+                    attributes=_correlation_span_attributes(carrier),
+                    record_exception=False,
+                    set_status_on_exception=False,
+                ):
+                    handler = _HANDLERS.get(record["job_type"])
+                    if handler is None:
+                        self._client.hset(
+                            key,
+                            mapping={
+                                "status": _STATUS_ERROR,
+                                "error": "No handler registered for job_type "
+                                f"{record['job_type']!r}.",
+                            },
+                        )
+                        return
+                    if record.get("batch"):
+                        result = self._run_batch(job_id, record, handler)
+                    else:
+                        result = handler(json.loads(record.get("payload") or "{}"))
+            self._client.hset(
+                key,
+                mapping={
+                    "status": _STATUS_DONE,
+                    "result": json.dumps(result),
+                    "error": "",
+                },
+            )
+        except Exception as exc:  # noqa: BLE001
+            terminal = not self._retry_or_bury(job_id, record, str(exc))
+        finally:
+            self._release_claim(job_id)
+            if terminal:
+                self._finalize(key)
+                if record.get("batch") and self._job_retention_seconds >= 0:
+                    self._client.expire(
+                        self._batch_claimed_key(job_id), self._job_retention_seconds
+                    )
+            with self._busy_lock:
+                self._busy_workers -= 1
+
+
+__all__ = ["RedisJobQueue"]
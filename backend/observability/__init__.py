@@ -17,9 +17,11 @@ from backend.observability.middleware import (
     get_registry,
 )
 from backend.observability.metrics import (
+    ConnectionPoolSnapshot,
     MetricSink,
     NoopMetricSink,
     OtelMetricSink,
+    QueueLaneSnapshot,
     QueueSnapshot,
     get_metric_sink,
     set_metric_sink,
@@ -34,12 +36,14 @@ from backend.observability.runtime import (
 )
 
 __all__ = [
+    "ConnectionPoolSnapshot",
     "CorrelationContext",
     "MetricsRegistry",
     "MetricSink",
     "NoopMetricSink",
     "ObservabilityRuntime",
     "OtelMetricSink",
+    "QueueLaneSnapshot",
     "QueueSnapshot",
     "RequestTracingMiddleware",
     "attach",
@@ -0,0 +1,86 @@
+"""Observable database connection-pool gauges, registered through the E11-S1 meter.
+
+Read on demand from each pool's
+:meth:`~backend.persistence.pool.SQLitePool.snapshot` and summed per backend;
+checkout waits are recorded separately, per checkout, through
+:meth:`~backend.observability.metrics.MetricSink.record_db_pool_wait`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Protocol
+
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+from backend.observability.context import sanitize_identifier
+from backend.observability.metrics import ConnectionPoolSnapshot
+
+
+class ObservablePool(Protocol):
+    """A connection pool the ``autodev.db.pool.*`` gauges can read."""
+
+    backend: str
+
+    def snapshot(self) -> ConnectionPoolSnapshot:
+        """Return the pool's current state."""
+        ...
+
+
+def register_db_pool_observables(
+    *, meter: Meter, pools: Callable[[], Iterable[ObservablePool]]
+) -> None:
+    """Register observable connection-pool usage gauges.
+
+    Args:
+        meter: Meter supplied by E11-S1.
+        pools: Returns the pools to observe at collection time, so stores
+            built after startup are still seen.
+    """
+
+    def totals() -> dict[str, ConnectionPoolSnapshot]:
+        """Sum every pool's snapshot per sanitized backend name."""
+        summed: dict[str, ConnectionPoolSnapshot] = {}
+        for pool in pools():
+            backend = sanitize_identifier(pool.backend)
+            snapshot = pool.snapshot()
+            previous = summed.get(backend, ConnectionPoolSnapshot(0, 0, 0, 0))
+            summed[backend] = ConnectionPoolSnapshot(
+                in_use=previous.in_use + snapshot.in_use,
+                idle=previous.idle + snapshot.idle,
+                max_size=previous.max_size + snapshot.max_size,
+                waiting=previous.waiting + snapshot.waiting,
+            )
+        return summed
+
+    def observe_connections(_: CallbackOptions) -> Iterable[Observation]:
+        observations = []
+        for backend, total in totals().items():
+            for state in ("in_use", "idle", "waiting"):
+                observations.append(
+                    Observation(getattr(total, state), {"backend": backend, "state": state})
+                )
+        return observations
+
+    def observe_utilization(_: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(total.in_use / total.max_size, {"backend": backend})
+            for backend, total in totals().items()
+            if total.max_size
+        ]
+
+    meter.create_observable_gauge(
+        "autodev.db.pool.connections",
+        callbacks=[observe_connections],
+        description="Pooled database connections by state (in_use, idle, waiting callers)",
+        unit="{connection}",
+    )
+    meter.create_observable_gauge(
+        "autodev.db.pool.utilization",
+        callbacks=[observe_utilization],
+        description="Checked-out connections over the pool ceiling (bounded pools only)",
+        unit="1",
+    )
+
+
+__all__ = ["ObservablePool", "register_db_pool_observables"]
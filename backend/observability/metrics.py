@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from opentelemetry.metrics import Meter, Observation
@@ -11,6 +11,22 @@ from opentelemetry.metrics import Meter, Observation
 from backend.observability.context import sanitize_identifier
 
 
+@dataclass(frozen=True)
+class QueueLaneSnapshot:
+    """Depth and age of one priority lane of a queue.
+
+    Attributes:
+        lane: Lane name (``high``/``normal``/``low``).
+        depth: Jobs waiting in the lane.
+        oldest_age_seconds: How long the lane's oldest job has waited, or
+            ``0.0`` when the lane is empty.
+    """
+
+    lane: str
+    depth: int
+    oldest_age_seconds: float
+
+
 @dataclass(frozen=True)
 class QueueSnapshot:
     """Bounded queue and worker state returned by queue backends.
@@ -20,12 +36,32 @@ class QueueSnapshot:
         running: Number of jobs currently running.
         workers: Number of available workers.
         busy_workers: Number of workers currently executing jobs.
+        lanes: Per-lane breakdown, for backends with priority lanes. Not
+            part of equality: ages change between any two reads.
     """
 
     pending: int
     running: int
     workers: int
     busy_workers: int
+    lanes: tuple[QueueLaneSnapshot, ...] = field(default=(), compare=False)
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSnapshot:
+    """Bounded state of one database connection pool.
+
+    Attributes:
+        in_use: Connections currently checked out.
+        idle: Open connections waiting to be reused.
+        max_size: Checked-out ceiling, or ``0`` when checkouts never block.
+        waiting: Callers blocked waiting for a connection.
+    """
+
+    in_use: int
+    idle: int
+    max_size: int
+    waiting: int
 
 
 class MetricSink(Protocol):
@@ -153,6 +189,33 @@ class MetricSink(Protocol):
             callback: Function returning the latest queue snapshot.
         """
 
+    def record_db_pool_wait(
+        self, *, backend: str, outcome: str, duration_seconds: float
+    ) -> None:
+        """Record how long one connection checkout waited for its pool.
+
+        Args:
+            backend: Stable database-backend identifier (``sqlite``/``postgres``).
+            outcome: ``acquired`` or ``timeout``.
+            duration_seconds: Time spent waiting for a connection.
+        """
+
+    def record_flow_checkpoint(self, *, kind: str, size_bytes: int) -> None:
+        """Record one flow run-state checkpoint write.
+
+        Args:
+            kind: ``snapshot`` (full ``state_json``) or ``delta`` (journal row).
+            size_bytes: Serialized bytes written.
+        """
+
+    def record_flow_run_checkpoints(self, *, status: str, size_bytes: int) -> None:
+        """Record the checkpoint bytes one flow run wrote, once it is terminal.
+
+        Args:
+            status: The run's terminal status.
+            size_bytes: State bytes written for the run by this process.
+        """
+
 
 class NoopMetricSink:
     """Metric sink used when OpenTelemetry is disabled."""
@@ -225,6 +288,17 @@ class NoopMetricSink:
     ) -> None:
         """Discard a queue observation callback."""
 
+    def record_db_pool_wait(
+        self, *, backend: str, outcome: str, duration_seconds: float
+    ) -> None:
+        """Discard one connection-pool wait measurement."""
+
+    def record_flow_checkpoint(self, *, kind: str, size_bytes: int) -> None:
+        """Discard one checkpoint-write measurement."""
+
+    def record_flow_run_checkpoints(self, *, status: str, size_bytes: int) -> None:
+        """Discard one per-run checkpoint measurement."""
+
 
 class OtelMetricSink:
     """OpenTelemetry implementation of the stable application metric sink."""
@@ -267,6 +341,25 @@ class OtelMetricSink:
             callbacks=[self._observe_worker_utilization],
             unit="1",
         )
+        meter.create_observable_gauge(
+            "autodev.queue.lane.jobs",
+            callbacks=[self._observe_lane_jobs],
+            unit="{job}",
+        )
+        meter.create_observable_gauge(
+            "autodev.queue.lane.oldest_age",
+            callbacks=[self._observe_lane_age],
+            unit="s",
+        )
+        self._db_pool_wait = meter.create_histogram(
+            "autodev.db.pool.wait.duration", unit="s"
+        )
+        self._checkpoint_bytes = meter.create_counter(
+            "autodev.flow.checkpoint.bytes", unit="By"
+        )
+        self._run_checkpoint_bytes = meter.create_histogram(
+            "autodev.flow.run.checkpoint.bytes", unit="By"
+        )
 
     @staticmethod
     def _safe(value: str) -> str:
@@ -427,6 +520,37 @@ class OtelMetricSink:
             )
             yield Observation(value, {"backend": backend})
 
+    def _observe_lane_jobs(self, _: object) -> Iterable[Observation]:
+        """Read queue callbacks for per-lane depth observations."""
+        for backend, callback in tuple(self._queue_callbacks.items()):
+            for lane in callback().lanes:
+                yield Observation(lane.depth, {"backend": backend, "lane": lane.lane})
+
+    def _observe_lane_age(self, _: object) -> Iterable[Observation]:
+        """Read queue callbacks for per-lane oldest-job age observations."""
+        for backend, callback in tuple(self._queue_callbacks.items()):
+            for lane in callback().lanes:
+                yield Observation(
+                    lane.oldest_age_seconds, {"backend": backend, "lane": lane.lane}
+                )
+
+    def record_db_pool_wait(
+        self, *, backend: str, outcome: str, duration_seconds: float
+    ) -> None:
+        """Record one connection-pool checkout wait."""
+        self._db_pool_wait.record(
+            duration_seconds,
+            {"backend": self._safe(backend), "outcome": self._safe(outcome)},
+        )
+
+    def record_flow_checkpoint(self, *, kind: str, size_bytes: int) -> None:
+        """Count the bytes of one run-state checkpoint write."""
+        self._checkpoint_bytes.add(size_bytes, {"kind": self._safe(kind)})
+
+    def record_flow_run_checkpoints(self, *, status: str, size_bytes: int) -> None:
+        """Record the checkpoint bytes of one terminal run."""
+        self._run_checkpoint_bytes.record(size_bytes, {"status": self._safe(status)})
+
 
 _metric_sink: MetricSink = NoopMetricSink()
 
@@ -451,9 +575,11 @@ def set_metric_sink(sink: MetricSink) -> None:
 
 
 __all__ = [
+    "ConnectionPoolSnapshot",
     "MetricSink",
     "NoopMetricSink",
     "OtelMetricSink",
+    "QueueLaneSnapshot",
     "QueueSnapshot",
     "get_metric_sink",
     "set_metric_sink",
@@ -471,11 +471,52 @@ class IndexingTrace:
         file_count: Number of files the operation walked.
         chunks_written: Number of chunk rows inserted or updated.
         chunks_deleted: Number of chunk rows removed for vanished files.
+        files_skipped: Number of files not chunked because their manifest
+            fingerprint (``index``) or whole-file hash (``reindex``) matched.
+        chunks_produced: Number of chunks the read/chunk stage produced,
+            whether or not they were then written.
+        worker_count: Number of chunking workers (``1`` for serial indexing).
+        chunk_seconds: Summed per-file read/parse/chunk time across workers.
+        persist_seconds: Wall time spent in the database writer.
     """
 
     file_count: int = 0
     chunks_written: int = 0
     chunks_deleted: int = 0
+    files_skipped: int = 0
+    chunks_produced: int = 0
+    worker_count: int = 1
+    chunk_seconds: float = 0.0
+    persist_seconds: float = 0.0
+
+    def throughput(self, elapsed_seconds: float) -> dict[str, float]:
+        """Return per-stage throughput for an operation that took *elapsed_seconds*.
+
+        The chunk stage's effective duration is its summed worker time
+        divided by ``worker_count``, so files/s reflects the parallel rate
+        rather than the per-worker one. A stage that did no measurable work
+        reports ``0.0`` instead of dividing by zero.
+
+        Args:
+            elapsed_seconds: Wall-clock duration of the whole operation.
+
+        Returns:
+            ``files_per_second`` / ``chunks_per_second`` overall, plus
+            ``chunk_files_per_second`` and ``persist_chunks_per_second`` for
+            the read/chunk and write stages.
+        """
+        chunk_stage = self.chunk_seconds / max(1, self.worker_count)
+        return {
+            "files_per_second": _rate(self.file_count, elapsed_seconds),
+            "chunks_per_second": _rate(self.chunks_produced, elapsed_seconds),
+            "chunk_files_per_second": _rate(self.file_count, chunk_stage),
+            "persist_chunks_per_second": _rate(self.chunks_produced, self.persist_seconds),
+        }
+
+
+def _rate(count: int, seconds: float) -> float:
+    """Return ``count / seconds`` rounded for a span attribute, or ``0.0`` without elapsed time."""
+    return round(count / seconds, 3) if seconds > 0 else 0.0
 
 
 @contextmanager
@@ -493,19 +534,25 @@ def trace_indexing(operation: str, *, tenant_id: str) -> Iterator[IndexingTrace]
         Mutable counters finalized as span attributes when the block exits.
     """
     measurements = IndexingTrace()
+    started = time.perf_counter()
     with get_tracer().start_as_current_span(f"autodev.repository.{operation}") as span:
         try:
             yield measurements
         finally:
-            span.set_attributes(
-                {
-                    "autodev.tenant_id": tenant_id,
-                    "autodev.index.operation": operation,
-                    "autodev.index.file_count": measurements.file_count,
-                    "autodev.index.chunks_written": measurements.chunks_written,
-                    "autodev.index.chunks_deleted": measurements.chunks_deleted,
-                }
-            )
+            elapsed = time.perf_counter() - started
+            attributes: dict[str, AttributeValue] = {
+                "autodev.tenant_id": tenant_id,
+                "autodev.index.operation": operation,
+                "autodev.index.file_count": measurements.file_count,
+                "autodev.index.chunks_written": measurements.chunks_written,
+                "autodev.index.chunks_deleted": measurements.chunks_deleted,
+                "autodev.index.files_skipped": measurements.files_skipped,
+                "autodev.index.chunks_produced": measurements.chunks_produced,
+                "autodev.index.workers": measurements.worker_count,
+            }
+            for name, value in measurements.throughput(elapsed).items():
+                attributes[f"autodev.index.{name}"] = value
+            span.set_attributes(attributes)
 
 
 @dataclass
@@ -208,6 +208,7 @@ class ChatMixin(OrchestratorState):
                 "flow_id": prepared.flow_id,
                 "tenant_id": tenant_id,
             },
+            priority="high",
         )
         return OrchestratorRun(
             run_id=prepared.run_id,
@@ -0,0 +1,88 @@
+"""Code-index migrations shared by the SQLite and PostgreSQL store lists.
+
+Schema steps for the repository index (``code_chunks`` and the tables that
+sit beside it) landed after E7-S1 live in this package rather than in
+``versions.py`` / ``postgres_versions.py``, keeping both of those modules
+under the repository's file-size guideline. They are split by feature:
+``manifest.py`` (file fingerprints, last indexed commit), ``lexical.py``
+(chunk language, search vector, FTS5), ``embeddings.py`` (vectors and the
+embedding cache) and ``generations.py`` (the index generation counter).
+Each function is still appended to
+:data:`~backend.persistence.migrations.versions.STORE_MIGRATIONS` or
+:data:`~backend.persistence.migrations.postgres_versions.POSTGRES_STORE_MIGRATIONS`
+in order — this package only holds the DDL, never the ordering.
+"""
+
+from __future__ import annotations
+
+from backend.persistence.migrations.code_index_versions.embeddings import (
+    pg_create_embedding_cache_table,
+    pg_drop_embedding_cache_table,
+    sqlite_create_code_embeddings_table,
+    sqlite_create_embedding_cache_table,
+    sqlite_drop_code_embeddings_table,
+    sqlite_drop_embedding_cache_table,
+)
+from backend.persistence.migrations.code_index_versions.generations import (
+    pg_create_code_index_generations_table,
+    pg_drop_code_index_generations_table,
+    sqlite_create_code_index_generations_table,
+    sqlite_drop_code_index_generations_table,
+)
+from backend.persistence.migrations.code_index_versions.lexical import (
+    pg_add_language_column_to_code_chunks,
+    pg_add_search_vector_to_code_chunks,
+    pg_remove_language_column_from_code_chunks,
+    pg_remove_search_vector_from_code_chunks,
+    sqlite_add_language_column_to_code_chunks,
+    sqlite_create_code_chunks_fts,
+    sqlite_drop_code_chunks_fts,
+    sqlite_remove_language_column_from_code_chunks,
+)
+from backend.persistence.migrations.code_index_versions.manifest import (
+    pg_create_code_index_commits_table,
+    pg_create_code_index_files_table,
+    pg_drop_code_index_commits_table,
+    pg_drop_code_index_files_table,
+    pg_scope_code_index_files_by_repo_root,
+    pg_unscope_code_index_files,
+    sqlite_create_code_index_commits_table,
+    sqlite_create_code_index_files_table,
+    sqlite_drop_code_index_commits_table,
+    sqlite_drop_code_index_files_table,
+    sqlite_scope_code_index_files_by_repo_root,
+    sqlite_unscope_code_index_files,
+)
+
+__all__ = [
+    "pg_add_language_column_to_code_chunks",
+    "pg_add_search_vector_to_code_chunks",
+    "pg_create_code_index_commits_table",
+    "pg_create_code_index_files_table",
+    "pg_create_code_index_generations_table",
+    "pg_create_embedding_cache_table",
+    "pg_drop_code_index_commits_table",
+    "pg_drop_code_index_files_table",
+    "pg_drop_code_index_generations_table",
+    "pg_drop_embedding_cache_table",
+    "pg_remove_language_column_from_code_chunks",
+    "pg_remove_search_vector_from_code_chunks",
+    "pg_scope_code_index_files_by_repo_root",
+    "pg_unscope_code_index_files",
+    "sqlite_add_language_column_to_code_chunks",
+    "sqlite_create_code_chunks_fts",
+    "sqlite_create_code_embeddings_table",
+    "sqlite_create_code_index_commits_table",
+    "sqlite_create_code_index_files_table",
+    "sqlite_create_code_index_generations_table",
+    "sqlite_create_embedding_cache_table",
+    "sqlite_drop_code_chunks_fts",
+    "sqlite_drop_code_embeddings_table",
+    "sqlite_drop_code_index_commits_table",
+    "sqlite_drop_code_index_files_table",
+    "sqlite_drop_code_index_generations_table",
+    "sqlite_drop_embedding_cache_table",
+    "sqlite_remove_language_column_from_code_chunks",
+    "sqlite_scope_code_index_files_by_repo_root",
+    "sqlite_unscope_code_index_files",
+]
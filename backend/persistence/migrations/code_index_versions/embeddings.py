@@ -0,0 +1,134 @@
+"""Code-index migrations: the SQLite ``code_embeddings`` table and the embedding cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Local-first vector index (SQLite only)
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_code_embeddings_table(conn: sqlite3.Connection) -> None:
+    """Create the SQLite ``code_embeddings`` table backing the local vector index.
+
+    The SQLite counterpart of the pgvector table: one float32 little-endian
+    ``embedding`` BLOB per chunk. ``seq`` is ``AUTOINCREMENT`` and writes use
+    ``INSERT OR REPLACE``, so every write gets a fresh, strictly larger
+    ``seq``. The on-disk :class:`~backend.repository.embeddings.local_index.LocalVectorIndex`
+    snapshot records the highest ``seq`` it covers, and anything above that
+    is the delta a query scans exactly.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS code_embeddings (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            chunk_id INTEGER NOT NULL REFERENCES code_chunks(id) ON DELETE CASCADE,
+            content_hash TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            model TEXT NOT NULL DEFAULT 'stub',
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(tenant_id, chunk_id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_code_embeddings_seq
+            ON code_embeddings(tenant_id, seq);
+        """
+    )
+
+
+def sqlite_drop_code_embeddings_table(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_code_embeddings_table` by dropping the table.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_embeddings")
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed embedding cache
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_embedding_cache_table(conn: sqlite3.Connection) -> None:
+    """Create ``embedding_cache``, embeddings keyed by (model, dimension, content hash).
+
+    Deliberately *not* tenant-scoped: a row is derived solely from the text
+    whose SHA-256 is its key, so a caller can only ever get back the vector
+    of content it already holds. This is what lets a forked repository or a
+    vendored dependency indexed by another tenant skip the provider call.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model TEXT NOT NULL,
+            dimension INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (model, dimension, content_hash)
+        );
+        """
+    )
+
+
+def sqlite_drop_embedding_cache_table(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_embedding_cache_table` by dropping the table.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS embedding_cache")
+
+
+def pg_create_embedding_cache_table(conn: Any) -> None:
+    """Create ``embedding_cache`` (Postgres counterpart, no Row-Level Security).
+
+    See :func:`sqlite_create_embedding_cache_table` for why the table is
+    shared across tenants. Vectors are stored as little-endian float32
+    ``BYTEA``, the same bytes as the SQLite ``BLOB``, rather than as a
+    pgvector column, so one table serves every model dimension.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            model TEXT NOT NULL,
+            dimension INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            embedding BYTEA NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (model, dimension, content_hash)
+        )
+        """
+    )
+
+
+def pg_drop_embedding_cache_table(conn: Any) -> None:
+    """Revert :func:`pg_create_embedding_cache_table` by dropping the table.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DROP TABLE IF EXISTS embedding_cache")
+
+
+__all__ = [
+    "pg_create_embedding_cache_table",
+    "pg_drop_embedding_cache_table",
+    "sqlite_create_code_embeddings_table",
+    "sqlite_create_embedding_cache_table",
+    "sqlite_drop_code_embeddings_table",
+    "sqlite_drop_embedding_cache_table",
+]
@@ -0,0 +1,83 @@
+"""Code-index migrations: the per-tenant index generation counter."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Index generation
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_code_index_generations_table(conn: sqlite3.Connection) -> None:
+    """Create ``code_index_generations``, a per-tenant counter of index changes.
+
+    Bumped in the same transaction as every write that can change retrieval
+    results (chunks, renames, embeddings), so a cached result keyed on the
+    generation can never outlive the data it was computed from.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_generations (
+            tenant_id TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+
+
+def sqlite_drop_code_index_generations_table(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_code_index_generations_table` by dropping the table.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_generations")
+
+
+def pg_create_code_index_generations_table(conn: Any) -> None:
+    """Create ``code_index_generations`` with Row-Level Security (Postgres counterpart).
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_generations (
+            tenant_id TEXT PRIMARY KEY,
+            generation BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute("ALTER TABLE code_index_generations ENABLE ROW LEVEL SECURITY")
+    conn.execute("ALTER TABLE code_index_generations FORCE ROW LEVEL SECURITY")
+    conn.execute(
+        "DROP POLICY IF EXISTS code_index_generations_tenant_isolation ON code_index_generations"
+    )
+    conn.execute(
+        "CREATE POLICY code_index_generations_tenant_isolation ON code_index_generations "
+        "USING (tenant_id = current_setting('app.tenant_id', true))"
+    )
+
+
+def pg_drop_code_index_generations_table(conn: Any) -> None:
+    """Revert :func:`pg_create_code_index_generations_table` by dropping the table.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_generations")
+
+
+__all__ = [
+    "pg_create_code_index_generations_table",
+    "pg_drop_code_index_generations_table",
+    "sqlite_create_code_index_generations_table",
+    "sqlite_drop_code_index_generations_table",
+]
@@ -0,0 +1,209 @@
+"""Code-index migrations: chunk language and lexical search (Postgres ``tsvector``, SQLite FTS5)."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Chunk language
+# ---------------------------------------------------------------------------
+
+
+def sqlite_add_language_column_to_code_chunks(conn: sqlite3.Connection) -> None:
+    """Add a ``language`` column to ``code_chunks`` plus a ``(tenant_id, language)`` index.
+
+    Existing rows default to ``'python'``, which is accurate: before this
+    step only ``.py`` files were indexed. The index lets a language-filtered
+    retrieval skip other languages' rows instead of scanning them.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(code_chunks)").fetchall()}
+    if "language" not in existing:
+        conn.execute("ALTER TABLE code_chunks ADD COLUMN language TEXT NOT NULL DEFAULT 'python'")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_code_chunks_language ON code_chunks(tenant_id, language)"
+    )
+
+
+def sqlite_remove_language_column_from_code_chunks(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_add_language_column_to_code_chunks`.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_code_chunks_language")
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(code_chunks)").fetchall()}
+    if "language" in existing:
+        conn.execute("ALTER TABLE code_chunks DROP COLUMN language")
+
+
+def pg_add_language_column_to_code_chunks(conn: Any) -> None:
+    """Add ``code_chunks.language`` and its index (Postgres counterpart).
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        "ALTER TABLE code_chunks ADD COLUMN IF NOT EXISTS language TEXT NOT NULL DEFAULT 'python'"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pg_code_chunks_language ON code_chunks(tenant_id, language)"
+    )
+
+
+def pg_remove_language_column_from_code_chunks(conn: Any) -> None:
+    """Revert :func:`pg_add_language_column_to_code_chunks`.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_pg_code_chunks_language")
+    conn.execute("ALTER TABLE code_chunks DROP COLUMN IF EXISTS language")
+
+
+# ---------------------------------------------------------------------------
+# Stored, code-aware search vector (Postgres only — lexical search is too)
+# ---------------------------------------------------------------------------
+
+#: ``code_identifier_split(text)``: the input with ``snake_case``, dotted and
+#: path-separated names broken on their separators and ``camelCase`` /
+#: ``PascalCase`` / ``HTTPServer`` names broken at case changes. IMMUTABLE so
+#: a generated column can call it; the query side calls it too, so a query
+#: for ``parseManifest`` matches ``parse_manifest`` and ``ParseManifest``.
+_PG_CODE_IDENTIFIER_SPLIT_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION code_identifier_split(value text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT regexp_replace(
+        regexp_replace(translate(value, '_./-:', '     '), '([a-z0-9])([A-Z])', '\1 \2', 'g'),
+        '([A-Z])([A-Z][a-z])', '\1 \2', 'g'
+    )
+$$
+"""
+
+#: Weighted document vector: symbol name (A) above file path (B) above body
+#: (D). Each field is indexed both verbatim and identifier-split.
+_PG_SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('english', symbol || ' ' || code_identifier_split(symbol)), 'A')
+    || setweight(to_tsvector('english', file_path || ' ' || code_identifier_split(file_path)), 'B')
+    || setweight(to_tsvector('english', content || ' ' || code_identifier_split(content)), 'D')
+"""
+
+
+def pg_add_search_vector_to_code_chunks(conn: Any) -> None:
+    """Add a stored, weighted ``search_vector`` column to ``code_chunks`` and index it.
+
+    Replaces the ``to_tsvector('english', content)`` expression index from
+    ``add_content_column_to_code_chunks``: lexical search previously
+    recomputed that expression for every candidate row, once to filter and
+    again inside ``ts_rank``. The generated column is computed once per
+    write, and a GIN index over it serves the ``@@`` filter directly.
+    Adding a stored generated column rewrites ``code_chunks`` once.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(_PG_CODE_IDENTIFIER_SPLIT_FUNCTION)
+    conn.execute(
+        "ALTER TABLE code_chunks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_PG_SEARCH_VECTOR_EXPRESSION}) STORED"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pg_code_chunks_search_vector ON code_chunks "
+        "USING GIN (search_vector)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_pg_code_chunks_fts")
+
+
+def pg_remove_search_vector_from_code_chunks(conn: Any) -> None:
+    """Revert :func:`pg_add_search_vector_to_code_chunks`, restoring the expression index.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pg_code_chunks_fts ON code_chunks "
+        "USING GIN (to_tsvector('english', content))"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_pg_code_chunks_search_vector")
+    conn.execute("ALTER TABLE code_chunks DROP COLUMN IF EXISTS search_vector")
+    conn.execute("DROP FUNCTION IF EXISTS code_identifier_split(text)")
+
+
+# ---------------------------------------------------------------------------
+
+
+# ---------------------------------------------------------------------------
+# Full-text search (SQLite only)
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_code_chunks_fts(conn: sqlite3.Connection) -> None:
+    """Create ``code_chunks_fts``, an FTS5 index over ``code_chunks``, kept in sync by triggers.
+
+    External-content FTS5 (``content='code_chunks'``) stores only the
+    inverted index, not a second copy of every chunk. Its columns are
+    ``symbol``, ``file_path``, ``content``, the same fields and order
+    :func:`backend.repository.retrieval.lexical.search` weights with
+    ``bm25``. The ``unicode61`` tokenizer already splits ``snake_case`` and
+    path names on their separators. Existing chunks are backfilled with
+    ``'rebuild'``.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS code_chunks_fts USING fts5(
+            symbol, file_path, content, content='code_chunks', content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS code_chunks_fts_after_insert
+        AFTER INSERT ON code_chunks BEGIN
+            INSERT INTO code_chunks_fts(rowid, symbol, file_path, content)
+            VALUES (new.id, new.symbol, new.file_path, new.content);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS code_chunks_fts_after_delete
+        AFTER DELETE ON code_chunks BEGIN
+            INSERT INTO code_chunks_fts(code_chunks_fts, rowid, symbol, file_path, content)
+            VALUES ('delete', old.id, old.symbol, old.file_path, old.content);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS code_chunks_fts_after_update
+        AFTER UPDATE ON code_chunks BEGIN
+            INSERT INTO code_chunks_fts(code_chunks_fts, rowid, symbol, file_path, content)
+            VALUES ('delete', old.id, old.symbol, old.file_path, old.content);
+            INSERT INTO code_chunks_fts(rowid, symbol, file_path, content)
+            VALUES (new.id, new.symbol, new.file_path, new.content);
+        END;
+
+        INSERT INTO code_chunks_fts(code_chunks_fts) VALUES ('rebuild');
+        """
+    )
+
+
+def sqlite_drop_code_chunks_fts(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_code_chunks_fts`.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    for trigger in ("insert", "delete", "update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS code_chunks_fts_after_{trigger}")
+    conn.execute("DROP TABLE IF EXISTS code_chunks_fts")
+
+
+__all__ = [
+    "pg_add_language_column_to_code_chunks",
+    "pg_add_search_vector_to_code_chunks",
+    "pg_remove_language_column_from_code_chunks",
+    "pg_remove_search_vector_from_code_chunks",
+    "sqlite_add_language_column_to_code_chunks",
+    "sqlite_create_code_chunks_fts",
+    "sqlite_drop_code_chunks_fts",
+    "sqlite_remove_language_column_from_code_chunks",
+]
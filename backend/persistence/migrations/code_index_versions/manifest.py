@@ -0,0 +1,255 @@
+"""Code-index migrations: the per-file fingerprint manifest and the last indexed commit."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# File fingerprint manifest
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_code_index_files_table(conn: sqlite3.Connection) -> None:
+    """Create the per-tenant ``code_index_files`` fingerprint manifest.
+
+    One row per indexed file: its ``os.stat`` fingerprint (size, mtime in
+    nanoseconds, inode) plus the SHA-256 of the whole file, so
+    :func:`backend.repository.indexing.index` can diff a tree by ``stat``
+    alone and only read files whose fingerprint moved.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_files (
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            file_path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            file_hash TEXT NOT NULL,
+            indexed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tenant_id, file_path)
+        );
+        """
+    )
+
+
+def sqlite_drop_code_index_files_table(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_code_index_files_table` by dropping the table.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_files")
+
+
+def pg_create_code_index_files_table(conn: Any) -> None:
+    """Create ``code_index_files`` with Row-Level Security (Postgres counterpart).
+
+    Mirrors :func:`sqlite_create_code_index_files_table`; like
+    ``code_chunks`` the table is tenant-scoped and RLS-enabled from creation.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_files (
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            file_path TEXT NOT NULL,
+            size BIGINT NOT NULL,
+            mtime_ns BIGINT NOT NULL,
+            inode BIGINT NOT NULL,
+            file_hash TEXT NOT NULL,
+            indexed_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tenant_id, file_path)
+        )
+        """
+    )
+    conn.execute("ALTER TABLE code_index_files ENABLE ROW LEVEL SECURITY")
+    conn.execute("ALTER TABLE code_index_files FORCE ROW LEVEL SECURITY")
+    conn.execute("DROP POLICY IF EXISTS code_index_files_tenant_isolation ON code_index_files")
+    conn.execute(
+        "CREATE POLICY code_index_files_tenant_isolation ON code_index_files "
+        "USING (tenant_id = current_setting('app.tenant_id', true))"
+    )
+
+
+def pg_drop_code_index_files_table(conn: Any) -> None:
+    """Revert :func:`pg_create_code_index_files_table` by dropping the table.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_files")
+
+
+# ---------------------------------------------------------------------------
+# Last indexed commit
+# ---------------------------------------------------------------------------
+
+
+def sqlite_create_code_index_commits_table(conn: sqlite3.Connection) -> None:
+    """Create ``code_index_commits``, the last commit indexed per tenant and repository.
+
+    :func:`backend.repository.git_indexing.index_commit_range` reads it as
+    the default diff base and advances it once a commit range is indexed.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_commits (
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            repo_key TEXT NOT NULL,
+            commit_sha TEXT NOT NULL,
+            indexed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tenant_id, repo_key)
+        );
+        """
+    )
+
+
+def sqlite_drop_code_index_commits_table(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_create_code_index_commits_table` by dropping the table.
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_commits")
+
+
+def pg_create_code_index_commits_table(conn: Any) -> None:
+    """Create ``code_index_commits`` with Row-Level Security (Postgres counterpart).
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS code_index_commits (
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            repo_key TEXT NOT NULL,
+            commit_sha TEXT NOT NULL,
+            indexed_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tenant_id, repo_key)
+        )
+        """
+    )
+    conn.execute("ALTER TABLE code_index_commits ENABLE ROW LEVEL SECURITY")
+    conn.execute("ALTER TABLE code_index_commits FORCE ROW LEVEL SECURITY")
+    conn.execute("DROP POLICY IF EXISTS code_index_commits_tenant_isolation ON code_index_commits")
+    conn.execute(
+        "CREATE POLICY code_index_commits_tenant_isolation ON code_index_commits "
+        "USING (tenant_id = current_setting('app.tenant_id', true))"
+    )
+
+
+def pg_drop_code_index_commits_table(conn: Any) -> None:
+    """Revert :func:`pg_create_code_index_commits_table` by dropping the table.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_commits")
+
+
+# ---------------------------------------------------------------------------
+# File manifest scoped by repository root and chunker version
+# ---------------------------------------------------------------------------
+
+
+def sqlite_scope_code_index_files_by_repo_root(conn: sqlite3.Connection) -> None:
+    """Key ``code_index_files`` by ``(tenant_id, repo_root, file_path)`` and add ``chunker_version``.
+
+    Stored paths are relative to the indexed root, so a manifest keyed by
+    tenant alone made indexing one checkout treat another checkout's files
+    as vanished. SQLite cannot change a primary key in place, so the table
+    is recreated. The manifest is a cache of what is on disk: dropping its
+    rows only costs the next :func:`backend.repository.indexing.index` one
+    read of every file, and unchanged chunks are still not rewritten.
+
+    Args:
+        conn: SQLite connection to apply the migration on.
+    """
+    conn.executescript(
+        """
+        DROP TABLE IF EXISTS code_index_files;
+        CREATE TABLE code_index_files (
+            tenant_id TEXT NOT NULL DEFAULT 'default',
+            repo_root TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            file_hash TEXT NOT NULL,
+            chunker_version TEXT NOT NULL DEFAULT '',
+            indexed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (tenant_id, repo_root, file_path)
+        );
+        """
+    )
+
+
+def sqlite_unscope_code_index_files(conn: sqlite3.Connection) -> None:
+    """Revert :func:`sqlite_scope_code_index_files_by_repo_root` (rows are dropped).
+
+    Args:
+        conn: SQLite connection to apply the rollback on.
+    """
+    conn.execute("DROP TABLE IF EXISTS code_index_files")
+    sqlite_create_code_index_files_table(conn)
+
+
+def pg_scope_code_index_files_by_repo_root(conn: Any) -> None:
+    """Key ``code_index_files`` by repository root too (Postgres counterpart).
+
+    See :func:`sqlite_scope_code_index_files_by_repo_root`; existing rows
+    carry no root, so they are deleted rather than left unreachable.
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DELETE FROM code_index_files")
+    conn.execute("ALTER TABLE code_index_files ADD COLUMN IF NOT EXISTS repo_root TEXT NOT NULL")
+    conn.execute(
+        "ALTER TABLE code_index_files "
+        "ADD COLUMN IF NOT EXISTS chunker_version TEXT NOT NULL DEFAULT ''"
+    )
+    conn.execute("ALTER TABLE code_index_files DROP CONSTRAINT IF EXISTS code_index_files_pkey")
+    conn.execute(
+        "ALTER TABLE code_index_files ADD PRIMARY KEY (tenant_id, repo_root, file_path)"
+    )
+
+
+def pg_unscope_code_index_files(conn: Any) -> None:
+    """Revert :func:`pg_scope_code_index_files_by_repo_root` (rows are dropped).
+
+    Args:
+        conn: Open psycopg connection.
+    """
+    conn.execute("DELETE FROM code_index_files")
+    conn.execute("ALTER TABLE code_index_files DROP CONSTRAINT IF EXISTS code_index_files_pkey")
+    conn.execute("ALTER TABLE code_index_files DROP COLUMN IF EXISTS chunker_version")
+    conn.execute("ALTER TABLE code_index_files DROP COLUMN IF EXISTS repo_root")
+    conn.execute("ALTER TABLE code_index_files ADD PRIMARY KEY (tenant_id, file_path)")
+
+
+__all__ = [
+    "pg_create_code_index_commits_table",
+    "pg_create_code_index_files_table",
+    "pg_drop_code_index_commits_table",
+    "pg_drop_code_index_files_table",
+    "pg_scope_code_index_files_by_repo_root",
+    "pg_unscope_code_index_files",
+    "sqlite_create_code_index_commits_table",
+    "sqlite_create_code_index_files_table",
+    "sqlite_drop_code_index_commits_table",
+    "sqlite_drop_code_index_files_table",
+    "sqlite_scope_code_index_files_by_repo_root",
+    "sqlite_unscope_code_index_files",
+]
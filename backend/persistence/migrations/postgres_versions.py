@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from backend.persistence.migrations import code_index_versions
 from backend.persistence.migrations.runner import Migration, MigrationEntry
 from backend.persistence.migrations.versions import TENANT_SCOPED_STORE_TABLES
 
@@ -504,6 +505,41 @@ POSTGRES_STORE_MIGRATIONS: list[MigrationEntry] = [
         down=_pg_m7_down_run_step_position,
         name="run_step_position",
     ),
+    Migration(
+        up=code_index_versions.pg_create_code_index_files_table,
+        down=code_index_versions.pg_drop_code_index_files_table,
+        name="create_code_index_files_table",
+    ),
+    Migration(
+        up=code_index_versions.pg_create_code_index_commits_table,
+        down=code_index_versions.pg_drop_code_index_commits_table,
+        name="create_code_index_commits_table",
+    ),
+    Migration(
+        up=code_index_versions.pg_add_language_column_to_code_chunks,
+        down=code_index_versions.pg_remove_language_column_from_code_chunks,
+        name="add_language_column_to_code_chunks",
+    ),
+    Migration(
+        up=code_index_versions.pg_add_search_vector_to_code_chunks,
+        down=code_index_versions.pg_remove_search_vector_from_code_chunks,
+        name="add_search_vector_to_code_chunks",
+    ),
+    Migration(
+        up=code_index_versions.pg_create_embedding_cache_table,
+        down=code_index_versions.pg_drop_embedding_cache_table,
+        name="create_embedding_cache_table",
+    ),
+    Migration(
+        up=code_index_versions.pg_create_code_index_generations_table,
+        down=code_index_versions.pg_drop_code_index_generations_table,
+        name="create_code_index_generations_table",
+    ),
+    Migration(
+        up=code_index_versions.pg_scope_code_index_files_by_repo_root,
+        down=code_index_versions.pg_unscope_code_index_files,
+        name="scope_code_index_files_by_repo_root",
+    ),
 ]
 
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sqlite3
 
+from backend.persistence.migrations import code_index_versions
 from backend.persistence.migrations.runner import Migration, MigrationEntry
 
 #: Core store tables retrofitted with a ``tenant_id`` column (E8-S1 scoped
@@ -445,6 +446,46 @@ STORE_MIGRATIONS: list[MigrationEntry] = [
         down=_m11_down_run_step_position,
         name="run_step_position",
     ),
+    Migration(
+        up=code_index_versions.sqlite_create_code_index_files_table,
+        down=code_index_versions.sqlite_drop_code_index_files_table,
+        name="create_code_index_files_table",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_create_code_index_commits_table,
+        down=code_index_versions.sqlite_drop_code_index_commits_table,
+        name="create_code_index_commits_table",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_add_language_column_to_code_chunks,
+        down=code_index_versions.sqlite_remove_language_column_from_code_chunks,
+        name="add_language_column_to_code_chunks",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_create_code_embeddings_table,
+        down=code_index_versions.sqlite_drop_code_embeddings_table,
+        name="create_code_embeddings_table",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_create_code_chunks_fts,
+        down=code_index_versions.sqlite_drop_code_chunks_fts,
+        name="create_code_chunks_fts",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_create_embedding_cache_table,
+        down=code_index_versions.sqlite_drop_embedding_cache_table,
+        name="create_embedding_cache_table",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_create_code_index_generations_table,
+        down=code_index_versions.sqlite_drop_code_index_generations_table,
+        name="create_code_index_generations_table",
+    ),
+    Migration(
+        up=code_index_versions.sqlite_scope_code_index_files_by_repo_root,
+        down=code_index_versions.sqlite_unscope_code_index_files,
+        name="scope_code_index_files_by_repo_root",
+    ),
 ]
 
 
@@ -0,0 +1,408 @@
+"""Bounded connection pools behind ``SQLiteStore.connect()`` and ``PostgresStore.connect()``.
+
+Both stores used to open a new connection on every ``connect()`` call, and
+every caller that wanted SQLite tuned for concurrent writers re-issued the
+same PRAGMAs each time. ``connect()`` now returns a :class:`ConnectionCheckout`:
+``with store.connect() as conn:`` yields the connection itself, commits (or
+rolls back) on exit and then hands it back for reuse, and ``close()`` on the
+checkout ends the caller's use without committing. The connection keeps its
+driver's own semantics — a nested ``with conn:`` is a plain transaction
+scope, and ``conn.close()`` really closes it (the pool then drops it):
+
+* :class:`SQLitePool` opens :class:`PooledSQLiteConnection` objects (a
+  ``sqlite3.Connection`` subclass, so ``isinstance`` dispatch keeps working)
+  with :data:`SQLITE_PRAGMAS` applied once, at open. ``sqlite3`` connections
+  may not cross threads, so idle connections are kept per thread, at most
+  ``max_idle`` each; checkouts never block.
+* :class:`~backend.persistence.postgres_adapter.pool.PostgresPool` keeps up to ``max_size`` psycopg connections. A
+  checkout past the ceiling waits up to ``timeout_seconds`` and then raises
+  :class:`ConnectionPoolTimeout`. Connections are recycled after
+  ``max_lifetime_seconds``, dropped when broken, and pinged before reuse
+  once they have sat idle for a while.
+
+A checkout that is never closed is reclaimed when it is garbage-collected. Every checkout reports its wait through
+:meth:`~backend.observability.metrics.MetricSink.record_db_pool_wait`;
+:meth:`snapshot` feeds the ``autodev.db.pool.*`` gauges
+(:mod:`backend.observability.db_pool_metrics`).
+
+``AUTODEV_DB_POOL_SIZE`` (``0`` disables pooling), ``AUTODEV_DB_POOL_TIMEOUT_SECONDS``
+and ``AUTODEV_DB_POOL_MAX_LIFETIME_SECONDS`` configure the pools the stores
+build (:func:`pool_settings`, read through :class:`~backend.config.settings.Settings`).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from backend.config.settings import get_settings
+from backend.observability.metrics import ConnectionPoolSnapshot, get_metric_sink
+
+_ConnT_co = TypeVar("_ConnT_co", covariant=True)
+
+#: PRAGMAs every pooled SQLite connection gets once, at open: queue on the
+#: write lock instead of failing with ``database is locked``, and let readers
+#: run alongside the single writer.
+SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA busy_timeout=15000",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+#: Idle SQLite connections kept per thread — enough for one nested checkout.
+_SQLITE_MAX_IDLE_PER_THREAD = 2
+
+
+class ConnectionPoolTimeout(TimeoutError):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Pool sizing read from Settings by :func:`pool_settings`.
+
+    Attributes:
+        size: Postgres checked-out ceiling; ``0`` disables pooling for both
+            backends.
+        timeout_seconds: Longest a checkout waits for a free connection.
+        max_lifetime_seconds: Age after which a connection is closed instead
+            of reused.
+    """
+
+    size: int = 10
+    timeout_seconds: float = 30.0
+    max_lifetime_seconds: float = 1800.0
+
+
+def pool_settings() -> PoolSettings:
+    """Read ``Settings.autodev_db_pool_*`` (``AUTODEV_DB_POOL_*``).
+
+    Returns:
+        The configured :class:`PoolSettings`.
+    """
+    settings = get_settings()
+    return PoolSettings(
+        size=settings.autodev_db_pool_size,
+        timeout_seconds=settings.autodev_db_pool_timeout_seconds,
+        max_lifetime_seconds=settings.autodev_db_pool_max_lifetime_seconds,
+    )
+
+
+class ConnectionCheckout(Generic[_ConnT_co]):
+    """One use of a store connection, returned by ``store.connect()``.
+
+    ``with`` yields the connection, commits on a clean exit or rolls back on
+    an error, then releases it. :meth:`close` releases it without committing;
+    the pool rolls back whatever was left open. Releasing twice is a no-op.
+    """
+
+    __slots__ = ("_release", "connection")
+
+    def __init__(self, connection: _ConnT_co, release: Callable[[], None]) -> None:
+        """Wrap a checked-out *connection*.
+
+        Args:
+            connection: The connection handed to the caller.
+            release: Returns *connection* to its pool (or closes it).
+        """
+        self.connection = connection
+        self._release: Callable[[], None] | None = release
+
+    def __enter__(self) -> _ConnT_co:
+        """Return the checked-out connection."""
+        return self.connection
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit on a clean exit or roll back on an error, then release.
+
+        Args:
+            exc_type: Type of the exception leaving the block, if any.
+            exc: The exception leaving the block, if any.
+            traceback: Its traceback, if any.
+        """
+        try:
+            if exc_type is None:
+                self.connection.commit()  # type: ignore[attr-defined]
+            else:
+                # The original error matters more than a failed rollback.
+                with contextlib.suppress(Exception):
+                    self.connection.rollback()  # type: ignore[attr-defined]
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection; later calls are no-ops."""
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+    def __del__(self) -> None:
+        """Release a checkout that was never closed; never raises."""
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+def apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply :data:`SQLITE_PRAGMAS` to *conn* unless its pool already did.
+
+    For stores that may be handed a non-pooled SQLite store (tests, ad hoc
+    scripts) and still want the concurrency tuning.
+
+    Args:
+        conn: An open SQLite connection.
+    """
+    if isinstance(conn, PooledSQLiteConnection):
+        return
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+
+class PooledSQLiteConnection(sqlite3.Connection):
+    """``sqlite3.Connection`` opened by a :class:`SQLitePool`, with its pool bookkeeping.
+
+    Behaves exactly like a plain connection: ``with conn:`` only commits or
+    rolls back, and ``close()`` closes it. It goes back to the pool when its
+    :class:`ConnectionCheckout` is released.
+    """
+
+    _owner_thread = 0
+    _created_at = 0.0
+
+    def _discard(self) -> None:
+        """Close the underlying connection for good."""
+        with contextlib.suppress(sqlite3.Error):
+            self.close()
+
+
+class BoundedPool(ABC):
+    """Checkout accounting, waits and metrics shared by both pools."""
+
+    backend = ""
+
+    def __init__(self, *, max_size: int, timeout_seconds: float) -> None:
+        """Initialize the checkout accounting.
+
+        Args:
+            max_size: Most connections checked out at once; ``0`` for no limit.
+            timeout_seconds: Longest a checkout waits for a free slot.
+        """
+        self._max_size = max_size
+        self._timeout_seconds = timeout_seconds
+        self._condition = threading.Condition()
+        self._in_use = 0
+        self._waiting = 0
+
+    @abstractmethod
+    def _idle_count(self) -> int:
+        """Return the number of idle connections; called under the pool's condition."""
+
+    def snapshot(self) -> ConnectionPoolSnapshot:
+        """Return the pool's current in-use, idle and waiting counts."""
+        with self._condition:
+            return ConnectionPoolSnapshot(
+                in_use=self._in_use,
+                idle=self._idle_count(),
+                max_size=self._max_size,
+                waiting=self._waiting,
+            )
+
+    def _acquire_slot(self) -> None:
+        """Take a checkout slot, waiting while ``max_size`` are in use.
+
+        Raises:
+            ConnectionPoolTimeout: If no slot frees up within the timeout.
+        """
+        started = time.monotonic()
+        with self._condition:
+            if self._max_size:
+                deadline = started + self._timeout_seconds
+                self._waiting += 1
+                try:
+                    while self._in_use >= self._max_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            get_metric_sink().record_db_pool_wait(
+                                backend=self.backend,
+                                outcome="timeout",
+                                duration_seconds=time.monotonic() - started,
+                            )
+                            raise ConnectionPoolTimeout(
+                                f"no {self.backend} connection free after "
+                                f"{self._timeout_seconds:g}s ({self._max_size} in use)"
+                            )
+                        self._condition.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            self._in_use += 1
+        get_metric_sink().record_db_pool_wait(
+            backend=self.backend,
+            outcome="acquired",
+            duration_seconds=time.monotonic() - started,
+        )
+
+    def _release_slot(self) -> None:
+        """Give a checkout slot back and wake one waiter."""
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+
+class SQLitePool(BoundedPool):
+    """Per-thread reuse of SQLite connections with PRAGMAs applied once."""
+
+    backend = "sqlite"
+
+    def __init__(
+        self,
+        database_path: Path,
+        *,
+        max_idle: int = _SQLITE_MAX_IDLE_PER_THREAD,
+        max_lifetime_seconds: float | None = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            database_path: SQLite database file.
+            max_idle: Idle connections kept per thread.
+            max_lifetime_seconds: Age after which a connection is closed
+                instead of reused, or ``None`` for no limit.
+        """
+        super().__init__(max_size=0, timeout_seconds=0.0)
+        self._database_path = database_path
+        self._max_idle = max_idle
+        self._max_lifetime_seconds = max_lifetime_seconds
+        self._local = threading.local()
+        self._idle_total = 0
+
+    def _idle_count(self) -> int:
+        """Return the idle connections parked across every thread."""
+        return self._idle_total
+
+    def connect(self) -> ConnectionCheckout[PooledSQLiteConnection]:
+        """Check out one of this thread's idle connections, or open a new one.
+
+        Returns:
+            A checkout of a connection with ``row_factory`` set to
+            :class:`sqlite3.Row`.
+        """
+        self._acquire_slot()
+        idle: list[PooledSQLiteConnection] = self._thread_idle()
+        now = time.monotonic()
+        conn: PooledSQLiteConnection | None = None
+        while idle and conn is None:
+            candidate = idle.pop()
+            with self._condition:
+                self._idle_total -= 1
+            if self._expired(candidate, now):
+                candidate._discard()
+            else:
+                conn = candidate
+        if conn is None:
+            try:
+                conn = sqlite3.connect(self._database_path, factory=PooledSQLiteConnection)
+                for pragma in SQLITE_PRAGMAS:
+                    conn.execute(pragma)
+            except BaseException:
+                self._release_slot()
+                raise
+            conn.row_factory = sqlite3.Row
+            conn._owner_thread = threading.get_ident()
+            conn._created_at = now
+        return ConnectionCheckout(conn, pool_release(self, conn))
+
+    def close(self) -> None:
+        """Close the calling thread's idle connections (others close with their thread)."""
+        idle = self._thread_idle()
+        while idle:
+            idle.pop()._discard()
+            with self._condition:
+                self._idle_total -= 1
+
+    def _thread_idle(self) -> list[PooledSQLiteConnection]:
+        """Return the calling thread's idle connections, creating the list on first use."""
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def _expired(self, conn: PooledSQLiteConnection, now: float) -> bool:
+        """Return whether *conn* has outlived ``max_lifetime_seconds`` at *now*."""
+        return (
+            self._max_lifetime_seconds is not None
+            and now - conn._created_at >= self._max_lifetime_seconds
+        )
+
+    def _release(self, conn: PooledSQLiteConnection) -> None:
+        """Roll back any open transaction and park *conn* for this thread's next checkout."""
+        self._release_slot()
+        if conn._owner_thread != threading.get_ident():
+            # Closing from another thread is not allowed; let GC close it.
+            return
+        idle = self._thread_idle()
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn._discard()
+            return
+        if len(idle) >= self._max_idle or self._expired(conn, time.monotonic()):
+            conn._discard()
+            return
+        idle.append(conn)
+        with self._condition:
+            self._idle_total += 1
+
+
+def pool_release(pool: Any, *args: Any) -> Callable[[], None]:
+    """Return a callback handing a checkout back to *pool*, held by weak reference.
+
+    A checkout must not keep its pool alive; once the pool is gone the
+    connection is simply closed.
+    """
+    pool_ref = weakref.ref(pool)
+
+    def release() -> None:
+        """Return the connection to the pool, or close it once the pool is gone."""
+        owner = pool_ref()
+        if owner is not None:
+            owner._release(*args)
+        else:
+            close_quietly(args[0])
+
+    return release
+
+
+def close_quietly(raw: Any) -> None:
+    """Close a raw connection that is being discarded, ignoring errors."""
+    with contextlib.suppress(Exception):
+        raw.close()
+
+
+__all__ = [
+    "SQLITE_PRAGMAS",
+    "BoundedPool",
+    "ConnectionCheckout",
+    "ConnectionPoolTimeout",
+    "PoolSettings",
+    "PooledSQLiteConnection",
+    "SQLitePool",
+    "apply_sqlite_pragmas",
+    "close_quietly",
+    "pool_release",
+    "pool_settings",
+]
@@ -0,0 +1,154 @@
+"""Bounded, health-checked pool of psycopg connections behind ``PostgresStore.connect()``.
+
+Keeps up to ``max_size`` connections checked out; a checkout past the
+ceiling waits up to ``timeout_seconds`` and then raises
+:class:`~backend.persistence.pool.ConnectionPoolTimeout`. Connections are
+recycled after ``max_lifetime_seconds``, dropped when broken, and pinged
+before reuse once they have sat idle for a while. The checkout accounting,
+waits and metrics are shared with the SQLite pool
+(:class:`~backend.persistence.pool.BoundedPool`).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from backend.persistence.pool import (
+    BoundedPool,
+    ConnectionCheckout,
+    close_quietly,
+    pool_release,
+)
+
+#: A PostgreSQL connection idle longer than this is pinged before reuse.
+_PING_AFTER_IDLE_SECONDS = 30.0
+
+#: ``psycopg.pq.TransactionStatus`` values (IDLE, INERROR, UNKNOWN).
+_PG_IDLE = 0
+_PG_BROKEN = (3, 4)
+
+
+class PostgresPool(BoundedPool):
+    """Bounded, health-checked pool of psycopg connections."""
+
+    backend = "postgres"
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        max_size: int = 10,
+        timeout_seconds: float = 30.0,
+        max_lifetime_seconds: float | None = 1800.0,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            connect: Opens one new raw connection.
+            max_size: Most connections checked out at once.
+            timeout_seconds: Longest a checkout waits for a free connection.
+            max_lifetime_seconds: Age after which a connection is closed
+                instead of reused, or ``None`` for no limit.
+
+        Raises:
+            ValueError: If ``max_size`` or ``timeout_seconds`` is not positive.
+        """
+        if max_size <= 0 or timeout_seconds <= 0:
+            raise ValueError("max_size and timeout_seconds must be positive")
+        super().__init__(max_size=max_size, timeout_seconds=timeout_seconds)
+        self._open = connect
+        self._max_lifetime_seconds = max_lifetime_seconds
+        # (raw connection, created at, idle since); reused most-recent first.
+        self._idle: list[tuple[Any, float, float]] = []
+
+    def _idle_count(self) -> int:
+        """Return the number of parked connections."""
+        return len(self._idle)
+
+    def connect(self) -> ConnectionCheckout[Any]:
+        """Check out a healthy idle connection, or open a new one.
+
+        Returns:
+            A checkout of the raw psycopg connection.
+
+        Raises:
+            ConnectionPoolTimeout: If ``max_size`` connections stay checked
+                out for the whole timeout.
+        """
+        self._acquire_slot()
+        try:
+            while True:
+                with self._condition:
+                    entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    raw, created_at = self._open(), time.monotonic()
+                    break
+                raw, created_at, idle_since = entry
+                if self._reusable(raw, created_at, idle_since):
+                    break
+                close_quietly(raw)
+        except BaseException:
+            self._release_slot()
+            raise
+        return ConnectionCheckout(raw, pool_release(self, raw, created_at))
+
+    def close(self) -> None:
+        """Close every idle connection; checked-out ones close when returned."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._max_lifetime_seconds = 0.0
+        for raw, _created_at, _idle_since in idle:
+            close_quietly(raw)
+
+    def _reusable(self, raw: Any, created_at: float, idle_since: float) -> bool:
+        """Health-check an idle connection before handing it out."""
+        now = time.monotonic()
+        if self._expired(created_at, now) or getattr(raw, "closed", False):
+            return False
+        if now - idle_since < _PING_AFTER_IDLE_SECONDS:
+            return True
+        try:
+            raw.execute("SELECT 1")
+            raw.rollback()
+        except Exception:  # noqa: BLE001 - any failure means the connection is unusable
+            return False
+        return True
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        """Return whether a connection opened at *created_at* is too old at *now*."""
+        return (
+            self._max_lifetime_seconds is not None
+            and now - created_at >= self._max_lifetime_seconds
+        )
+
+    def _release(self, raw: Any, created_at: float) -> None:
+        """Reset *raw* and park it for reuse, or close it when it cannot be reused."""
+        try:
+            reusable = self._reset(raw) and not self._expired(created_at, time.monotonic())
+        finally:
+            self._release_slot()
+        with self._condition:
+            if reusable and len(self._idle) < self._max_size:
+                self._idle.append((raw, created_at, time.monotonic()))
+                return
+        close_quietly(raw)
+
+    @staticmethod
+    def _reset(raw: Any) -> bool:
+        """Roll back an open transaction; return whether *raw* is still usable."""
+        if getattr(raw, "closed", False):
+            return False
+        status = getattr(getattr(raw, "info", None), "transaction_status", _PG_IDLE)
+        if status in _PG_BROKEN:
+            return False
+        if status != _PG_IDLE:
+            try:
+                raw.rollback()
+            except Exception:  # noqa: BLE001 - a failed rollback means a broken connection
+                return False
+        return True
+
+
+__all__ = ["PostgresPool"]
@@ -6,12 +6,14 @@ from typing import Any
 
 from backend.persistence.migrations import MigrationRunner
 from backend.persistence.migrations.postgres_versions import POSTGRES_STORE_MIGRATIONS
+from backend.persistence.pool import ConnectionCheckout, pool_settings
 from backend.persistence.postgres_adapter._shared import (
     _DEFAULT_DATABASE_URL,
     _connect,
 )
 from backend.persistence.postgres_adapter.eval_scoring import _EvalScoringMixin
 from backend.persistence.postgres_adapter.messages import _MessagesMixin
+from backend.persistence.postgres_adapter.pool import PostgresPool
 from backend.persistence.postgres_adapter.runs import _RunsMixin
 from backend.persistence.postgres_adapter.sessions import _SessionsMixin
 
@@ -28,16 +30,40 @@ class PostgresStore(_SessionsMixin, _RunsMixin, _MessagesMixin, _EvalScoringMixi
     def __init__(self, database_url: str = _DEFAULT_DATABASE_URL) -> None:
         """Initialize the store and apply its migrations.
 
+        Connections come from a bounded
+        :class:`~backend.persistence.postgres_adapter.pool.PostgresPool` sized by
+        ``AUTODEV_DB_POOL_SIZE`` (``0`` opens one per call instead).
+
         Args:
             database_url: PostgreSQL connection URL.
         """
         self.database_url = database_url
+        settings = pool_settings()
+        self.pool = (
+            PostgresPool(
+                lambda: _connect(database_url),
+                max_size=settings.size,
+                timeout_seconds=settings.timeout_seconds,
+                max_lifetime_seconds=settings.max_lifetime_seconds,
+            )
+            if settings.size
+            else None
+        )
         with self.connect() as conn:
             self._run_migrations(conn)
 
-    def connect(self) -> Any:
-        """Open a new connection to this store's database."""
-        return _connect(self.database_url)
+    def connect(self) -> ConnectionCheckout[Any]:
+        """Check out a pooled connection to this store's database.
+
+        ``with store.connect() as conn:`` commits or rolls back on exit and
+        then returns the connection to the pool; the checkout's ``close()``
+        returns it without committing. With pooling off this opens a new
+        connection and closes it on release.
+        """
+        if self.pool is not None:
+            return self.pool.connect()
+        conn = _connect(self.database_url)
+        return ConnectionCheckout(conn, conn.close)
 
     def _run_migrations(self, conn: Any) -> None:
         """Apply this store's versioned migrations via the shared runner.
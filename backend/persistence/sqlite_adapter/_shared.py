@@ -5,6 +5,8 @@ from __future__ import annotations
 import sqlite3
 from pathlib import Path
 
+from backend.persistence.pool import ConnectionCheckout
+
 _DEFAULT_DATABASE_URL = "sqlite:///./autodev.db"
 
 
@@ -31,7 +33,7 @@ class _ConnectionOwner:
 
     database_url: str
 
-    def connect(self) -> sqlite3.Connection:  # pragma: no cover - overridden by SQLiteStore
+    def connect(self) -> ConnectionCheckout[sqlite3.Connection]:  # pragma: no cover - overridden by SQLiteStore
         raise NotImplementedError
 
 
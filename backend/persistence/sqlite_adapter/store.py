@@ -6,6 +6,7 @@ import sqlite3
 
 from backend.persistence.migrations import MigrationRunner
 from backend.persistence.migrations.versions import STORE_MIGRATIONS
+from backend.persistence.pool import ConnectionCheckout, SQLitePool, pool_settings
 from backend.persistence.sqlite_adapter._shared import _DEFAULT_DATABASE_URL, _resolve_db_path
 from backend.persistence.sqlite_adapter.eval_scoring import _EvalScoringMixin
 from backend.persistence.sqlite_adapter.messages import _MessagesMixin
@@ -16,7 +17,9 @@ from backend.persistence.sqlite_adapter.sessions import _SessionsMixin
 class SQLiteStore(_SessionsMixin, _RunsMixin, _MessagesMixin, _EvalScoringMixin):
     """SQLite-backed store implementing SessionRepository, RunRepository,
     MessageRepository, EvalResultRepository, and ScoreSnapshotRepository in a
-    single connection-per-call style.
+    single connection-per-call style. Calls share connections through a
+    :class:`~backend.persistence.pool.SQLitePool` (per-thread reuse, PRAGMAs
+    applied once) unless ``AUTODEV_DB_POOL_SIZE=0``.
 
     Every read/write is scoped to a ``tenant_id`` (default
     :data:`~backend.persistence.tenancy.DEFAULT_TENANT_ID`), per the E8-S1
@@ -39,13 +42,22 @@ class SQLiteStore(_SessionsMixin, _RunsMixin, _MessagesMixin, _EvalScoringMixin)
         self.database_url = database_url
         self._database_path = _resolve_db_path(database_url)
         self._database_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = SQLitePool(self._database_path) if pool_settings().size else None
         with self.connect() as conn:
             MigrationRunner(conn, STORE_MIGRATIONS, namespace="store").run_pending()
 
-    def connect(self) -> sqlite3.Connection:
+    def connect(self) -> ConnectionCheckout[sqlite3.Connection]:
+        """Check out a pooled connection (a fresh one when pooling is off).
+
+        ``with store.connect() as conn:`` commits or rolls back on exit and
+        then returns the connection to the pool (closes it when pooling is
+        off); the checkout's ``close()`` returns it without committing.
+        """
+        if self.pool is not None:
+            return self.pool.connect()
         conn = sqlite3.connect(self._database_path)
         conn.row_factory = sqlite3.Row
-        return conn
+        return ConnectionCheckout(conn, conn.close)
 
 
 __all__ = ["SQLiteStore"]
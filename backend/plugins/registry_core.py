@@ -12,22 +12,38 @@ while keeping its own manifest-format specifics -- ``AgentRegistry`` keeps
 ``find_by_capability`` and agent-manifest loading; ``SkillRegistry`` keeps
 ``find_by_trigger`` and YAML loading. A version-resolution or upsert fix now
 lands once, for both.
+
+Resolution is cached. :meth:`VersionedExtensionRegistryCore.resolve` reads
+and re-validates every stored version of an id, so its results are memoized
+per ``(id, range)`` in a :class:`ResolutionCache` shared by every registry
+instance over the same table and database in this process (registries are
+built per request). Writes through any of them bump the cache's generation,
+which drops every entry at once; writes made by another process are picked
+up within ``AUTODEV_REGISTRY_RESOLVE_CACHE_SECONDS``. The flow registry
+(:class:`backend.flows.registry.FlowRegistry`) uses the same cache.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Callable, Generic, Sequence, TypeVar
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
+from backend.config.settings import get_settings
 from backend.plugins.events import PluginEvent
 from backend.plugins.manifest import validate_manifest as validate_plugin_manifest
 from backend.plugins.store import PluginStore
 
 RefT = TypeVar("RefT")
 ManifestT = TypeVar("ManifestT")
+ValueT = TypeVar("ValueT")
+
+_RESOLUTION_CACHE_MAX_ENTRIES = 1024
 
 
 def version_matches(version: str, version_range: str) -> bool:
@@ -45,6 +61,92 @@ def version_matches(version: str, version_range: str) -> bool:
     return Version(version) in SpecifierSet(version_range.replace(" ", ","))
 
 
+class ResolutionCache(Generic[ValueT]):
+    """Resolved registry entries keyed by ``(id, version range)``.
+
+    Every write to the backing table calls :meth:`invalidate`, which bumps
+    the generation and drops all entries. A resolver reads
+    :attr:`generation` before querying the store and hands it back to
+    :meth:`put`, so a result computed across a concurrent write is never
+    cached.
+    """
+
+    def __init__(self, max_entries: int = _RESOLUTION_CACHE_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is dropped.
+        """
+        self._max_entries = max_entries
+        # (id, range) -> (value, monotonic time it was cached)
+        self._entries: OrderedDict[tuple[str, str], tuple[ValueT, float]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations so far."""
+        return self._generation
+
+    def get(self, key: tuple[str, str], ttl_seconds: float) -> ValueT | None:
+        """Return the cached resolution of *key* if it is younger than the TTL."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, cached_at = entry
+            if time.monotonic() - cached_at < ttl_seconds:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+            return None
+
+    def put(self, key: tuple[str, str], value: ValueT, generation: int) -> None:
+        """Cache *value* unless the table was written since *generation*."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Bump the generation and drop every cached resolution."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+_resolution_caches: dict[tuple[str, str], ResolutionCache[Any]] = {}
+_resolution_caches_lock = threading.Lock()
+
+
+def resolution_cache(store: Any, table: str) -> ResolutionCache[Any]:
+    """Return the process-wide resolution cache of *table* in *store*'s database.
+
+    Stores without a file or server URL (in-memory SQLite, test doubles) get
+    a cache of their own, since two of them never share a database.
+
+    Args:
+        store: Durable store backing the registry.
+        table: Registry table name.
+
+    Returns:
+        The shared (or private) :class:`ResolutionCache`.
+    """
+    url = str(getattr(store, "database_url", ""))
+    if not url or ":memory:" in url:
+        return ResolutionCache()
+    with _resolution_caches_lock:
+        return _resolution_caches.setdefault((table, url), ResolutionCache())
+
+
+def resolve_cache_seconds() -> float:
+    """Seconds a resolution is reused before the store is read again."""
+    return get_settings().autodev_registry_resolve_cache_seconds
+
+
 class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
     """Durable register/resolve/deprecate/activate/catalog core.
 
@@ -90,6 +192,7 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
         self._catalog_key = catalog_key
         self._decode_ref = decode_ref
         self._plugin_store = PluginStore(store)
+        self._resolutions: ResolutionCache[RefT] = resolution_cache(store, table)
         self._ensure_schema()
 
     def upsert(self, manifest: ManifestT, *, plugin_id: str) -> None:
@@ -103,10 +206,14 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
         with self._store.connect() as conn:
             conn.execute(self._upsert_sql, self._upsert_params(manifest, plugin_id))
             conn.commit()
+        self._resolutions.invalidate()
 
     def resolve(self, ext_id: str, version_range: str = "*") -> RefT:
         """Resolve the highest registered version matching a SemVer range.
 
+        Served from the shared :class:`ResolutionCache` when possible;
+        failed resolutions are not cached.
+
         Args:
             ext_id: Fully qualified extension id.
             version_range: SemVer range expression, or ``"*"`` for any version.
@@ -117,15 +224,24 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
         Raises:
             KeyError: If no registered version satisfies the range.
         """
+        key = (ext_id, version_range)
+        ttl = resolve_cache_seconds()
+        cached = self._resolutions.get(key, ttl) if ttl > 0 else None
+        if cached is not None:
+            return cached
+        generation = self._resolutions.generation
         matches = [
             ref for ref in self.list_all(ext_id=ext_id)
             if version_matches(ref.version, version_range)  # type: ignore[attr-defined]
         ]
         if not matches:
             raise KeyError(f"No {self._kind} {ext_id!r} matches {version_range!r}")
-        return sorted(
+        resolved = sorted(
             matches, key=lambda ref: Version(ref.version), reverse=True  # type: ignore[attr-defined]
         )[0]
+        if ttl > 0:
+            self._resolutions.put(key, resolved, generation)
+        return resolved
 
     def deprecate(self, ext_id: str, version: str, reason: str) -> None:
         """Mark a specific version as deprecated and emit a plugin event.
@@ -146,6 +262,7 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
                 (reason, ext_id, version),
             )
             conn.commit()
+        self._resolutions.invalidate()
         self._plugin_store.append_event(
             PluginEvent(
                 name=f"{self._kind}.version.deprecated",
@@ -176,6 +293,7 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
                 (ext_id, version),
             )
             conn.commit()
+        self._resolutions.invalidate()
         self._plugin_store.append_event(
             PluginEvent(
                 name=f"{self._kind}.version.activated",
@@ -353,4 +471,10 @@ class VersionedExtensionRegistryCore(Generic[RefT, ManifestT]):
         return dict(zip(columns, row))
 
 
-__all__ = ["VersionedExtensionRegistryCore", "version_matches"]
+__all__ = [
+    "ResolutionCache",
+    "VersionedExtensionRegistryCore",
+    "resolution_cache",
+    "resolve_cache_seconds",
+    "version_matches",
+]
@@ -19,6 +19,11 @@ from backend.quotas.contracts import (
     usd_to_micros,
     utc_month_window,
 )
+from backend.quotas.rate_limit import (
+    RateLimiter,
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+)
 from backend.quotas.service import QuotaPolicyMissingError, QuotaService, TenantUsageSnapshot
 from backend.quotas.store import QuotaStore
 
@@ -33,10 +38,13 @@ __all__ = [
     "QuotaResource",
     "QuotaService",
     "QuotaStore",
+    "RateLimiter",
+    "RedisTokenBucketRateLimiter",
     "ReservationResult",
     "TenantUsageSnapshot",
     "RunBudgetLimits",
     "TenantQuotaPolicy",
+    "TokenBucketRateLimiter",
     "UsageDelta",
     "UsageResult",
     "narrow_budget",
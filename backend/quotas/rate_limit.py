@@ -0,0 +1,271 @@
+"""Token-bucket request-rate admission (ADR-019, E11-S3).
+
+:meth:`~backend.quotas.store.QuotaStore.consume_request_slot` admits each
+request with a ``BEGIN IMMEDIATE`` write, which serializes every
+authenticated API request on the database file lock. The limiters here keep
+the admission decision off the durable store:
+
+* :class:`TokenBucketRateLimiter` — one in-process bucket per credential,
+  holding up to ``requests_per_second`` tokens and refilled continuously at
+  that rate. A decision is a dict lookup and some arithmetic under a lock.
+* :class:`RedisTokenBucketRateLimiter` — the same bucket, kept in a Redis
+  hash and updated by one Lua script, so every replica draws from one
+  bucket per credential. If Redis fails the replica falls back to its own
+  in-process bucket rather than failing every request.
+
+Admitted counts are aggregated per one-second window and written to the
+durable ``request_rate_buckets`` table at most once per
+``reconcile_interval_seconds``
+(:meth:`~backend.quotas.store.QuotaStore.record_request_counts`), so usage
+stays auditable without a write per request.
+
+A full bucket admits a burst of ``requests_per_second`` requests, the same
+ceiling as the one-second window the store enforces; a denial raises the
+same :class:`~backend.quotas.contracts.QuotaExceededError` (HTTP 429).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any
+
+from backend.config.settings import Settings
+from backend.quotas.store import QuotaStore
+
+logger = logging.getLogger(__name__)
+
+_BUCKET_IDLE_EVICT_SECONDS = 60.0
+_REDIS_KEY_PREFIX = "autodev:ratelimit:"
+
+# KEYS[1]: the credential's bucket hash. ARGV[1]: requests per second.
+# Redis' own clock is used so replicas with skewed clocks share one refill rate.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or rate
+local updated = tonumber(state[2]) or now
+tokens = math.min(rate, tokens + math.max(0, now - updated) * rate)
+local admitted = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  admitted = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], 2000)
+return admitted
+"""
+
+
+class RateLimiter(ABC):
+    """Admits or rejects one request of a credential against its per-second limit."""
+
+    def __init__(
+        self, store: QuotaStore | None = None, *, reconcile_interval_seconds: float = 5.0
+    ) -> None:
+        """Initialize the admitted-count aggregation.
+
+        Args:
+            store: Durable store admitted counts are reconciled into;
+                ``None`` keeps them in memory only.
+            reconcile_interval_seconds: Least time between two writes to
+                *store*.
+        """
+        self._store = store
+        self._reconcile_interval_seconds = reconcile_interval_seconds
+        self._admitted: Counter[tuple[str, int]] = Counter()
+        self._counts_lock = threading.Lock()
+        self._reconcile_lock = threading.Lock()
+        self._next_reconcile = time.monotonic() + reconcile_interval_seconds
+
+    def admit(self, *, credential_id: str, requests_per_second: int) -> bool:
+        """Take one request slot for *credential_id* if its bucket has one.
+
+        Args:
+            credential_id: The presented credential's stable identifier.
+            requests_per_second: The credential's configured rate limit.
+
+        Returns:
+            ``True`` if the request is admitted; ``False`` if the credential
+            is over its limit.
+        """
+        admitted = self._take(credential_id, requests_per_second)
+        if admitted:
+            with self._counts_lock:
+                self._admitted[(credential_id, int(time.time()))] += 1
+        if time.monotonic() >= self._next_reconcile:
+            self.reconcile()
+        return admitted
+
+    def reconcile(self) -> int:
+        """Write the admitted counts gathered since the last call to the durable store.
+
+        Runs from one caller at a time; a concurrent caller returns at once.
+        Counts whose write fails are kept for the next attempt.
+
+        Returns:
+            Number of ``(credential, window)`` rows written.
+        """
+        if not self._reconcile_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._next_reconcile = time.monotonic() + self._reconcile_interval_seconds
+            self._evict_idle()
+            with self._counts_lock:
+                counts, self._admitted = self._admitted, Counter()
+            if not counts or self._store is None:
+                return 0
+            try:
+                self._store.record_request_counts(counts)
+            except Exception:  # noqa: BLE001 - admission must not fail on a reconcile error
+                logger.warning("Request-rate reconcile failed; retrying later", exc_info=True)
+                with self._counts_lock:
+                    self._admitted.update(counts)
+                return 0
+            return len(counts)
+        finally:
+            self._reconcile_lock.release()
+
+    @abstractmethod
+    def _take(self, credential_id: str, requests_per_second: int) -> bool:
+        """Take one token from *credential_id*'s bucket, if it has one."""
+
+    def _evict_idle(self) -> None:
+        """Drop state for credentials that have been idle; a no-op by default."""
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Per-credential token buckets held in this process."""
+
+    def __init__(
+        self, store: QuotaStore | None = None, *, reconcile_interval_seconds: float = 5.0
+    ) -> None:
+        """Initialize with no buckets; a credential's bucket starts full.
+
+        Args:
+            store: Durable store admitted counts are reconciled into.
+            reconcile_interval_seconds: Least time between two writes to
+                *store*.
+        """
+        super().__init__(store, reconcile_interval_seconds=reconcile_interval_seconds)
+        # credential_id -> [tokens, last refill (monotonic seconds)]
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _take(self, credential_id: str, requests_per_second: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(credential_id)
+            if bucket is None:
+                bucket = self._buckets[credential_id] = [float(requests_per_second), now]
+            tokens = min(
+                float(requests_per_second), bucket[0] + (now - bucket[1]) * requests_per_second
+            )
+            admitted = tokens >= 1.0
+            bucket[0] = tokens - 1.0 if admitted else tokens
+            bucket[1] = now
+        return admitted
+
+    def _evict_idle(self) -> None:
+        # An idle bucket has refilled completely, so dropping it changes nothing.
+        cutoff = time.monotonic() - _BUCKET_IDLE_EVICT_SECONDS
+        with self._lock:
+            for credential_id in [c for c, b in self._buckets.items() if b[1] < cutoff]:
+                del self._buckets[credential_id]
+
+
+class RedisTokenBucketRateLimiter(RateLimiter):
+    """Per-credential token buckets shared by every replica through Redis."""
+
+    def __init__(
+        self,
+        client: Any,
+        store: QuotaStore | None = None,
+        *,
+        reconcile_interval_seconds: float = 5.0,
+    ) -> None:
+        """Register the bucket script with *client*.
+
+        Args:
+            client: Redis client.
+            store: Durable store admitted counts are reconciled into.
+            reconcile_interval_seconds: Least time between two writes to
+                *store*.
+        """
+        super().__init__(store, reconcile_interval_seconds=reconcile_interval_seconds)
+        self._script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._fallback = TokenBucketRateLimiter()
+
+    def _take(self, credential_id: str, requests_per_second: int) -> bool:
+        try:
+            return bool(
+                int(
+                    self._script(
+                        keys=[f"{_REDIS_KEY_PREFIX}{credential_id}"], args=[requests_per_second]
+                    )
+                )
+            )
+        except Exception:  # noqa: BLE001 - degrade to a per-replica bucket, not to 5xx
+            logger.warning("Redis rate limiter unavailable; using the local bucket", exc_info=True)
+            return self._fallback._take(credential_id, requests_per_second)  # noqa: SLF001
+
+    def _evict_idle(self) -> None:
+        self._fallback._evict_idle()  # noqa: SLF001
+
+
+_limiters: dict[tuple[str, str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: Settings, store: QuotaStore) -> RateLimiter:
+    """Return the process-wide limiter for *store*'s database and the configured backend.
+
+    Bucket state must outlive the per-request services that consult it, so
+    limiters are cached per backend, Redis URL and database path.
+
+    Args:
+        settings: Settings selecting ``autodev_rate_limit_backend``.
+        store: Durable store admitted counts are reconciled into.
+
+    Returns:
+        The shared limiter.
+
+    Raises:
+        RuntimeError: If the Redis backend is selected without the ``redis``
+            package or a Redis URL.
+    """
+    backend = settings.autodev_rate_limit_backend
+    redis_url = settings.autodev_redis_url.strip() if backend == "redis" else ""
+    key = (backend, redis_url, str(store.db_path))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is not None:
+            return limiter
+        interval = settings.autodev_rate_limit_reconcile_seconds
+        if backend == "redis":
+            if not redis_url:
+                raise RuntimeError("AUTODEV_REDIS_URL is required for the redis rate limiter.")
+            try:
+                import redis as _redis  # type: ignore[import-untyped]  # noqa: PLC0415
+            except ImportError as exc:
+                raise RuntimeError("redis package is not installed.") from exc
+            limiter = RedisTokenBucketRateLimiter(
+                _redis.from_url(redis_url), store, reconcile_interval_seconds=interval
+            )
+        else:
+            limiter = TokenBucketRateLimiter(store, reconcile_interval_seconds=interval)
+        _limiters[key] = limiter
+        return limiter
+
+
+__all__ = [
+    "RateLimiter",
+    "RedisTokenBucketRateLimiter",
+    "TokenBucketRateLimiter",
+    "get_rate_limiter",
+]
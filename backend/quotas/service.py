@@ -10,6 +10,9 @@ compare-and-set primitives report but never publish themselves.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -25,6 +28,7 @@ from backend.quotas.contracts import (
     TenantQuotaPolicy,
     utc_month_window,
 )
+from backend.quotas.rate_limit import RateLimiter, get_rate_limiter
 from backend.quotas.store import QuotaStore
 
 
@@ -67,6 +71,80 @@ class TenantUsageSnapshot:
     month_window_key: str
 
 
+_POLICY_CACHE_MAX_ENTRIES = 4096
+
+
+class _PolicyCache:
+    """Recently resolved tenant policies of one quota database, for rate-limit checks.
+
+    Module-level like :func:`~backend.quotas.rate_limit.get_rate_limiter`'s
+    limiters: :class:`QuotaService` is built per request, and the cache must
+    outlive it. :meth:`QuotaService.set_policy` calls :meth:`invalidate`,
+    which bumps the generation, so a policy resolved across a concurrent
+    write is never cached.
+    """
+
+    def __init__(self, max_entries: int = _POLICY_CACHE_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Tenants kept before the least recently used is dropped.
+        """
+        self._max_entries = max_entries
+        # tenant_id -> (policy, monotonic time it was cached)
+        self._entries: OrderedDict[str, tuple[TenantQuotaPolicy, float]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations so far."""
+        return self._generation
+
+    def get(self, tenant_id: str, ttl_seconds: float) -> TenantQuotaPolicy | None:
+        """Return *tenant_id*'s cached policy if it is younger than the TTL."""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is None:
+                return None
+            policy, cached_at = entry
+            if time.monotonic() - cached_at < ttl_seconds:
+                self._entries.move_to_end(tenant_id)
+                return policy
+            del self._entries[tenant_id]
+            return None
+
+    def put(self, tenant_id: str, policy: TenantQuotaPolicy, generation: int) -> None:
+        """Cache *policy* unless a policy was written since *generation*."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[tenant_id] = (policy, time.monotonic())
+            self._entries.move_to_end(tenant_id)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tenant_id: str) -> None:
+        """Bump the generation and drop *tenant_id*'s cached policy."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(tenant_id, None)
+
+
+_policy_caches: dict[str, _PolicyCache] = {}
+_policy_caches_lock = threading.Lock()
+
+
+def _policy_cache(store: QuotaStore) -> _PolicyCache:
+    """Return the process-wide policy cache of *store*'s database."""
+    key = str(store.db_path)
+    with _policy_caches_lock:
+        cache = _policy_caches.get(key)
+        if cache is None:
+            cache = _policy_caches[key] = _PolicyCache()
+        return cache
+
+
 def _month_window_key(settings: Settings) -> str:
     """Return the current UTC month as a stable ``YYYY-MM`` window key."""
     del settings
@@ -77,15 +155,24 @@ def _month_window_key(settings: Settings) -> str:
 class QuotaService:
     """Resolves tenant quota policy and durably reports warning/exceeded crossings."""
 
-    def __init__(self, store: Optional[QuotaStore] = None, settings: Optional[Settings] = None) -> None:
+    def __init__(
+        self,
+        store: Optional[QuotaStore] = None,
+        settings: Optional[Settings] = None,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         """Build the service over a store and settings snapshot.
 
         Args:
             store: Durable quota store; defaults to a fresh :class:`QuotaStore`.
             settings: Application settings; defaults to the cached settings.
+            rate_limiter: Request-rate limiter; defaults to the process-wide
+                limiter for ``store`` (:func:`~backend.quotas.rate_limit.get_rate_limiter`).
         """
         self._store = store or QuotaStore()
         self._settings = settings or get_settings()
+        self._rate_limiter = rate_limiter
 
     def _local_default_policy(self, tenant_id: str) -> TenantQuotaPolicy:
         """Build the finite local-mode default policy from settings (ADR-019)."""
@@ -142,7 +229,10 @@ class QuotaService:
         Returns:
             The stored policy, with its incremented version.
         """
-        return self._store.upsert_policy(policy, expected_version=expected_version)
+        try:
+            return self._store.upsert_policy(policy, expected_version=expected_version)
+        finally:
+            _policy_cache(self._store).invalidate(policy.tenant_id)
 
     def list_tenant_ids(self) -> list[str]:
         """Return every tenant with a durably stored quota policy."""
@@ -175,16 +265,23 @@ class QuotaService:
     def check_rate_limit(self, *, tenant_id: str, credential_id: str) -> None:
         """Enforce a credential's per-second request rate against its tenant's policy.
 
+        Admission is decided by a token bucket, in memory or in Redis
+        (:mod:`backend.quotas.rate_limit`), not by a durable write per request,
+        and the tenant's policy is reused for ``autodev_quota_policy_cache_seconds``
+        rather than read from the store on every request.
+
         Args:
             tenant_id: Tenant the credential authenticates into.
             credential_id: Stable identifier of the presented credential.
 
         Raises:
-            QuotaExceededError: If the credential's current one-second
-                window is already at its limit.
+            QuotaExceededError: If the credential has used up its
+                ``requests_per_second`` allowance.
         """
-        policy = self.resolve_policy(tenant_id)
-        admitted = self._store.consume_request_slot(
+        policy = self._cached_policy(tenant_id)
+        if self._rate_limiter is None:
+            self._rate_limiter = get_rate_limiter(self._settings, self._store)
+        admitted = self._rate_limiter.admit(
             credential_id=credential_id, requests_per_second=policy.requests_per_second
         )
         if not admitted:
@@ -195,6 +292,19 @@ class QuotaService:
                 limit=policy.requests_per_second,
             )
 
+    def _cached_policy(self, tenant_id: str) -> TenantQuotaPolicy:
+        """Return :meth:`resolve_policy` for *tenant_id*, through the shared policy cache."""
+        ttl_seconds = self._settings.autodev_quota_policy_cache_seconds
+        if ttl_seconds <= 0:
+            return self.resolve_policy(tenant_id)
+        cache = _policy_cache(self._store)
+        policy = cache.get(tenant_id, ttl_seconds)
+        if policy is None:
+            generation = cache.generation
+            policy = self.resolve_policy(tenant_id)
+            cache.put(tenant_id, policy, generation)
+        return policy
+
     def record_monthly_usage(
         self, *, tenant_id: str, resource: QuotaResource, delta: int
     ) -> None:
@@ -7,13 +7,19 @@ writers with ``BEGIN IMMEDIATE`` (a real file-lock, safe across threads and
 processes on one machine); PostgreSQL serializes with ``SELECT ... FOR
 UPDATE`` inside an explicit transaction. Every mutating method commits
 exactly once, at the end of its own transaction.
+
+The one exception is per-second request-rate admission. It is too hot to
+write per request, so :mod:`backend.quotas.rate_limit` decides it in memory
+(or in Redis) and reconciles the admitted counts here periodically.
 """
 
 from __future__ import annotations
 
 import os
 import sqlite3
+import threading
 import time
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -66,6 +72,11 @@ class QuotaStore:
             self._create_schema(conn)
             conn.commit()
 
+    @property
+    def db_path(self) -> Path:
+        """The SQLite database file backing this store."""
+        return self._db_path
+
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self._db_path), timeout=30)
         conn.row_factory = sqlite3.Row
@@ -270,6 +281,25 @@ class QuotaStore:
             conn.commit()
             return cursor.rowcount > 0
 
+    def record_request_counts(self, counts: Mapping[tuple[str, int], int]) -> None:
+        """Add admitted-request counts to their one-second windows in one transaction.
+
+        The write side of :mod:`backend.quotas.rate_limit`: admission happens
+        in memory, and the aggregated counts land here periodically.
+
+        Args:
+            counts: Admitted requests keyed by ``(credential_id, window_start)``.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO request_rate_buckets (credential_id, window_start, count) "
+                "VALUES (?, ?, ?) ON CONFLICT (credential_id, window_start) "
+                "DO UPDATE SET count = count + excluded.count",
+                [(credential_id, window, count) for (credential_id, window), count in counts.items()],
+            )
+            conn.commit()
+
     def release_run_lease(self, run_id: str) -> None:
         """Release a run's concurrency lease, freeing its tenant's slot."""
         with self._connect() as conn:
@@ -376,6 +406,9 @@ class QuotaStore:
     def consume_request_slot(self, *, credential_id: str, requests_per_second: int) -> bool:
         """Atomically consume one request slot in the current one-second window.
 
+        A durable write per call. API admission uses
+        :mod:`backend.quotas.rate_limit` instead.
+
         Args:
             credential_id: The presented credential's stable identifier.
             requests_per_second: The credential's configured rate limit.
@@ -473,9 +506,33 @@ class QuotaStore:
         return int(row["used"]) if row is not None else 0
 
 
+_shared_stores: dict[Path, QuotaStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def get_quota_store() -> QuotaStore:
+    """Return the process-wide store for the current ``DATABASE_URL``.
+
+    For per-request callers: constructing a :class:`QuotaStore` re-runs its
+    schema script, which is wasted work on every request. The cache is
+    keyed by the resolved path, so a changed ``DATABASE_URL`` gets its own
+    store.
+
+    Returns:
+        The shared store.
+    """
+    db_path = _resolve_db_path(os.environ.get("DATABASE_URL", ""))
+    with _shared_stores_lock:
+        store = _shared_stores.get(db_path)
+        if store is None:
+            store = _shared_stores[db_path] = QuotaStore(db_path=db_path)
+        return store
+
+
 __all__ = [
     "LeaseResult",
     "QuotaStore",
+    "get_quota_store",
     "ReservationResult",
     "UsageResult",
 ]
@@ -0,0 +1,155 @@
+"""Read/chunk stage of the indexing pipeline, serial or on a process pool.
+
+Reading, parsing, chunking, and hashing a file is CPU-bound and independent
+per file, so :func:`backend.repository.indexing.reindex` can fan it out over
+a bounded :class:`~concurrent.futures.ProcessPoolExecutor`.
+:func:`read_and_chunk` is the unit of work — module-level and fed only
+picklable values, so a worker process can run it — and
+:func:`chunk_batches` streams its results back in input order, one writer
+batch at a time, so persistence never has to hold a whole repository's
+chunks in memory.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.config.settings import get_settings
+from backend.repository import file_manifest
+from backend.repository.chunking import Chunk, chunk_source, language_for_path
+from backend.repository.file_manifest import FileFingerprint
+
+#: Upper bound on chunking worker processes, whatever ``workers`` or
+#: ``AUTODEV_INDEX_WORKERS`` asks for (also capped at the CPU count).
+MAX_INDEX_WORKERS = 32
+
+#: Batches submitted to the worker pool ahead of the one being persisted —
+#: keeps workers busy while the writer commits, without materializing the
+#: chunks of a whole repository in memory at once.
+_PREFETCH_BATCHES = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkedFile:
+    """One file's output from the read/chunk stage, handed to the writer.
+
+    Attributes:
+        relative_path: Stored (repository-relative) path of the file.
+        fingerprint: The file's fresh manifest fingerprint, or ``None`` when
+            the file no longer exists on disk and its stored chunks and
+            manifest row must be deleted.
+        chunks: Freshly computed chunks, or ``None`` when the file's content
+            hash matched its recorded one and chunking was skipped.
+        seconds: Time spent reading and chunking the file.
+    """
+
+    relative_path: str
+    fingerprint: FileFingerprint | None
+    chunks: list[Chunk] | None
+    seconds: float
+
+
+def resolve_worker_count(workers: int | None, file_count: int) -> int:
+    """Return the bounded number of chunking processes to use for *file_count* files.
+
+    Args:
+        workers: Explicit request, or ``None`` for
+            ``Settings.autodev_index_workers`` (``AUTODEV_INDEX_WORKERS``).
+        file_count: Number of files about to be reindexed; a pool is never
+            larger than the work it would receive.
+
+    Returns:
+        A worker count in ``[1, min(cpu_count, MAX_INDEX_WORKERS, file_count)]``;
+        ``1`` means chunk serially in-process.
+    """
+    requested = workers
+    if requested is None:
+        requested = get_settings().autodev_index_workers
+    ceiling = min(os.cpu_count() or 1, MAX_INDEX_WORKERS, max(1, file_count))
+    return max(1, min(requested, ceiling))
+
+
+def read_and_chunk(
+    absolute_path: str, relative_path: str, known_hash: str | None = None
+) -> ChunkedFile:
+    """Read one file from disk and chunk it (runs in a worker process when parallel).
+
+    The file is ``stat``-ed before it is read (see
+    :func:`~backend.repository.file_manifest.fingerprint`), and decoded with
+    universal newlines exactly as ``Path.read_text`` would.
+
+    Args:
+        absolute_path: Absolute path of the file to read.
+        relative_path: Stored path recorded on each chunk.
+        known_hash: Whole-file hash recorded in the manifest, if any; when
+            the content still hashes to it, chunking is skipped.
+
+    Returns:
+        The file's fingerprint and chunks; ``fingerprint=None`` if the file
+        does not exist, ``chunks=None`` if its content is unchanged.
+    """
+    started = time.perf_counter()
+    absolute = Path(absolute_path)
+    try:
+        stat_result = absolute.stat()
+    except OSError:
+        stat_result = None
+    if stat_result is None or not absolute.is_file():
+        return ChunkedFile(relative_path, None, None, time.perf_counter() - started)
+    data = absolute.read_bytes()
+    recorded = file_manifest.fingerprint(stat_result, data)
+    if recorded.file_hash == known_hash:
+        return ChunkedFile(relative_path, recorded, None, time.perf_counter() - started)
+    code = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    chunks = chunk_source(relative_path, code, language_for_path(relative_path) or "python")
+    return ChunkedFile(relative_path, recorded, chunks, time.perf_counter() - started)
+
+
+def chunk_batches(
+    items: list[tuple[str, str, str | None]],
+    batch_size: int,
+    pool: ProcessPoolExecutor | None,
+) -> Iterator[list[ChunkedFile]]:
+    """Yield :func:`read_and_chunk` results in batches of *batch_size* files, in input order.
+
+    Serially (``pool is None``) each batch is chunked on the calling thread
+    just before it is yielded. With a pool, up to ``_PREFETCH_BATCHES``
+    batches are in flight ahead of the one being yielded, so workers keep
+    chunking while the caller persists.
+
+    Args:
+        items: ``(absolute_path, stored_path, known_hash)`` triples.
+        batch_size: Files per yielded batch (one writer transaction each).
+        pool: Worker pool, or ``None`` for serial chunking.
+
+    Yields:
+        One list of :class:`ChunkedFile` per batch, ordered as *items*.
+    """
+    batches = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+    if pool is None:
+        for batch in batches:
+            yield [read_and_chunk(*item) for item in batch]
+        return
+
+    in_flight: deque[list[Future[ChunkedFile]]] = deque()
+    for batch in batches:
+        in_flight.append([pool.submit(read_and_chunk, *item) for item in batch])
+        if len(in_flight) > _PREFETCH_BATCHES:
+            yield [future.result() for future in in_flight.popleft()]
+    while in_flight:
+        yield [future.result() for future in in_flight.popleft()]
+
+
+__all__ = [
+    "MAX_INDEX_WORKERS",
+    "ChunkedFile",
+    "chunk_batches",
+    "read_and_chunk",
+    "resolve_worker_count",
+]
@@ -6,20 +6,35 @@ boundary keeps some surrounding context. Falls back to a single whole-file
 chunk when the active provider cannot supply symbol spans (see
 :class:`~backend.repository.providers.symbol_span.SymbolSpan`) or the file
 has none (e.g. a script with no top-level functions/classes).
+
+:data:`LANGUAGE_BY_EXTENSION` is the single source of truth for which files
+the indexer walks and which grammar each is parsed with; the language is
+recorded on every :class:`Chunk` and persisted to ``code_chunks.language``.
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import json
 from dataclasses import dataclass
+from pathlib import PurePath
 
 from backend.repository.providers import RepositoryProvider
 from backend.repository.providers.symbol_span import SymbolSpan
-from backend.repository.providers.treesitter_provider import TreeSitterProvider
+from backend.repository.providers.treesitter_provider import (
+    TreeSitterProvider,
+    grammar_versions,
+)
 
 #: Default number of trailing/leading context lines shared between adjacent chunks.
 DEFAULT_OVERLAP_LINES = 2
 
+#: Bump whenever the same source would chunk differently (span rules,
+#: overlap, the whole-file fallback): files indexed under another version
+#: are re-chunked even when their fingerprint has not moved.
+CHUNKER_VERSION = 1
+
 #: Default span source: always attempts a real tree-sitter parse, degrading
 #: internally to the lexical fallback when the package/grammar is
 #: unavailable. Deliberately independent of ``get_provider()``'s
@@ -27,6 +42,35 @@ DEFAULT_OVERLAP_LINES = 2
 #: ``/repository/symbols`` API; indexing should always prefer real parsing).
 _DEFAULT_PROVIDER = TreeSitterProvider()
 
+#: File extension to language name (a key of the tree-sitter provider's
+#: registry). Only files with one of these extensions are indexed.
+LANGUAGE_BY_EXTENSION: dict[str, str] = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".mts": "typescript",
+    ".cts": "typescript",
+    ".tsx": "tsx",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".jsx": "javascript",
+    ".go": "go",
+    ".tf": "hcl",
+    ".hcl": "hcl",
+}
+
+
+def language_for_path(file_path: str | PurePath) -> str | None:
+    """Return the language *file_path* is indexed as, or ``None`` if it is not indexed.
+
+    Args:
+        file_path: Path (or bare file name) to classify by extension.
+
+    Returns:
+        A language name from :data:`LANGUAGE_BY_EXTENSION`, or ``None``.
+    """
+    return LANGUAGE_BY_EXTENSION.get(PurePath(file_path).suffix)
+
 
 @dataclass(frozen=True, slots=True)
 class Chunk:
@@ -41,6 +85,8 @@ class Chunk:
         content: The chunk's exact source text, including any overlap.
         content_hash: SHA-256 hex digest of ``content``, used to detect
             unchanged chunks across reindex runs.
+        language: Language the file was chunked as (see
+            :data:`LANGUAGE_BY_EXTENSION`).
     """
 
     file_path: str
@@ -49,6 +95,7 @@ class Chunk:
     end_line: int
     content: str
     content_hash: str
+    language: str = "python"
 
 
 def chunk_source(
@@ -79,7 +126,7 @@ def chunk_source(
     active_provider = provider or _DEFAULT_PROVIDER
     spans = _symbol_spans(active_provider, code, language)
     if not spans:
-        return [_whole_file_chunk(file_path, code)]
+        return [_whole_file_chunk(file_path, code, language)]
 
     lines = code.splitlines(keepends=True)
     last_line_index = len(lines) - 1
@@ -96,6 +143,7 @@ def chunk_source(
                 end_line=end,
                 content=content,
                 content_hash=_hash_content(content),
+                language=language,
             )
         )
     return chunks
@@ -125,12 +173,13 @@ def _symbol_spans(provider: RepositoryProvider, code: str, language: str) -> lis
         return []
 
 
-def _whole_file_chunk(file_path: str, code: str) -> Chunk:
+def _whole_file_chunk(file_path: str, code: str, language: str) -> Chunk:
     """Build a single chunk covering the entire file.
 
     Args:
         file_path: Path of the file *code* was read from.
         code: Full source text.
+        language: Language recorded on the chunk.
 
     Returns:
         A :class:`Chunk` with an empty ``symbol`` spanning every line.
@@ -143,12 +192,36 @@ def _whole_file_chunk(file_path: str, code: str) -> Chunk:
         end_line=end_line,
         content=code,
         content_hash=_hash_content(code),
+        language=language,
     )
 
 
+@functools.cache
+def chunker_version() -> str:
+    """Return the version recorded with every file manifest row.
+
+    Combines :data:`CHUNKER_VERSION`, the default overlap, and the installed
+    tree-sitter and grammar package versions, so upgrading any of them
+    invalidates the manifest (see :mod:`backend.repository.file_manifest`).
+
+    Returns:
+        A short hex digest.
+    """
+    document = json.dumps([CHUNKER_VERSION, DEFAULT_OVERLAP_LINES, grammar_versions()])
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()[:16]
+
+
 def _hash_content(content: str) -> str:
     """Return the SHA-256 hex digest of *content*, used to detect unchanged chunks."""
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-__all__ = ["Chunk", "DEFAULT_OVERLAP_LINES", "chunk_source"]
+__all__ = [
+    "CHUNKER_VERSION",
+    "DEFAULT_OVERLAP_LINES",
+    "LANGUAGE_BY_EXTENSION",
+    "Chunk",
+    "chunk_source",
+    "chunker_version",
+    "language_for_path",
+]
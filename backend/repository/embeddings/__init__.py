@@ -1,9 +1,29 @@
 """Embedding generation and pgvector-backed storage for indexed code chunks (E7-S2)."""
 
+from backend.repository.embeddings.cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    StoreEmbeddingCache,
+)
+from backend.repository.embeddings.pipeline import (
+    EmbeddingPipeline,
+    EmbeddingPipelineStats,
+    get_embedding_pipeline,
+)
 from backend.repository.embeddings.provider import (
     DEFAULT_EMBEDDING_DIMENSION,
     EmbeddingProvider,
     StubEmbeddingProvider,
 )
 
-__all__ = ["DEFAULT_EMBEDDING_DIMENSION", "EmbeddingProvider", "StubEmbeddingProvider"]
+__all__ = [
+    "DEFAULT_EMBEDDING_DIMENSION",
+    "EmbeddingCache",
+    "EmbeddingPipeline",
+    "EmbeddingPipelineStats",
+    "EmbeddingProvider",
+    "InMemoryEmbeddingCache",
+    "StoreEmbeddingCache",
+    "StubEmbeddingProvider",
+    "get_embedding_pipeline",
+]
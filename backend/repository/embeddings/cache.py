@@ -0,0 +1,179 @@
+"""Content-addressed embedding caches consulted before an embedding provider.
+
+An embedding is a pure function of (model, dimension, text), so it can be
+cached under the text's SHA-256 — the same digest ``code_chunks.content_hash``
+already stores — and shared across tenants and repositories. Re-indexing a
+fork or a vendored dependency then finds every vector in the cache.
+
+Two implementations of the :class:`EmbeddingCache` Protocol ship here:
+
+* :class:`InMemoryEmbeddingCache` — a bounded, thread-safe LRU local to one
+  process; the default.
+* :class:`StoreEmbeddingCache` — the ``embedding_cache`` table of a durable
+  store (SQLite or PostgreSQL), shared by every process on that store; what
+  :func:`~backend.repository.embeddings.pipeline.get_embedding_pipeline`
+  uses.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol, runtime_checkable
+
+import numpy as np
+
+from backend.repository.index_generation import param_style
+
+#: Rows read or written per statement, keeping ``IN (...)`` lists under
+#: SQLite's bound-parameter limit.
+_STORE_BATCH_ROWS = 500
+
+
+@runtime_checkable
+class EmbeddingCache(Protocol):
+    """Structural Protocol for embedding caches keyed by content hash."""
+
+    def get_many(self, model: str, dimension: int, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return the cached vector for each of *hashes* that is present."""
+        ...
+
+    def put_many(self, model: str, dimension: int, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store *vectors* (content hash to vector) for *model* / *dimension*."""
+        ...
+
+
+class InMemoryEmbeddingCache:
+    """Bounded least-recently-used embedding cache local to one process."""
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Vectors kept before the least recently used is evicted.
+
+        Raises:
+            ValueError: If ``max_entries`` is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors."""
+        return len(self._entries)
+
+    def get_many(self, model: str, dimension: int, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return cached vectors for *hashes*, marking each hit as recently used.
+
+        Args:
+            model: Model label the vectors were produced by.
+            dimension: Vector length.
+            hashes: Content hashes to look up.
+
+        Returns:
+            Hash to vector, for hits only.
+        """
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for content_hash in hashes:
+                key = (model, dimension, content_hash)
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[content_hash] = vector
+        return found
+
+    def put_many(self, model: str, dimension: int, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store *vectors*, evicting the least recently used beyond the bound.
+
+        Args:
+            model: Model label the vectors were produced by.
+            dimension: Vector length.
+            vectors: Content hash to vector.
+        """
+        with self._lock:
+            for content_hash, vector in vectors.items():
+                key = (model, dimension, content_hash)
+                self._entries[key] = list(vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class StoreEmbeddingCache:
+    """Embedding cache backed by a durable store's ``embedding_cache`` table.
+
+    Works against both :class:`~backend.persistence.sqlite_adapter.SQLiteStore`
+    and :class:`~backend.persistence.postgres_adapter.PostgresStore`; vectors
+    are stored as little-endian float32 bytes in either.
+    """
+
+    def __init__(self, store: Any) -> None:
+        """Initialize the cache over *store*.
+
+        Args:
+            store: Durable store whose migrations created ``embedding_cache``.
+        """
+        self._store = store
+        self._param = param_style(store)
+
+    def get_many(self, model: str, dimension: int, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """Return stored vectors for *hashes*.
+
+        Args:
+            model: Model label the vectors were produced by.
+            dimension: Vector length.
+            hashes: Content hashes to look up.
+
+        Returns:
+            Hash to vector, for hits only.
+        """
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+        if not unique:
+            return found
+        param = self._param
+        with self._store.connect() as conn:
+            for start in range(0, len(unique), _STORE_BATCH_ROWS):
+                batch = unique[start : start + _STORE_BATCH_ROWS]
+                placeholders = ", ".join([param] * len(batch))
+                rows = conn.execute(
+                    "SELECT content_hash, embedding FROM embedding_cache "
+                    f"WHERE model = {param} AND dimension = {param} "
+                    f"AND content_hash IN ({placeholders})",
+                    (model, dimension, *batch),
+                ).fetchall()
+                for content_hash, blob in rows:
+                    found[content_hash] = np.frombuffer(bytes(blob), dtype="<f4").tolist()
+        return found
+
+    def put_many(self, model: str, dimension: int, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Insert *vectors*; a hash already cached for the same key is left as is.
+
+        Args:
+            model: Model label the vectors were produced by.
+            dimension: Vector length.
+            vectors: Content hash to vector.
+        """
+        if not vectors:
+            return
+        param = self._param
+        rows = [
+            (model, dimension, content_hash, np.asarray(vector, dtype="<f4").tobytes())
+            for content_hash, vector in vectors.items()
+        ]
+        with self._store.connect() as conn:
+            conn.cursor().executemany(
+                "INSERT INTO embedding_cache (model, dimension, content_hash, embedding) "
+                f"VALUES ({param}, {param}, {param}, {param}) "
+                "ON CONFLICT (model, dimension, content_hash) DO NOTHING",
+                rows,
+            )
+            conn.commit()
+
+
+__all__ = ["EmbeddingCache", "InMemoryEmbeddingCache", "StoreEmbeddingCache"]
@@ -0,0 +1,326 @@
+"""Embedded IVF-flat vector index over a memory-mapped NumPy matrix.
+
+The local-first counterpart of the pgvector HNSW index (ADR-011): SQLite
+deployments have no ANN operator, so :mod:`backend.repository.embeddings.sqlite_store`
+keeps one :class:`LocalVectorIndex` snapshot per tenant on disk and searches
+it in-process.
+
+An IVF ("inverted file") index partitions the unit-normalized vectors into
+``nlist`` clusters around spherical k-means centroids and stores them
+cluster-contiguous, so a query scores the centroids, then only the vectors of
+the ``nprobe`` nearest clusters — a few percent of the matrix instead of all
+of it. Below :data:`_IVF_MIN_VECTORS` the index is a single cluster, i.e. an
+exact flat scan, which is already fast at that size.
+
+A snapshot is a directory of ``.npy`` files plus ``meta.json``, opened with
+``mmap_mode="r"`` so a query pages in only the clusters it probes, and
+several processes share the page cache. Snapshots are immutable: a rebuild
+writes a new directory and atomically repoints ``CURRENT`` at it.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: saves are not serialized across processes
+    fcntl = None  # type: ignore[assignment]
+
+#: Below this many vectors the index is one cluster (an exact scan).
+_IVF_MIN_VECTORS = 4096
+
+#: Bounds on the number of clusters; ``nlist`` is ``sqrt(count)`` within them.
+_MIN_LISTS = 16
+_MAX_LISTS = 4096
+
+#: k-means training: sample this many vectors per cluster, for this many rounds.
+_TRAINING_SAMPLES_PER_LIST = 64
+_KMEANS_ITERATIONS = 10
+
+#: Fraction of clusters probed per query (at least :data:`_MIN_PROBES`).
+_PROBE_FRACTION = 1 / 16
+_MIN_PROBES = 8
+
+#: Vectors assigned to centroids per matrix multiply while building, bounding
+#: the temporary ``(rows, nlist)`` score matrix.
+_ASSIGN_BATCH_ROWS = 65536
+
+_SNAPSHOT_FORMAT = 1
+_CURRENT_POINTER = "CURRENT"
+_SWAP_LOCK = ".lock"
+
+
+def normalize(vectors: Any) -> Any:
+    """Return *vectors* as float32 rows scaled to unit L2 norm (zero rows stay zero).
+
+    Args:
+        vectors: ``(n, d)`` array-like, or a single ``(d,)`` vector.
+
+    Returns:
+        A float32 ``ndarray`` of the same shape.
+    """
+    array = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    return array / np.where(norms == 0.0, 1.0, norms)
+
+
+@dataclass(frozen=True)
+class LocalVectorIndex:
+    """An immutable IVF-flat snapshot of one tenant's embeddings.
+
+    Attributes:
+        vectors: ``(count, dimension)`` unit-normalized float32 rows, stored
+            cluster-contiguous.
+        ids: ``(count,)`` int64 chunk ids, aligned with *vectors*.
+        centroids: ``(nlist, dimension)`` unit-normalized cluster centroids.
+        offsets: ``(nlist + 1,)`` int64; cluster ``i`` is
+            ``vectors[offsets[i]:offsets[i + 1]]``.
+        max_seq: Highest ``code_embeddings.seq`` folded into this snapshot;
+            rows written after it are the caller's delta.
+    """
+
+    vectors: Any
+    ids: Any
+    centroids: Any
+    offsets: Any
+    max_seq: int
+
+    @property
+    def count(self) -> int:
+        """Return the number of vectors in the snapshot."""
+        return int(self.ids.shape[0])
+
+    @property
+    def dimension(self) -> int:
+        """Return the vector dimension, ``0`` for an empty snapshot."""
+        return int(self.vectors.shape[1]) if self.vectors.ndim == 2 else 0
+
+    @classmethod
+    def build(
+        cls, ids: Any, vectors: Any, *, max_seq: int, seed: int = 0
+    ) -> LocalVectorIndex:
+        """Cluster *vectors* and return an in-memory snapshot.
+
+        Args:
+            ids: Chunk ids, one per row of *vectors*.
+            vectors: ``(count, dimension)`` raw embeddings (normalized here).
+            max_seq: Highest ``seq`` the rows cover.
+            seed: Seed for the k-means sample and initialization, so a
+                rebuild over the same rows is reproducible.
+
+        Returns:
+            The snapshot; an exact single-cluster index below
+            :data:`_IVF_MIN_VECTORS` rows.
+        """
+        id_array = np.asarray(ids, dtype=np.int64)
+        matrix = normalize(vectors)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(id_array), -1)
+        count = len(id_array)
+        if count < _IVF_MIN_VECTORS:
+            centroids = normalize(matrix.mean(axis=0, keepdims=True)) if count else matrix[:0]
+            offsets = np.array([0, count], dtype=np.int64)
+            return cls(matrix, id_array, centroids, offsets, max_seq)
+
+        nlist = min(_MAX_LISTS, max(_MIN_LISTS, int(math.sqrt(count))))
+        centroids = _train_centroids(matrix, nlist, np.random.default_rng(seed))
+        assignment = _assign(matrix, centroids)
+        order = np.argsort(assignment, kind="stable")
+        sizes = np.bincount(assignment, minlength=nlist)
+        offsets = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+        return cls(matrix[order], id_array[order], centroids, offsets, max_seq)
+
+    def search(self, query: Any, count: int, *, nprobe: int | None = None) -> list[tuple[int, float]]:
+        """Return up to *count* ``(chunk_id, cosine_distance)`` pairs nearest *query*.
+
+        Args:
+            query: ``(dimension,)`` query embedding (normalized here).
+            count: Maximum number of results.
+            nprobe: Clusters to scan; defaults to 1/16 of them (at least 8).
+                Passing the cluster count makes the search exact.
+
+        Returns:
+            Pairs ordered by ascending distance (``1 - cosine similarity``).
+        """
+        if count <= 0 or self.count == 0:
+            return []
+        unit_query = normalize(query)
+        nlist = len(self.offsets) - 1
+        probes = nprobe or max(_MIN_PROBES, math.ceil(nlist * _PROBE_FRACTION))
+        lists: Any
+        if probes >= nlist:
+            lists = range(nlist)
+        else:
+            centroid_scores = self.centroids @ unit_query
+            lists = np.argpartition(-centroid_scores, probes - 1)[:probes]
+
+        candidate_ids: list[Any] = []
+        candidate_scores: list[Any] = []
+        for cluster in lists:
+            start, end = int(self.offsets[cluster]), int(self.offsets[cluster + 1])
+            if start == end:
+                continue
+            candidate_scores.append(self.vectors[start:end] @ unit_query)
+            candidate_ids.append(self.ids[start:end])
+        if not candidate_ids:
+            return []
+        scores = np.concatenate(candidate_scores)
+        chunk_ids = np.concatenate(candidate_ids)
+        return top_k(chunk_ids, scores, count)
+
+    def save(self, root: Path) -> None:
+        """Write the snapshot under *root* and atomically make it current.
+
+        ``CURRENT`` only ever moves forward: if another writer has already
+        made a snapshot with a higher ``max_seq`` current, this one is
+        discarded instead. Snapshot directories below the current
+        ``max_seq`` are removed afterwards (a process that still has one
+        memory-mapped keeps reading it until it reloads); higher ones
+        belong to a writer that has not swapped yet and are left alone.
+
+        Args:
+            root: Per-tenant index directory (created if missing).
+        """
+        root.mkdir(parents=True, exist_ok=True)
+        name = f"snapshot-{self.max_seq}-{os.getpid()}"
+        staging = root / f".{name}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        np.save(staging / "vectors.npy", np.ascontiguousarray(self.vectors, dtype=np.float32))
+        np.save(staging / "ids.npy", np.asarray(self.ids, dtype=np.int64))
+        np.save(staging / "centroids.npy", np.asarray(self.centroids, dtype=np.float32))
+        np.save(staging / "offsets.npy", np.asarray(self.offsets, dtype=np.int64))
+        (staging / "meta.json").write_text(
+            json.dumps({"format": _SNAPSHOT_FORMAT, "max_seq": self.max_seq}), encoding="utf-8"
+        )
+        os.replace(staging, root / name)
+        with _swap_lock(root):
+            current_seq = _current_seq(root)
+            if current_seq is not None and current_seq > self.max_seq:
+                shutil.rmtree(root / name, ignore_errors=True)
+                return
+            pointer = root / f".{_CURRENT_POINTER}.{os.getpid()}.tmp"
+            pointer.write_text(name, encoding="utf-8")
+            os.replace(pointer, root / _CURRENT_POINTER)
+            for stale in root.glob("snapshot-*"):
+                seq = _snapshot_seq(stale.name)
+                if seq is not None and seq < self.max_seq:
+                    shutil.rmtree(stale, ignore_errors=True)
+
+    @classmethod
+    def load(cls, root: Path) -> LocalVectorIndex | None:
+        """Memory-map the current snapshot under *root*.
+
+        Args:
+            root: Per-tenant index directory.
+
+        Returns:
+            The snapshot, or ``None`` if there is none or it is unreadable
+            (the caller rebuilds it from the database).
+        """
+        try:
+            directory = root / (root / _CURRENT_POINTER).read_text(encoding="utf-8").strip()
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+            if meta.get("format") != _SNAPSHOT_FORMAT:
+                return None
+            return cls(
+                vectors=np.load(directory / "vectors.npy", mmap_mode="r"),
+                ids=np.load(directory / "ids.npy", mmap_mode="r"),
+                centroids=np.load(directory / "centroids.npy"),
+                offsets=np.load(directory / "offsets.npy"),
+                max_seq=int(meta["max_seq"]),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def top_k(ids: Any, scores: Any, count: int) -> list[tuple[int, float]]:
+    """Return the *count* highest-similarity ``(id, distance)`` pairs, nearest first.
+
+    Args:
+        ids: Candidate chunk ids.
+        scores: Cosine similarities aligned with *ids*.
+        count: Maximum number of pairs.
+
+    Returns:
+        Pairs ordered by ascending ``1 - similarity``.
+    """
+    if len(ids) == 0:
+        return []
+    if count < len(scores):
+        keep = np.argpartition(-scores, count - 1)[:count]
+    else:
+        keep = np.arange(len(scores))
+    keep = keep[np.argsort(-scores[keep], kind="stable")]
+    return [(int(ids[i]), float(1.0 - scores[i])) for i in keep]
+
+
+@contextmanager
+def _swap_lock(root: Path) -> Iterator[None]:
+    """Hold an exclusive lock on *root* while ``CURRENT`` is compared and swapped.
+
+    Without :mod:`fcntl` (non-POSIX) this only opens the lock file, and
+    concurrent saves from different processes may race.
+    """
+    with open(root / _SWAP_LOCK, "a", encoding="utf-8") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        yield  # closing the file releases the lock
+
+
+def _snapshot_seq(name: str) -> int | None:
+    """Return the ``max_seq`` encoded in a ``snapshot-{max_seq}-{pid}`` directory name."""
+    parts = name.split("-")
+    if len(parts) != 3 or parts[0] != "snapshot":
+        return None
+    try:
+        return int(parts[1])
+    except ValueError:
+        return None
+
+
+def _current_seq(root: Path) -> int | None:
+    """Return the ``max_seq`` of the snapshot ``CURRENT`` names, ``None`` if there is none."""
+    try:
+        return _snapshot_seq((root / _CURRENT_POINTER).read_text(encoding="utf-8").strip())
+    except OSError:
+        return None
+
+
+def _train_centroids(matrix: Any, nlist: int, rng: Any) -> Any:
+    """Spherical k-means over a sample of *matrix*; returns ``(nlist, d)`` unit centroids."""
+    sample_size = min(len(matrix), nlist * _TRAINING_SAMPLES_PER_LIST)
+    sample = matrix[rng.choice(len(matrix), size=sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        empty = np.bincount(assignment, minlength=nlist) == 0
+        # Re-seed empty clusters from random samples so every list stays usable.
+        sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+
+def _assign(matrix: Any, centroids: Any) -> Any:
+    """Return the nearest-centroid index of every row, in bounded batches."""
+    assignment = np.empty(len(matrix), dtype=np.int64)
+    for start in range(0, len(matrix), _ASSIGN_BATCH_ROWS):
+        batch = matrix[start : start + _ASSIGN_BATCH_ROWS]
+        assignment[start : start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assignment
+
+
+__all__ = ["LocalVectorIndex", "normalize", "top_k"]
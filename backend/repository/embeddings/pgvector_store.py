@@ -2,10 +2,10 @@
 
 Requires PostgreSQL with the ``vector`` extension and the ``code_embeddings``
 table (created by the migration in
-``backend/persistence/migrations/postgres_versions.py``) — there is no
-SQLite equivalent; local-first (SQLite) deployments can still run an
-:class:`~backend.repository.embeddings.provider.EmbeddingProvider` but do not
-persist vectors (see ADR-011).
+``backend/persistence/migrations/postgres_versions.py``). Local-first
+(SQLite) deployments use :mod:`backend.repository.embeddings.sqlite_store`
+instead; :mod:`backend.repository.embeddings.vector_store` picks between the
+two by connection type (see ADR-011).
 
 The ``pgvector`` Python package is an *optional* dependency, imported lazily
 exactly like ``tree_sitter``
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 from typing import Any, Sequence
 
+from backend.repository import index_generation
 from backend.repository.embeddings.provider import EmbeddingProvider
 
 try:
@@ -144,6 +145,7 @@ def upsert_embeddings(
         """,
         rows_to_write,
     )
+    index_generation.bump_generation(conn, "%s", tenant_id)
     conn.commit()
     return len(rows_to_write)
 
@@ -154,6 +156,7 @@ def query_top_k(
     *,
     tenant_id: str,
     k: int = 10,
+    language: str | None = None,
 ) -> list[tuple[int, float]]:
     """Return the *k* nearest chunk ids to *query_vector*, scoped to a tenant.
 
@@ -164,6 +167,8 @@ def query_top_k(
             when the caller has set the tenant session variable via
             :func:`backend.persistence.tenancy.set_postgres_tenant`).
         k: Maximum number of results to return.
+        language: Only consider embeddings of chunks in this language
+            (``code_chunks.language``); ``None`` searches every language.
 
     Returns:
         ``(chunk_id, distance)`` pairs ordered by ascending cosine distance
@@ -171,16 +176,30 @@ def query_top_k(
         makes this an approximate-nearest-neighbor query.
     """
     adapter_active = register_vector_adapter(conn)
-    rows = conn.execute(
-        """
-        SELECT chunk_id, embedding <=> %s::vector AS distance
-        FROM code_embeddings
-        WHERE tenant_id = %s
-        ORDER BY distance ASC
-        LIMIT %s
-        """,
-        (_vector_param(query_vector, adapter_active=adapter_active), tenant_id, k),
-    ).fetchall()
+    vector = _vector_param(query_vector, adapter_active=adapter_active)
+    if language is None:
+        rows = conn.execute(
+            """
+            SELECT chunk_id, embedding <=> %s::vector AS distance
+            FROM code_embeddings
+            WHERE tenant_id = %s
+            ORDER BY distance ASC
+            LIMIT %s
+            """,
+            (vector, tenant_id, k),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            """
+            SELECT e.chunk_id, e.embedding <=> %s::vector AS distance
+            FROM code_embeddings e
+            JOIN code_chunks c ON c.id = e.chunk_id AND c.tenant_id = e.tenant_id
+            WHERE e.tenant_id = %s AND c.language = %s
+            ORDER BY distance ASC
+            LIMIT %s
+            """,
+            (vector, tenant_id, language, k),
+        ).fetchall()
     return [(row[0], row[1]) for row in rows]
 
 
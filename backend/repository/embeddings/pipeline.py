@@ -0,0 +1,263 @@
+"""Batched, concurrent, cached embedding pipeline (an :class:`EmbeddingProvider` itself).
+
+:class:`EmbeddingPipeline` wraps any
+:class:`~backend.repository.embeddings.provider.EmbeddingProvider` and is a
+drop-in replacement for it — pass it wherever a provider is accepted
+(``upsert_embeddings``, ``retrieve``). For each :meth:`~EmbeddingPipeline.embed`
+call it:
+
+1. hashes every text (SHA-256, the digest ``code_chunks.content_hash``
+   stores) and answers what it can from an
+   :class:`~backend.repository.embeddings.cache.EmbeddingCache` keyed by
+   (model, dimension, hash);
+2. de-duplicates the misses, so identical texts are embedded once;
+3. splits them into batches bounded by text count and by an estimated token
+   count (~4 characters per token — no tokenizer dependency);
+4. runs the batches on up to ``max_concurrency`` threads, spacing provider
+   calls to at most ``max_requests_per_second``;
+5. writes every completed batch back to the cache, even when another batch
+   fails, so a retry only pays for what is still missing.
+
+:func:`get_embedding_pipeline` returns the process-wide pipeline over the
+default provider that ``GET /v2/context/retrieve`` embeds queries with; it
+caches into the durable store's ``embedding_cache`` table
+(:class:`~backend.repository.embeddings.cache.StoreEmbeddingCache`), so every
+process on that store shares one cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from backend.persistence.database import get_store
+from backend.repository.embeddings.cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    StoreEmbeddingCache,
+)
+from backend.repository.embeddings.provider import (
+    EmbeddingProvider,
+    StubEmbeddingProvider,
+)
+
+#: Rough characters-per-token heuristic for batch sizing, matching the one
+#: :mod:`backend.repository.retrieval.retriever` uses for budgets.
+_CHARS_PER_TOKEN_ESTIMATE = 4
+
+
+@dataclass
+class EmbeddingPipelineStats:
+    """Running counters for one :class:`EmbeddingPipeline`.
+
+    Attributes:
+        texts_requested: Texts passed to :meth:`EmbeddingPipeline.embed`.
+        cache_hits: Texts answered from the cache (or from a duplicate in
+            the same call).
+        texts_embedded: Distinct texts sent to the wrapped provider.
+        provider_calls: Batches sent to the wrapped provider.
+    """
+
+    texts_requested: int = 0
+    cache_hits: int = 0
+    texts_embedded: int = 0
+    provider_calls: int = 0
+
+
+class _RequestPacer:
+    """Spaces calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(self, requests_per_second: float | None) -> None:
+        """Start with no call spaced yet; ``None`` or ``0`` disables pacing."""
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may issue its request."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class EmbeddingPipeline:
+    """Cache-first, batched, concurrent front end for an :class:`EmbeddingProvider`."""
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        *,
+        model: str | None = None,
+        cache: EmbeddingCache | None = None,
+        max_batch_texts: int = 64,
+        max_batch_tokens: int = 8192,
+        max_concurrency: int = 4,
+        max_requests_per_second: float | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            provider: Provider that computes embeddings on a cache miss.
+            model: Cache namespace for *provider*'s vectors; defaults to the
+                provider's class name. Two providers must not share a label
+                unless they return identical vectors.
+            cache: Cache to consult; defaults to a new
+                :class:`~backend.repository.embeddings.cache.InMemoryEmbeddingCache`.
+            max_batch_texts: Most texts per provider call.
+            max_batch_tokens: Most estimated tokens per provider call; a
+                single longer text is still sent, alone.
+            max_concurrency: Provider calls in flight at once.
+            max_requests_per_second: Ceiling on the provider call rate, or
+                ``None`` for no limit.
+
+        Raises:
+            ValueError: If a batch bound or the concurrency is not positive,
+                or the rate is not positive.
+        """
+        if max_batch_texts <= 0 or max_batch_tokens <= 0 or max_concurrency <= 0:
+            raise ValueError("batch bounds and max_concurrency must be positive")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        self._provider = provider
+        self.model = model or type(provider).__name__
+        self._cache: EmbeddingCache = cache if cache is not None else InMemoryEmbeddingCache()
+        self._max_batch_texts = max_batch_texts
+        self._max_batch_tokens = max_batch_tokens
+        self._max_concurrency = max_concurrency
+        self._pacer = _RequestPacer(max_requests_per_second)
+        self._stats_lock = threading.Lock()
+        self.stats = EmbeddingPipelineStats()
+
+    @property
+    def dimension(self) -> int:
+        """Return the wrapped provider's vector length."""
+        return self._provider.dimension
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Return one embedding per text, calling the provider only for uncached content.
+
+        Args:
+            texts: Input strings to embed.
+
+        Returns:
+            One vector per input text, in the same order.
+
+        Raises:
+            ValueError: If the provider returns the wrong number of vectors
+                for a batch.
+            Exception: The first error any provider call raised, after the
+                batches that did succeed have been cached.
+        """
+        if not texts:
+            return []
+        dimension = self.dimension
+        hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        resolved = self._cache.get_many(self.model, dimension, hashes)
+        pending: dict[str, str] = {}
+        for content_hash, text in zip(hashes, texts):
+            if content_hash not in resolved:
+                pending.setdefault(content_hash, text)
+
+        batches = self._batches(list(pending.items()))
+        errors: list[BaseException] = []
+        if len(batches) <= 1 or self._max_concurrency == 1:
+            for batch in batches:
+                self._run_batch(batch, dimension, resolved, errors)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(batches)),
+                thread_name_prefix="embed",
+            ) as executor:
+                for batch in batches:
+                    executor.submit(self._run_batch, batch, dimension, resolved, errors)
+
+        with self._stats_lock:
+            self.stats.texts_requested += len(texts)
+            self.stats.cache_hits += len(texts) - len(pending)
+        if errors:
+            raise errors[0]
+        return [resolved[content_hash] for content_hash in hashes]
+
+    def _batches(self, items: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+        """Split ``(hash, text)`` pairs into count- and token-bounded batches, in order."""
+        batches: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
+        current_tokens = 0
+        for item in items:
+            tokens = max(1, len(item[1]) // _CHARS_PER_TOKEN_ESTIMATE)
+            if current and (
+                len(current) >= self._max_batch_texts
+                or current_tokens + tokens > self._max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _run_batch(
+        self,
+        batch: list[tuple[str, str]],
+        dimension: int,
+        resolved: dict[str, list[float]],
+        errors: list[BaseException],
+    ) -> None:
+        """Embed one batch, cache it, and merge it into *resolved*; record any error."""
+        try:
+            self._pacer.wait()
+            vectors = self._provider.embed([text for _hash, text in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"embedding provider returned {len(vectors)} vectors for {len(batch)} texts"
+                )
+            computed = {content_hash: list(vector) for (content_hash, _text), vector in zip(batch, vectors)}
+            self._cache.put_many(self.model, dimension, computed)
+        except Exception as exc:  # noqa: BLE001 - re-raised by embed() once all batches finish
+            with self._stats_lock:
+                errors.append(exc)
+            return
+        with self._stats_lock:
+            resolved.update(computed)
+            self.stats.provider_calls += 1
+            self.stats.texts_embedded += len(batch)
+
+
+# (store the pipeline caches into, pipeline)
+_pipeline_singleton: tuple[Any, EmbeddingPipeline] | None = None
+_pipeline_lock = threading.Lock()
+
+
+def get_embedding_pipeline() -> EmbeddingPipeline:
+    """Return the process-wide pipeline over the default embedding provider.
+
+    Vectors are cached in the ``embedding_cache`` table of :func:`get_store`;
+    the pipeline is rebuilt when that store changes (e.g. after
+    ``reset_store_cache``). Its model label is the provider's class name, so
+    cache keys built by
+    :func:`backend.repository.retrieval.cache.embedding_model_label` match
+    those of the bare provider.
+
+    Returns:
+        The shared :class:`EmbeddingPipeline`.
+    """
+    global _pipeline_singleton
+    store = get_store()
+    with _pipeline_lock:
+        if _pipeline_singleton is None or _pipeline_singleton[0] is not store:
+            pipeline = EmbeddingPipeline(StubEmbeddingProvider(), cache=StoreEmbeddingCache(store))
+            _pipeline_singleton = (store, pipeline)
+        return _pipeline_singleton[1]
+
+
+__all__ = ["EmbeddingPipeline", "EmbeddingPipelineStats", "get_embedding_pipeline"]
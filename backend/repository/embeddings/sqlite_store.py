@@ -0,0 +1,333 @@
+"""SQLite-backed vector store for code chunk embeddings (local-first counterpart of pgvector).
+
+Implements the :mod:`~backend.repository.embeddings.pgvector_store` contract
+— :func:`upsert_embeddings` and :func:`query_top_k` — for
+:class:`~backend.persistence.sqlite_adapter.SQLiteStore` connections, so
+hybrid retrieval works without PostgreSQL.
+
+Embeddings are persisted as float32 BLOBs in SQLite's ``code_embeddings``
+table, which stays the source of truth. Queries search a per-tenant
+:class:`~backend.repository.embeddings.local_index.LocalVectorIndex`
+snapshot, memory-mapped from ``<database file>.vectors/<tenant>/`` (or
+``$AUTODEV_VECTOR_INDEX_DIR/<tenant>/``), plus an exact scan of the rows
+written since that snapshot (``seq`` above its ``max_seq``). The snapshot is
+rebuilt only once that delta outgrows :data:`_REBUILD_MIN_DELTA_ROWS` or
+:data:`_REBUILD_DELTA_FRACTION` of the snapshot, so a burst of upserts
+during indexing costs one rebuild on the next query, not one per write.
+
+Loaded snapshots are kept per snapshot directory in a bounded LRU
+(:data:`_MAX_CACHED_SNAPSHOTS`). An in-memory database has no directory and
+no stable identity to key on, so its snapshot is built per query.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from backend.config.settings import get_settings
+from backend.repository import index_generation
+from backend.repository.embeddings.local_index import LocalVectorIndex, normalize, top_k
+from backend.repository.embeddings.provider import EmbeddingProvider
+
+#: Rebuild the snapshot once the unindexed delta exceeds this many rows...
+_REBUILD_MIN_DELTA_ROWS = 2048
+#: ...or this fraction of the snapshot, whichever is larger.
+_REBUILD_DELTA_FRACTION = 0.1
+
+#: Candidates fetched per requested result before dropping deleted or
+#: filtered-out chunks; grows 4x per retry until *k* survive.
+_OVERFETCH_FACTOR = 4
+
+_SAFE_TENANT_DIRECTORY = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+#: Snapshot directories whose loaded snapshot this process keeps.
+_MAX_CACHED_SNAPSHOTS = 64
+
+
+@dataclass
+class _SnapshotSlot:
+    """One snapshot directory's cached snapshot and the lock serializing its rebuilds."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    snapshot: LocalVectorIndex | None = None
+
+
+_slots: OrderedDict[tuple[str, str], _SnapshotSlot] = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Return *vector* as the little-endian float32 BLOB stored in ``code_embeddings``."""
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def upsert_embeddings(
+    conn: sqlite3.Connection,
+    chunk_rows: Sequence[tuple[int, str, str]],
+    provider: EmbeddingProvider,
+    *,
+    tenant_id: str,
+    model: str = "stub",
+) -> int:
+    """Embed and upsert vectors for chunks whose content hash has changed.
+
+    Same contract as :func:`backend.repository.embeddings.pgvector_store.upsert_embeddings`:
+    chunks whose stored ``content_hash`` still matches are neither
+    re-embedded nor rewritten.
+
+    Args:
+        conn: Open SQLite connection with the ``code_embeddings`` table.
+        chunk_rows: ``(chunk_id, content, content_hash)`` triples.
+        provider: Embedding provider to run over any new/changed content.
+        tenant_id: Tenant to scope embedding rows to.
+        model: Label recorded on each row identifying the provider/model used.
+
+    Returns:
+        Number of rows inserted or updated.
+    """
+    if not chunk_rows:
+        return 0
+    chunk_ids = [row[0] for row in chunk_rows]
+    existing: dict[int, str] = {}
+    for start in range(0, len(chunk_ids), 500):
+        batch = chunk_ids[start : start + 500]
+        placeholders = ", ".join("?" * len(batch))
+        existing.update(
+            (row[0], row[1])
+            for row in conn.execute(
+                "SELECT chunk_id, content_hash FROM code_embeddings "
+                f"WHERE tenant_id = ? AND chunk_id IN ({placeholders})",
+                (tenant_id, *batch),
+            ).fetchall()
+        )
+    to_embed = [row for row in chunk_rows if existing.get(row[0]) != row[2]]
+    if not to_embed:
+        return 0
+
+    vectors = provider.embed([content for _chunk_id, content, _hash in to_embed])
+    # REPLACE deletes the old row and inserts a new one, so a rewritten
+    # embedding always lands above the snapshot's max_seq.
+    conn.cursor().executemany(
+        "INSERT OR REPLACE INTO code_embeddings "
+        "(tenant_id, chunk_id, content_hash, embedding, model) VALUES (?, ?, ?, ?, ?)",
+        [
+            (tenant_id, chunk_id, content_hash, encode_vector(vector), model)
+            for (chunk_id, _content, content_hash), vector in zip(to_embed, vectors)
+        ],
+    )
+    index_generation.bump_generation(conn, "?", tenant_id)
+    conn.commit()
+    return len(to_embed)
+
+
+def query_top_k(
+    conn: sqlite3.Connection,
+    query_vector: Sequence[float],
+    *,
+    tenant_id: str,
+    k: int = 10,
+    language: str | None = None,
+) -> list[tuple[int, float]]:
+    """Return the *k* nearest live chunk ids to *query_vector*, scoped to a tenant.
+
+    Args:
+        conn: Open SQLite connection with the ``code_embeddings`` table.
+        query_vector: Embedding to search for nearest neighbors of.
+        tenant_id: Tenant to scope the search to.
+        k: Maximum number of results to return.
+        language: Only return chunks in this language (``code_chunks.language``).
+
+    Returns:
+        ``(chunk_id, distance)`` pairs ordered by ascending cosine distance,
+        matching :func:`backend.repository.embeddings.pgvector_store.query_top_k`.
+        Embeddings whose chunk has since been deleted are never returned.
+
+    Raises:
+        ValueError: If *query_vector*'s length differs from the stored embeddings'.
+    """
+    if k <= 0:
+        return []
+    latest_seq = _latest_seq(conn, tenant_id)
+    if latest_seq == 0:
+        return []
+    snapshot = _snapshot(conn, tenant_id, latest_seq)
+    query = np.asarray(query_vector, dtype=np.float32)
+    delta_ids, delta_vectors = _delta(conn, tenant_id, snapshot.max_seq, len(query))
+    if snapshot.count and snapshot.dimension != len(query):
+        raise ValueError(
+            f"query vector has dimension {len(query)}, stored embeddings have {snapshot.dimension}"
+        )
+
+    superseded = set(delta_ids.tolist())
+    delta_hits = top_k(delta_ids, normalize(delta_vectors) @ normalize(query), len(delta_ids))
+    fetch = k * _OVERFETCH_FACTOR
+    while True:
+        exhaustive = fetch >= snapshot.count
+        nprobe = len(snapshot.offsets) - 1 if exhaustive else None
+        snapshot_hits = [
+            hit
+            for hit in snapshot.search(query, fetch + len(superseded), nprobe=nprobe)
+            if hit[0] not in superseded
+        ]
+        candidates = sorted(snapshot_hits + delta_hits, key=lambda hit: hit[1])
+        live = _live_chunk_ids(conn, tenant_id, [hit[0] for hit in candidates], language)
+        results = [hit for hit in candidates if hit[0] in live][:k]
+        if len(results) >= k or exhaustive:
+            return results
+        fetch *= _OVERFETCH_FACTOR
+
+
+def _latest_seq(conn: sqlite3.Connection, tenant_id: str) -> int:
+    """Return the highest ``seq`` written for *tenant_id*, ``0`` if none."""
+    row = conn.execute(
+        "SELECT COALESCE(MAX(seq), 0) FROM code_embeddings WHERE tenant_id = ?", (tenant_id,)
+    ).fetchone()
+    return int(row[0])
+
+
+def _snapshot(conn: sqlite3.Connection, tenant_id: str, latest_seq: int) -> LocalVectorIndex:
+    """Return a snapshot for *tenant_id* whose delta to *latest_seq* is small enough to scan.
+
+    Tries, in order: this process's cached snapshot, the one on disk (another
+    process may have rebuilt it), and finally a rebuild from ``code_embeddings``.
+    """
+    root = _index_root(conn, tenant_id)
+    if root is None:
+        return _rebuild(conn, tenant_id, latest_seq)
+    slot = _slot((str(root), tenant_id))
+    with slot.lock:
+        cached = slot.snapshot
+        if cached is not None and _is_fresh(conn, tenant_id, cached, latest_seq):
+            return cached
+        on_disk = LocalVectorIndex.load(root)
+        if on_disk is not None and _is_fresh(conn, tenant_id, on_disk, latest_seq):
+            slot.snapshot = on_disk
+            return on_disk
+        rebuilt = _rebuild(conn, tenant_id, latest_seq)
+        rebuilt.save(root)
+        slot.snapshot = LocalVectorIndex.load(root) or rebuilt
+        return slot.snapshot
+
+
+def _slot(key: tuple[str, str]) -> _SnapshotSlot:
+    """Return the cache slot of a ``(directory, tenant)`` key, evicting the least recent."""
+    with _registry_lock:
+        slot = _slots.get(key)
+        if slot is None:
+            slot = _slots[key] = _SnapshotSlot()
+            while len(_slots) > _MAX_CACHED_SNAPSHOTS:
+                _slots.popitem(last=False)
+        else:
+            _slots.move_to_end(key)
+        return slot
+
+
+def _is_fresh(
+    conn: sqlite3.Connection, tenant_id: str, snapshot: LocalVectorIndex, latest_seq: int
+) -> bool:
+    """Return whether *snapshot* is usable: not ahead of the table, and with a small delta."""
+    if snapshot.max_seq > latest_seq:
+        return False  # the database was reset or restored underneath the snapshot
+    if snapshot.max_seq == latest_seq:
+        return True
+    delta_rows = conn.execute(
+        "SELECT COUNT(*) FROM code_embeddings WHERE tenant_id = ? AND seq > ?",
+        (tenant_id, snapshot.max_seq),
+    ).fetchone()[0]
+    return delta_rows <= max(_REBUILD_MIN_DELTA_ROWS, snapshot.count * _REBUILD_DELTA_FRACTION)
+
+
+def _rebuild(conn: sqlite3.Connection, tenant_id: str, latest_seq: int) -> LocalVectorIndex:
+    """Build a snapshot of every live embedding of *tenant_id* up to *latest_seq*.
+
+    Only rows whose chunk still exists are included, and only those with the
+    most recent row's dimension (a provider switch leaves the older
+    dimension behind until those chunks are re-embedded).
+    """
+    rows = conn.execute(
+        "SELECT e.chunk_id, e.embedding FROM code_embeddings e "
+        "JOIN code_chunks c ON c.id = e.chunk_id AND c.tenant_id = e.tenant_id "
+        "WHERE e.tenant_id = ? AND e.seq <= ? ORDER BY e.seq",
+        (tenant_id, latest_seq),
+    ).fetchall()
+    width = len(rows[-1][1]) if rows else 0
+    kept = [row for row in rows if len(row[1]) == width]
+    ids = np.fromiter((row[0] for row in kept), dtype=np.int64, count=len(kept))
+    vectors = np.frombuffer(b"".join(row[1] for row in kept), dtype="<f4").reshape(
+        len(kept), width // 4
+    )
+    return LocalVectorIndex.build(ids, vectors, max_seq=latest_seq)
+
+
+def _delta(
+    conn: sqlite3.Connection, tenant_id: str, after_seq: int, dimension: int
+) -> tuple[Any, Any]:
+    """Return ``(ids, vectors)`` written after *after_seq* with the query's *dimension*."""
+    rows = [
+        row
+        for row in conn.execute(
+            "SELECT chunk_id, embedding FROM code_embeddings WHERE tenant_id = ? AND seq > ?",
+            (tenant_id, after_seq),
+        ).fetchall()
+        if len(row[1]) == dimension * 4
+    ]
+    ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    vectors = np.frombuffer(b"".join(row[1] for row in rows), dtype="<f4").reshape(
+        len(rows), dimension
+    )
+    return ids, vectors
+
+
+def _live_chunk_ids(
+    conn: sqlite3.Connection, tenant_id: str, chunk_ids: list[int], language: str | None
+) -> set[int]:
+    """Return the subset of *chunk_ids* that still exist (and match *language*)."""
+    live: set[int] = set()
+    language_clause = " AND language = ?" if language else ""
+    for start in range(0, len(chunk_ids), 500):
+        batch = chunk_ids[start : start + 500]
+        placeholders = ", ".join("?" * len(batch))
+        params: tuple[Any, ...] = (tenant_id, *batch, *((language,) if language else ()))
+        live.update(
+            row[0]
+            for row in conn.execute(
+                f"SELECT id FROM code_chunks WHERE tenant_id = ? AND id IN ({placeholders})"
+                f"{language_clause}",
+                params,
+            ).fetchall()
+        )
+    return live
+
+
+def _index_root(conn: sqlite3.Connection, tenant_id: str) -> Path | None:
+    """Return the per-tenant snapshot directory, or ``None`` for an in-memory database.
+
+    ``Settings.autodev_vector_index_dir`` (``AUTODEV_VECTOR_INDEX_DIR``)
+    overrides the default of a ``.vectors`` directory next to the database
+    file.
+    """
+    override = get_settings().autodev_vector_index_dir
+    if override:
+        base = Path(override)
+    else:
+        database_file = next(
+            (row[2] for row in conn.execute("PRAGMA database_list").fetchall() if row[1] == "main"),
+            "",
+        )
+        if not database_file:
+            return None
+        base = Path(f"{database_file}.vectors")
+    directory = tenant_id if _SAFE_TENANT_DIRECTORY.match(tenant_id) else tenant_id.encode().hex()
+    return base / directory
+
+
+__all__ = ["encode_vector", "query_top_k", "upsert_embeddings"]
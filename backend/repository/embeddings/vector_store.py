@@ -0,0 +1,55 @@
+"""Backend-agnostic entry points for storing and searching chunk embeddings.
+
+Routes :func:`upsert_embeddings` / :func:`query_top_k` to
+:mod:`~backend.repository.embeddings.sqlite_store` for a ``sqlite3``
+connection and to :mod:`~backend.repository.embeddings.pgvector_store` for
+anything else (a psycopg connection), so callers such as
+:func:`backend.repository.retrieval.retriever.retrieve` work unchanged
+against either durable store.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence
+from typing import Any
+
+from backend.repository.embeddings import pgvector_store, sqlite_store
+from backend.repository.embeddings.provider import EmbeddingProvider
+
+
+def upsert_embeddings(
+    conn: Any,
+    chunk_rows: Sequence[tuple[int, str, str]],
+    provider: EmbeddingProvider,
+    *,
+    tenant_id: str,
+    model: str = "stub",
+) -> int:
+    """Embed and upsert vectors for changed chunks on whichever backend *conn* belongs to.
+
+    See :func:`backend.repository.embeddings.pgvector_store.upsert_embeddings`
+    for the contract.
+    """
+    backend = sqlite_store if isinstance(conn, sqlite3.Connection) else pgvector_store
+    return backend.upsert_embeddings(conn, chunk_rows, provider, tenant_id=tenant_id, model=model)
+
+
+def query_top_k(
+    conn: Any,
+    query_vector: Sequence[float],
+    *,
+    tenant_id: str,
+    k: int = 10,
+    language: str | None = None,
+) -> list[tuple[int, float]]:
+    """Return the *k* nearest chunk ids to *query_vector* on whichever backend *conn* belongs to.
+
+    See :func:`backend.repository.embeddings.pgvector_store.query_top_k`
+    for the contract.
+    """
+    backend = sqlite_store if isinstance(conn, sqlite3.Connection) else pgvector_store
+    return backend.query_top_k(conn, query_vector, tenant_id=tenant_id, k=k, language=language)
+
+
+__all__ = ["query_top_k", "upsert_embeddings"]
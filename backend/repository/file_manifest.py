@@ -0,0 +1,256 @@
+"""Per-file fingerprint manifest for incremental indexing.
+
+Each indexed file has one ``code_index_files`` row per tenant and repository
+root recording its ``os.stat`` fingerprint (size, ``mtime_ns``, inode), the
+SHA-256 of its whole content, and the
+:func:`~backend.repository.chunking.chunker_version` it was chunked under.
+:func:`backend.repository.indexing.index` compares a fresh ``stat`` of every
+walked file against the manifest of the root it walks, so only files whose
+fingerprint moved are read and parsed; a file whose ``stat`` moved but whose
+content hash did not (e.g. a ``touch`` or a branch switch and back) is
+re-fingerprinted without being chunked again. A row recorded under another
+chunker version never counts as unchanged, so upgrading the chunker or a
+grammar re-chunks every file once.
+
+Rows are scoped by repository root because stored paths are relative to it:
+indexing one checkout must never treat another checkout's files as vanished.
+
+The helpers here take an already-open connection and never commit — the
+caller writes manifest rows in the same transaction as the chunks they
+describe, so the two can never disagree after a crash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from backend.repository.chunking import chunker_version
+
+#: Manifest paths looked up per ``IN (...)`` query, well under SQLite's
+#: default bound-parameter limit.
+_LOOKUP_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    """The stat fingerprint and content hash recorded for one indexed file.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number (``0`` where the platform does not report one).
+        file_hash: SHA-256 hex digest of the file's raw bytes.
+        chunker_version: Chunker version the file was last chunked under;
+            empty for a fingerprint not read from the manifest.
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+    file_hash: str
+    chunker_version: str = ""
+
+    @property
+    def current(self) -> bool:
+        """Whether the file was chunked by the running chunker and grammars."""
+        return self.chunker_version == chunker_version()
+
+    @property
+    def stat_key(self) -> tuple[int, int, int]:
+        """Return the ``(size, mtime_ns, inode)`` triple compared during a tree diff."""
+        return (self.size, self.mtime_ns, self.inode)
+
+
+def stat_key(result: os.stat_result) -> tuple[int, int, int]:
+    """Return the ``(size, mtime_ns, inode)`` triple for a ``stat`` result.
+
+    Args:
+        result: Output of ``os.stat`` / ``Path.stat``.
+
+    Returns:
+        The triple compared against :attr:`FileFingerprint.stat_key`.
+    """
+    return (result.st_size, result.st_mtime_ns, result.st_ino)
+
+
+def fingerprint(result: os.stat_result, data: bytes) -> FileFingerprint:
+    """Build a :class:`FileFingerprint` from a ``stat`` taken before reading *data*.
+
+    The ``stat`` must precede the read: a write landing in between then
+    leaves a stale fingerprint, which the next diff sees as moved and
+    re-reads, instead of a fresh fingerprint next to stale content.
+
+    Args:
+        result: ``stat`` of the file taken before it was read.
+        data: The file's raw bytes.
+
+    Returns:
+        The fingerprint to record for the file.
+    """
+    return FileFingerprint(
+        size=result.st_size,
+        mtime_ns=result.st_mtime_ns,
+        inode=result.st_ino,
+        file_hash=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def load_manifest(
+    conn: Any,
+    param: str,
+    tenant_id: str,
+    repo_root: str,
+    paths: Iterable[str] | None = None,
+) -> dict[str, FileFingerprint]:
+    """Return the fingerprints recorded for *repo_root*, keyed by stored file path.
+
+    Args:
+        conn: Open connection.
+        param: SQL placeholder style for *conn* (``"?"`` or ``"%s"``).
+        tenant_id: Tenant whose manifest is read.
+        repo_root: Resolved repository root the paths are relative to.
+        paths: Restrict the lookup to these stored paths; ``None`` reads the
+            root's whole manifest (one row per indexed file).
+
+    Returns:
+        Mapping of stored path to its recorded :class:`FileFingerprint`.
+    """
+    select = (
+        "SELECT file_path, size, mtime_ns, inode, file_hash, chunker_version "
+        f"FROM code_index_files WHERE tenant_id = {param} AND repo_root = {param}"
+    )
+    if paths is None:
+        rows = conn.execute(select, (tenant_id, repo_root)).fetchall()
+    else:
+        wanted = list(dict.fromkeys(paths))
+        rows = []
+        for start in range(0, len(wanted), _LOOKUP_BATCH_SIZE):
+            batch = wanted[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join([param] * len(batch))
+            rows.extend(
+                conn.execute(
+                    f"{select} AND file_path IN ({placeholders})",
+                    (tenant_id, repo_root, *batch),
+                ).fetchall()
+            )
+    return {
+        row[0]: FileFingerprint(
+            size=int(row[1]),
+            mtime_ns=int(row[2]),
+            inode=int(row[3]),
+            file_hash=row[4],
+            chunker_version=row[5],
+        )
+        for row in rows
+    }
+
+
+def record_fingerprints(
+    conn: Any,
+    param: str,
+    tenant_id: str,
+    repo_root: str,
+    entries: list[tuple[str, FileFingerprint]],
+) -> None:
+    """Upsert manifest rows for *entries* in one ``executemany`` batch.
+
+    Every row is stamped with the running :func:`chunker_version`.
+
+    Args:
+        conn: Open connection from the caller's batch (not committed here).
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant to scope the rows to.
+        repo_root: Resolved repository root the paths are relative to.
+        entries: ``(stored_path, fingerprint)`` pairs to record.
+    """
+    if not entries:
+        return
+    version = chunker_version()
+    conn.cursor().executemany(
+        f"""
+        INSERT INTO code_index_files
+            (tenant_id, repo_root, file_path, size, mtime_ns, inode, file_hash,
+             chunker_version)
+        VALUES ({param}, {param}, {param}, {param}, {param}, {param}, {param}, {param})
+        ON CONFLICT(tenant_id, repo_root, file_path) DO UPDATE SET
+            size = excluded.size,
+            mtime_ns = excluded.mtime_ns,
+            inode = excluded.inode,
+            file_hash = excluded.file_hash,
+            chunker_version = excluded.chunker_version,
+            indexed_at = CURRENT_TIMESTAMP
+        """,
+        [
+            (
+                tenant_id,
+                repo_root,
+                path,
+                recorded.size,
+                recorded.mtime_ns,
+                recorded.inode,
+                recorded.file_hash,
+                version,
+            )
+            for path, recorded in entries
+        ],
+    )
+
+
+def forget_files(
+    conn: Any, param: str, tenant_id: str, repo_root: str, paths: list[str]
+) -> None:
+    """Delete the manifest rows for files that vanished from disk.
+
+    Args:
+        conn: Open connection from the caller's batch (not committed here).
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant the rows are scoped to.
+        repo_root: Resolved repository root the paths are relative to.
+        paths: Stored paths to forget.
+    """
+    if not paths:
+        return
+    conn.cursor().executemany(
+        f"DELETE FROM code_index_files WHERE tenant_id = {param} "
+        f"AND repo_root = {param} AND file_path = {param}",
+        [(tenant_id, repo_root, path) for path in paths],
+    )
+
+
+def move_file(
+    conn: Any, param: str, tenant_id: str, repo_root: str, old_path: str, new_path: str
+) -> None:
+    """Re-point *old_path*'s manifest row at *new_path* (a rename).
+
+    Any row already recorded for *new_path* is dropped first.
+
+    Args:
+        conn: Open connection (not committed here).
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant the rows are scoped to.
+        repo_root: Resolved repository root the paths are relative to.
+        old_path: Stored path before the rename.
+        new_path: Stored path after the rename.
+    """
+    scope = f"tenant_id = {param} AND repo_root = {param} AND file_path = {param}"
+    conn.execute(
+        f"DELETE FROM code_index_files WHERE {scope}", (tenant_id, repo_root, new_path)
+    )
+    conn.execute(
+        f"UPDATE code_index_files SET file_path = {param} WHERE {scope}",
+        (new_path, tenant_id, repo_root, old_path),
+    )
+
+
+__all__ = [
+    "FileFingerprint",
+    "fingerprint",
+    "forget_files",
+    "load_manifest",
+    "move_file",
+    "record_fingerprints",
+    "stat_key",
+]
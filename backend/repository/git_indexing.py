@@ -0,0 +1,374 @@
+"""Git-aware incremental indexing driven by commit diffs.
+
+:func:`index_commit_range` reindexes exactly the files listed by
+``git diff --name-status`` between two commits instead of walking the tree,
+so post-merge reindexing costs work proportional to the diff. Renames are
+applied as chunk *moves* — the stored rows (and therefore their ids and any
+``code_embeddings`` hanging off them) are re-pointed at the new path before
+the new path is reindexed, so an unmodified rename writes zero chunk rows.
+
+The last commit indexed per tenant and repository is kept in
+``code_index_commits`` and is the default diff base; with no recorded base
+the first call falls back to a full :func:`~backend.repository.indexing.index`.
+Files are read from the working tree, so *head* is expected to be the
+checked-out commit (the default, ``HEAD``).
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.jobs.queue import get_queue, register_handler
+from backend.observability.tracing import trace_indexing
+from backend.persistence.database import get_store
+from backend.persistence.tenancy import DEFAULT_TENANT_ID
+from backend.repository import file_manifest, index_generation, indexing, source_files
+
+#: Upper bound on one ``git`` invocation; a diff that takes longer than this
+#: is better served by a full walk.
+_GIT_TIMEOUT_SECONDS = 60
+
+
+class GitDiffError(RuntimeError):
+    """Raised when ``git`` is unavailable or rejects a revision or repository."""
+
+
+@dataclass(frozen=True, slots=True)
+class GitChange:
+    """One entry of ``git diff --name-status`` output.
+
+    Attributes:
+        status: Single-letter status (``A``, ``M``, ``D``, ``R``, ``C``, ``T``),
+            with any similarity score stripped.
+        path: Repository-relative path after the change.
+        old_path: Path before a rename or copy; ``None`` otherwise.
+    """
+
+    status: str
+    path: str
+    old_path: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CommitIndexResult:
+    """Outcome of :func:`index_commit_range`.
+
+    Attributes:
+        base: Commit diffed from, or ``None`` when a full index ran instead.
+        head: Commit now recorded as last indexed.
+        files_reindexed: Paths passed to :func:`~backend.repository.indexing.reindex`
+            (added, modified, renamed-to, and deleted paths).
+        files_renamed: Renames applied as chunk moves.
+        chunks_written: Chunk rows inserted or updated.
+    """
+
+    base: str | None
+    head: str
+    files_reindexed: int
+    files_renamed: int
+    chunks_written: int
+
+
+def resolve_commit(repo_root: str | Path, revision: str) -> str:
+    """Resolve *revision* to a full commit SHA.
+
+    Args:
+        repo_root: Directory inside the repository.
+        revision: Any revision ``git rev-parse`` accepts (``HEAD``, a branch, a SHA).
+
+    Returns:
+        The 40-character (or 64 for SHA-256 repositories) commit id.
+
+    Raises:
+        GitDiffError: If git fails or *revision* is not a commit.
+    """
+    return _run_git(repo_root, "rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}").strip()
+
+
+def diff_name_status(repo_root: str | Path, base: str, head: str) -> list[GitChange]:
+    """List the files that changed between *base* and *head*, with rename detection.
+
+    Paths are relative to *repo_root* (``--relative``), matching the stored
+    paths :func:`~backend.repository.indexing.index` records when called on
+    the same root; changes outside it are omitted.
+
+    Args:
+        repo_root: Directory inside the repository the index is rooted at.
+        base: Commit to diff from.
+        head: Commit to diff to.
+
+    Returns:
+        One :class:`GitChange` per changed path, in git's output order.
+
+    Raises:
+        GitDiffError: If git fails.
+    """
+    output = _run_git(
+        repo_root, "diff", "--name-status", "--find-renames", "--relative", "-z", base, head
+    )
+    tokens = output.split("\0")
+    changes: list[GitChange] = []
+    position = 0
+    while position < len(tokens) and tokens[position]:
+        status = tokens[position][0]
+        if status in ("R", "C"):
+            changes.append(GitChange(status, tokens[position + 2], tokens[position + 1]))
+            position += 3
+        else:
+            changes.append(GitChange(status, tokens[position + 1]))
+            position += 2
+    return changes
+
+
+def index_commit_range(
+    repo_root: str | Path,
+    *,
+    base: str | None = None,
+    head: str = "HEAD",
+    tenant_id: str = DEFAULT_TENANT_ID,
+    store: Any | None = None,
+    repo_key: str | None = None,
+    workers: int | None = None,
+) -> CommitIndexResult:
+    """Reindex the files changed between two commits and record *head* as indexed.
+
+    Args:
+        repo_root: Repository root the index is scoped to.
+        base: Commit to diff from; defaults to the last commit recorded for
+            (*tenant_id*, *repo_key*). With neither, a full index runs.
+        head: Commit to diff to; must be checked out, since files are read
+            from the working tree.
+        tenant_id: Tenant to scope persisted chunks to.
+        store: Durable store to persist into; defaults to :func:`get_store`.
+        repo_key: Key the last indexed commit is stored under; defaults to
+            the resolved *repo_root* path.
+        workers: Chunking worker processes (see
+            :func:`~backend.repository.indexing.reindex`).
+
+    Returns:
+        What was reindexed, and the commit now recorded.
+
+    Raises:
+        GitDiffError: If git fails or a revision does not resolve.
+    """
+    active_store = store if store is not None else get_store()
+    param = index_generation.param_style(active_store)
+    root = Path(repo_root).resolve()
+    key = repo_key or str(root)
+    head_sha = resolve_commit(root, head)
+    if base is None:
+        base = last_indexed_commit(key, tenant_id=tenant_id, store=active_store)
+    if base is None:
+        written = indexing.index(root, tenant_id=tenant_id, store=active_store, workers=workers)
+        _record_commit(active_store, param, tenant_id, key, head_sha)
+        return CommitIndexResult(None, head_sha, 0, 0, written)
+
+    base_sha = resolve_commit(root, base)
+    with trace_indexing("index_commits", tenant_id=tenant_id) as measurements:
+        changes = diff_name_status(root, base_sha, head_sha)
+        paths: list[str] = []
+        moves: list[tuple[str, str]] = []
+        for change in changes:
+            old_indexed = change.old_path is not None and source_files.is_indexed_path(
+                change.old_path
+            )
+            if change.status == "R" and change.old_path is not None and old_indexed:
+                if source_files.is_indexed_path(change.path):
+                    moves.append((change.old_path, change.path))
+                else:
+                    paths.append(change.old_path)
+            if source_files.is_indexed_path(change.path):
+                paths.append(change.path)
+        if moves:
+            with active_store.connect() as conn:
+                for old_path, new_path in moves:
+                    _move_file(conn, param, tenant_id, root, old_path, new_path)
+                index_generation.bump_generation(conn, param, tenant_id)
+                conn.commit()
+        paths = list(dict.fromkeys(paths))
+        measurements.file_count = len(paths)
+        written = indexing.reindex(
+            paths, repo_root=root, tenant_id=tenant_id, store=active_store, workers=workers
+        )
+        measurements.chunks_written = written
+        _record_commit(active_store, param, tenant_id, key, head_sha)
+    return CommitIndexResult(base_sha, head_sha, len(paths), len(moves), written)
+
+
+def last_indexed_commit(
+    repo_key: str, *, tenant_id: str = DEFAULT_TENANT_ID, store: Any | None = None
+) -> str | None:
+    """Return the last commit recorded by :func:`index_commit_range`, if any.
+
+    Args:
+        repo_key: Repository key the commit was stored under.
+        tenant_id: Tenant the index belongs to.
+        store: Durable store; defaults to :func:`get_store`.
+
+    Returns:
+        The recorded commit SHA, or ``None`` when the repository was never
+        indexed by commit range.
+    """
+    active_store = store if store is not None else get_store()
+    param = index_generation.param_style(active_store)
+    with active_store.connect() as conn:
+        row = conn.execute(
+            f"SELECT commit_sha FROM code_index_commits "
+            f"WHERE tenant_id = {param} AND repo_key = {param}",
+            (tenant_id, repo_key),
+        ).fetchone()
+    return str(row[0]) if row else None
+
+
+@register_handler("repo.index.reindex_commits")
+def _handle_reindex_commits_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """Job handler: reindex one commit range as a single batched job.
+
+    Args:
+        payload: ``{"repo_root": str, "tenant_id": str, "base": str | None,
+            "head": str}`` as built by :func:`enqueue_commit_range`.
+
+    Returns:
+        ``{"base", "head", "files_reindexed", "files_renamed", "chunks_written"}``.
+    """
+    result = index_commit_range(
+        payload.get("repo_root", "."),
+        base=payload.get("base"),
+        head=payload.get("head", "HEAD"),
+        tenant_id=payload.get("tenant_id", DEFAULT_TENANT_ID),
+    )
+    return {
+        "base": result.base,
+        "head": result.head,
+        "files_reindexed": result.files_reindexed,
+        "files_renamed": result.files_renamed,
+        "chunks_written": result.chunks_written,
+    }
+
+
+def enqueue_commit_range(
+    *,
+    repo_root: str | Path = ".",
+    base: str | None = None,
+    head: str = "HEAD",
+    tenant_id: str = DEFAULT_TENANT_ID,
+) -> str:
+    """Enqueue one job reindexing every file changed between *base* and *head*.
+
+    Intended for a post-merge hook or CI step: however many files the merge
+    touched, it is one job and one batched :func:`~backend.repository.indexing.reindex`.
+    Enqueuing the same range again while its job is still pending returns
+    that job's id.
+
+    Args:
+        repo_root: Repository root the index is scoped to.
+        base: Commit to diff from; ``None`` uses the last indexed commit.
+        head: Commit to diff to.
+        tenant_id: Tenant to scope the reindex to.
+
+    Returns:
+        The job id returned by the active queue's ``enqueue``.
+    """
+    return get_queue().enqueue(
+        "repo.index.reindex_commits",
+        {"repo_root": str(repo_root), "base": base, "head": head, "tenant_id": tenant_id},
+        priority="low",
+        dedup_key=f"repo.index.reindex_commits:{tenant_id}:{repo_root}:{base}:{head}",
+    )
+
+
+def _move_file(
+    conn: Any, param: str, tenant_id: str, root: Path, old_path: str, new_path: str
+) -> None:
+    """Re-point *old_path*'s stored chunks and manifest row at *new_path*.
+
+    Anything already stored under *new_path* is dropped first so the move
+    cannot collide with the unique keys; the reindex that follows then diffs
+    the moved rows against the file's current content.
+
+    Args:
+        conn: Open connection (not committed here).
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant the rows are scoped to.
+        root: Resolved repository root the stored paths are relative to.
+        old_path: Stored path before the rename.
+        new_path: Stored path after the rename.
+    """
+    conn.execute(
+        f"DELETE FROM code_chunks WHERE tenant_id = {param} AND file_path = {param}",
+        (tenant_id, new_path),
+    )
+    conn.execute(
+        f"UPDATE code_chunks SET file_path = {param} "
+        f"WHERE tenant_id = {param} AND file_path = {param}",
+        (new_path, tenant_id, old_path),
+    )
+    file_manifest.move_file(conn, param, tenant_id, str(root), old_path, new_path)
+
+
+def _record_commit(store: Any, param: str, tenant_id: str, repo_key: str, commit_sha: str) -> None:
+    """Upsert *commit_sha* as the last commit indexed for (*tenant_id*, *repo_key*).
+
+    Args:
+        store: Durable store.
+        param: SQL placeholder style for *store*.
+        tenant_id: Tenant the index belongs to.
+        repo_key: Repository key.
+        commit_sha: Commit to record.
+    """
+    with store.connect() as conn:
+        conn.execute(
+            f"""
+            INSERT INTO code_index_commits (tenant_id, repo_key, commit_sha)
+            VALUES ({param}, {param}, {param})
+            ON CONFLICT(tenant_id, repo_key) DO UPDATE SET
+                commit_sha = excluded.commit_sha,
+                indexed_at = CURRENT_TIMESTAMP
+            """,
+            (tenant_id, repo_key, commit_sha),
+        )
+        conn.commit()
+
+
+def _run_git(repo_root: str | Path, *args: str) -> str:
+    """Run ``git -C repo_root <args>`` and return its stdout.
+
+    Args:
+        repo_root: Directory to run git in.
+        *args: Git subcommand and arguments.
+
+    Returns:
+        Decoded standard output.
+
+    Raises:
+        GitDiffError: If git is missing, times out, or exits non-zero. The
+            error carries git's exit status, not its stderr, which can echo
+            repository paths.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_root), *args],
+            capture_output=True,
+            check=False,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        raise GitDiffError(f"git {args[0]} could not run: {type(exc).__name__}") from exc
+    if result.returncode != 0:
+        raise GitDiffError(f"git {args[0]} exited with status {result.returncode}")
+    return result.stdout.decode("utf-8", errors="surrogateescape")
+
+
+__all__ = [
+    "CommitIndexResult",
+    "GitChange",
+    "GitDiffError",
+    "diff_name_status",
+    "enqueue_commit_range",
+    "index_commit_range",
+    "last_indexed_commit",
+    "resolve_commit",
+]
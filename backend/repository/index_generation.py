@@ -0,0 +1,75 @@
+"""Per-tenant index generation counter.
+
+``code_index_generations`` holds one monotonically increasing integer per
+tenant. Every write that can change what retrieval returns — chunk upserts
+and deletes (:mod:`backend.repository.indexing`), rename moves
+(:mod:`backend.repository.git_indexing`), and embedding upserts
+(:mod:`backend.repository.embeddings`) — calls :func:`bump_generation` on
+the connection doing the write, before it commits. Caches key their entries
+on :func:`current_generation`
+(:class:`backend.repository.retrieval.cache.RetrievalCache`), so a commit
+that changes the index makes every older entry unreachable at once, in
+every process, without enumerating or deleting them.
+
+Like :mod:`backend.repository.file_manifest`, the helpers take an open
+connection and never commit. :func:`param_for` and :func:`param_style`
+give the placeholder style for a connection or a store, for the other
+index modules too.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+
+def param_for(conn: Any) -> str:
+    """Return the SQL placeholder style for *conn* (``?`` for SQLite, else ``%s``)."""
+    return "?" if isinstance(conn, sqlite3.Connection) else "%s"
+
+
+def param_style(store: Any) -> str:
+    """Return the SQL placeholder style for *store*'s connections, from its ``database_url``."""
+    url = str(getattr(store, "database_url", ""))
+    return "%s" if url.startswith(("postgresql://", "postgres://")) else "?"
+
+
+def bump_generation(conn: Any, param: str, tenant_id: str) -> None:
+    """Increment *tenant_id*'s index generation (not committed here).
+
+    Args:
+        conn: Open connection carrying the index write.
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant whose index changed.
+    """
+    conn.execute(
+        f"""
+        INSERT INTO code_index_generations (tenant_id, generation)
+        VALUES ({param}, 1)
+        ON CONFLICT(tenant_id) DO UPDATE SET
+            generation = code_index_generations.generation + 1,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        (tenant_id,),
+    )
+
+
+def current_generation(conn: Any, param: str, tenant_id: str) -> int:
+    """Return *tenant_id*'s index generation, ``0`` if its index was never written.
+
+    Args:
+        conn: Open connection.
+        param: SQL placeholder style for *conn*.
+        tenant_id: Tenant to look up.
+
+    Returns:
+        The current generation.
+    """
+    row = conn.execute(
+        f"SELECT generation FROM code_index_generations WHERE tenant_id = {param}",
+        (tenant_id,),
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+__all__ = ["bump_generation", "current_generation", "param_for", "param_style"]
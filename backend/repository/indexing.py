@@ -1,19 +1,37 @@
 """Repository indexing pipeline (E7-S1-T3/T4).
 
-``index(repo_path)`` walks a repository, chunks every source file via
-:mod:`backend.repository.chunking`, and persists chunk metadata (file path,
-span, symbol, content hash) into the active durable store's ``code_chunks``
+``index(repo_path)`` walks a repository, chunks every source file whose
+extension is in :data:`~backend.repository.chunking.LANGUAGE_BY_EXTENSION`
+via :mod:`backend.repository.chunking`, and persists chunk metadata (file
+path, span, symbol, content hash, language) into the active durable store's ``code_chunks``
 table (created by the migrations in
 ``backend/persistence/migrations/versions.py`` /
 ``postgres_versions.py``). ``reindex(paths)`` recomputes chunks for specific
 files only and diffs by content hash so unchanged chunks are not rewritten —
 the incremental-reindexing contract a ``repo.file.changed`` event handler
 needs (:func:`enqueue_file_changed` registers the job type that drives it).
+
+Both entry points keep the per-tenant fingerprint manifest
+(:mod:`backend.repository.file_manifest`) in step with ``code_chunks``, which
+lets :func:`index` diff a tree by ``stat`` alone: only files whose fingerprint
+moved are read, and files that vanished since the last run have their chunks
+deleted.
+
+Every batch that re-chunks or drops a file also bumps the tenant's index
+generation (:mod:`backend.repository.index_generation`) in the same
+transaction, invalidating cached retrieval results.
+
+Both entry points accept a ``workers`` count (default
+``AUTODEV_INDEX_WORKERS``, else ``1``): above one, the read/chunk stage
+(:mod:`backend.repository.chunk_stage`) fans out over a bounded process pool
+while the single database writer keeps consuming finished batches of
+``_REINDEX_BATCH_SIZE`` files in submission order.
 """
 
 from __future__ import annotations
 
-import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -21,46 +39,78 @@ from backend.jobs.queue import get_queue, register_handler
 from backend.observability.tracing import trace_indexing
 from backend.persistence.database import get_store
 from backend.persistence.tenancy import DEFAULT_TENANT_ID
-from backend.repository.chunking import Chunk, chunk_source
-
-#: Source file extensions walked by :func:`index`. Scoped to Python for
-#: E7-S1 (see ``backend/repository/providers/treesitter_provider.py``).
-_INDEXED_EXTENSIONS = {".py"}
+from backend.repository import file_manifest, index_generation, source_files
+from backend.repository.chunk_stage import chunk_batches, resolve_worker_count
+from backend.repository.chunking import Chunk
+from backend.repository.file_manifest import FileFingerprint
 
 #: Files reindexed per connection/transaction (E45-S5) — bounds how long a
 #: single transaction stays open while still batching far more than one
 #: statement per file.
 _REINDEX_BATCH_SIZE = 200
 
-_IGNORED_DIRECTORIES = {
-    ".git",
-    ".venv",
-    "__pycache__",
-    "node_modules",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".ruff_cache",
-}
+#: How long a ``repo.index.reindex_file`` job waits for further changed files
+#: to coalesce with it before the batch is reindexed.
+_REINDEX_COALESCE_WINDOW_SECONDS = 0.5
 
 
-def index(repo_path: str | Path, *, tenant_id: str = DEFAULT_TENANT_ID, store: Any | None = None) -> int:
+def index(
+    repo_path: str | Path,
+    *,
+    tenant_id: str = DEFAULT_TENANT_ID,
+    store: Any | None = None,
+    workers: int | None = None,
+) -> int:
     """Index every source file under *repo_path*, persisting chunk metadata.
 
+    Each walked file is ``stat``-ed and compared with the fingerprint
+    manifest recorded for this tenant and root; a file whose size,
+    ``mtime_ns``, and inode all match, and that was chunked by the running
+    chunker version, is skipped without being read. Files recorded in the
+    root's manifest but no longer on disk have their chunks deleted. A no-op reindex therefore
+    costs one directory walk plus one manifest read.
+
     Args:
         repo_path: Root directory to walk.
         tenant_id: Tenant to scope persisted chunks to.
         store: Durable store to persist into; defaults to :func:`get_store`.
+        workers: Chunking worker processes (see :func:`reindex`).
 
     Returns:
         Total number of chunk rows written (inserted or updated) across every
         file — unchanged chunks (same file/symbol/span with an identical
         content hash) are not counted.
     """
+    active_store = store if store is not None else get_store()
+    param = index_generation.param_style(active_store)
     with trace_indexing("index", tenant_id=tenant_id) as measurements:
         root = Path(repo_path).resolve()
-        files = [str(path) for path in _iter_source_files(root)]
-        measurements.file_count = len(files)
-        written = reindex(files, repo_root=root, tenant_id=tenant_id, store=store)
+        walked: dict[str, tuple[str, tuple[int, int, int]]] = {}
+        for path in source_files.iter_source_files(root):
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            key = file_manifest.stat_key(stat_result)
+            walked[_relative_path(path, root)] = (str(path), key)
+        measurements.file_count = len(walked)
+        with active_store.connect() as conn:
+            manifest = file_manifest.load_manifest(conn, param, tenant_id, str(root))
+
+        targets: list[tuple[str, str | None]] = []
+        for relative, (absolute, key) in walked.items():
+            known = manifest.get(relative)
+            if known is None or not known.current:
+                targets.append((absolute, None))
+            elif known.stat_key != key:
+                targets.append((absolute, known.file_hash))
+        measurements.files_skipped = len(walked) - len(targets)
+        vanished = sorted(manifest.keys() - walked.keys())
+        targets.extend((str(root / relative), None) for relative in vanished)
+
+        written = _reindex(
+            targets, root=root, tenant_id=tenant_id, store=active_store, workers=workers
+        )
         measurements.chunks_written = written
         return written
 
@@ -71,13 +121,16 @@ def reindex(
     repo_root: Path | None = None,
     tenant_id: str = DEFAULT_TENANT_ID,
     store: Any | None = None,
+    workers: int | None = None,
 ) -> int:
     """Recompute chunks for specific files and persist only changed ones.
 
     A chunk unchanged since the last run (same file path, symbol, start
     line, and content hash already stored) is left untouched. A chunk that no
     longer exists for a file (e.g. a removed function, or the file itself
-    was deleted) is deleted from the store.
+    was deleted) is deleted from the store. Every named file is re-read and
+    re-chunked regardless of its recorded fingerprint, which is refreshed (or
+    forgotten, for a deleted file) in the same transaction.
 
     Args:
         paths: File paths to reindex (absolute, or relative to *repo_root*).
@@ -85,59 +138,177 @@ def reindex(
             defaults to the current working directory.
         tenant_id: Tenant to scope persisted chunks to.
         store: Durable store to persist into; defaults to :func:`get_store`.
+        workers: Number of processes reading and chunking files in parallel;
+            defaults to ``AUTODEV_INDEX_WORKERS`` (else ``1``, fully serial)
+            and is capped at the CPU count (see
+            :func:`~backend.repository.chunk_stage.resolve_worker_count`).
+            Persistence stays on the calling thread either way.
 
     Returns:
         Number of chunk rows written (inserted or updated); unchanged rows do
         not count.
     """
     active_store = store if store is not None else get_store()
-    param = _param_style(active_store)
     root = (repo_root or Path.cwd()).resolve()
-    path_list = list(paths)
+    targets: list[tuple[str, str | None]] = [(raw_path, None) for raw_path in paths]
+    return _reindex(targets, root=root, tenant_id=tenant_id, store=active_store, workers=workers)
+
+
+def _reindex(
+    targets: list[tuple[str, str | None]],
+    *,
+    root: Path,
+    tenant_id: str,
+    store: Any,
+    workers: int | None,
+) -> int:
+    """Chunk and persist *targets*, traced as one ``reindex`` operation.
+
+    Args:
+        targets: ``(path, known_file_hash)`` pairs; a file whose content
+            still hashes to ``known_file_hash`` is re-fingerprinted without
+            being chunked. ``None`` always chunks.
+        root: Resolved repository root.
+        tenant_id: Tenant to scope persisted rows to.
+        store: Durable store to persist into.
+        workers: Requested chunking worker count (see :func:`reindex`).
+
+    Returns:
+        Number of chunk rows written (inserted or updated).
+    """
+    param = index_generation.param_style(store)
+    worker_count = resolve_worker_count(workers, len(targets))
     written = 0
     with trace_indexing("reindex", tenant_id=tenant_id) as measurements:
-        for batch_start in range(0, len(path_list), _REINDEX_BATCH_SIZE):
-            batch = path_list[batch_start : batch_start + _REINDEX_BATCH_SIZE]
-            with active_store.connect() as conn:
-                for raw_path in batch:
-                    measurements.file_count += 1
-                    candidate = Path(raw_path)
-                    absolute = candidate if candidate.is_absolute() else (root / candidate)
-                    relative = _relative_path(absolute, root)
-                    if not absolute.is_file():
-                        measurements.chunks_deleted += _delete_chunks_for_file(
-                            conn, param, relative, tenant_id
+        measurements.worker_count = worker_count
+        pool = ProcessPoolExecutor(max_workers=worker_count) if worker_count > 1 else None
+        try:
+            items = _resolve_targets(targets, root)
+            for batch in chunk_batches(items, _REINDEX_BATCH_SIZE, pool):
+                started = time.perf_counter()
+                fingerprints: list[tuple[str, FileFingerprint]] = []
+                vanished: list[str] = []
+                rechunked = False
+                with store.connect() as conn:
+                    for chunked in batch:
+                        measurements.file_count += 1
+                        measurements.chunk_seconds += chunked.seconds
+                        if chunked.fingerprint is None:
+                            vanished.append(chunked.relative_path)
+                            measurements.chunks_deleted += _delete_chunks_for_file(
+                                conn, param, chunked.relative_path, tenant_id
+                            )
+                            continue
+                        fingerprints.append((chunked.relative_path, chunked.fingerprint))
+                        if chunked.chunks is None:
+                            measurements.files_skipped += 1
+                            continue
+                        measurements.chunks_produced += len(chunked.chunks)
+                        rechunked = True
+                        written += _persist_chunks(
+                            conn, param, chunked.relative_path, chunked.chunks, tenant_id
                         )
-                        continue
-                    code = absolute.read_text(encoding="utf-8", errors="replace")
-                    chunks = chunk_source(relative, code, "python")
-                    written += _persist_chunks(conn, param, relative, chunks, tenant_id)
-                conn.commit()
+                    file_manifest.record_fingerprints(
+                        conn, param, tenant_id, str(root), fingerprints
+                    )
+                    file_manifest.forget_files(conn, param, tenant_id, str(root), vanished)
+                    if rechunked or vanished:
+                        index_generation.bump_generation(conn, param, tenant_id)
+                    conn.commit()
+                measurements.persist_seconds += time.perf_counter() - started
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
         measurements.chunks_written = written
     return written
 
 
-@register_handler("repo.index.reindex_file")
-def _handle_reindex_file_job(payload: dict[str, Any]) -> dict[str, Any]:
-    """Job handler: reindex a single file's chunks (E7-S1-T3).
+@register_handler(
+    "repo.index.reindex_file",
+    batch_size=_REINDEX_BATCH_SIZE,
+    batch_window_seconds=_REINDEX_COALESCE_WINDOW_SECONDS,
+)
+def _handle_reindex_file_job(
+    payloads: list[dict[str, Any]] | dict[str, Any],
+) -> dict[str, Any]:
+    """Job handler: reindex a coalesced batch of single-file changes (E7-S1-T3).
 
     Registered against :func:`backend.jobs.queue.register_handler` so a
     ``repo.file.changed`` event handler can drive incremental reindexing by
     calling :func:`enqueue_file_changed`, without the event handler itself
-    needing to know how chunking/persistence works.
+    needing to know how chunking/persistence works. The handler is
+    batch-capable: changes enqueued within
+    ``_REINDEX_COALESCE_WINDOW_SECONDS`` of each other arrive together and
+    cost one :func:`reindex` call per ``(repo_root, tenant_id)``, with
+    repeated paths reindexed once.
 
     Args:
-        payload: ``{"path": str, "repo_root": str, "tenant_id": str}`` as
-            built by :func:`enqueue_file_changed`.
+        payloads: ``{"path": str, "repo_root": str, "tenant_id": str}``
+            dicts as built by :func:`enqueue_file_changed`; a single dict
+            (a job queued before the handler was batch-capable) is treated
+            as a batch of one.
 
     Returns:
-        ``{"path": ..., "chunks_written": int}``.
+        ``{"file_count": int, "chunks_written": int}``.
     """
-    path = payload["path"]
+    if isinstance(payloads, dict):
+        payloads = [payloads]
+    groups: dict[tuple[str, str], dict[str, None]] = {}
+    for payload in payloads:
+        scope = (payload.get("repo_root", "."), payload.get("tenant_id", DEFAULT_TENANT_ID))
+        groups.setdefault(scope, {})[str(payload["path"])] = None
+    written = sum(
+        reindex(list(paths), repo_root=Path(repo_root), tenant_id=tenant_id)
+        for (repo_root, tenant_id), paths in groups.items()
+    )
+    return {"file_count": sum(len(paths) for paths in groups.values()), "chunks_written": written}
+
+
+@register_handler("repo.index.reindex_files")
+def _handle_reindex_files_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """Job handler: reindex several changed files in one batched pass.
+
+    The batched sibling of :func:`_handle_reindex_file_job`: one job, one
+    :func:`reindex` call, and one transaction per ``_REINDEX_BATCH_SIZE``
+    files, instead of one of each per file.
+
+    Args:
+        payload: ``{"paths": list[str], "repo_root": str, "tenant_id": str}``
+            as built by :func:`enqueue_files_changed`.
+
+    Returns:
+        ``{"file_count": int, "chunks_written": int}``.
+    """
+    paths = [str(path) for path in payload["paths"]]
     repo_root = Path(payload.get("repo_root", "."))
     tenant_id = payload.get("tenant_id", DEFAULT_TENANT_ID)
-    written = reindex([path], repo_root=repo_root, tenant_id=tenant_id)
-    return {"path": path, "chunks_written": written}
+    written = reindex(paths, repo_root=repo_root, tenant_id=tenant_id)
+    return {"file_count": len(paths), "chunks_written": written}
+
+
+def enqueue_files_changed(
+    paths: Iterable[str], *, repo_root: str | Path = ".", tenant_id: str = DEFAULT_TENANT_ID
+) -> str:
+    """Enqueue one batched reindex job covering several changed files.
+
+    Args:
+        paths: Paths of the files that changed (duplicates are dropped).
+        repo_root: Root used to resolve each path and compute its stored relative path.
+        tenant_id: Tenant to scope the reindex to.
+
+    Returns:
+        The job id returned by the active queue's ``enqueue``.
+    """
+    queue = get_queue()
+    return queue.enqueue(
+        "repo.index.reindex_files",
+        {
+            "paths": list(dict.fromkeys(str(path) for path in paths)),
+            "repo_root": str(repo_root),
+            "tenant_id": tenant_id,
+        },
+        priority="low",
+    )
 
 
 def enqueue_file_changed(
@@ -145,7 +316,9 @@ def enqueue_file_changed(
 ) -> str:
     """Enqueue incremental reindexing for a single changed file (E7-S1-T3).
 
-    Intended to be called from a ``repo.file.changed`` event handler.
+    Intended to be called from a ``repo.file.changed`` event handler. Calls
+    made in quick succession (a save storm, a checkout) coalesce into one
+    batched job, so they share its id.
 
     Args:
         path: Path of the file that changed.
@@ -160,6 +333,7 @@ def enqueue_file_changed(
     return queue.enqueue(
         "repo.index.reindex_file",
         {"path": str(path), "repo_root": str(repo_root), "tenant_id": tenant_id},
+        priority="low",
     )
 
 
@@ -168,12 +342,6 @@ def enqueue_file_changed(
 # ---------------------------------------------------------------------------
 
 
-def _param_style(store: Any) -> str:
-    """Return the SQL placeholder style for *store*'s underlying connection."""
-    url = str(getattr(store, "database_url", ""))
-    return "%s" if url.startswith(("postgresql://", "postgres://")) else "?"
-
-
 def _persist_chunks(conn: Any, param: str, file_path: str, chunks: list[Chunk], tenant_id: str) -> int:
     """Upsert *chunks* for *file_path* on an already-open connection.
 
@@ -186,7 +354,8 @@ def _persist_chunks(conn: Any, param: str, file_path: str, chunks: list[Chunk],
 
     Args:
         conn: Open connection from the caller's batch (not committed here).
-        param: SQL placeholder style for *conn* (see :func:`_param_style`).
+        param: SQL placeholder style for *conn* (see
+            :func:`~backend.repository.index_generation.param_style`).
         file_path: Stored (relative) path the chunks belong to.
         chunks: Freshly computed chunks for *file_path*.
         tenant_id: Tenant to scope persisted rows to.
@@ -214,12 +383,14 @@ def _persist_chunks(conn: Any, param: str, file_path: str, chunks: list[Chunk],
         conn.cursor().executemany(
             f"""
             INSERT INTO code_chunks
-                (tenant_id, file_path, symbol, start_line, end_line, content_hash, content)
-            VALUES ({param}, {param}, {param}, {param}, {param}, {param}, {param})
+                (tenant_id, file_path, symbol, start_line, end_line, content_hash, content,
+                 language)
+            VALUES ({param}, {param}, {param}, {param}, {param}, {param}, {param}, {param})
             ON CONFLICT(tenant_id, file_path, symbol, start_line) DO UPDATE SET
                 end_line = excluded.end_line,
                 content_hash = excluded.content_hash,
                 content = excluded.content,
+                language = excluded.language,
                 indexed_at = CURRENT_TIMESTAMP
             """,
             [
@@ -231,6 +402,7 @@ def _persist_chunks(conn: Any, param: str, file_path: str, chunks: list[Chunk],
                     chunk.end_line,
                     chunk.content_hash,
                     chunk.content,
+                    chunk.language,
                 )
                 for chunk in to_upsert
             ],
@@ -251,7 +423,8 @@ def _delete_chunks_for_file(conn: Any, param: str, file_path: str, tenant_id: st
 
     Args:
         conn: Open connection from the caller's batch (not committed here).
-        param: SQL placeholder style for *conn* (see :func:`_param_style`).
+        param: SQL placeholder style for *conn* (see
+            :func:`~backend.repository.index_generation.param_style`).
         file_path: Repository-relative path whose chunks are removed.
         tenant_id: Tenant the chunks are scoped to.
 
@@ -267,21 +440,26 @@ def _delete_chunks_for_file(conn: Any, param: str, file_path: str, tenant_id: st
     return rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
 
 
-def _iter_source_files(root: Path) -> Iterable[Path]:
-    """Stream every indexable source file under *root*, pruning ignored directories.
+def _resolve_targets(
+    targets: list[tuple[str, str | None]], root: Path
+) -> list[tuple[str, str, str | None]]:
+    """Resolve ``(path, known_hash)`` targets to ``(absolute, stored, known_hash)`` triples.
 
-    Uses ``os.walk`` with in-place ``dirnames`` pruning (E45-S5) so an
-    ignored directory (``.venv``, ``node_modules``, ...) is never descended
-    into at all — unlike ``sorted(root.rglob("*"))``, which materializes and
-    sorts the full recursive listing (including ignored subtrees) before
-    filtering.
+    Args:
+        targets: Paths (absolute, or relative to *root*) with their recorded
+            whole-file hash, if any.
+        root: Resolved repository root.
+
+    Returns:
+        One triple per target, in input order, as
+        :func:`~backend.repository.chunk_stage.read_and_chunk` takes them.
     """
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRECTORIES)
-        for filename in sorted(filenames):
-            path = Path(dirpath) / filename
-            if path.suffix in _INDEXED_EXTENSIONS:
-                yield path
+    resolved = []
+    for raw_path, known_hash in targets:
+        candidate = Path(raw_path)
+        absolute = candidate if candidate.is_absolute() else (root / candidate)
+        resolved.append((str(absolute), _relative_path(absolute, root), known_hash))
+    return resolved
 
 
 def _relative_path(path: Path, root: Path) -> str:
@@ -292,4 +470,4 @@ def _relative_path(path: Path, root: Path) -> str:
         return str(path)
 
 
-__all__ = ["enqueue_file_changed", "index", "reindex"]
+__all__ = ["enqueue_file_changed", "enqueue_files_changed", "index", "reindex"]
@@ -1,20 +1,30 @@
 """Tree-sitter symbol extractor with a config-driven language registry (E7-S1).
 
-Real tree-sitter parsing is implemented for Python via
-:data:`_LANGUAGE_REGISTRY` below — the grammar package is already vendored
-(``tree-sitter-python`` in ``backend/requirements.txt``). Adding another
-language later is a one-line registry entry (loader + node-type vocabulary),
-not a redesign; no other languages are wired in yet by design (scoped to
-Python for E7-S1).
+Real tree-sitter parsing is implemented for every language in
+:data:`_LANGUAGE_REGISTRY` below — Python, TypeScript/TSX, JavaScript, Go,
+and HCL (Terraform), each backed by its grammar package in
+``backend/requirements.txt``. Adding another language is a registry entry
+(loader + node-type vocabulary) plus an extension mapping in
+:data:`backend.repository.chunking.LANGUAGE_BY_EXTENSION`, not a redesign.
+
+Grammars load lazily, once per process: :func:`_load_language` caches each
+``Language`` (or the fact that its grammar package is missing), so a
+repository walk touching thousands of files of one language builds its
+grammar once, and a missing grammar costs one failed import, not one per file.
 
 Degrades gracefully to :class:`LexicalProvider` when ``tree_sitter`` is not
-installed, the requested language has no registry entry, or parsing itself
-raises for any reason — a parse failure must never abort a caller's batch.
+installed, the requested language has no registry entry or grammar package,
+or parsing itself raises for any reason — a parse failure must never abort a
+caller's batch.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable
+import functools
+import importlib.metadata
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from backend.repository.providers.lexical_provider import LexicalProvider
 from backend.repository.providers.symbol_span import SymbolSpan
@@ -41,26 +51,223 @@ def _load_python_language() -> Any:
     return tree_sitter.Language(tree_sitter_python.language())
 
 
+def _load_typescript_language() -> Any:
+    """Build the tree-sitter ``Language`` for TypeScript (``.ts``).
+
+    Raises:
+        ImportError: If ``tree_sitter_typescript`` is not installed.
+    """
+    import tree_sitter_typescript  # type: ignore[import-untyped]
+
+    return tree_sitter.Language(tree_sitter_typescript.language_typescript())
+
+
+def _load_tsx_language() -> Any:
+    """Build the tree-sitter ``Language`` for TSX (``.tsx``), shipped with the TypeScript grammar.
+
+    Raises:
+        ImportError: If ``tree_sitter_typescript`` is not installed.
+    """
+    import tree_sitter_typescript  # type: ignore[import-untyped]
+
+    return tree_sitter.Language(tree_sitter_typescript.language_tsx())
+
+
+def _load_javascript_language() -> Any:
+    """Build the tree-sitter ``Language`` for JavaScript (including JSX).
+
+    Raises:
+        ImportError: If ``tree_sitter_javascript`` is not installed.
+    """
+    import tree_sitter_javascript  # type: ignore[import-untyped]
+
+    return tree_sitter.Language(tree_sitter_javascript.language())
+
+
+def _load_go_language() -> Any:
+    """Build the tree-sitter ``Language`` for Go.
+
+    Raises:
+        ImportError: If ``tree_sitter_go`` is not installed.
+    """
+    import tree_sitter_go  # type: ignore[import-untyped]
+
+    return tree_sitter.Language(tree_sitter_go.language())
+
+
+def _load_hcl_language() -> Any:
+    """Build the tree-sitter ``Language`` for HCL (Terraform ``.tf`` files).
+
+    Raises:
+        ImportError: If ``tree_sitter_hcl`` is not installed.
+    """
+    import tree_sitter_hcl  # type: ignore[import-untyped]
+
+    return tree_sitter.Language(tree_sitter_hcl.language())
+
+
 #: Registry mapping a language name to a zero-arg loader returning its
 #: tree-sitter ``Language``. Add a new language by adding one entry here
-#: (plus its grammar package to ``backend/requirements.txt`` and an entry in
-#: ``_DEFINITION_NODE_TYPES``/``_IMPORT_NODE_TYPES`` below) — no other code
-#: needs to change.
+#: (plus its grammar package to ``backend/requirements.txt``, an entry in
+#: ``_DEFINITION_NODE_TYPES``/``_IMPORT_NODE_TYPES`` below, and its file
+#: extensions in :data:`backend.repository.chunking.LANGUAGE_BY_EXTENSION`).
 _LANGUAGE_REGISTRY: dict[str, Callable[[], Any]] = {
     "python": _load_python_language,
+    "typescript": _load_typescript_language,
+    "tsx": _load_tsx_language,
+    "javascript": _load_javascript_language,
+    "go": _load_go_language,
+    "hcl": _load_hcl_language,
+}
+
+#: Distributions whose versions decide what :meth:`TreeSitterProvider.extract_symbol_spans`
+#: returns: the runtime plus every grammar package in :data:`_LANGUAGE_REGISTRY`.
+_GRAMMAR_DISTRIBUTIONS = (
+    "tree-sitter",
+    "tree-sitter-python",
+    "tree-sitter-typescript",
+    "tree-sitter-javascript",
+    "tree-sitter-go",
+    "tree-sitter-hcl",
+)
+
+_TYPESCRIPT_DEFINITIONS = {
+    "function_declaration": "function",
+    "generator_function_declaration": "function",
+    "class_declaration": "class",
+    "abstract_class_declaration": "class",
+    "method_definition": "method",
+    "interface_declaration": "interface",
+    "type_alias_declaration": "type",
+    "enum_declaration": "enum",
 }
 
-#: Node types treated as function/class definitions, per language, mapped to
-#: the symbol ``kind`` recorded on their :class:`SymbolSpan`.
+#: Node types treated as definitions, per language, mapped to the symbol
+#: ``kind`` recorded on their :class:`SymbolSpan`.
 _DEFINITION_NODE_TYPES: dict[str, dict[str, str]] = {
     "python": {"function_definition": "function", "class_definition": "class"},
+    "typescript": _TYPESCRIPT_DEFINITIONS,
+    "tsx": _TYPESCRIPT_DEFINITIONS,
+    "javascript": {
+        "function_declaration": "function",
+        "generator_function_declaration": "function",
+        "class_declaration": "class",
+        "method_definition": "method",
+    },
+    "go": {
+        "function_declaration": "function",
+        "method_declaration": "method",
+        "type_spec": "type",
+    },
+    "hcl": {"block": "block"},
 }
 
 #: Node types treated as import statements, per language.
 _IMPORT_NODE_TYPES: dict[str, set[str]] = {
     "python": {"import_statement", "import_from_statement"},
+    "typescript": {"import_statement"},
+    "tsx": {"import_statement"},
+    "javascript": {"import_statement"},
+    "go": {"import_spec"},
 }
 
+#: Child node types of an import node that carry the imported name, per
+#: language (string literals are recorded without their quotes).
+_IMPORT_NAME_NODE_TYPES: dict[str, set[str]] = {
+    "python": {"dotted_name", "identifier", "aliased_import"},
+    "typescript": {"string"},
+    "tsx": {"string"},
+    "javascript": {"string"},
+    "go": {"interpreted_string_literal", "raw_string_literal"},
+}
+
+#: Languages whose definitions are not descended into: a Terraform block's
+#: nested blocks (``ingress``, ``lifecycle``, ...) are attributes of the
+#: resource, not symbols of their own.
+_TOP_LEVEL_DEFINITIONS_ONLY = {"hcl"}
+
+
+@functools.cache
+def _load_language(language: str) -> Any | None:
+    """Return the cached tree-sitter ``Language`` for *language*, loading it on first use.
+
+    The result — including ``None`` for a missing grammar package — is
+    cached for the life of the process and shared by every provider.
+
+    Args:
+        language: Registry key (e.g. ``"go"``).
+
+    Returns:
+        The ``Language``, or ``None`` if tree-sitter or the grammar is unavailable.
+    """
+    loader = _LANGUAGE_REGISTRY.get(language)
+    if not _TREE_SITTER_AVAILABLE or loader is None:
+        return None
+    try:
+        return loader()
+    except Exception:
+        return None
+
+
+@functools.cache
+def grammar_versions() -> tuple[tuple[str, str], ...]:
+    """Return the installed version of tree-sitter and each grammar package.
+
+    A missing package is reported as ``"missing"``: the provider then falls
+    back to lexical spans, which chunk differently too.
+
+    Returns:
+        ``(distribution, version)`` pairs in :data:`_GRAMMAR_DISTRIBUTIONS` order.
+    """
+    versions = []
+    for distribution in _GRAMMAR_DISTRIBUTIONS:
+        try:
+            versions.append((distribution, importlib.metadata.version(distribution)))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append((distribution, "missing"))
+    return tuple(versions)
+
+
+def _node_text(source_bytes: bytes, node: Any) -> str:
+    """Return the decoded source text covered by *node*."""
+    return source_bytes[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+
+
+def _definition_name(node: Any, source_bytes: bytes) -> str:
+    """Return the symbol name of a definition node.
+
+    Most grammars expose a ``name`` field. HCL blocks do not, so a block's
+    name is its type plus its labels, dot-joined (``resource.aws_s3_bucket.logs``).
+
+    Args:
+        node: Definition node.
+        source_bytes: UTF-8 source the node was parsed from.
+
+    Returns:
+        The name, or ``""`` if the node carries none.
+    """
+    name_node = node.child_by_field_name("name")
+    if name_node is not None:
+        return _node_text(source_bytes, name_node)
+    if node.type == "block":
+        parts = [
+            _node_text(source_bytes, child).strip('"')
+            for child in node.children
+            if child.type in ("identifier", "string_lit")
+        ]
+        return ".".join(parts)
+    return ""
+
+
+@dataclass(frozen=True, slots=True)
+class _Vocabulary:
+    """Per-language node-type vocabulary consulted while walking one parse tree."""
+
+    definition_kinds: dict[str, str]
+    import_types: set[str]
+    import_name_types: set[str]
+    descend_into_definitions: bool
+
 
 class TreeSitterProvider:
     """Extract symbols (and their spans) via tree-sitter; fall back to lexical."""
@@ -68,7 +275,7 @@ class TreeSitterProvider:
     def __init__(self) -> None:
         """Initialize the provider, lazily building a ``Parser`` per language on first use."""
         self._fallback = LexicalProvider()
-        self._parsers: dict[str, Any] = {}
+        self._parsers: dict[str, Any | None] = {}
         self._available = _TREE_SITTER_AVAILABLE
 
     def extract_symbols(self, code: str, language: str) -> list[str]:
@@ -132,36 +339,33 @@ class TreeSitterProvider:
         Returns:
             A ``(spans, import_names)`` pair, both in source order.
         """
-        definition_kinds = _DEFINITION_NODE_TYPES.get(language, {})
-        import_types = _IMPORT_NODE_TYPES.get(language, set())
+        vocabulary = _Vocabulary(
+            definition_kinds=_DEFINITION_NODE_TYPES.get(language, {}),
+            import_types=_IMPORT_NODE_TYPES.get(language, set()),
+            import_name_types=_IMPORT_NAME_NODE_TYPES.get(language, set()),
+            descend_into_definitions=language not in _TOP_LEVEL_DEFINITIONS_ONLY,
+        )
         source_bytes = code.encode("utf-8")
         tree = parser.parse(source_bytes)
         spans: list[SymbolSpan] = []
         imports: list[str] = []
-        self._walk(tree.root_node, definition_kinds, import_types, source_bytes, spans, imports)
+        self._walk(tree.root_node, vocabulary, source_bytes, spans, imports)
         return spans, imports
 
     def _walk(
         self,
         node: Any,
-        definition_kinds: dict[str, str],
-        import_types: set[str],
+        vocabulary: _Vocabulary,
         source_bytes: bytes,
         spans: list[SymbolSpan],
         imports: list[str],
     ) -> None:
         """Recursively visit *node*, appending definition spans and import names in place."""
-        kind = definition_kinds.get(node.type)
+        kind = vocabulary.definition_kinds.get(node.type)
         if kind is not None:
-            name_node = node.child_by_field_name("name")
-            name = (
-                source_bytes[name_node.start_byte:name_node.end_byte].decode("utf-8", errors="replace")
-                if name_node is not None
-                else ""
-            )
             spans.append(
                 SymbolSpan(
-                    name=name,
+                    name=_definition_name(node, source_bytes),
                     kind=kind,
                     start_line=node.start_point[0],
                     end_line=node.end_point[0],
@@ -169,26 +373,25 @@ class TreeSitterProvider:
                     end_byte=node.end_byte,
                 )
             )
-        elif node.type in import_types:
+            if not vocabulary.descend_into_definitions:
+                return
+        elif node.type in vocabulary.import_types:
             for child in node.children:
-                if child.type in ("dotted_name", "identifier", "aliased_import"):
-                    imports.append(
-                        source_bytes[child.start_byte:child.end_byte].decode("utf-8", errors="replace")
-                    )
+                if child.type in vocabulary.import_name_types:
+                    imports.append(_node_text(source_bytes, child).strip("\"'`"))
         for child in node.children:
-            self._walk(child, definition_kinds, import_types, source_bytes, spans, imports)
+            self._walk(child, vocabulary, source_bytes, spans, imports)
 
     def _get_parser(self, language: str) -> Any | None:
         """Return a cached tree-sitter ``Parser`` for *language*, or ``None`` if unavailable."""
-        if not self._available or language not in _LANGUAGE_REGISTRY:
+        if not self._available:
             return None
         if language not in self._parsers:
-            try:
-                ts_language = _LANGUAGE_REGISTRY[language]()
-                self._parsers[language] = tree_sitter.Parser(ts_language)
-            except Exception:
-                return None
+            ts_language = _load_language(language)
+            self._parsers[language] = (
+                tree_sitter.Parser(ts_language) if ts_language is not None else None
+            )
         return self._parsers[language]
 
 
-__all__ = ["TreeSitterProvider"]
+__all__ = ["TreeSitterProvider", "grammar_versions"]
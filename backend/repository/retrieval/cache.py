@@ -0,0 +1,173 @@
+"""Retrieval result and query-embedding caches for :func:`~backend.repository.retrieval.retriever.retrieve`.
+
+Agents repeat near-identical retrieval queries many times per run. A
+:class:`RetrievalCache` sits on the shared cache backend
+(:func:`backend.coordination.redis.get_cache` — Redis when configured, else
+a bounded in-process LRU) and holds two kinds of entry:
+
+* **Results**, keyed by tenant, query, mode, filters, limit, budget, fusion
+  settings, embedding model and the tenant's index generation
+  (:mod:`backend.repository.index_generation`). Any write to the index
+  bumps the generation, so stale results are never served; they simply
+  stop being addressed and age out by TTL/LRU.
+* **Query vectors**, keyed by embedding model, dimension and query text.
+  They do not depend on the index, so they survive reindexing and let a
+  repeated query skip ``provider.embed`` even after its results were
+  invalidated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from backend.config.settings import get_settings
+from backend.coordination.redis import get_cache
+from backend.repository.embeddings.provider import EmbeddingProvider
+
+_RESULTS_NAMESPACE = "retrieval:results"
+_QUERY_VECTOR_NAMESPACE = "retrieval:query-vectors"
+
+#: Result lifetime of a directly constructed :class:`RetrievalCache`; the
+#: process-wide one reads ``autodev_retrieval_cache_ttl_seconds`` instead.
+_DEFAULT_TTL_SECONDS = 300.0
+
+#: Query vectors do not go stale with the index, so they are kept longer.
+_QUERY_VECTOR_TTL_FACTOR = 12
+
+
+def embedding_model_label(provider: EmbeddingProvider) -> str:
+    """Return the label identifying *provider*'s vectors in cache keys.
+
+    Uses the provider's ``model`` attribute when it has one (as
+    :class:`~backend.repository.embeddings.pipeline.EmbeddingPipeline`
+    does), else its class name.
+    """
+    return str(getattr(provider, "model", None) or type(provider).__name__)
+
+
+class RetrievalCache:
+    """Result and query-vector cache over a :mod:`backend.coordination.redis` cache backend."""
+
+    def __init__(self, backend: Any, *, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: A ``LocalCache`` or ``RedisCache`` (anything with
+                ``get(namespace, key)`` / ``set(namespace, key, value, ttl_seconds=)``).
+            ttl_seconds: Lifetime of a cached result; query vectors live
+                :data:`_QUERY_VECTOR_TTL_FACTOR` times longer.
+
+        Raises:
+            ValueError: If ``ttl_seconds`` is not positive.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+
+    def get_results(self, key: str) -> list[dict[str, Any]] | None:
+        """Return the snippet fields cached under *key* (see :func:`results_key`), if any."""
+        raw = self._backend.get(_RESULTS_NAMESPACE, key)
+        return None if raw is None else json.loads(raw)
+
+    def put_results(self, key: str, snippets: Sequence[dict[str, Any]]) -> None:
+        """Cache *snippets* (one JSON-serializable field mapping each) under *key*."""
+        payload = json.dumps(list(snippets)).encode("utf-8")
+        self._backend.set(_RESULTS_NAMESPACE, key, payload, ttl_seconds=self._ttl_seconds)
+
+    def query_vector(self, provider: EmbeddingProvider, query: str) -> list[float]:
+        """Return *provider*'s embedding of *query*, embedding it only on a miss.
+
+        Args:
+            provider: Provider that embeds the query on a miss.
+            query: Query text.
+
+        Returns:
+            The query vector (float32 precision when served from the cache).
+        """
+        key = _digest([embedding_model_label(provider), provider.dimension, query])
+        raw = self._backend.get(_QUERY_VECTOR_NAMESPACE, key)
+        if raw is not None:
+            return np.frombuffer(raw, dtype="<f4").tolist()
+        vector = provider.embed([query])[0]
+        self._backend.set(
+            _QUERY_VECTOR_NAMESPACE,
+            key,
+            np.asarray(vector, dtype="<f4").tobytes(),
+            ttl_seconds=self._ttl_seconds * _QUERY_VECTOR_TTL_FACTOR,
+        )
+        return list(vector)
+
+
+def results_key(*, tenant_id: str, generation: int, **request: Any) -> str:
+    """Build the result-cache key for one retrieval request.
+
+    Args:
+        tenant_id: Tenant the request is scoped to.
+        generation: The tenant's current index generation.
+        **request: Every other input that can change the result (query,
+            mode, filters, limit, budget, fusion settings, embedding model).
+
+    Returns:
+        A hex digest; the full request never appears in the backend.
+    """
+    return _digest([tenant_id, generation, sorted(request.items())])
+
+
+def _digest(parts: list[Any]) -> str:
+    """Return a SHA-256 hex digest of *parts*' canonical JSON form."""
+    return hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+
+_cache_singleton: RetrievalCache | None = None
+_cache_built = False
+_cache_lock = threading.Lock()
+
+
+def get_retrieval_cache() -> RetrievalCache | None:
+    """Return the process-wide retrieval cache, or ``None`` when disabled.
+
+    ``Settings.autodev_retrieval_cache_ttl_seconds`` sets the result
+    lifetime (``0`` disables caching);
+    ``Settings.autodev_retrieval_cache_max_entries`` bounds the in-process
+    fallback. The backend comes from
+    :func:`~backend.coordination.redis.get_cache`.
+
+    Returns:
+        The shared :class:`RetrievalCache`, or ``None``.
+    """
+    global _cache_singleton, _cache_built
+    with _cache_lock:
+        if not _cache_built:
+            settings = get_settings()
+            ttl = settings.autodev_retrieval_cache_ttl_seconds
+            max_entries = settings.autodev_retrieval_cache_max_entries
+            _cache_singleton = (
+                RetrievalCache(get_cache(max_entries=max_entries), ttl_seconds=ttl)
+                if ttl > 0
+                else None
+            )
+            _cache_built = True
+        return _cache_singleton
+
+
+def _reset_retrieval_cache() -> None:
+    """Test helper — forget the singleton so the next call rebuilds it."""
+    global _cache_singleton, _cache_built
+    with _cache_lock:
+        _cache_singleton = None
+        _cache_built = False
+
+
+__all__ = [
+    "RetrievalCache",
+    "embedding_model_label",
+    "get_retrieval_cache",
+    "results_key",
+]
@@ -1,17 +1,35 @@
 """Lexical retrieval over ``code_chunks`` via PostgreSQL full-text search (E7-S3-T1).
 
-Uses ``to_tsvector('english', content)`` / ``plainto_tsquery`` and
-``ts_rank``, backed by the GIN index added in
-``backend/persistence/migrations/postgres_versions.py`` — no separate stored
-tsvector column in this slice (an expression index is sufficient for this
-story's scope; a generated stored column is a natural follow-up if lexical
-query volume grows). Postgres-only, matching the rest of the E7-S1/S2 schema.
+Matches and ranks against the stored ``code_chunks.search_vector`` column
+(see ``pg_add_search_vector_to_code_chunks`` in
+``backend/persistence/migrations/code_index_versions/lexical.py``), so
+neither the GIN-indexed ``@@`` filter nor ``ts_rank`` re-tokenizes chunk
+content at query time. The vector is code-aware: identifiers are indexed both verbatim
+and split at ``snake_case``/``camelCase`` boundaries, and the query is split
+the same way by ``code_identifier_split``. Symbol hits (weight ``A``)
+outrank file-path hits (``B``), which outrank body hits (``D``).
+
+On a ``sqlite3`` connection (local-first deployments) the same contract is
+served by SQLite FTS5 over ``code_chunks_fts`` (see ``create_code_chunks_fts``
+in ``code_index_versions/lexical.py``), ranked by ``bm25`` with the same
+symbol > path > body column weighting.
 """
 
 from __future__ import annotations
 
+import re
+import sqlite3
 from typing import Any
 
+#: ``ts_rank`` weights for ``{D, C, B, A}``: body, (unused), file path, symbol.
+_RANK_WEIGHTS = "{0.1, 0.2, 0.4, 1.0}"
+
+#: FTS5 ``bm25`` weights for the ``(symbol, file_path, content)`` columns,
+#: mirroring the A/B/D ratio of :data:`_RANK_WEIGHTS`.
+_FTS5_COLUMN_WEIGHTS = (10.0, 4.0, 1.0)
+
+_QUERY_TERM = re.compile(r"\w+")
+
 
 def search(
     conn: Any,
@@ -21,6 +39,7 @@ def search(
     limit: int = 10,
     path_prefix: str | None = None,
     symbol: str | None = None,
+    language: str | None = None,
 ) -> list[tuple[int, float]]:
     """Return the top matching chunk ids for *query*, ranked by ``ts_rank``.
 
@@ -31,31 +50,86 @@ def search(
         limit: Maximum number of results to return.
         path_prefix: Optional ``file_path`` prefix filter.
         symbol: Optional exact ``symbol`` filter.
+        language: Optional exact ``language`` filter (see
+            :data:`backend.repository.chunking.LANGUAGE_BY_EXTENSION`).
 
     Returns:
         ``(chunk_id, rank)`` pairs ordered by descending ``ts_rank``; empty
         when *query* has no lexical matches.
     """
-    conditions = [
-        "tenant_id = %s",
-        "to_tsvector('english', content) @@ plainto_tsquery('english', %s)",
-    ]
-    params: list[Any] = [tenant_id, query]
+    if isinstance(conn, sqlite3.Connection):
+        return _search_sqlite(
+            conn,
+            query,
+            tenant_id=tenant_id,
+            limit=limit,
+            path_prefix=path_prefix,
+            symbol=symbol,
+            language=language,
+        )
+    conditions = ["tenant_id = %s", "search_vector @@ tsq"]
+    params: list[Any] = [tenant_id]
     if path_prefix:
         conditions.append("file_path LIKE %s")
         params.append(f"{path_prefix}%")
     if symbol:
         conditions.append("symbol = %s")
         params.append(symbol)
+    if language:
+        conditions.append("language = %s")
+        params.append(language)
 
-    rank_expr = "ts_rank(to_tsvector('english', content), plainto_tsquery('english', %s))"
-    params_with_rank = [query, *params, limit]
     sql = (
-        f"SELECT id, {rank_expr} AS rank FROM code_chunks "
+        f"SELECT id, ts_rank('{_RANK_WEIGHTS}'::real[], search_vector, tsq) AS rank "
+        "FROM code_chunks, plainto_tsquery('english', code_identifier_split(%s)) AS tsq "
         f"WHERE {' AND '.join(conditions)} "
         "ORDER BY rank DESC LIMIT %s"
     )
-    rows = conn.execute(sql, tuple(params_with_rank)).fetchall()
+    rows = conn.execute(sql, (query, *params, limit)).fetchall()
+    return [(row[0], row[1]) for row in rows]
+
+
+def _search_sqlite(
+    conn: sqlite3.Connection,
+    query: str,
+    *,
+    tenant_id: str,
+    limit: int,
+    path_prefix: str | None,
+    symbol: str | None,
+    language: str | None,
+) -> list[tuple[int, float]]:
+    """Serve :func:`search` from SQLite FTS5, ranked by weighted ``bm25``.
+
+    The query is reduced to its word tokens, each quoted, so user input can
+    never be parsed as FTS5 syntax. Tokens are ANDed, like ``plainto_tsquery``.
+
+    Returns:
+        ``(chunk_id, rank)`` pairs, with rank = ``-bm25`` so higher is more relevant.
+    """
+    terms = _QUERY_TERM.findall(query)
+    if not terms:
+        return []
+    match = " ".join(f'"{term}"' for term in terms)
+    conditions = ["code_chunks_fts MATCH ?", "c.tenant_id = ?"]
+    params: list[Any] = [match, tenant_id]
+    if path_prefix:
+        conditions.append("c.file_path LIKE ?")
+        params.append(f"{path_prefix}%")
+    if symbol:
+        conditions.append("c.symbol = ?")
+        params.append(symbol)
+    if language:
+        conditions.append("c.language = ?")
+        params.append(language)
+    weights = ", ".join(str(weight) for weight in _FTS5_COLUMN_WEIGHTS)
+    sql = (
+        f"SELECT c.id, -bm25(code_chunks_fts, {weights}) AS rank "
+        "FROM code_chunks_fts JOIN code_chunks c ON c.id = code_chunks_fts.rowid "
+        f"WHERE {' AND '.join(conditions)} "
+        "ORDER BY rank DESC LIMIT ?"
+    )
+    rows = conn.execute(sql, (*params, limit)).fetchall()
     return [(row[0], row[1]) for row in rows]
 
 
@@ -0,0 +1,407 @@
+"""Offline retrieval benchmark: a labeled corpus from this repository, run on SQLite.
+
+:func:`~backend.repository.retrieval.benchmark.run_benchmark` needs an
+indexed corpus and labeled cases. This module supplies both without
+PostgreSQL, so recall@k, MRR and p50/p95 per mode can be produced on any
+Linux box and compared with a recorded baseline.
+
+**Corpus.** :func:`build_corpus` snapshots the Python sources under a few
+directories of this repository (default :data:`DEFAULT_CORPUS_PATHS`) and
+labels one case per top-level function or class that has a docstring: the
+query is built from the docstring's first sentence, and the relevant chunk
+is that definition's own chunk, identified by ``(file_path, symbol)`` so
+labels survive re-indexing. This is the CodeSearchNet convention —
+docstrings are human-written descriptions of the code, not retriever output.
+The labeled docstrings are then stripped from the snapshot, so a query
+never matches the text it was derived from. The snapshot is pinned
+(``files`` in the corpus document), so editing the live tree does not move
+the numbers; only changes to chunking, ranking, fusion or embeddings do.
+
+**Queries.** The lexical leg ANDs every query term (like
+``plainto_tsquery``), so a full sentence almost never matches code once its
+docstring is gone. Each query is therefore the summary's first
+:data:`_QUERY_TERMS` content words — the few keywords a developer would
+type into code search.
+
+**Run.** :func:`run_offline_benchmark` materializes the snapshot in a
+temporary directory, indexes it into a temporary
+:class:`~backend.persistence.sqlite_adapter.SQLiteStore` (FTS5 lexical leg,
+embedded vector index), embeds every chunk, resolves labels to chunk ids,
+and runs the shared harness.
+
+**Modes.** The default embedding provider is
+:class:`~backend.repository.embeddings.provider.StubEmbeddingProvider`,
+whose vectors carry no meaning, so vector-only recall says nothing about
+quality and is not measured by default (:data:`OFFLINE_MODES`). Hybrid mode
+is kept: it pins how fusion ranks the lexical hits against that noise. Pass
+a real provider and every mode
+(:data:`~backend.repository.retrieval.benchmark.DEFAULT_MODES`) to measure
+the vector leg.
+"""
+
+from __future__ import annotations
+
+import ast
+import gzip
+import json
+import re
+import tempfile
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.repository.embeddings.provider import (
+    EmbeddingProvider,
+    StubEmbeddingProvider,
+)
+from backend.repository.retrieval.benchmark import (
+    DEFAULT_K,
+    BenchmarkReport,
+    RetrievalCase,
+    run_benchmark,
+)
+from backend.repository.retrieval.retriever import RetrievalMode
+
+#: Repository directories snapshotted by default: the indexing/retrieval
+#: code itself plus the job queue, a few hundred chunks in all.
+DEFAULT_CORPUS_PATHS: tuple[str, ...] = ("backend/repository", "backend/jobs")
+
+#: Where the shipped corpus, cases and baseline live, relative to the repo root.
+DEFAULT_CORPUS_DIR = Path("evals/retrieval/offline")
+
+_CORPUS_FORMAT = 1
+_TENANT_ID = "benchmark"
+
+#: Modes measured and pinned by default: not ``vector``, whose recall under
+#: the stub provider is noise.
+OFFLINE_MODES: tuple[RetrievalMode, ...] = ("lexical", "hybrid")
+
+#: Content words per query; summaries with fewer are too vague to label.
+_QUERY_TERMS = 3
+
+#: Words dropped from a summary before picking its query terms.
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "any", "are", "as", "at", "be", "by", "do", "does", "each",
+        "every", "for", "from", "given", "if", "in", "into", "is", "it", "its", "no",
+        "not", "of", "on", "one", "or", "per", "return", "returns", "so", "than", "that",
+        "the", "their", "this", "to", "up", "when", "whether", "which", "with",
+    }
+)
+
+_RST_ROLE = re.compile(r":[a-z]+:`~?([^`]+)`")
+_RST_LITERAL = re.compile(r"``([^`]+)``")
+_RST_EMPHASIS = re.compile(r"\*{1,2}([^*]+)\*{1,2}")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class LabeledQuery:
+    """One generated case, labeled by chunk identity rather than chunk id.
+
+    Attributes:
+        query: Query text (keywords of a docstring summary).
+        relevant: ``(file_path, symbol)`` of every chunk that answers it.
+    """
+
+    query: str
+    relevant: frozenset[tuple[str, str]]
+
+
+@dataclass(frozen=True, slots=True)
+class Corpus:
+    """A pinned source snapshot plus the queries labeled against it.
+
+    Attributes:
+        files: Repository-relative path to file content.
+        cases: Labeled queries, in a stable order.
+    """
+
+    files: dict[str, str]
+    cases: tuple[LabeledQuery, ...]
+
+
+def build_corpus(repo_root: Path, paths: Sequence[str] = DEFAULT_CORPUS_PATHS) -> Corpus:
+    """Snapshot the Python files under *paths* and label docstring queries against them.
+
+    Args:
+        repo_root: Repository root the *paths* are relative to.
+        paths: Directories (or files) to include.
+
+    Returns:
+        The corpus; cases are sorted by file then line, with duplicate
+        queries dropped so every query has exactly one label set.
+    """
+    files: dict[str, str] = {}
+    for relative in paths:
+        target = repo_root / relative
+        candidates = [target] if target.is_file() else sorted(target.rglob("*.py"))
+        for path in candidates:
+            if "__pycache__" in path.parts:
+                continue
+            files[path.relative_to(repo_root).as_posix()] = path.read_text(encoding="utf-8")
+
+    cases: list[LabeledQuery] = []
+    seen: dict[str, int] = {}
+    for file_path, source in files.items():
+        for symbol, query in _docstring_queries(source):
+            if query in seen:
+                # An ambiguous summary labels nothing reliably; drop every copy.
+                cases[seen[query]] = LabeledQuery("", frozenset())
+                continue
+            seen[query] = len(cases)
+            cases.append(LabeledQuery(query, frozenset({(file_path, symbol)})))
+        files[file_path] = _strip_docstrings(source)
+    return Corpus(files=files, cases=tuple(case for case in cases if case.query))
+
+
+def save_corpus(corpus: Corpus, directory: Path) -> None:
+    """Write *corpus* as ``corpus.json.gz`` (sources) and ``cases.json`` (labels).
+
+    Args:
+        corpus: Corpus to persist.
+        directory: Target directory (created if missing).
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps({"format": _CORPUS_FORMAT, "files": corpus.files}, sort_keys=True)
+    # mtime=0 keeps the archive byte-identical across regenerations.
+    with gzip.GzipFile(directory / "corpus.json.gz", "wb", mtime=0) as handle:
+        handle.write(payload.encode("utf-8"))
+    cases = [
+        {
+            "query": case.query,
+            "relevant": [
+                {"filePath": file_path, "symbol": symbol} for file_path, symbol in sorted(case.relevant)
+            ],
+        }
+        for case in corpus.cases
+    ]
+    (directory / "cases.json").write_text(json.dumps(cases, indent=2) + "\n", encoding="utf-8")
+
+
+def load_corpus(directory: Path) -> Corpus:
+    """Load a corpus written by :func:`save_corpus`.
+
+    Args:
+        directory: Directory holding ``corpus.json.gz`` and ``cases.json``.
+
+    Returns:
+        The corpus.
+
+    Raises:
+        ValueError: If the snapshot format is not supported.
+    """
+    document = json.loads(gzip.decompress((directory / "corpus.json.gz").read_bytes()))
+    if document.get("format") != _CORPUS_FORMAT:
+        raise ValueError(f"{directory}: unsupported corpus format {document.get('format')!r}")
+    cases = tuple(
+        LabeledQuery(
+            entry["query"],
+            frozenset((item["filePath"], item["symbol"]) for item in entry["relevant"]),
+        )
+        for entry in json.loads((directory / "cases.json").read_text(encoding="utf-8"))
+    )
+    return Corpus(files=dict(document["files"]), cases=cases)
+
+
+def run_offline_benchmark(
+    corpus: Corpus,
+    *,
+    modes: Sequence[RetrievalMode] = OFFLINE_MODES,
+    k: int = DEFAULT_K,
+    embedding_provider: EmbeddingProvider | None = None,
+) -> BenchmarkReport:
+    """Index *corpus* into a throwaway SQLite store and benchmark every mode.
+
+    Args:
+        corpus: Snapshot and labels to measure.
+        modes: Retrieval modes to measure.
+        k: Cut-off for recall@k.
+        embedding_provider: Provider for chunk and query embeddings;
+            defaults to :class:`StubEmbeddingProvider`.
+
+    Returns:
+        The benchmark report.
+    """
+    from backend.persistence.sqlite_adapter import SQLiteStore
+    from backend.repository import indexing
+    from backend.repository.embeddings.vector_store import upsert_embeddings
+    from backend.repository.retrieval.retriever import retrieve
+
+    provider = embedding_provider or StubEmbeddingProvider()
+    with tempfile.TemporaryDirectory(prefix="autodev-retrieval-bench-") as scratch:
+        root = Path(scratch) / "corpus"
+        for file_path, content in corpus.files.items():
+            target = root / file_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+        store = SQLiteStore(f"sqlite:///{Path(scratch) / 'bench.db'}")
+        indexing.index(root, tenant_id=_TENANT_ID, store=store, workers=1)
+        with store.connect() as conn:
+            rows = conn.execute(
+                "SELECT id, content, content_hash FROM code_chunks WHERE tenant_id = ?",
+                (_TENANT_ID,),
+            ).fetchall()
+            upsert_embeddings(
+                conn, [tuple(row) for row in rows], provider, tenant_id=_TENANT_ID
+            )
+            cases = resolve_cases(conn, corpus.cases)
+
+            def retrieve_with_provider(conn: Any, query: str, **kwargs: Any) -> Any:
+                return retrieve(conn, query, embedding_provider=provider, **kwargs)
+
+            return run_benchmark(
+                conn,
+                cases,
+                tenant_id=_TENANT_ID,
+                modes=modes,
+                k=k,
+                retrieve_fn=retrieve_with_provider,
+            )
+
+
+def resolve_cases(conn: Any, labeled: Iterable[LabeledQuery]) -> list[RetrievalCase]:
+    """Map ``(file_path, symbol)`` labels to the chunk ids of this index.
+
+    Cases none of whose labels resolve (the definition produced no chunk of
+    that name) are dropped rather than scored as misses.
+
+    Args:
+        conn: Connection to the benchmark store.
+        labeled: Cases to resolve.
+
+    Returns:
+        :class:`RetrievalCase` objects for the harness.
+    """
+    ids: dict[tuple[str, str], set[int]] = {}
+    for chunk_id, file_path, symbol in conn.execute(
+        "SELECT id, file_path, symbol FROM code_chunks WHERE tenant_id = ?", (_TENANT_ID,)
+    ).fetchall():
+        ids.setdefault((file_path, symbol), set()).add(int(chunk_id))
+    cases: list[RetrievalCase] = []
+    for case in labeled:
+        relevant = frozenset().union(*(ids.get(label, set()) for label in case.relevant))
+        if relevant:
+            cases.append(RetrievalCase(query=case.query, relevant_chunk_ids=relevant))
+    return cases
+
+
+def compare_to_baseline(
+    report: BenchmarkReport, baseline: dict[str, Any], *, tolerance: float = 0.01
+) -> list[str]:
+    """Return the quality regressions of *report* against a recorded baseline.
+
+    Recall@k and MRR are compared per mode; a drop larger than *tolerance*
+    is a regression, as is a mode recorded in the baseline but missing from
+    the report or a change in the cut-off or case count. Latency is not
+    compared — it depends on the machine; gate it with an absolute
+    threshold instead.
+
+    Args:
+        report: Fresh report.
+        baseline: A previous ``report.to_dict()``.
+        tolerance: Largest acceptable absolute drop in a quality metric.
+
+    Returns:
+        Human-readable regression messages; empty when nothing regressed.
+    """
+    current = report.to_dict()
+    if current["k"] != baseline.get("k"):
+        return [f"cut-off changed: k={current['k']} vs baseline k={baseline.get('k')}"]
+    by_mode = {entry["mode"]: entry for entry in current["modes"]}
+    regressions: list[str] = []
+    for recorded in baseline.get("modes", []):
+        mode = recorded["mode"]
+        measured = by_mode.get(mode)
+        if measured is None:
+            regressions.append(f"{mode}: not measured")
+            continue
+        if measured["caseCount"] != recorded["caseCount"]:
+            regressions.append(
+                f"{mode}: {measured['caseCount']} cases vs {recorded['caseCount']} in the baseline"
+            )
+        for metric in ("recallAtK", "meanReciprocalRank"):
+            if measured[metric] < recorded[metric] - tolerance:
+                regressions.append(
+                    f"{mode} {metric} {measured[metric]:.3f} below baseline {recorded[metric]:.3f}"
+                )
+    return regressions
+
+
+def _docstring_queries(source: str) -> list[tuple[str, str]]:
+    """Return ``(symbol, query)`` for each documented top-level def/class in *source*."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    queries: list[tuple[str, str]] = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        docstring = ast.get_docstring(node)
+        if not docstring:
+            continue
+        terms = _query_terms(_clean_summary(docstring))
+        if len(terms) == _QUERY_TERMS:
+            queries.append((node.name, " ".join(terms)))
+    return queries
+
+
+def _query_terms(summary: str) -> list[str]:
+    """Return the first :data:`_QUERY_TERMS` distinct content words of *summary*, lower-cased."""
+    terms: list[str] = []
+    for word in _WORD.findall(summary.lower()):
+        if len(word) > 2 and word not in _STOPWORDS and word not in terms:
+            terms.append(word)
+            if len(terms) == _QUERY_TERMS:
+                break
+    return terms
+
+
+def _strip_docstrings(source: str) -> str:
+    """Return *source* without the docstrings of its top-level defs and classes.
+
+    A body that was only a docstring keeps an ``...`` in its place, so the
+    snapshot still parses and chunks the same definitions.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return source
+    lines = source.splitlines(keepends=True)
+    for node in reversed(tree.body):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        if ast.get_docstring(node) is None:
+            continue
+        docstring = node.body[0]
+        start, end = docstring.lineno - 1, docstring.end_lineno or docstring.lineno
+        indent = lines[start][: len(lines[start]) - len(lines[start].lstrip())]
+        lines[start:end] = [f"{indent}...\n"] if len(node.body) == 1 else []
+    return "".join(lines)
+
+
+def _clean_summary(docstring: str) -> str:
+    """Return the first sentence of *docstring*'s first paragraph as plain text."""
+    paragraph = " ".join(docstring.strip().split("\n\n", 1)[0].split())
+    sentence = _SENTENCE_END.split(paragraph, 1)[0]
+    for pattern in (_RST_ROLE, _RST_LITERAL, _RST_EMPHASIS):
+        sentence = pattern.sub(lambda match: match.group(1).rsplit(".", 1)[-1], sentence)
+    return sentence.rstrip(".").strip()
+
+
+__all__ = [
+    "DEFAULT_CORPUS_DIR",
+    "DEFAULT_CORPUS_PATHS",
+    "OFFLINE_MODES",
+    "Corpus",
+    "LabeledQuery",
+    "build_corpus",
+    "compare_to_baseline",
+    "load_corpus",
+    "resolve_cases",
+    "run_offline_benchmark",
+    "save_corpus",
+]
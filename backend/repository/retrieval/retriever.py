@@ -1,28 +1,49 @@
 """Hybrid retrieval contract (E7-S3-T3/T4): ``retrieve(query, filters, budget) -> list[Snippet]``.
 
 Combines lexical (:mod:`backend.repository.retrieval.lexical`) and vector
-(:mod:`backend.repository.embeddings.pgvector_store`) retrieval via
+(:mod:`backend.repository.embeddings.vector_store` — pgvector on PostgreSQL,
+the embedded local index on SQLite) retrieval via
 Reciprocal Rank Fusion (:mod:`backend.repository.retrieval.fusion`),
 truncating results to an optional token budget by relevance (the
 lowest-scoring snippets are dropped first). Every result carries its score
 and source attribution (file path + line span + which mode(s) surfaced it).
+
+Given a ``connect`` factory, hybrid mode runs the lexical and the vector leg
+concurrently, each on its own connection, so latency is the slower leg
+rather than the sum of both. With a ``leg_timeout`` as well, a leg that has
+not answered by the deadline is dropped and the other leg's ranking is
+used alone; the abandoned query finishes in the background.
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+import logging
+import sqlite3
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from typing import Any, Literal
 
-from backend.repository.embeddings.pgvector_store import query_top_k
-from backend.repository.embeddings.provider import EmbeddingProvider, StubEmbeddingProvider
+from backend.repository import index_generation
+from backend.repository.embeddings.provider import (
+    EmbeddingProvider,
+    StubEmbeddingProvider,
+)
+from backend.repository.embeddings.vector_store import query_top_k
 from backend.repository.retrieval import lexical
+from backend.repository.retrieval.cache import (
+    RetrievalCache,
+    embedding_model_label,
+    results_key,
+)
 from backend.repository.retrieval.fusion import DEFAULT_RRF_K, reciprocal_rank_fusion
 
 RetrievalMode = Literal["lexical", "vector", "hybrid"]
 
 _VALID_MODES = ("lexical", "vector", "hybrid")
 
+logger = logging.getLogger(__name__)
+
 #: Rough characters-per-token heuristic used for budget truncation, avoiding
 #: a hard dependency on a specific tokenizer library for this slice.
 _CHARS_PER_TOKEN_ESTIMATE = 4
@@ -35,10 +56,10 @@ class RetrievalFilters:
     Attributes:
         path_prefix: Restrict results to chunks whose file path starts with this.
         symbol: Restrict results to chunks with this exact symbol name.
-        language: Restrict results to chunks of this language. Reserved for
-            forward compatibility — ``code_chunks`` does not yet carry a
-            language column (E7-S1 is Python-only), so this is currently a
-            no-op, mirroring :func:`backend.repository.retrieval.lexical.search`.
+        language: Restrict results to chunks of this language (a value of
+            :data:`backend.repository.chunking.LANGUAGE_BY_EXTENSION`, e.g.
+            ``"go"``). Applied inside both the lexical and the vector query,
+            so other languages never take up ranking slots.
     """
 
     path_prefix: str | None = None
@@ -87,15 +108,18 @@ def retrieve(
     embedding_provider: EmbeddingProvider | None = None,
     fusion_k: int = DEFAULT_RRF_K,
     fusion_weights: Sequence[float] | None = None,
+    cache: RetrievalCache | None = None,
+    connect: Callable[[], Any] | None = None,
+    leg_timeout: float | None = None,
 ) -> list[Snippet]:
     """Retrieve the most relevant code snippets for *query*.
 
     Args:
-        conn: Open psycopg connection with the ``code_chunks``/
-            ``code_embeddings`` tables.
+        conn: Open psycopg or ``sqlite3`` connection with the
+            ``code_chunks``/``code_embeddings`` tables.
         query: Free-text (and, in vector/hybrid mode, embedded) search query.
         tenant_id: Tenant to scope the search to.
-        mode: ``"lexical"`` (PostgreSQL full-text search only), ``"vector"``
+        mode: ``"lexical"`` (full-text search only), ``"vector"``
             (ANN search only), or ``"hybrid"`` (both, fused via Reciprocal
             Rank Fusion).
         filters: Optional path/symbol/language filters.
@@ -114,6 +138,17 @@ def retrieve(
         fusion_weights: Optional per-ranking weights as
             ``(lexical_weight, vector_weight)``, defaulting to equal weight.
             Applies to ``"hybrid"`` mode only; ignored otherwise.
+        cache: Optional result and query-vector cache. A hit for the same
+            request at the tenant's current index generation returns
+            without searching; a repeated query skips ``provider.embed``.
+        connect: Optional factory returning a new connection context
+            manager (e.g. ``store.connect``). In hybrid mode each leg then
+            runs concurrently on its own connection; *conn* is still used
+            for the generation lookup and the final chunk fetch.
+        leg_timeout: Seconds each concurrent leg may take. A leg that misses
+            the deadline is dropped from fusion (if both miss, the first to
+            finish is used). Degraded results are not cached. Ignored
+            without *connect*.
 
     Returns:
         Snippets ordered by descending relevance, truncated to *budget*
@@ -127,23 +162,65 @@ def retrieve(
     if mode not in _VALID_MODES:
         raise ValueError(f"unknown retrieval mode: {mode!r}")
     active_filters = filters or RetrievalFilters()
+    provider = embedding_provider or StubEmbeddingProvider()
 
-    lexical_results: list[tuple[int, float]] = []
-    if mode in ("lexical", "hybrid"):
-        lexical_results = lexical.search(
-            conn,
+    cache_key: str | None = None
+    if cache is not None:
+        generation = index_generation.current_generation(
+            conn, index_generation.param_for(conn), tenant_id
+        )
+        cache_key = results_key(
+            tenant_id=tenant_id,
+            generation=generation,
+            query=query,
+            mode=mode,
+            filters=asdict(active_filters),
+            budget=budget,
+            limit=limit,
+            fusion_k=fusion_k,
+            fusion_weights=list(fusion_weights) if fusion_weights is not None else None,
+            embedding=(
+                None if mode == "lexical" else [embedding_model_label(provider), provider.dimension]
+            ),
+        )
+        cached = cache.get_results(cache_key)
+        if cached is not None:
+            return [Snippet(**fields) for fields in cached]
+
+    def lexical_leg(leg_conn: Any) -> list[tuple[int, float]]:
+        return lexical.search(
+            leg_conn,
             query,
             tenant_id=tenant_id,
             limit=limit,
             path_prefix=active_filters.path_prefix,
             symbol=active_filters.symbol,
+            language=active_filters.language,
+        )
+
+    def vector_leg(leg_conn: Any) -> list[tuple[int, float]]:
+        if cache is not None:
+            query_vector = cache.query_vector(provider, query)
+        else:
+            query_vector = provider.embed([query])[0]
+        return query_top_k(
+            leg_conn, query_vector, tenant_id=tenant_id, k=limit, language=active_filters.language
         )
 
+    lexical_results: list[tuple[int, float]] = []
     vector_results: list[tuple[int, float]] = []
-    if mode in ("vector", "hybrid"):
-        provider = embedding_provider or StubEmbeddingProvider()
-        query_vector = provider.embed([query])[0]
-        vector_results = query_top_k(conn, query_vector, tenant_id=tenant_id, k=limit)
+    degraded = False
+    if mode == "hybrid" and connect is not None:
+        lexical_results, vector_results, degraded = _run_legs_concurrently(
+            connect, lexical_leg, vector_leg, leg_timeout
+        )
+    else:
+        if mode in ("lexical", "hybrid"):
+            lexical_results = lexical_leg(conn)
+        if mode in ("vector", "hybrid"):
+            vector_results = vector_leg(conn)
+    if degraded:
+        cache_key = None
 
     chunk_ids, scores, sources = _combine(
         mode,
@@ -153,6 +230,8 @@ def retrieve(
         fusion_weights=fusion_weights,
     )
     if not chunk_ids:
+        if cache is not None and cache_key is not None:
+            cache.put_results(cache_key, [])
         return []
 
     rows = _fetch_chunks(conn, chunk_ids, tenant_id, active_filters)
@@ -171,7 +250,59 @@ def retrieve(
         if row["id"] in scores
     ]
     snippets.sort(key=lambda snippet: -snippet.score)
-    return _truncate_to_budget(snippets, budget)
+    kept = _truncate_to_budget(snippets, budget)
+    if cache is not None and cache_key is not None:
+        cache.put_results(cache_key, [asdict(snippet) for snippet in kept])
+    return kept
+
+
+def _run_legs_concurrently(
+    connect: Callable[[], Any],
+    lexical_leg: Callable[[Any], list[tuple[int, float]]],
+    vector_leg: Callable[[Any], list[tuple[int, float]]],
+    leg_timeout: float | None,
+) -> tuple[list[tuple[int, float]], list[tuple[int, float]], bool]:
+    """Run both hybrid legs in parallel, each on a connection from *connect*.
+
+    Args:
+        connect: Factory returning a connection context manager.
+        lexical_leg: Runs the lexical search on a connection.
+        vector_leg: Embeds the query and runs the ANN search on a connection.
+        leg_timeout: Deadline in seconds, or ``None`` to wait for both.
+
+    Returns:
+        ``(lexical_results, vector_results, degraded)``; a leg dropped at
+        the deadline contributes ``[]`` and sets *degraded*.
+
+    Raises:
+        Exception: Whatever a leg that finished in time raised.
+    """
+
+    def on_own_connection(leg: Callable[[Any], list[tuple[int, float]]]) -> list[tuple[int, float]]:
+        with connect() as leg_conn:
+            return leg(leg_conn)
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="retrieval-leg")
+    try:
+        legs: dict[str, Future[list[tuple[int, float]]]] = {
+            "lexical": executor.submit(on_own_connection, lexical_leg),
+            "vector": executor.submit(on_own_connection, vector_leg),
+        }
+        done, _pending = wait(legs.values(), timeout=leg_timeout)
+        if not done:
+            done, _pending = wait(legs.values(), return_when=FIRST_COMPLETED)
+        results: dict[str, list[tuple[int, float]]] = {}
+        for name, future in legs.items():
+            if future in done:
+                results[name] = future.result()
+            else:
+                future.cancel()
+                logger.warning("hybrid retrieval: %s leg missed the %.3fs deadline", name, leg_timeout)
+    finally:
+        # Never block on an abandoned leg; its thread exits when its query returns.
+        executor.shutdown(wait=False)
+    degraded = len(results) < len(legs)
+    return results.get("lexical", []), results.get("vector", []), degraded
 
 
 def _combine(
@@ -236,14 +367,23 @@ def _fetch_chunks(
     conn: Any, chunk_ids: list[int], tenant_id: str, filters: RetrievalFilters
 ) -> list[dict[str, Any]]:
     """Fetch chunk rows for *chunk_ids* (any order — the caller re-sorts by score)."""
-    conditions = ["tenant_id = %s", "id = ANY(%s)"]
-    params: list[Any] = [tenant_id, chunk_ids]
+    if isinstance(conn, sqlite3.Connection):
+        param = "?"
+        conditions = ["tenant_id = ?", f"id IN ({', '.join('?' * len(chunk_ids))})"]
+        params: list[Any] = [tenant_id, *chunk_ids]
+    else:
+        param = "%s"
+        conditions = ["tenant_id = %s", "id = ANY(%s)"]
+        params = [tenant_id, chunk_ids]
     if filters.path_prefix:
-        conditions.append("file_path LIKE %s")
+        conditions.append(f"file_path LIKE {param}")
         params.append(f"{filters.path_prefix}%")
     if filters.symbol:
-        conditions.append("symbol = %s")
+        conditions.append(f"symbol = {param}")
         params.append(filters.symbol)
+    if filters.language:
+        conditions.append(f"language = {param}")
+        params.append(filters.language)
     sql = (
         "SELECT id, file_path, symbol, start_line, end_line, content FROM code_chunks "
         f"WHERE {' AND '.join(conditions)}"
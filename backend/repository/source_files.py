@@ -0,0 +1,62 @@
+"""Which files the repository index covers.
+
+:func:`backend.repository.indexing.index` walks a tree with
+:func:`iter_source_files`; callers that learn about changed files some other
+way (e.g. :mod:`backend.repository.git_indexing` from a git diff) filter them
+with :func:`is_indexed_path`, so both apply the same extension and
+ignored-directory rules.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from backend.repository.chunking import LANGUAGE_BY_EXTENSION
+
+_IGNORED_DIRECTORIES = {
+    ".git",
+    ".venv",
+    "__pycache__",
+    "node_modules",
+    ".terraform",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+
+
+def iter_source_files(root: Path) -> Iterable[Path]:
+    """Stream every indexable source file under *root*, pruning ignored directories.
+
+    Uses ``os.walk`` with in-place ``dirnames`` pruning (E45-S5) so an
+    ignored directory (``.venv``, ``node_modules``, ...) is never descended
+    into at all — unlike ``sorted(root.rglob("*"))``, which materializes and
+    sorts the full recursive listing (including ignored subtrees) before
+    filtering.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRECTORIES)
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if path.suffix in LANGUAGE_BY_EXTENSION:
+                yield path
+
+
+def is_indexed_path(relative_path: str) -> bool:
+    """Return whether :func:`iter_source_files` would yield *relative_path*.
+
+    Checks the extension and that no parent directory is ignored, without
+    touching the filesystem.
+
+    Args:
+        relative_path: Repository-relative path.
+    """
+    path = Path(relative_path)
+    if any(part in _IGNORED_DIRECTORIES for part in path.parts[:-1]):
+        return False
+    return path.suffix in LANGUAGE_BY_EXTENSION
+
+
+__all__ = ["is_indexed_path", "iter_source_files"]
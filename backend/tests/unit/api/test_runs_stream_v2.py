@@ -331,7 +331,7 @@ class TestStreamEventsGenerator:
         class _SlowReplayBus:
             """Bus stand-in whose ``replay_from`` blocks synchronously."""
 
-            def subscribe(self, _type: str, _subscriber: Any) -> Any:
+            def subscribe_partition(self, _run_id: str, _subscriber: Any) -> Any:
                 """Return a no-op unsubscribe token."""
                 return lambda: None
 
@@ -374,7 +374,8 @@ class TestStreamEventsGenerator:
             agen = _stream_events(request, bus, run_id, None, None)  # type: ignore[arg-type]
             async for _frame in agen:
                 pass
-            return len(bus._registry._subscribers[WILDCARD])  # noqa: SLF001
+            registry = bus._registry  # noqa: SLF001
+            return len(registry._subscribers[WILDCARD]) + len(registry._partition_subscribers)
 
         remaining = asyncio.run(run())
 
@@ -397,7 +398,8 @@ class TestStreamEventsGenerator:
             with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
                 await task
             await agen.aclose()  # type: ignore[attr-defined]
-            return len(bus._registry._subscribers[WILDCARD])  # noqa: SLF001
+            registry = bus._registry  # noqa: SLF001
+            return len(registry._subscribers[WILDCARD]) + len(registry._partition_subscribers)
 
         remaining = asyncio.run(run())
 
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import threading
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.auth.audit import AuditWriter, override_audit_writer
+from backend.auth.audit import AuditSpool, AuditWriter, override_audit_writer
 from backend.auth.contracts import AccessAuditRecord, AuthMethod, Role
 from backend.auth.service import get_auth_service, reset_auth_service_cache
 from backend.auth.store import AuthStore, utcnow
@@ -160,11 +161,9 @@ def test_audit_read_requires_audit_read_scope(client: TestClient) -> None:
     assert response.status_code == 403
 
 
-def test_store_append_and_list_round_trip(tmp_path: Path) -> None:
-    """AuthStore persists and retrieves access-audit rows directly."""
-    store = AuthStore(SQLiteStore(f"sqlite:///{tmp_path / 'direct.db'}"))
-    record = AccessAuditRecord(
-        audit_id="a1",
+def _audit_record(audit_id: str) -> AccessAuditRecord:
+    return AccessAuditRecord(
+        audit_id=audit_id,
         occurred_at=utcnow(),
         tenant_id="tenant-a",
         subject="user-1",
@@ -180,9 +179,94 @@ def test_store_append_and_list_round_trip(tmp_path: Path) -> None:
         reason="ok",
         request_id="req-1",
     )
+
+
+def test_store_append_and_list_round_trip(tmp_path: Path) -> None:
+    """AuthStore persists and retrieves access-audit rows directly."""
+    store = AuthStore(SQLiteStore(f"sqlite:///{tmp_path / 'direct.db'}"))
     writer = AuditWriter(store)
-    writer.record(record, required=True)
+    writer.record(_audit_record("a1"), required=True)
     rows = writer.list(tenant_id="tenant-a", limit=10, before=None)
     assert len(rows) == 1
     assert rows[0].audit_id == "a1"
     assert rows[0].decision == "allowed"
+
+
+def test_concurrent_records_share_one_commit(tmp_path: Path) -> None:
+    """Rows recorded while a commit is in flight are written together by the next one."""
+    store = AuthStore(SQLiteStore(f"sqlite:///{tmp_path / 'group.db'}"))
+    original = store.append_access_audits
+    first_commit_started = threading.Event()
+    release_first_commit = threading.Event()
+    batch_sizes: list[int] = []
+
+    def _append(records: Sequence[AccessAuditRecord]) -> None:
+        batch_sizes.append(len(records))
+        if len(batch_sizes) == 1:
+            first_commit_started.set()
+            release_first_commit.wait(timeout=5)
+        original(records)
+
+    store.append_access_audits = _append  # type: ignore[method-assign]
+    writer = AuditWriter(store)
+    leader = threading.Thread(
+        target=writer.record, args=(_audit_record("a0"),), kwargs={"required": True}
+    )
+    leader.start()
+    assert first_commit_started.wait(timeout=5)
+    followers = [
+        threading.Thread(
+            target=writer.record, args=(_audit_record(f"a{n}"),), kwargs={"required": True}
+        )
+        for n in range(1, 6)
+    ]
+    for thread in followers:
+        thread.start()
+    while len(writer._open_group.records) < 5:  # noqa: SLF001
+        threading.Event().wait(0.01)
+    release_first_commit.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert batch_sizes == [1, 5]
+    assert len(writer.list(tenant_id="tenant-a", limit=10, before=None)) == 6
+
+
+def test_store_failure_spools_rows_and_a_later_write_replays_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed group is fsynced to the spool and replayed, once, by the next good write."""
+    store = AuthStore(SQLiteStore(f"sqlite:///{tmp_path / 'spool.db'}"))
+
+    def _unavailable(_records: Sequence[AccessAuditRecord]) -> None:
+        raise RuntimeError("audit store unavailable")
+
+    spool_path = tmp_path / "audit.spool"
+    writer = AuditWriter(store, spool=AuditSpool(spool_path, max_records=10))
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "append_access_audits", _unavailable)
+        writer.record(_audit_record("spooled"), required=True)
+        assert writer.list(tenant_id="tenant-a", limit=10, before=None) == []
+        assert AuditSpool(spool_path, max_records=10).pending == 1
+
+    writer.record(_audit_record("direct"), required=True)
+
+    rows = writer.list(tenant_id="tenant-a", limit=10, before=None)
+    assert sorted(row.audit_id for row in rows) == ["direct", "spooled"]
+    assert rows[0].roles == (Role.VIEWER,)
+    assert not spool_path.exists()
+
+
+def test_full_spool_fails_closed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Once the spool is full a required write raises again, so the request gets ``503``."""
+    store = AuthStore(SQLiteStore(f"sqlite:///{tmp_path / 'full.db'}"))
+
+    def _unavailable(_records: Sequence[AccessAuditRecord]) -> None:
+        raise RuntimeError("audit store unavailable")
+
+    monkeypatch.setattr(store, "append_access_audits", _unavailable)
+    writer = AuditWriter(store, spool=AuditSpool(tmp_path / "audit.spool", max_records=1))
+    writer.record(_audit_record("a1"), required=True)
+
+    with pytest.raises(RuntimeError, match="spool is full"):
+        writer.record(_audit_record("a2"), required=True)
@@ -117,6 +117,34 @@ def test_service_key_is_hash_only_and_revocable(tmp_path: Path) -> None:
         service.authenticate_service_key(secret)
 
 
+def test_service_key_principal_is_cached_until_revoked(tmp_path: Path) -> None:
+    """A repeat presentation skips the store; revoking through the service drops the entry."""
+    service = auth_service_for(tmp_path)
+    record, secret = service.create_service_key(
+        tenant_id="tenant-a",
+        subject="ci",
+        roles=(Role.VIEWER,),
+        scopes=frozenset(),
+        expires_at=utcnow() + timedelta(days=30),
+    )
+    first = service.authenticate_service_key(secret)
+    lookups: list[str] = []
+    original = service.store.get_service_credential
+
+    def _counting(key_id: str) -> Any:
+        lookups.append(key_id)
+        return original(key_id)
+
+    service.store.get_service_credential = _counting  # type: ignore[method-assign]
+    assert service.authenticate_service_key(secret) is first
+    assert lookups == []
+
+    service.revoke_service_key(tenant_id="tenant-a", key_id=record.key_id)
+    with pytest.raises(InvalidCredentialError):
+        service.authenticate_service_key(secret)
+    assert lookups == [record.key_id]
+
+
 def test_service_key_expiry_must_be_one_to_ninety_days(tmp_path: Path) -> None:
     """Service key expiry outside 1-90 days is rejected."""
     service = auth_service_for(tmp_path)
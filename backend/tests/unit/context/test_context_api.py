@@ -15,10 +15,18 @@ from fastapi.testclient import TestClient
 
 from backend.api.main import app
 from backend.api.routers import context as context_router
+from backend.config.settings import reset_settings_cache
+from backend.repository.embeddings import EmbeddingPipeline, StubEmbeddingProvider
 from backend.repository.retrieval import retriever as retriever_module
 
 client = TestClient(app)
 
+
+@pytest.fixture(autouse=True)
+def _no_retrieval_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the process-wide result cache: every test here mocks different backend data."""
+    monkeypatch.setattr(context_router, "get_retrieval_cache", lambda: None)
+
 _ROWS = {
     1: {"id": 1, "file_path": "pkg/a.py", "symbol": "add", "start_line": 0, "end_line": 2, "content": "a" * 40},
     2: {"id": 2, "file_path": "pkg/b.py", "symbol": "sub", "start_line": 4, "end_line": 6, "content": "b" * 40},
@@ -84,9 +92,10 @@ def test_retrieve_context_forwards_filters(monkeypatch: pytest.MonkeyPatch) -> N
     monkeypatch.setattr(context_router, "get_store", lambda: _fake_store())
     captured: dict[str, object] = {}
 
-    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol):  # noqa: ANN001, ARG001
+    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol, language):  # noqa: ANN001, ARG001
         captured["path_prefix"] = path_prefix
         captured["symbol"] = symbol
+        captured["language"] = language
         return []
 
     monkeypatch.setattr(retriever_module.lexical, "search", fake_search)
@@ -94,11 +103,17 @@ def test_retrieve_context_forwards_filters(monkeypatch: pytest.MonkeyPatch) -> N
 
     resp = client.get(
         "/v2/context/retrieve",
-        params={"query": "add", "mode": "lexical", "path_prefix": "pkg/", "symbol": "add"},
+        params={
+            "query": "add",
+            "mode": "lexical",
+            "path_prefix": "pkg/",
+            "symbol": "add",
+            "language": "go",
+        },
     )
 
     assert resp.status_code == 200
-    assert captured == {"path_prefix": "pkg/", "symbol": "add"}
+    assert captured == {"path_prefix": "pkg/", "symbol": "add", "language": "go"}
 
 
 def test_retrieve_context_rejects_invalid_mode(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -109,8 +124,8 @@ def test_retrieve_context_rejects_invalid_mode(monkeypatch: pytest.MonkeyPatch)
     assert resp.status_code == 422
 
 
-def test_retrieve_context_returns_501_for_non_postgres_store(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(context_router, "get_store", lambda: _fake_store("sqlite:///./local.db"))
+def test_retrieve_context_returns_501_for_unsupported_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(context_router, "get_store", lambda: _fake_store("mysql://db/autodev"))
 
     resp = client.get("/v2/context/retrieve", params={"query": "add"})
 
@@ -137,7 +152,7 @@ def test_retrieve_context_ignores_a_caller_supplied_tenant_id(
     monkeypatch.setattr(context_router, "get_store", lambda: _fake_store())
     captured: dict[str, object] = {}
 
-    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol):  # noqa: ANN001, ARG001
+    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol, language):  # noqa: ANN001, ARG001
         captured["tenant_id"] = tenant_id
         return []
 
@@ -151,3 +166,32 @@ def test_retrieve_context_ignores_a_caller_supplied_tenant_id(
 
     assert resp.status_code == 200
     assert captured["tenant_id"] != "other-tenant"
+
+
+def test_retrieve_context_embeds_queries_through_the_shared_pipeline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Vector-mode queries go through the process-wide embedding pipeline and its cache."""
+    monkeypatch.setattr(context_router, "get_store", lambda: _fake_store())
+    _patch_backends(monkeypatch, lexical_results=[], vector_results=[(1, 0.8)])
+    pipeline = EmbeddingPipeline(StubEmbeddingProvider())
+    monkeypatch.setattr(context_router, "get_embedding_pipeline", lambda: pipeline)
+
+    for _ in range(2):
+        resp = client.get("/v2/context/retrieve", params={"query": "add", "mode": "vector"})
+        assert resp.status_code == 200
+        assert [r["chunkId"] for r in resp.json()["results"]] == [1]
+
+    assert pipeline.stats.texts_requested == 2
+    assert pipeline.stats.texts_embedded == 1
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("250", 0.25), ("0", None)])
+def test_leg_timeout_reads_the_setting(
+    monkeypatch: pytest.MonkeyPatch, raw: str, expected: float | None
+) -> None:
+    """``AUTODEV_RETRIEVAL_LEG_TIMEOUT_MS`` is read through Settings; ``0`` waits for both legs."""
+    monkeypatch.setenv("AUTODEV_RETRIEVAL_LEG_TIMEOUT_MS", raw)
+    reset_settings_cache()
+
+    assert context_router._leg_timeout_seconds() == expected
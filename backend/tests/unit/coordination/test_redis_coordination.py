@@ -46,6 +46,20 @@ def test_local_cache_roundtrip_and_expiry() -> None:
     assert cache.get("registry", "agents") is None
 
 
+def test_local_cache_evicts_least_recently_used_beyond_max_entries() -> None:
+    """With a bound, reading a value protects it and the stalest one is evicted."""
+    cache = LocalCache(max_entries=2)
+
+    cache.set("ns", "a", b"1")
+    cache.set("ns", "b", b"2")
+    assert cache.get("ns", "a") == b"1"
+    cache.set("ns", "c", b"3")
+
+    assert cache.get("ns", "b") is None
+    assert cache.get("ns", "a") == b"1"
+    assert cache.get("ns", "c") == b"3"
+
+
 class _FakeRedis:
     """In-memory stand-in for a Redis client, used to test the Redis-backed cache and locks."""
 
@@ -0,0 +1,222 @@
+"""Tests for batched Event Store appends and the write-behind appender."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from backend.config.settings import reset_settings_cache
+from backend.events.appender import WriteBehindAppender
+from backend.events.catalog import EventEnvelope, make_envelope
+from backend.events.runtime import (
+    emit_event,
+    get_event_store,
+    reset_event_bus_for_tests,
+    reset_event_store_for_tests,
+)
+from backend.events.store import EventStore
+from backend.persistence.database import reset_store_cache
+from backend.persistence.sqlite_adapter import SQLiteStore
+
+
+class _GatedEventStore(EventStore):
+    """Event Store whose batch appends wait until the test opens the gate."""
+
+    def __init__(self, store: SQLiteStore) -> None:
+        super().__init__(store)
+        self.gate = threading.Event()
+
+    def append_many(self, envelopes):  # type: ignore[no-untyped-def]
+        self.gate.wait(timeout=5.0)
+        return super().append_many(envelopes)
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def _sqlite(tmp_path: Path) -> SQLiteStore:
+    return SQLiteStore(f"sqlite:///{tmp_path / 'events.db'}")
+
+
+def _started(run_id: str) -> EventEnvelope:
+    return make_envelope(
+        "flow.run.started",
+        tenant_id="default",
+        partition_key=run_id,
+        data={"flowId": "f", "flowVersion": "1.0.0"},
+    )
+
+
+def _step(run_id: str, key: str) -> EventEnvelope:
+    return make_envelope(
+        "run.step.started",
+        tenant_id="default",
+        partition_key=run_id,
+        data={"stepKey": key, "agent": "a"},
+    )
+
+
+def _completed(run_id: str) -> EventEnvelope:
+    return make_envelope(
+        "flow.run.completed",
+        tenant_id="default",
+        partition_key=run_id,
+        data={"status": "completed", "costUsd": 0.0, "tokens": 0},
+    )
+
+
+def test_append_many_continues_each_partition_and_folds_projections(tmp_path: Path) -> None:
+    """A batch interleaving partitions gets gap-free sequences and one projection each."""
+    store = EventStore(_sqlite(tmp_path))
+    store.append(_started("run-a"))
+
+    stored = store.append_many(
+        [_step("run-a", "s1"), _started("run-b"), _step("run-a", "s2"), _completed("run-a")]
+    )
+
+    assert [(event.envelope.partitionKey, event.sequence) for event in stored] == [
+        ("run-a", 2),
+        ("run-b", 1),
+        ("run-a", 3),
+        ("run-a", 4),
+    ]
+    projection = store.get_projection("run-a")
+    assert projection is not None
+    assert projection.status == "completed"
+    assert projection.last_sequence == 4
+    assert projection.counts == {
+        "flow.run.started": 1,
+        "run.step.started": 2,
+        "flow.run.completed": 1,
+    }
+    assert store.get_projection("run-b").last_sequence == 1  # type: ignore[union-attr]
+
+
+def test_write_behind_reads_see_every_enqueued_event_in_order(tmp_path: Path) -> None:
+    """Reads flush the queue, so reconstruction matches the synchronous path."""
+    store = EventStore(_sqlite(tmp_path))
+    store.start_write_behind(batch_size=4, flush_interval_seconds=10.0)
+    try:
+        store.enqueue(_started("run-a"))
+        for index in range(10):
+            store.enqueue(_step("run-a", f"s{index}"))
+        store.enqueue(_completed("run-a"))
+
+        view = store.reconstruct_run("run-a")
+        assert view["status"] == "completed"
+        assert view["eventCount"] == 12
+        assert [step["stepKey"] for step in view["steps"]] == [f"s{index}" for index in range(10)]
+        assert [event.sequence for event in store.list_events("run-a")] == list(range(1, 13))
+        assert store.get_projection("run-a").last_sequence == 12  # type: ignore[union-attr]
+    finally:
+        store.close()
+
+
+def test_full_queue_drops_with_the_drop_policy(tmp_path: Path) -> None:
+    """``overflow="drop"`` discards instead of stalling the publisher."""
+    store = _GatedEventStore(_sqlite(tmp_path))
+    appender = WriteBehindAppender(
+        store, queue_size=1, batch_size=1, flush_interval_seconds=0.01, overflow="drop"
+    )
+    try:
+        assert appender.submit(_started("run-a"))  # taken by the writer, which blocks
+        _wait_until(lambda: not appender._pending)
+        assert appender.submit(_step("run-a", "s1"))  # fills the queue
+        assert not appender.submit(_step("run-a", "s2"))
+        assert appender.dropped == 1
+    finally:
+        store.gate.set()
+        appender.close()
+    assert [event.envelope.type for event in store.list_events("run-a")] == [
+        "flow.run.started",
+        "run.step.started",
+    ]
+
+
+def test_full_queue_blocks_the_publisher_with_the_block_policy(tmp_path: Path) -> None:
+    """``overflow="block"`` applies back-pressure until the writer catches up."""
+    store = _GatedEventStore(_sqlite(tmp_path))
+    appender = WriteBehindAppender(store, queue_size=1, batch_size=1, flush_interval_seconds=0.01)
+    for envelope in (_started("run-a"), _step("run-a", "s1")):
+        appender.submit(envelope)
+    publisher = threading.Thread(target=appender.submit, args=(_step("run-a", "s2"),))
+    publisher.start()
+    publisher.join(timeout=0.1)
+    assert publisher.is_alive()
+
+    store.gate.set()
+    publisher.join(timeout=5.0)
+    appender.close()
+
+    assert not publisher.is_alive()
+    assert len(store.list_events("run-a")) == 3
+
+
+def test_close_drains_the_queue_and_later_appends_are_synchronous(tmp_path: Path) -> None:
+    """Nothing queued is lost on shutdown; a closed store writes inline."""
+    store = EventStore(_sqlite(tmp_path))
+    appender = store.start_write_behind(flush_interval_seconds=10.0)
+    store.enqueue(_started("run-a"))
+    store.enqueue(_step("run-a", "s1"))
+
+    appender.close()
+    appender.submit(_completed("run-a"))
+
+    reader = EventStore(store.backing_store)
+    assert [event.sequence for event in reader.list_events("run-a")] == [1, 2, 3]
+
+
+def test_failed_batch_is_retried_one_event_at_a_time(tmp_path: Path) -> None:
+    """A duplicate event id fails its batch but not the events around it."""
+    store = EventStore(_sqlite(tmp_path))
+    started = _started("run-a")
+    store.append(started)
+    store.start_write_behind(batch_size=10, flush_interval_seconds=10.0)
+    try:
+        store.enqueue(_step("run-a", "s1"))
+        store.enqueue(started)  # already stored: violates the primary key
+        store.enqueue(_step("run-a", "s2"))
+
+        assert [event.envelope.type for event in store.list_events("run-a")] == [
+            "flow.run.started",
+            "run.step.started",
+            "run.step.started",
+        ]
+    finally:
+        store.close()
+
+
+def test_write_behind_setting_routes_emitted_events_through_the_appender(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``AUTODEV_EVENT_STORE_WRITE_BEHIND`` wires the process Event Store."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'wired.db'}")
+    monkeypatch.setenv("AUTODEV_EVENT_STORE_WRITE_BEHIND", "true")
+    monkeypatch.setenv("AUTODEV_EVENT_STORE_FLUSH_INTERVAL_MS", "10000")
+    monkeypatch.delenv("AUTODEV_EVENT_BUS", raising=False)
+    reset_settings_cache()
+    reset_store_cache()
+    reset_event_bus_for_tests()
+    reset_event_store_for_tests()
+    try:
+        emit_event(
+            "flow.run.started",
+            tenant_id="default",
+            partition_key="run-w",
+            data={"flowId": "f", "flowVersion": "1.0.0"},
+        )
+        assert get_event_store()._appender is not None
+        assert [event.sequence for event in get_event_store().list_events("run-w")] == [1]
+    finally:
+        reset_event_store_for_tests()
+        reset_settings_cache()
+        reset_store_cache()
+        reset_event_bus_for_tests()
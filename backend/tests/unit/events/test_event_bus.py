@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import pytest
 
-from backend.events.bus import WILDCARD, InMemoryEventBus, RedisEventBus
+from backend.events.bus import (
+    WILDCARD,
+    InMemoryEventBus,
+    RedisEventBus,
+    cursor_position,
+)
 from backend.events.catalog import EventEnvelope, make_envelope
 
 
@@ -274,3 +279,27 @@ def test_redis_bus_replay_from_full_and_resumed() -> None:
     assert [e.eventId for _, e in resumed] == [second.eventId, third.eventId]
 
     assert bus.replay_from("run_1", cursors[-1]) == []
+
+
+def test_partition_subscription_only_sees_its_partition() -> None:
+    """``subscribe_partition`` is woken by its run's events, whatever their type."""
+    bus = InMemoryEventBus()
+    received: list[str] = []
+    unsubscribe = bus.subscribe_partition("run_1", lambda e: received.append(e.partitionKey))
+
+    bus.publish(_envelope(partition="run_1"))
+    bus.publish(_envelope(partition="run_2"))
+    bus.publish(_envelope("run.step.started", partition="run_1"))
+    unsubscribe()
+    bus.publish(_envelope(partition="run_1"))
+
+    assert received == ["run_1", "run_1"]
+    assert bus._registry._partition_subscribers == {}  # noqa: SLF001
+
+
+def test_cursor_position_orders_both_backends_cursors() -> None:
+    """In-memory and Redis cursors compare numerically, not as strings."""
+    assert cursor_position("9") < cursor_position("10")  # type: ignore[operator]
+    earlier, later = cursor_position("1700000000000-2"), cursor_position("1700000000001-0")
+    assert earlier < later  # type: ignore[operator]
+    assert cursor_position("not-a-cursor") is None
@@ -175,6 +175,62 @@ class TestAppendOrdering:
         assert len(unscoped_events) == 2
 
 
+class TestAppendCost:
+    """Appends allocate sequences and fold counts without reading the partition back."""
+
+    def test_append_issues_no_reads_of_the_partition(self, store: EventStore) -> None:
+        """Sequence and counts come from upserts, not ``MAX(sequence)``/JSON reads."""
+        _lifecycle(store, "run-a")
+        checkout = store.backing_store.connect()
+        conn = checkout.connection
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        checkout.close()
+
+        stored = store.append(
+            _envelope("run-a", "run.step.started", {"stepKey": "s2", "agent": "a"})
+        )
+        conn.set_trace_callback(None)
+
+        assert stored.sequence == 5
+        assert statements, "append did not reuse the traced pooled connection"
+        assert not any("FROM events" in sql or "counts_json FROM" in sql for sql in statements)
+
+    def test_sequences_continue_after_compaction(self, store: EventStore) -> None:
+        """The projection's counter keeps sequences monotonic once old rows are purged."""
+        _lifecycle(store, "run-a")
+        store.purge_expired(
+            retention_days=0, now=datetime.now(timezone.utc) + timedelta(days=1)
+        )
+
+        stored = store.append(
+            _envelope("run-a", "run.step.started", {"stepKey": "s9", "agent": "a"})
+        )
+
+        assert stored.sequence == 5
+        assert store.list_events("run-a", after_sequence=4)[0].envelope.eventId == (
+            stored.envelope.eventId
+        )
+
+    def test_counts_written_before_the_counts_table_are_kept(self, store: EventStore) -> None:
+        """Legacy ``counts_json`` totals are the base new increments add to."""
+        with store.backing_store.connect() as conn:
+            conn.execute(
+                "INSERT INTO event_projections (partition_key, tenant_id, status, "
+                "last_sequence, last_event_type, last_event_at, counts_json, updated_at) "
+                "VALUES ('run-old', 'default', 'running', 2, 'run.step.started', "
+                "'2026-01-01T00:00:00+00:00', ?, '2026-01-01T00:00:00+00:00')",
+                ('{"flow.run.started": 1, "run.step.started": 1}',),
+            )
+
+        store.append(_envelope("run-old", "run.step.started", {"stepKey": "s2", "agent": "a"}))
+
+        projection = store.get_projection("run-old")
+        assert projection is not None
+        assert projection.last_sequence == 3
+        assert projection.counts == {"flow.run.started": 1, "run.step.started": 2}
+
+
 class TestProjections:
     """E8-S2-T3 — materialized per-partition status summaries."""
 
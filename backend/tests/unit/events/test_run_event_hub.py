@@ -0,0 +1,147 @@
+"""Tests for the per-run live event hub behind the SSE stream (E9-S2)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from backend.events.bus import InMemoryEventBus, Subscriber, Unsubscribe
+from backend.events.catalog import EventEnvelope, make_envelope
+from backend.events.fanout import (
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    SLOW_CONSUMER,
+    RunEventHub,
+    get_run_event_hub,
+)
+
+
+def _envelope(partition: str = "run_1", step: str = "coder") -> EventEnvelope:
+    return make_envelope(
+        "run.step.started",
+        tenant_id="acme",
+        partition_key=partition,
+        data={"stepKey": step, "agent": "autodev/agent-coder"},
+    )
+
+
+def test_clients_of_one_run_share_a_single_bus_subscription() -> None:
+    """Two clients of a run cost one partition subscriber and both get each event."""
+
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        hub = RunEventHub(bus)
+        first, second = hub.join("run_1"), hub.join("run_1")
+        first.start(None)
+        second.start(None)
+
+        event_id = bus.publish(_envelope())
+        got = [await first.next(1.0), await second.next(1.0)]
+
+        assert hub.watched_runs() == 1
+        assert len(bus._registry._partition_subscribers["run_1"]) == 1  # noqa: SLF001
+        assert [item[1].eventId for item in got] == [event_id, event_id]  # type: ignore[index]
+        first.close()
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_events_already_in_the_backlog_are_not_sent_twice() -> None:
+    """A client that started at cursor N only receives events after N."""
+
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        hub = RunEventHub(bus)
+        watcher, subscription = hub.join("run_1"), hub.join("run_1")
+        watcher.start(None)  # the channel reads the run from its first event
+        bus.publish(_envelope(step="backlog"))
+        backlog_cursor = bus.replay_from("run_1", None)[-1][0]
+        subscription.start(backlog_cursor)
+        bus.publish(_envelope(step="live"))
+
+        item = await subscription.next(1.0)
+        assert item is not None and item[1].data["stepKey"] == "live"  # type: ignore[index]
+        assert await subscription.next(0.05) is None
+        watcher.close()
+        subscription.close()
+
+    asyncio.run(scenario())
+
+
+def test_a_client_that_falls_behind_is_told_to_reconnect() -> None:
+    """Overflowing the per-client buffer yields :data:`SLOW_CONSUMER`, not unbounded memory."""
+
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        hub = RunEventHub(bus, client_buffer=1)
+        slow = hub.join("run_1")
+        slow.start(None)
+
+        bus.publish(_envelope(step="a"))
+        bus.publish(_envelope(step="b"))
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if slow.overflowed:
+                break
+
+        assert await slow.next(1.0) is SLOW_CONSUMER
+        assert hub.watched_runs() == 0
+
+    asyncio.run(scenario())
+
+
+def test_last_client_leaving_releases_the_bus_subscription() -> None:
+    """Closing every client drops the run's channel and its partition subscriber."""
+
+    async def scenario() -> None:
+        bus = InMemoryEventBus()
+        hub = get_run_event_hub(bus)
+        assert get_run_event_hub(bus) is hub
+        first, second = hub.join("run_1"), hub.join("run_1")
+
+        first.close()
+        assert hub.watched_runs() == 1
+        second.close()
+        second.close()
+
+        assert hub.watched_runs() == 0
+        assert bus._registry._partition_subscribers == {}  # noqa: SLF001
+
+    asyncio.run(scenario())
+
+
+class _WorkerOnlyBus(InMemoryEventBus):
+    """Bus whose events come from another process: nothing wakes local subscribers."""
+
+    def subscribe_partition(self, partition_key: str, subscriber: Subscriber) -> Unsubscribe:
+        return lambda: None
+
+
+def test_events_published_by_another_process_reach_clients_by_polling() -> None:
+    """Without a cross-process listener the channel re-reads the run periodically."""
+
+    async def scenario() -> None:
+        bus = _WorkerOnlyBus()
+        hub = RunEventHub(bus, poll_interval=0.02)
+        subscription = hub.join("run_1")
+        subscription.start(None)
+
+        event_id = bus.publish(_envelope())
+        item = await subscription.next(1.0)
+
+        assert item is not None and item[1].eventId == event_id  # type: ignore[index]
+        subscription.close()
+
+    asyncio.run(scenario())
+
+
+def test_a_cross_process_bus_is_not_polled() -> None:
+    """A bus that delivers other processes' events itself disables the re-read."""
+
+    class _CrossProcessBus(InMemoryEventBus):
+        cross_process = True
+
+    async def scenario() -> None:
+        assert RunEventHub(_CrossProcessBus()).poll_interval is None
+        assert RunEventHub(InMemoryEventBus()).poll_interval == DEFAULT_POLL_INTERVAL_SECONDS
+
+    asyncio.run(scenario())
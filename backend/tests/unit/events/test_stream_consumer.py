@@ -0,0 +1,290 @@
+"""Cross-process delivery tests for the Redis Streams readers (E9-S3)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from backend.events.bus import RedisEventBus
+from backend.events.catalog import EventEnvelope, make_envelope
+from backend.events.stream_consumer import (
+    FEED_STREAM_KEY,
+    PartitionStreamListener,
+    StreamGroupConsumer,
+)
+
+Entry = tuple[str, dict[str, str]]
+
+
+def _key(entry_id: str) -> tuple[int, int]:
+    ms, _, seq = entry_id.partition("-")
+    return (int(ms), int(seq or 0))
+
+
+class _FakeStreamsClient:
+    """In-memory Redis stand-in with blocking reads and consumer groups.
+
+    Several buses sharing one instance behave like replicas sharing one Redis.
+    """
+
+    def __init__(self) -> None:
+        self.streams: dict[str, list[Entry]] = {}
+        self.groups: dict[tuple[str, str], dict[str, Any]] = {}
+        self._next = 0
+        self._changed = threading.Condition()
+
+    def ping(self) -> bool:
+        return True
+
+    def xadd(self, key: str, fields: dict[str, str], **_kwargs: Any) -> str:
+        with self._changed:
+            self._next += 1
+            entry_id = f"{self._next}-0"
+            self.streams.setdefault(key, []).append((entry_id, dict(fields)))
+            self._changed.notify_all()
+            return entry_id
+
+    def xrange(self, key: str, min: str = "-") -> list[Entry]:
+        entries = self.streams.get(key, [])
+        if min == "-":
+            return list(entries)
+        return [entry for entry in entries if _key(entry[0]) > _key(min.lstrip("("))]
+
+    def xrevrange(self, key: str, count: int | None = None) -> list[Entry]:
+        return list(reversed(self.streams.get(key, [])))[:count]
+
+    def _after(self, key: str, cursor: str, count: int | None) -> list[Entry]:
+        return [e for e in self.streams.get(key, []) if _key(e[0]) > _key(cursor)][:count]
+
+    def xread(
+        self, streams: dict[str, str], count: int | None = None, block: int | None = None
+    ) -> list[tuple[str, list[Entry]]]:
+        with self._changed:
+            deadline = time.monotonic() + (block or 0) / 1000
+            while True:
+                result = [
+                    (key, entries)
+                    for key, cursor in streams.items()
+                    if (entries := self._after(key, cursor, count))
+                ]
+                remaining = deadline - time.monotonic()
+                if result or block is None or remaining <= 0:
+                    return result
+                self._changed.wait(remaining)
+
+    def xgroup_create(self, key: str, group: str, id: str = "$", mkstream: bool = False) -> None:
+        if (key, group) in self.groups:
+            raise RuntimeError("BUSYGROUP Consumer Group name already exists")
+        entries = self.streams.setdefault(key, [])
+        last = entries[-1][0] if id == "$" and entries else "0-0"
+        self.groups[(key, group)] = {"last": last, "pending": {}}
+
+    def xreadgroup(
+        self,
+        group: str,
+        consumer: str,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[tuple[str, list[Entry]]]:
+        result = []
+        for key in streams:
+            state = self.groups[(key, group)]
+            entries = self._after(key, state["last"], count)
+            if entries:
+                state["last"] = entries[-1][0]
+                for entry_id, _fields in entries:
+                    state["pending"][entry_id] = (consumer, time.monotonic(), 1)
+                result.append((key, entries))
+        return result
+
+    def xack(self, key: str, group: str, *ids: str) -> int:
+        pending = self.groups[(key, group)]["pending"]
+        return sum(pending.pop(entry_id, None) is not None for entry_id in ids)
+
+    def xautoclaim(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+    ) -> list[Any]:
+        pending = self.groups[(key, group)]["pending"]
+        now = time.monotonic()
+        fields = dict(self.streams.get(key, []))
+        claimed = []
+        for entry_id, (_owner, since, delivered) in sorted(
+            pending.items(), key=lambda i: _key(i[0])
+        ):
+            if (now - since) * 1000 >= min_idle_time:
+                pending[entry_id] = (consumer, now, delivered + 1)
+                claimed.append((entry_id, fields.get(entry_id)))
+        return ["0-0", claimed[:count], []]
+
+    def xpending_range(
+        self, key: str, group: str, min: str, max: str, count: int
+    ) -> list[dict[str, Any]]:
+        pending = self.groups[(key, group)]["pending"]
+        return [
+            {"message_id": entry_id, "consumer": owner, "times_delivered": delivered}
+            for entry_id, (owner, _since, delivered) in sorted(
+                pending.items(), key=lambda i: _key(i[0])
+            )
+            if _key(min) <= _key(entry_id) <= _key(max)
+        ][:count]
+
+
+def _envelope(partition: str = "run_1", step: str = "coder") -> EventEnvelope:
+    return make_envelope(
+        "run.step.started",
+        tenant_id="acme",
+        partition_key=partition,
+        data={"stepKey": step, "agent": "autodev/agent-coder"},
+    )
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def test_partition_listener_delivers_only_new_entries_of_watched_partitions() -> None:
+    """The listener starts at the stream's end and keeps one cursor per partition."""
+    client = _FakeStreamsClient()
+    publisher = RedisEventBus(client=client)
+    publisher.publish(_envelope(step="before-watch"))
+    received: list[str] = []
+    listener = PartitionStreamListener(
+        client, lambda e: received.append(e.data["stepKey"]), block_ms=10
+    )
+
+    listener.watch("run_1")
+    publisher.publish(_envelope(step="s1"))
+    publisher.publish(_envelope(partition="run_2", step="other-run"))
+    publisher.publish(_envelope(step="s2"))
+
+    assert listener.poll_once() == 2
+    assert listener.poll_once() == 0
+    assert received == ["s1", "s2"]
+    listener.unwatch("run_1")
+    assert listener.watched() == []
+
+
+def test_partition_subscribers_see_events_published_by_another_replica() -> None:
+    """Two buses on one Redis: a run watched on replica B is woken by replica A's publish."""
+    client = _FakeStreamsClient()
+    replica_a = RedisEventBus(client=client, cross_process=True, block_ms=20)
+    replica_b = RedisEventBus(client=client, cross_process=True, block_ms=20)
+    received: list[str] = []
+    try:
+        unsubscribe = replica_b.subscribe_partition("run_1", lambda e: received.append(e.eventId))
+        published = replica_a.publish(_envelope())
+
+        _wait_until(lambda: received == [published])
+        unsubscribe()
+        assert replica_b._listener is not None and replica_b._listener.watched() == []
+    finally:
+        replica_a.close()
+        replica_b.close()
+
+
+def test_group_consumers_share_the_feed_and_acknowledge_handled_entries() -> None:
+    """Each feed entry is handled by exactly one consumer of the group, then acked."""
+    client = _FakeStreamsClient()
+    bus = RedisEventBus(client=client, cross_process=True)
+    handled: dict[str, list[str]] = {"c1": [], "c2": []}
+
+    def _handler(name: str) -> Callable[[EventEnvelope], None]:
+        def _handle(envelope: EventEnvelope) -> None:
+            handled[name].append(envelope.eventId)
+
+        return _handle
+
+    consumers = {
+        name: StreamGroupConsumer(
+            client, group="projections", consumer=name, handler=_handler(name), block_ms=0
+        )
+        for name in handled
+    }
+
+    ids = [bus.publish(_envelope(step=f"s{index}")) for index in range(3)]
+    consumers["c1"].poll_once()
+    consumers["c2"].poll_once()
+
+    assert sorted(handled["c1"] + handled["c2"]) == sorted(ids)
+    assert client.groups[(FEED_STREAM_KEY, "projections")]["pending"] == {}
+
+
+def test_entries_a_consumer_failed_on_are_reclaimed_by_another() -> None:
+    """A handler failure leaves the entry pending; ``XAUTOCLAIM`` hands it on."""
+    client = _FakeStreamsClient()
+    bus = RedisEventBus(client=client, cross_process=True)
+
+    def _crash(_envelope: EventEnvelope) -> None:
+        raise RuntimeError("consumer died mid-event")
+
+    failing = StreamGroupConsumer(
+        client, group="g", consumer="dead", handler=_crash, block_ms=0, min_idle_ms=0
+    )
+    event_id = bus.publish(_envelope())
+    assert failing.poll_once() == 0
+    assert len(client.groups[(FEED_STREAM_KEY, "g")]["pending"]) == 1
+
+    recovered: list[str] = []
+    survivor = StreamGroupConsumer(
+        client,
+        group="g",
+        consumer="alive",
+        handler=lambda e: recovered.append(e.eventId),
+        block_ms=0,
+        min_idle_ms=0,
+    )
+    assert survivor.reclaim() == 1
+    assert recovered == [event_id]
+    assert client.groups[(FEED_STREAM_KEY, "g")]["pending"] == {}
+
+
+def test_entry_that_keeps_failing_is_dead_lettered_after_max_deliveries() -> None:
+    """A poison entry is copied to ``<stream>:dead`` and acked instead of staying pending."""
+    client = _FakeStreamsClient()
+    bus = RedisEventBus(client=client, cross_process=True)
+
+    def _crash(_envelope: EventEnvelope) -> None:
+        raise RuntimeError("handler bug")
+
+    consumer = StreamGroupConsumer(
+        client,
+        group="g",
+        consumer="c",
+        handler=_crash,
+        block_ms=0,
+        min_idle_ms=0,
+        max_deliveries=3,
+    )
+    event_id = bus.publish(_envelope())
+    assert consumer.poll_once() == 0
+    assert consumer.reclaim() == 0
+    assert client.streams.get(f"{FEED_STREAM_KEY}:dead") is None
+
+    assert consumer.reclaim() == 1
+
+    assert client.groups[(FEED_STREAM_KEY, "g")]["pending"] == {}
+    [(_dead_id, fields)] = client.streams[f"{FEED_STREAM_KEY}:dead"]
+    assert EventEnvelope.model_validate_json(fields["envelope"]).eventId == event_id
+    assert (fields["dead_group"], fields["dead_error"]) == ("g", "RuntimeError")
+
+
+def test_consume_group_requires_cross_process_mode() -> None:
+    """Without the feed stream there is nothing for a group to read."""
+    bus = RedisEventBus(client=_FakeStreamsClient())
+
+    with pytest.raises(RuntimeError, match="cross_process"):
+        bus.consume_group("g", "c", lambda _e: None)
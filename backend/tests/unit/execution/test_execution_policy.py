@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -182,3 +183,151 @@ def test_revoke_dynamic_permission_removes_it(tmp_path: Path) -> None:
     assert service.list_dynamic_permissions("acme")
     assert service.revoke_dynamic_permission("acme", permission_id) is True
     assert service.list_dynamic_permissions("acme") == []
+
+
+def test_the_compiled_index_is_reused_until_a_rule_or_grant_changes(tmp_path: Path) -> None:
+    """Repeat decisions skip the store; ``set_rule``/grant/revoke apply at once."""
+    service = _service(tmp_path, profile="local")
+    shell_deny = PolicyRule(
+        category=PolicyCategory.SHELL,
+        effect=PolicyEffect.DENY,
+        scope_kind=PolicyScopeKind.PROJECT,
+        scope_id="*",
+    )
+    service.set_rule("acme", shell_deny)
+    store = service._store  # noqa: SLF001
+    reads: list[str] = []
+    original = store.list_rules
+
+    def _counting(tenant_id: str) -> list[PolicyRule]:
+        reads.append(tenant_id)
+        return original(tenant_id)
+
+    store.list_rules = _counting  # type: ignore[method-assign]
+    pytest_action = _action(command=["pytest"])
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+    assert reads == ["acme"]
+
+    permission_id = service.grant_dynamic_permission(
+        "acme",
+        PolicyRule(
+            category=PolicyCategory.SHELL,
+            effect=PolicyEffect.ALLOW,
+            scope_kind=PolicyScopeKind.PROJECT,
+            scope_id="*",
+            pattern="py*",
+        ),
+        actor="operator@example.com",
+    )
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is True
+    service.revoke_dynamic_permission("acme", permission_id)
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+    assert reads == ["acme", "acme", "acme"]
+
+
+def test_an_index_rebuilt_across_a_revoke_is_not_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A rebuild that read a grant revoked meanwhile decides once, then is rebuilt."""
+    service = _service(tmp_path, profile="local")
+    service.set_rule(
+        "acme",
+        PolicyRule(
+            category=PolicyCategory.SHELL,
+            effect=PolicyEffect.DENY,
+            scope_kind=PolicyScopeKind.PROJECT,
+            scope_id="*",
+        ),
+    )
+    permission_id = service.grant_dynamic_permission(
+        "acme",
+        PolicyRule(
+            category=PolicyCategory.SHELL,
+            effect=PolicyEffect.ALLOW,
+            scope_kind=PolicyScopeKind.PROJECT,
+            scope_id="*",
+            pattern="py*",
+        ),
+        actor="operator@example.com",
+    )
+    store = service._store
+    original = store.list_dynamic_permissions
+
+    def _read_then_revoke(tenant_id: str) -> list[tuple[str, PolicyRule]]:
+        permissions = original(tenant_id)
+        monkeypatch.setattr(store, "list_dynamic_permissions", original)
+        service.revoke_dynamic_permission(tenant_id, permission_id)
+        return permissions
+
+    monkeypatch.setattr(store, "list_dynamic_permissions", _read_then_revoke)
+    pytest_action = _action(command=["pytest"])
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is True
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+
+
+def test_a_write_through_another_store_applies_to_the_next_decision(tmp_path: Path) -> None:
+    """Another process's write bumps the durable generation, so the cached index is rebuilt."""
+    service = _service(tmp_path, profile="local")
+    shell_deny = PolicyRule(
+        category=PolicyCategory.SHELL,
+        effect=PolicyEffect.DENY,
+        scope_kind=PolicyScopeKind.PROJECT,
+        scope_id="*",
+    )
+    service.set_rule("acme", shell_deny)
+    pytest_action = _action(command=["pytest"])
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+    generation = service._store.policy_generation("acme")
+
+    other = PolicyStore(db_path=tmp_path / "policy.db")
+    permission_id = other.add_dynamic_permission(
+        "acme",
+        PolicyRule(
+            category=PolicyCategory.SHELL,
+            effect=PolicyEffect.ALLOW,
+            scope_kind=PolicyScopeKind.PROJECT,
+            scope_id="*",
+            pattern="py*",
+        ),
+        actor="operator@example.com",
+    )
+    assert other.policy_generation("acme") == generation + 1
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is True
+
+    assert other.remove_dynamic_permission("acme", "missing") is False
+    assert other.policy_generation("acme") == generation + 1
+    other.remove_dynamic_permission("acme", permission_id)
+    assert service.preview(tenant_id="acme", action=pytest_action).allowed is False
+
+
+def test_evaluate_many_decides_records_and_emits_per_action(tmp_path: Path) -> None:
+    """A task's actions are decided against one index and audited in one write."""
+    service = _service(tmp_path, profile="local")
+    service.set_rule(
+        "acme",
+        PolicyRule(
+            category=PolicyCategory.SHELL,
+            effect=PolicyEffect.ALLOW,
+            scope_kind=PolicyScopeKind.PROJECT,
+            scope_id="*",
+        ),
+    )
+    actions = [
+        _action(action_id="a1", command=["pytest"]),
+        _action(action_id="a2", path="src/app.py"),
+    ]
+
+    decisions = service.evaluate_many(tenant_id="acme", actions=actions, run_id="run-1")
+
+    assert [(d.allowed, d.matched) for d in decisions] == [(True, True), (False, False)]
+    assert decisions == [
+        service.preview(tenant_id="acme", action=action) for action in actions
+    ]
+    with sqlite3.connect(tmp_path / "policy.db") as conn:
+        rows = conn.execute(
+            "SELECT action_id, allowed FROM execution_policy_decisions ORDER BY action_id"
+        ).fetchall()
+    assert rows == [("a1", 1), ("a2", 0)]
+    types = [envelope.type for envelope in get_event_bus().replay("run-1")]
+    assert types == ["execution.policy.allowed", "execution.policy.denied"]
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import time
-from contextlib import closing
 from pathlib import Path
 from typing import Any, Callable
 
@@ -513,7 +512,7 @@ class TestDeterministicReplay:
         store, engine, run = self._run_with_rework_loop(tmp_path)
         # Corrupt the SECOND (successful) work step so the gate predicate
         # would route back to `work` instead of `finish` on replay.
-        with closing(store.connect()) as conn:
+        with store.connect() as conn:
             conn.execute(
                 """
                 UPDATE flow_steps SET output_json = ?
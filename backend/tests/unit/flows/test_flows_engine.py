@@ -400,3 +400,30 @@ class TestFlowRegistry:
         catalog = registry.catalog()
         assert catalog["schemaVersion"] == "1"
         assert len(catalog["flows"]) == 3
+
+    def test_resolve_is_cached_until_any_registry_registers(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hot-path resolution skips the store; a new version shows up at once."""
+        store = SQLiteStore(f"sqlite:///{tmp_path / 'registry.db'}")
+        registry = FlowRegistry(store)
+        registry.register_raw(_linear_flow())
+        reads: list[str | None] = []
+        list_flows = registry.list_flows
+
+        def counting_list_flows(*, flow_id: str | None = None) -> Any:
+            reads.append(flow_id)
+            return list_flows(flow_id=flow_id)
+
+        monkeypatch.setattr(registry, "list_flows", counting_list_flows)
+
+        first = registry.resolve("autodev/flow-linear")
+        assert registry.resolve("autodev/flow-linear") is first
+        assert reads == ["autodev/flow-linear"]
+
+        newer = _linear_flow()
+        newer["version"] = "1.1.0"
+        FlowRegistry(store).register_raw(newer)
+
+        assert registry.resolve("autodev/flow-linear").version == "1.1.0"
+        assert len(reads) == 2
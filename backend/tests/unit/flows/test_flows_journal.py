@@ -0,0 +1,233 @@
+"""Delta checkpoints: journaled state deltas, compaction, stale bases, metrics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from backend.flows.journal import apply_delta, state_delta
+from backend.flows.state import FlowRunStore
+from backend.observability.metrics import (
+    NoopMetricSink,
+    get_metric_sink,
+    set_metric_sink,
+)
+from backend.persistence.pool import ConnectionCheckout
+from backend.persistence.sqlite_adapter import SQLiteStore
+
+
+class _RecordingSink(NoopMetricSink):
+    """Metric sink that keeps every checkpoint observation."""
+
+    def __init__(self) -> None:
+        self.checkpoints: list[tuple[str, int]] = []
+        self.runs: list[tuple[str, int]] = []
+
+    def record_flow_checkpoint(self, *, kind: str, size_bytes: int) -> None:
+        self.checkpoints.append((kind, size_bytes))
+
+    def record_flow_run_checkpoints(self, *, status: str, size_bytes: int) -> None:
+        self.runs.append((status, size_bytes))
+
+
+@pytest.fixture
+def sink() -> Any:
+    """Install a recording metric sink for the duration of one test."""
+    previous = get_metric_sink()
+    recording = _RecordingSink()
+    set_metric_sink(recording)
+    yield recording
+    set_metric_sink(previous)
+
+
+def _store(tmp_path: Path, **kwargs: Any) -> tuple[SQLiteStore, FlowRunStore]:
+    backing = SQLiteStore(f"sqlite:///{tmp_path / 'flows.db'}")
+    return backing, FlowRunStore(backing, **kwargs)
+
+
+def _initial_state() -> dict[str, Any]:
+    return {"cursor": "a", "nodes": {}, "metrics": {"tokens": 0.0, "cost_usd": 0.0}}
+
+
+def _advance(state: dict[str, Any], node_id: str, payload: str) -> None:
+    state["nodes"][node_id] = {"output": {"blob": payload}}
+    state["metrics"]["tokens"] += 10.0
+    state["cursor"] = node_id
+
+
+def _journal(backing: SQLiteStore, run_id: str) -> list[tuple[int, bool]]:
+    with backing.connect() as conn:
+        rows = conn.execute(
+            "SELECT sequence, delta_json IS NULL FROM flow_state_journal "
+            "WHERE run_id = ? ORDER BY sequence",
+            (run_id,),
+        ).fetchall()
+    return [(int(row[0]), bool(row[1])) for row in rows]
+
+
+def _snapshot(backing: SQLiteStore, run_id: str) -> str:
+    with backing.connect() as conn:
+        row = conn.execute(
+            "SELECT state_json FROM flow_runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+    return str(row[0])
+
+
+def test_state_delta_round_trips() -> None:
+    """Applying the delta of two states to the first yields the second."""
+    before = {"cursor": "a", "nodes": {"a": {"output": 1}}, "budget_cap": 5}
+    after = {"cursor": "b", "nodes": {"a": {"output": 1}, "b": {"output": 2}}}
+
+    ops = state_delta(before, after)
+    apply_delta(before, ops)
+
+    assert before == after
+    assert {"op": "set", "path": ["nodes", "b"], "value": {"output": 2}} in ops
+    assert not any(op["path"] == ["nodes", "a"] for op in ops)
+    assert state_delta(after, after) == []
+
+
+def test_state_delta_preserves_mapping_key_order() -> None:
+    """A mapping whose new key sorts before an existing one is set whole."""
+    before = {"nodes": {"b": 2}}
+    after = {"nodes": {"a": 1, "b": 2}}
+
+    ops = state_delta(before, after)
+    apply_delta(before, ops)
+
+    assert list(before["nodes"]) == ["a", "b"]
+    assert ops == [{"op": "set", "path": ["nodes"], "value": {"a": 1, "b": 2}}]
+
+
+def test_steps_are_journaled_and_reads_rebuild_the_full_state(
+    tmp_path: Path,
+) -> None:
+    """Only new outputs are written; any store reads snapshot plus deltas."""
+    backing, runs = _store(tmp_path)
+    state = _initial_state()
+    run = runs.create_run(flow_id="f", flow_version="1", state=state)
+    runs.update_run(run.run_id, status="running")
+    for node_id in ("a", "b", "c"):
+        _advance(state, node_id, node_id * 4096)
+        runs.update_run(run.run_id, state=state)
+
+    assert _journal(backing, run.run_id) == [(1, False), (2, False), (3, False)]
+    assert "bbbb" not in _snapshot(backing, run.run_id)
+    fresh = FlowRunStore(backing)
+    record = fresh.get_run(run.run_id)
+    assert record is not None and record.state == state
+    assert [r.state for r in fresh.list_runs(flow_id="f")] == [state]
+
+
+def test_journal_is_compacted_periodically_and_at_terminal_status(
+    tmp_path: Path,
+) -> None:
+    """Every ``snapshot_every`` deltas, and on completion, state_json is rewritten."""
+    backing, runs = _store(tmp_path, snapshot_every=2)
+    state = _initial_state()
+    run = runs.create_run(flow_id="f", flow_version="1", state=state)
+    for node_id in ("a", "b", "c"):
+        _advance(state, node_id, node_id)
+        runs.update_run(run.run_id, state=state)
+
+    assert _journal(backing, run.run_id) == [(3, True)]
+    _advance(state, "d", "d")
+    runs.update_run(run.run_id, state=state)
+    assert _journal(backing, run.run_id) == [(3, True), (4, False)]
+
+    runs.update_run(run.run_id, status="completed", state=state, output={})
+
+    assert _journal(backing, run.run_id) == [(5, True)]
+    assert '"d"' in _snapshot(backing, run.run_id)
+    record = runs.get_run(run.run_id)
+    assert record is not None and record.state == state
+
+
+def test_a_stale_base_falls_back_to_a_snapshot(tmp_path: Path) -> None:
+    """A store whose base another writer moved on never journals against it."""
+    backing, engine_runs = _store(tmp_path)
+    other_runs = FlowRunStore(backing)
+    state = _initial_state()
+    run = engine_runs.create_run(flow_id="f", flow_version="1", state=state)
+    _advance(state, "a", "a")
+    engine_runs.update_run(run.run_id, state=state)
+
+    other = other_runs.get_run(run.run_id)
+    assert other is not None
+    other_state = other.state
+    other_state["decision"] = "approve"
+    other_runs.update_run(run.run_id, state=other_state)
+    assert _journal(backing, run.run_id)[-1] == (2, True)
+
+    _advance(other_state, "b", "b")
+    engine_runs.update_run(run.run_id, state=other_state)
+
+    assert _journal(backing, run.run_id) == [(3, True)]
+    record = FlowRunStore(backing).get_run(run.run_id)
+    assert record is not None and record.state == other_state
+
+
+def test_checkpoint_bytes_are_reported(tmp_path: Path, sink: _RecordingSink) -> None:
+    """Each write reports its size; the terminal write reports the run total."""
+    _, runs = _store(tmp_path)
+    state = _initial_state()
+    run = runs.create_run(flow_id="f", flow_version="1", state=state)
+    _advance(state, "a", "x" * 1000)
+    runs.update_run(run.run_id, state=state)
+    runs.update_run(run.run_id, state=state)
+    runs.update_run(run.run_id, status="failed", state=state)
+
+    kinds = [kind for kind, _ in sink.checkpoints]
+    assert kinds == ["snapshot", "delta", "snapshot"]
+    assert all(size > 0 for _, size in sink.checkpoints)
+    assert sink.runs == [("failed", sum(size for _, size in sink.checkpoints))]
+
+
+class _RecordingConnection:
+    """Postgres stand-in that records statements; every run has an empty journal."""
+
+    def __init__(self, statements: list[str]) -> None:
+        self.statements = statements
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> _RecordingConnection:
+        self.statements.append(" ".join(sql.split()))
+        return self
+
+    def fetchone(self) -> tuple[int]:
+        return (0,)
+
+    def fetchall(self) -> list[Any]:
+        return []
+
+    def commit(self) -> None:
+        self.statements.append("COMMIT")
+
+
+class _RecordingPostgresStore:
+    database_url = "postgresql://flows"
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def connect(self) -> ConnectionCheckout[_RecordingConnection]:
+        return ConnectionCheckout(_RecordingConnection(self.statements), lambda: None)
+
+
+def test_postgres_checkpoints_lock_the_run_and_reads_share_one_snapshot() -> None:
+    """The run row is locked before the journal head is read; reads run repeatable."""
+    backing = _RecordingPostgresStore()
+    runs = FlowRunStore(backing)
+
+    backing.statements.clear()
+    runs.update_run("run-1", state=_initial_state())
+    assert backing.statements[:2] == [
+        "SELECT run_id FROM flow_runs WHERE run_id = %s FOR UPDATE",
+        "SELECT COALESCE(MAX(sequence), 0) FROM flow_state_journal WHERE run_id = %s",
+    ]
+
+    backing.statements.clear()
+    runs.list_runs(flow_id="f")
+    assert backing.statements[0] == "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+    assert backing.statements[-1] == "COMMIT"
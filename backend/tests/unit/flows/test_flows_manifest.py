@@ -23,6 +23,7 @@ from backend.flows.manifest import (
     validate_flow_manifest,
     version_in_range,
 )
+from backend.flows.templates import compile_template, guard_holds, render_node_input
 
 SCHEMA_PATH = (
     Path(__file__).resolve().parents[3] / "flows" / "schemas" / "flow.schema.json"
@@ -347,6 +348,47 @@ class TestConditionalEdgePredicates:
         rendered = render_template({"t": ["{{ flow.input.task }}"]}, state)
         assert rendered == {"t": ["fix"]}
 
+    def test_compiled_expressions_are_cached_by_source(self) -> None:
+        """Re-compiling the same source reuses the parsed expression."""
+        source = "nodes.cache-probe.output.ok == true"
+        assert compile_expression(source) is compile_expression(source)
+        assert compile_expression(source) is not compile_expression(f" {source}")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "{{ flow.input.count }}",
+            "  {{ flow.input.task }}  ",
+            "task: {{ flow.input.task }}, n={{ flow.input.count }}!",
+            "#{{ flow.input.task }}{{ flow.input.count }}",
+            "no templates",
+            {"t": ["{{ flow.input.task }}", 3, None], "n": {"m": "{{ item }}"}},
+            7,
+        ],
+    )
+    def test_template_plan_matches_render_template(self, value: Any) -> None:
+        """A compiled plan renders exactly what render_template does."""
+        state = {"flow": {"input": {"task": "fix", "count": 2}}, "item": [1]}
+        plan = compile_template(value)
+        assert plan.render(state) == render_template(value, state)
+        assert plan.render(state) == plan.render(state)
+
+    def test_validated_manifest_carries_a_render_plan(self) -> None:
+        """Bindings and guards are compiled once, at validation."""
+        manifest = validate_flow_manifest(_all_node_types_flow()).manifest
+        assert manifest is not None and manifest.render_plan is not None
+        plan = manifest.render_plan
+        assert set(plan.inputs) == {node.id for node in manifest.nodes}
+        assert all(edge.when in plan.guards for edge in manifest.edges if edge.when)
+        edge = manifest.edges_from("gate")[0]
+        state = {"nodes": {"lint": {"output": {"ok": True}}}}
+        assert guard_holds(manifest, edge, state) is True
+        for node in manifest.nodes:
+            if node.type != "map":
+                assert render_node_input(manifest, node, state) == render_template(
+                    dict(node.input_bindings), state
+                )
+
 
 class TestVersioning:
     """Flow versioning (E3-S1-T3)."""
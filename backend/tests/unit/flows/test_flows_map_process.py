@@ -0,0 +1,251 @@
+"""``map`` nodes with ``executor: process``: worker branches, budgets, fail-closed."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from backend.config.settings import Settings
+from backend.flows import map_process
+from backend.flows.engine import FlowEngine
+from backend.flows.handlers import (
+    CallableRegistry,
+    NodeContext,
+    NodeOutcome,
+    build_default_handlers,
+)
+from backend.flows.manifest import validate_flow_manifest
+from backend.persistence.sqlite_adapter import SQLiteStore
+
+ROOT = Path(__file__).resolve().parents[4]
+BENCHMARK = ROOT / "scripts" / "benchmark_map_executor.py"
+
+CHILD_FLOW: dict[str, Any] = {
+    "schemaVersion": "1",
+    "id": "autodev/flow-child",
+    "version": "1.0.0",
+    "hostApi": ">=2.0 <3.0",
+    "nodes": [
+        {
+            "id": "transform",
+            "type": "skill",
+            "ref": "autodev/skill-transform",
+            "input": {"value": "{{ flow.input.value }}"},
+        }
+    ],
+    "edges": [],
+}
+
+
+def _transform(payload: dict[str, Any]) -> dict[str, Any]:
+    """Upper-case ``value`` and report the process that did it."""
+    if payload["value"] == "boom":
+        raise RuntimeError("transform exploded")
+    return {"transformed": str(payload["value"]).upper(), "pid": os.getpid()}
+
+
+def _costly(ctx: NodeContext) -> NodeOutcome:
+    """Skill handler charging 0.4 USD per activation."""
+    return NodeOutcome(output={"transformed": "x"}, metrics={"cost_usd": 0.4})
+
+
+def worker_engine(database_url: str) -> FlowEngine:
+    """Process engine factory installing :func:`_transform`."""
+    store = SQLiteStore(database_url)
+    callables = CallableRegistry()
+    callables.register("autodev/skill-transform", _transform)
+    return FlowEngine(
+        store=store, handlers=build_default_handlers(store=store, callables=callables)
+    )
+
+
+def costly_worker_engine(database_url: str) -> FlowEngine:
+    """Process engine factory whose skills all cost 0.4 USD."""
+    engine = FlowEngine(store=SQLiteStore(database_url))
+    engine.handlers.register("skill", _costly)
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def cross_process_bus(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Report a cross-process event bus to the ``executor: process`` check.
+
+    Workers spawned here still use the in-memory bus; no Redis is needed.
+    """
+    settings = Settings(autodev_event_bus="redis", autodev_event_bus_cross_process=True)
+    monkeypatch.setattr(map_process, "get_settings", lambda: settings)
+    yield
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stop_worker_pools() -> Iterator[None]:
+    yield
+    map_process.shutdown_process_pools()
+
+
+def _engine(tmp_path: Path, factory: Any = worker_engine) -> FlowEngine:
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'flows.db'}")
+    engine = FlowEngine(store=store, process_engine_factory=factory)
+    engine.registry.register_raw(CHILD_FLOW)
+    return engine
+
+
+def _map_parent(**extra: Any) -> dict[str, Any]:
+    """A parent flow fanning the child out with ``executor: process``."""
+    return {
+        "schemaVersion": "1",
+        "id": "autodev/flow-map",
+        "version": "1.0.0",
+        "hostApi": ">=2.0 <3.0",
+        "nodes": [
+            {
+                "id": "fan",
+                "type": "map",
+                "ref": "autodev/flow-child",
+                "over": "{{ flow.input.items }}",
+                "input": {"value": "{{ item }}"},
+                "executor": "process",
+                "maxParallel": 2,
+            }
+        ],
+        "edges": [],
+        **extra,
+    }
+
+
+def test_branches_run_in_worker_processes_in_input_order(tmp_path: Path) -> None:
+    """Children execute outside the parent process and collect in order."""
+    engine = _engine(tmp_path)
+    engine.registry.register_raw(_map_parent())
+    items = ["a", "b", "c", "d"]
+
+    run = engine.start_run("autodev/flow-map", input={"items": items})
+
+    assert run.status == "completed", run.state
+    assert run.output is not None
+    assert [out["transformed"] for out in run.output["items"]] == ["A", "B", "C", "D"]
+    assert os.getpid() not in {out["pid"] for out in run.output["items"]}
+    children = engine.runs.list_runs(parent_run_id=run.run_id)
+    assert {child.run_id for child in children} == set(run.output["childRunIds"])
+    assert all(child.trigger["type"] == "map" for child in children)
+
+
+def test_failed_branch_fails_the_step_closed(tmp_path: Path) -> None:
+    """A child failing in a worker fails the parent like a thread branch."""
+    engine = _engine(tmp_path)
+    engine.registry.register_raw(_map_parent())
+
+    run = engine.start_run("autodev/flow-map", input={"items": ["a", "boom"]})
+
+    assert run.status == "failed"
+    assert run.stop_reason == "node_failed"
+
+
+def test_branches_keep_in_flight_budget_reservations(tmp_path: Path) -> None:
+    """Each worker branch runs under its reserved share, as on threads."""
+    engine = _engine(tmp_path, factory=costly_worker_engine)
+    engine.registry.register_raw(
+        _map_parent(
+            budgets={"maxCostUsd": 0.5, "maxWallClockSec": 60, "maxTokens": 1000}
+        )
+    )
+
+    run = engine.start_run("autodev/flow-map", input={"items": ["a", "b"]})
+
+    assert run.status == "failed"
+    assert run.stop_reason == "budget_exhausted"
+    children = engine.runs.list_runs(parent_run_id=run.run_id)
+    assert children
+    for child in children:
+        assert child.state["budget_cap"]["max_cost_usd"] == pytest.approx(0.25)
+        assert child.stop_reason == "budget_exhausted"
+
+
+def test_worker_pool_is_shared_across_activations(tmp_path: Path) -> None:
+    """A second activation reuses the first one's warm workers."""
+    engine = _engine(tmp_path)
+    engine.registry.register_raw(_map_parent())
+
+    first = engine.start_run("autodev/flow-map", input={"items": ["a", "b"]})
+    second = engine.start_run("autodev/flow-map", input={"items": ["c", "d"]})
+
+    assert first.output is not None and second.output is not None
+    pids = {out["pid"] for out in first.output["items"] + second.output["items"]}
+    assert len(pids) <= 2  # one pool of maxParallel workers served both
+
+
+def test_without_the_cross_process_bus_fails_closed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Children whose events could not reach the parent's subscribers never start."""
+    monkeypatch.setattr(map_process, "get_settings", Settings)
+    engine = _engine(tmp_path)
+    engine.registry.register_raw(_map_parent())
+
+    run = engine.start_run("autodev/flow-map", input={"items": ["a"]})
+
+    assert run.status == "failed"
+    assert engine.runs.list_runs(parent_run_id=run.run_id) == []
+    step = engine.runs.list_steps(run.run_id)[-1]
+    assert step.status == "failed" and "cross-process" in str(step.error)
+
+
+def test_unpicklable_factory_fails_closed(tmp_path: Path) -> None:
+    """A factory workers cannot import fails the step before any launch."""
+    engine = _engine(tmp_path, factory=lambda url: worker_engine(url))
+    engine.registry.register_raw(_map_parent())
+
+    run = engine.start_run("autodev/flow-map", input={"items": ["a"]})
+
+    assert run.status == "failed"
+    assert engine.runs.list_runs(parent_run_id=run.run_id) == []
+    step = engine.runs.list_steps(run.run_id)[-1]
+    assert step.status == "failed" and "module-level" in str(step.error)
+
+
+@pytest.mark.parametrize(
+    ("node_extra", "message"),
+    [
+        ({"executor": "cluster"}, "executor must be one of"),
+        ({"type": "skill", "over": None}, "only allowed on map nodes"),
+    ],
+)
+def test_executor_manifest_rules(node_extra: dict[str, Any], message: str) -> None:
+    """``executor`` takes a known value and only appears on map nodes."""
+    raw = _map_parent()
+    node = raw["nodes"][0]
+    node.update(node_extra)
+    for key in [key for key, value in node.items() if value is None]:
+        del node[key]
+
+    result = validate_flow_manifest(raw)
+
+    assert not result.valid
+    assert any(message in error for error in result.errors), result.errors
+
+
+def _load_benchmark() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("benchmark_map_executor", BENCHMARK)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_reports_both_executors() -> None:
+    """The benchmark script times the same fan-out on threads and processes."""
+    result = _load_benchmark().run_benchmark(items=2, workers=1, rounds=1000)
+
+    assert result["thread_seconds"] > 0
+    assert result["process_seconds"] > 0
+    assert result["speedup"] == pytest.approx(
+        result["thread_seconds"] / result["process_seconds"]
+    )
@@ -0,0 +1,289 @@
+"""Parallel DAG execution: ready sets, joins, concurrency caps, resume and replay."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from backend.flows.engine import FlowEngine
+from backend.flows.handlers import CallableRegistry, build_default_handlers
+from backend.flows.manifest import validate_flow_manifest
+from backend.persistence.sqlite_adapter import SQLiteStore
+
+CHECKS = ("lint", "scan", "docs")
+
+
+def _review_flow(*, max_concurrency: int = 4) -> dict[str, Any]:
+    """Checkout fans out to three independent checks that join in a report."""
+    return {
+        "schemaVersion": "1",
+        "id": "autodev/flow-review",
+        "version": "1.0.0",
+        "hostApi": ">=2.0 <3.0",
+        "triggers": [{"type": "message"}],
+        "execution": {"mode": "parallel", "maxConcurrency": max_concurrency},
+        "nodes": [
+            {"id": "checkout", "type": "skill", "ref": "autodev/skill-checkout"},
+            *(
+                {
+                    "id": check,
+                    "type": "skill",
+                    "ref": f"autodev/skill-{check}",
+                    "input": {"sha": "{{ nodes.checkout.output.sha }}"},
+                }
+                for check in CHECKS
+            ),
+            {
+                "id": "report",
+                "type": "skill",
+                "ref": "autodev/skill-report",
+                "input": {
+                    check: f"{{{{ nodes.{check}.output.ok }}}}" for check in CHECKS
+                },
+            },
+        ],
+        "edges": [
+            *({"from": "checkout", "to": check} for check in CHECKS),
+            *({"from": check, "to": "report"} for check in CHECKS),
+        ],
+    }
+
+
+def _engine(tmp_path: Path) -> tuple[FlowEngine, CallableRegistry]:
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'flows.db'}")
+    callables = CallableRegistry()
+    engine = FlowEngine(
+        store=store,
+        handlers=build_default_handlers(store=store, callables=callables),
+        sleeper=lambda _delay: None,
+    )
+    return engine, callables
+
+
+def _register_review(
+    callables: CallableRegistry, check: Any = None
+) -> dict[str, int]:
+    """Register the review flow's skills; *check* runs inside every check."""
+    counts = {name: 0 for name in ("checkout", *CHECKS, "report")}
+    lock = threading.Lock()
+
+    def _skill(name: str) -> Any:
+        def run(payload: dict[str, Any]) -> dict[str, Any]:
+            with lock:
+                counts[name] += 1
+            if name == "checkout":
+                return {"sha": "abc123"}
+            if name == "report":
+                return {"passed": all(payload.values())}
+            if check is not None:
+                check(name)
+            return {"ok": payload["sha"] == "abc123"}
+
+        return run
+
+    for name in counts:
+        callables.register(f"autodev/skill-{name}", _skill(name))
+    return counts
+
+
+def test_independent_nodes_run_concurrently_and_join(tmp_path: Path) -> None:
+    """All three checks must be in flight at once to pass the barrier."""
+    engine, callables = _engine(tmp_path)
+    barrier = threading.Barrier(len(CHECKS), timeout=5)
+    _register_review(callables, check=lambda _name: barrier.wait())
+    engine.registry.register_raw(_review_flow())
+
+    run = engine.start_run("autodev/flow-review")
+
+    assert run.status == "completed"
+    assert run.output == {"passed": True}
+    assert run.state["cursor"] is None
+    assert list(run.state["nodes"]) == ["checkout", *CHECKS, "report"]
+    assert run.state["routes"]["checkout"] == list(CHECKS)
+    report = engine.replay_run(run.run_id)
+    assert report.deterministic, report.divergences
+    assert sorted(report.recorded_sequence) == sorted(report.replayed_sequence)
+
+
+def test_checkpointed_state_reads_back_in_declaration_order(tmp_path: Path) -> None:
+    """Branches finishing in reverse order still read back in declaration order.
+
+    The read happens while the run is live, so the state comes from the
+    journal's deltas, not from a compacted snapshot.
+    """
+    engine, callables = _engine(tmp_path)
+    finished: list[str] = []
+    turn = threading.Condition()
+
+    def check(name: str) -> None:
+        # docs finishes first, then scan, then lint.
+        later = list(reversed(CHECKS[CHECKS.index(name) + 1 :]))
+        with turn:
+            assert turn.wait_for(lambda: finished == later, timeout=5)
+            finished.append(name)
+            turn.notify_all()
+
+    _register_review(callables, check=check)
+    live: list[dict[str, Any]] = []
+
+    def report(payload: dict[str, Any]) -> dict[str, Any]:
+        live.append(engine.runs.list_runs(flow_id="autodev/flow-review")[0].state)
+        return {"passed": all(payload.values())}
+
+    callables.register("autodev/skill-report", report)
+    engine.registry.register_raw(_review_flow())
+
+    run = engine.start_run("autodev/flow-review")
+
+    assert run.status == "completed"
+    assert finished == list(reversed(CHECKS))
+    assert list(live[0]["nodes"]) == ["checkout", *CHECKS]
+    assert list(live[0]["routes"]) == ["checkout", *CHECKS]
+
+
+def test_max_concurrency_caps_in_flight_nodes(tmp_path: Path) -> None:
+    """With ``maxConcurrency: 2`` no more than two checks ever overlap."""
+    engine, callables = _engine(tmp_path)
+    active = [0, 0]  # current, peak
+    lock = threading.Lock()
+
+    def check(_name: str) -> None:
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        threading.Event().wait(0.05)
+        with lock:
+            active[0] -= 1
+
+    _register_review(callables, check=check)
+    engine.registry.register_raw(_review_flow(max_concurrency=2))
+
+    assert engine.start_run("autodev/flow-review").status == "completed"
+    assert active[1] == 2
+
+
+def test_untaken_guarded_branch_is_skipped_and_join_still_runs(
+    tmp_path: Path,
+) -> None:
+    """A join runs once its taken inputs finish; an untaken branch is skipped."""
+    engine, callables = _engine(tmp_path)
+    counts = _register_review(callables)
+    raw = _review_flow()
+    raw["edges"][2] = {
+        "from": "checkout",
+        "to": "docs",
+        "when": "{{ nodes.checkout.output.sha == 'docs-only' }}",
+    }
+    engine.registry.register_raw(raw)
+
+    run = engine.start_run("autodev/flow-review")
+
+    assert run.status == "completed"
+    assert counts["docs"] == 0 and counts["report"] == 1
+    assert "docs" not in run.state["nodes"]
+    assert run.state["routes"]["checkout"] == ["lint", "scan"]
+    assert engine.replay_run(run.run_id).deterministic
+
+
+def test_failed_branch_fails_the_run_without_launching_dependents(
+    tmp_path: Path,
+) -> None:
+    """The run fails on the failing node; nothing downstream of it starts."""
+    engine, callables = _engine(tmp_path)
+
+    def check(name: str) -> None:
+        if name == "scan":
+            raise RuntimeError("scanner crashed")
+
+    counts = _register_review(callables, check=check)
+    engine.registry.register_raw(_review_flow())
+
+    run = engine.start_run("autodev/flow-review")
+
+    assert run.status == "failed" and run.stop_reason == "node_failed"
+    assert run.state["cursor"] == "scan"
+    assert counts["report"] == 0
+    assert set(run.state["nodes"]) == {"checkout", "lint", "docs"}
+    assert engine.replay_run(run.run_id).deterministic
+
+
+def test_resume_folds_every_unrouted_step_without_reexecuting(
+    tmp_path: Path,
+) -> None:
+    """Two branches completed before a crash are reconciled, not re-run."""
+    engine, callables = _engine(tmp_path)
+    counts = _register_review(callables)
+    engine.registry.register_raw(_review_flow())
+    run = engine.start_run("autodev/flow-review", execute=False)
+    checkout = engine.runs.create_step(
+        run_id=run.run_id, node_id="checkout", node_type="skill", attempt=1, input={}
+    )
+    engine.runs.complete_step(
+        checkout.step_id, status="completed", output={"sha": "abc123"}
+    )
+    for check in ("lint", "scan"):
+        step = engine.runs.create_step(
+            run_id=run.run_id,
+            node_id=check,
+            node_type="skill",
+            attempt=1,
+            input={"sha": "abc123"},
+        )
+        engine.runs.complete_step(step.step_id, status="completed", output={"ok": True})
+
+    resumed = engine.resume_run(run.run_id)
+
+    assert resumed.status == "completed"
+    assert counts == {"checkout": 0, "lint": 0, "scan": 0, "docs": 1, "report": 1}
+    reconciled = [
+        event.payload["nodeId"]
+        for event in engine.runs.list_events(run.run_id)
+        if event.payload.get("reconciled")
+    ]
+    assert reconciled == ["checkout", "lint", "scan"]
+    assert engine.replay_run(run.run_id).deterministic
+
+
+@pytest.mark.parametrize(
+    ("mutate", "message"),
+    [
+        (
+            lambda raw: raw["execution"].update(maxConcurrency=0),
+            "maxConcurrency",
+        ),
+        (lambda raw: raw["execution"].update(mode="eager"), "execution.mode"),
+        (
+            lambda raw: raw["nodes"][1]["input"].update(
+                other="{{ nodes.scan.output.ok }}"
+            ),
+            "not upstream",
+        ),
+        (
+            lambda raw: raw["edges"].append(
+                {"from": "report", "to": "lint", "when": "{{ true }}"}
+            ),
+            "acyclic",
+        ),
+    ],
+)
+def test_parallel_manifest_rules(mutate: Any, message: str) -> None:
+    """Parallel flows validate their execution block and DAG-only rules."""
+    raw = _review_flow()
+    mutate(raw)
+
+    result = validate_flow_manifest(raw)
+
+    assert not result.valid
+    assert any(message in error for error in result.errors), result.errors
+
+
+def test_fan_out_needs_parallel_mode() -> None:
+    """Without ``execution.mode: parallel`` the fan-out stays ambiguous."""
+    raw = _review_flow()
+    del raw["execution"]
+
+    assert not validate_flow_manifest(raw).valid
+    assert validate_flow_manifest(_review_flow()).valid
@@ -0,0 +1,148 @@
+"""Shared in-memory Redis stand-in for the job-queue unit tests (no live Redis)."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class FakeRedisListClient:
+    """Thread-safe in-memory subset of the string, hash, list and sorted-set commands the queue uses."""
+
+    def __init__(self) -> None:
+        """Initialize empty strings, hashes, lists and sorted sets guarded by one lock."""
+        self.strings: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.queues: dict[str, list[str]] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def ping(self) -> bool:
+        return True
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        with self._lock:
+            if nx and key in self.strings:
+                return False
+            self.strings[key] = value
+            return True
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self.strings.get(key)
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(
+                any(store.pop(key, None) is not None for store in (self.strings, self.queues))
+                for key in keys
+            )
+
+    def hset(self, key: str, mapping: dict[str, str]) -> int:
+        with self._lock:
+            self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def hget(self, key: str, field: str) -> str | None:
+        with self._lock:
+            return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        with self._lock:
+            return dict(self.hashes.get(key, {}))
+
+    def hdel(self, key: str, *fields: str) -> int:
+        with self._lock:
+            record = self.hashes.get(key, {})
+            return sum(record.pop(field, None) is not None for field in fields)
+
+    def expire(self, key: str, seconds: int) -> bool:
+        return True
+
+    def rpush(self, key: str, value: str) -> int:
+        with self._lock:
+            self.queues.setdefault(key, []).append(value)
+            return len(self.queues[key])
+
+    def llen(self, key: str) -> int:
+        with self._lock:
+            return len(self.queues.get(key, []))
+
+    def lindex(self, key: str, index: int) -> str | None:
+        with self._lock:
+            values = self.queues.get(key, [])
+            return values[index] if values else None
+
+    def lrange(self, key: str, start: int, end: int) -> list[str]:
+        with self._lock:
+            return list(self.queues.get(key, []))
+
+    def lrem(self, key: str, count: int, value: str) -> int:
+        with self._lock:
+            values = self.queues.get(key, [])
+            if value not in values:
+                return 0
+            values.remove(value)
+            return 1
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        with self._lock:
+            self.queues[key] = self.queues.get(key, [])[start:]
+        return True
+
+    def lmove(self, source: str, destination: str, src: str, dest: str) -> str | None:
+        with self._lock:
+            values = self.queues.get(source, [])
+            if not values:
+                return None
+            value = values.pop(0)
+            self.queues.setdefault(destination, []).append(value)
+            return value
+
+    def blmove(
+        self, source: str, destination: str, timeout: float, src: str, dest: str
+    ) -> str | None:
+        value = self.lmove(source, destination, src, dest)
+        if value is None:
+            time.sleep(min(timeout, 0.01))
+        return value
+
+    def zadd(
+        self, key: str, mapping: dict[str, float], nx: bool = False, xx: bool = False
+    ) -> int:
+        with self._lock:
+            members = self.sorted_sets.setdefault(key, {})
+            added = 0
+            for member, score in mapping.items():
+                if (nx and member in members) or (xx and member not in members):
+                    continue
+                added += member not in members
+                members[member] = float(score)
+            return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        with self._lock:
+            scores = self.sorted_sets.get(key, {})
+            return sum(scores.pop(member, None) is not None for member in members)
+
+    def zrangebyscore(
+        self,
+        key: str,
+        low: float | str,
+        high: float | str,
+        start: int | None = None,
+        num: int | None = None,
+    ) -> list[str]:
+        with self._lock:
+            scores = self.sorted_sets.get(key, {})
+            due = sorted(
+                (score, member)
+                for member, score in scores.items()
+                if float(low) <= score <= float(high)
+            )
+        members = [member for _score, member in due][start or 0:]
+        return members[:num] if num is not None else members
+
+    def zcard(self, key: str) -> int:
+        with self._lock:
+            return len(self.sorted_sets.get(key, {}))
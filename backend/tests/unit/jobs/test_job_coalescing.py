@@ -0,0 +1,214 @@
+"""Dedup keys and batch-capable handlers on both job-queue backends.
+
+A fake, in-memory Redis client is used for :class:`RedisJobQueue` — no live
+Redis service or network access is required.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from backend.jobs.queue import (
+    _BATCH_POLICIES,
+    _HANDLERS,
+    InProcessJobQueue,
+    RedisJobQueue,
+    register_handler,
+)
+from backend.repository import indexing
+from backend.tests.unit.jobs.queue_helpers import FakeRedisListClient
+
+
+@pytest.fixture
+def batches() -> Generator[list[list[dict]], None, None]:
+    """Register ``unit_test_batch`` (at most two payloads per call) and record its calls."""
+    calls: list[list[dict]] = []
+
+    @register_handler("unit_test_batch", batch_size=2, batch_window_seconds=0.0)
+    def _batch(payloads: list[dict]) -> dict:
+        calls.append(payloads)
+        return {"handled": [payload["n"] for payload in payloads]}
+
+    yield calls
+    _HANDLERS.pop("unit_test_batch", None)
+    _BATCH_POLICIES.pop("unit_test_batch", None)
+
+
+def _wait_for(queue: InProcessJobQueue, job_id: str) -> dict:
+    deadline = time.monotonic() + 5
+    while (record := queue.get(job_id))["status"] in ("pending", "running"):
+        assert time.monotonic() < deadline, record
+        time.sleep(0.01)
+    return record
+
+
+def test_register_handler_rejects_an_empty_batch() -> None:
+    """A batch must hold at least one payload."""
+    with pytest.raises(ValueError, match="batch_size"):
+        register_handler("unit_test_never", batch_size=0)
+
+
+def test_inprocess_dedup_key_returns_the_pending_job_until_it_starts() -> None:
+    """A duplicate is dropped while the first job waits; once it runs, the key is free again."""
+    release = threading.Event()
+    _HANDLERS["unit_test_gate"] = lambda _payload: release.wait(timeout=5)
+    queue = InProcessJobQueue(max_workers=1)
+    try:
+        blocker = queue.enqueue("unit_test_gate", {})
+        first = queue.enqueue("echo", {"n": 1}, dedup_key="k")
+        assert queue.enqueue("echo", {"n": 2}, dedup_key="k") == first
+        assert queue.stats().pending == 1
+
+        release.set()
+        assert _wait_for(queue, first)["result"] == {"echoed": {"n": 1}}
+        assert queue.enqueue("echo", {"n": 3}, dedup_key="k") != first
+        _wait_for(queue, blocker)
+    finally:
+        release.set()
+        queue.close()
+        _HANDLERS.pop("unit_test_gate", None)
+
+
+def test_inprocess_batch_runs_once_full_and_close_flushes_the_rest() -> None:
+    """Payloads share one job until it holds ``batch_size``; a partial batch runs on close."""
+    calls: list[list[dict]] = []
+
+    @register_handler("unit_test_slow_batch", batch_size=2, batch_window_seconds=60.0)
+    def _record(payloads: list[dict]) -> int:
+        calls.append(payloads)
+        return len(payloads)
+
+    queue = InProcessJobQueue()
+    try:
+        first = queue.enqueue("unit_test_slow_batch", {"n": 1})
+        assert queue.enqueue("unit_test_slow_batch", {"n": 2}) == first
+        assert _wait_for(queue, first)["result"] == 2
+        leftover = queue.enqueue("unit_test_slow_batch", {"n": 3})
+        assert leftover != first
+    finally:
+        queue.close()
+        _HANDLERS.pop("unit_test_slow_batch", None)
+        _BATCH_POLICIES.pop("unit_test_slow_batch", None)
+
+    assert calls == [[{"n": 1}, {"n": 2}], [{"n": 3}]]
+    assert queue.get(leftover)["status"] == "done"
+
+
+def test_redis_dedup_key_is_released_when_the_job_starts() -> None:
+    """The ``SET NX`` claim names the pending job and is dropped once a worker runs it."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False)
+    first = queue.enqueue("echo", {"n": 1}, dedup_key="k")
+
+    assert queue.enqueue("echo", {"n": 2}, dedup_key="k") == first
+    assert client.queues["autodev:jobs:pending"] == [first]
+    assert queue.run_pending_once() is True
+    assert "autodev:jobs:dedup:k" not in client.strings
+    assert queue.enqueue("echo", {"n": 3}, dedup_key="k") != first
+
+
+def test_redis_drain_job_hands_payloads_to_the_handler_in_batches(
+    batches: list[list[dict]],
+) -> None:
+    """Three payloads make one drain job; it takes two and schedules a follow-up for the third."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False)
+    job_ids = {queue.enqueue("unit_test_batch", {"n": n}) for n in range(3)}
+
+    assert len(job_ids) == 1
+    drain = job_ids.pop()
+    assert client.queues["autodev:jobs:pending"] == [drain]
+    assert queue.run_pending_once() is True
+    assert queue.get(drain)["result"] == {"handled": [0, 1]}
+
+    assert queue.run_pending_once() is True
+    assert queue.run_pending_once() is False
+    assert batches == [[{"n": 0}, {"n": 1}], [{"n": 2}]]
+    assert client.queues["autodev:jobs:batch:unit_test_batch"] == []
+
+
+def test_redis_retried_drain_job_keeps_the_payloads_it_claimed() -> None:
+    """A failed drain retries with the same payloads instead of dropping or re-reading them."""
+    calls: list[list[Any]] = []
+
+    def _fail_once(payloads: list[dict]) -> int:
+        calls.append([payload["n"] for payload in payloads])
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        return len(payloads)
+
+    register_handler("unit_test_flaky_batch", batch_size=5, batch_window_seconds=0.0)(_fail_once)
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(
+        client=client, start_worker=False, max_attempts=2, retry_backoff_seconds=0.0
+    )
+    try:
+        drain = queue.enqueue("unit_test_flaky_batch", {"n": 1})
+        queue.run_pending_once()
+        later = queue.enqueue("unit_test_flaky_batch", {"n": 2})
+        queue.reclaim_expired()
+        while queue.run_pending_once():
+            pass
+    finally:
+        _HANDLERS.pop("unit_test_flaky_batch", None)
+        _BATCH_POLICIES.pop("unit_test_flaky_batch", None)
+
+    assert later != drain
+    assert sorted(calls) == [[1], [1], [2]]
+    assert queue.get(drain) == {
+        "job_id": drain,
+        "job_type": "unit_test_flaky_batch",
+        "status": "done",
+        "result": 1,
+        "error": None,
+    }
+
+
+def test_reindex_file_batch_calls_reindex_once_per_repo_and_tenant(monkeypatch) -> None:
+    """Coalesced file changes collapse into one deduplicated ``reindex`` per scope."""
+    calls: list[tuple[list[str], Path, str]] = []
+
+    def _reindex(paths: list[str], *, repo_root: Path, tenant_id: str) -> int:
+        calls.append((paths, repo_root, tenant_id))
+        return len(paths)
+
+    monkeypatch.setattr(indexing, "reindex", _reindex)
+
+    result = indexing._handle_reindex_file_job(  # noqa: SLF001
+        [
+            {"path": "a.py", "repo_root": "/repo", "tenant_id": "acme"},
+            {"path": "b.py", "repo_root": "/repo", "tenant_id": "acme"},
+            {"path": "a.py", "repo_root": "/repo", "tenant_id": "acme"},
+            {"path": "a.py", "repo_root": "/other", "tenant_id": "acme"},
+        ]
+    )
+
+    assert calls == [
+        (["a.py", "b.py"], Path("/repo"), "acme"),
+        (["a.py"], Path("/other"), "acme"),
+    ]
+    assert result == {"file_count": 3, "chunks_written": 3}
+
+
+def test_reindex_file_job_accepts_a_legacy_single_payload(monkeypatch) -> None:
+    """A job queued before batching carries one dict; it runs as a batch of one."""
+    calls: list[tuple[list[str], Path, str]] = []
+
+    def _reindex(paths: list[str], *, repo_root: Path, tenant_id: str) -> int:
+        calls.append((paths, repo_root, tenant_id))
+        return 2
+
+    monkeypatch.setattr(indexing, "reindex", _reindex)
+
+    result = indexing._handle_reindex_file_job(
+        {"path": "a.py", "repo_root": "/repo", "tenant_id": "acme"}
+    )
+
+    assert calls == [(["a.py"], Path("/repo"), "acme")]
+    assert result == {"file_count": 1, "chunks_written": 2}
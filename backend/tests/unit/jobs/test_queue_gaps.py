@@ -37,6 +37,7 @@ class _FakeRedisQueueClient:
         """Initialize storage and optional deterministic write failures."""
         self.hashes: dict[str, dict[str, str]] = {}
         self.queues: dict[str, list[str]] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
         self.expiries: dict[str, int] = {}
         self.fail_rpush = fail_rpush
         self.fail_delete = fail_delete
@@ -96,6 +97,89 @@ class _FakeRedisQueueClient:
                 return key, values.pop(0)
         return None
 
+    def lmove(
+        self, source: str, destination: str, src: str = "LEFT", dest: str = "RIGHT"
+    ) -> str | None:
+        """Move the first value of *source* to the end of *destination* (``LMOVE LEFT RIGHT``)."""
+        values = self.queues.setdefault(source, [])
+        if not values:
+            return None
+        value = values.pop(0)
+        self.queues.setdefault(destination, []).append(value)
+        return value
+
+    def blmove(
+        self, source: str, destination: str, timeout: float, src: str = "LEFT", dest: str = "RIGHT"
+    ) -> str | None:
+        """Non-blocking stand-in for ``BLMOVE``, like :meth:`blpop`."""
+        return self.lmove(source, destination, src, dest)
+
+    def zadd(
+        self, key: str, mapping: dict[str, float], nx: bool = False, xx: bool = False
+    ) -> int:
+        """Set member scores in an in-memory sorted set, honouring ``NX``/``XX``."""
+        members = self.sorted_sets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if (nx and member in members) or (xx and member not in members):
+                continue
+            added += member not in members
+            members[member] = float(score)
+        return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        """Remove members from an in-memory sorted set."""
+        scores = self.sorted_sets.get(key, {})
+        return sum(scores.pop(member, None) is not None for member in members)
+
+    def zrangebyscore(
+        self,
+        key: str,
+        low: float | str,
+        high: float | str,
+        start: int | None = None,
+        num: int | None = None,
+    ) -> list[str]:
+        """Return members scored within ``low..high``, lowest first, optionally paged."""
+        scores = self.sorted_sets.get(key, {})
+        due = sorted(
+            (score, member)
+            for member, score in scores.items()
+            if float(low) <= score <= float(high)
+        )
+        members = [member for _score, member in due][start or 0:]
+        return members[:num] if num is not None else members
+
+    def zcard(self, key: str) -> int:
+        """Return the size of an in-memory sorted set."""
+        return len(self.sorted_sets.get(key, {}))
+
+    def lrem(self, key: str, count: int, value: str) -> int:
+        """Remove the first occurrence of *value* from an in-memory list."""
+        values = self.queues.setdefault(key, [])
+        if value not in values:
+            return 0
+        values.remove(value)
+        return 1
+
+    def lrange(self, key: str, start: int, end: int) -> list[str]:
+        """Return a copy of an in-memory list (only full ranges are used)."""
+        return list(self.queues.get(key, []))
+
+    def lindex(self, key: str, index: int) -> str | None:
+        """Return the value at *index* of an in-memory list, or ``None``."""
+        values = self.queues.get(key, [])
+        return values[index] if -len(values) <= index < len(values) else None
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        """Keep the ``start..end`` slice of an in-memory list (negative indexes only)."""
+        self.queues[key] = self.queues.get(key, [])[start:]
+        return True
+
+    def hget(self, key: str, field: str) -> str | None:
+        """Return one field of an in-memory hash."""
+        return self.hashes.get(key, {}).get(field)
+
     def expire(self, key: str, seconds: int) -> bool:
         """Record the TTL a caller requested for *key*."""
         self.expiries[key] = seconds
@@ -0,0 +1,234 @@
+"""Priority lanes, leases, retries and dead-lettering of :class:`RedisJobQueue`.
+
+A fake, in-memory Redis client is used throughout — no live Redis service or
+network access is required.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+
+import pytest
+
+from backend.jobs.queue import _HANDLERS, RedisJobQueue
+from backend.tests.unit.jobs.queue_helpers import FakeRedisListClient
+
+
+@pytest.fixture
+def flaky_handler() -> Generator[list[int], None, None]:
+    """Register a handler that fails until its call list has three entries."""
+    calls: list[int] = []
+
+    def _flaky(payload: dict) -> dict:
+        calls.append(len(calls))
+        if len(calls) < 3:
+            raise RuntimeError(f"transient failure {len(calls)}")
+        return {"calls": len(calls)}
+
+    _HANDLERS["unit_test_flaky"] = _flaky
+    yield calls
+    _HANDLERS.pop("unit_test_flaky", None)
+
+
+def test_higher_lanes_are_claimed_first() -> None:
+    """A worker drains ``high`` before ``normal`` before ``low``, whatever the enqueue order."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False)
+    low = queue.enqueue("echo", {"n": "low"}, priority="low")
+    normal = queue.enqueue("echo", {"n": "normal"})
+    high = queue.enqueue("echo", {"n": "high"}, priority="high")
+
+    order: list[str] = []
+    while queue.run_pending_once():
+        order += [
+            job_id
+            for job_id in (low, normal, high)
+            if queue.get(job_id)["status"] == "done" and job_id not in order
+        ]
+
+    assert order == [high, normal, low]
+    assert client.queues["autodev:jobs:processing"] == []
+
+
+def test_unknown_priority_is_rejected() -> None:
+    """Only the declared lanes are accepted."""
+    queue = RedisJobQueue(client=FakeRedisListClient(), start_worker=False)
+
+    with pytest.raises(ValueError, match="unknown job priority"):
+        queue.enqueue("echo", {}, priority="urgent")
+
+
+def test_stats_report_depth_and_age_per_lane() -> None:
+    """``QueueSnapshot.lanes`` breaks pending work down by lane with the oldest job's age."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False)
+    first = queue.enqueue("echo", {})
+    queue.enqueue("echo", {})
+    queue.enqueue("echo", {}, priority="high")
+    client.hashes[f"autodev:jobs:{first}"]["enqueued_at"] = repr(time.time() - 30)
+
+    snapshot = queue.stats()
+
+    lanes = {lane.lane: lane for lane in snapshot.lanes}
+    assert snapshot.pending == 3
+    assert (lanes["high"].depth, lanes["normal"].depth, lanes["low"].depth) == (1, 2, 0)
+    assert lanes["normal"].oldest_age_seconds >= 30
+    assert lanes["low"].oldest_age_seconds == 0.0
+
+
+def test_job_whose_worker_died_is_reclaimed_after_its_lease_expires() -> None:
+    """A claimed job stays in the processing list and returns to its lane once its lease lapses."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(
+        client=client, start_worker=False, max_attempts=2, retry_backoff_seconds=0.0
+    )
+    job_id = queue.enqueue("echo", {"msg": "survives"}, priority="high")
+    assert queue._claim(block=False) == job_id  # noqa: SLF001 - the worker then "dies"
+
+    assert queue.reclaim_expired() == 0  # lease still valid
+    client.sorted_sets["autodev:jobs:leases"][job_id] = time.time() - 1
+    # Lease expired -> delayed (attempt 1 used) -> due at once -> back in its lane.
+    assert queue.reclaim_expired() == 2
+    assert client.queues["autodev:jobs:processing"] == []
+    assert client.queues["autodev:jobs:pending:high"] == [job_id]
+
+    assert queue.run_pending_once() is True
+    assert queue.get(job_id)["status"] == "done"
+
+
+def test_reclaim_only_reads_jobs_whose_lease_or_backoff_is_due() -> None:
+    """Leases and retries are scored sets, so a pass skips jobs that are not yet due."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False, max_attempts=2)
+    leased = [queue.enqueue("echo", {"n": n}) for n in range(3)]
+    for _ in leased:
+        queue._claim(block=False)  # workers that then "die"
+    queue.reclaim_expired()  # the first pass also audits the processing list
+    read: list[str] = []
+    hgetall = client.hgetall
+
+    def _recording_hgetall(key: str) -> dict[str, str]:
+        read.append(key)
+        return hgetall(key)
+
+    client.hgetall = _recording_hgetall  # type: ignore[method-assign]
+    client.sorted_sets["autodev:jobs:leases"][leased[0]] = time.time() - 1
+
+    assert queue.reclaim_expired() == 1
+
+    assert read == [f"autodev:jobs:{leased[0]}"]
+    assert client.queues["autodev:jobs:processing"] == leased[1:]
+
+
+def test_claimed_job_without_a_lease_gets_one_on_the_next_audit() -> None:
+    """A worker that died between ``LMOVE`` and recording the lease still has its job reclaimed."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False)
+    job_id = queue.enqueue("echo", {})
+    client.lmove("autodev:jobs:pending", "autodev:jobs:processing", "LEFT", "RIGHT")
+
+    assert queue.reclaim_expired() == 0
+    assert client.sorted_sets["autodev:jobs:leases"][job_id] > time.time()
+
+
+def test_running_job_keeps_its_lease_past_the_visibility_timeout() -> None:
+    """A handler outliving the visibility timeout is not reclaimed while it runs."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, start_worker=False, visibility_timeout_seconds=0.15)
+    started, release = threading.Event(), threading.Event()
+
+    def _slow(payload: dict) -> dict:
+        started.set()
+        release.wait(5.0)
+        return {"ok": True}
+
+    _HANDLERS["unit_test_slow"] = _slow
+    try:
+        job_id = queue.enqueue("unit_test_slow", {})
+        runner = threading.Thread(target=queue.run_pending_once)
+        runner.start()
+        assert started.wait(5.0)
+        time.sleep(0.4)  # well past the visibility timeout
+
+        assert queue.reclaim_expired() == 0
+        assert client.queues["autodev:jobs:processing"] == [job_id]
+        release.set()
+        runner.join(5.0)
+    finally:
+        _HANDLERS.pop("unit_test_slow", None)
+
+    assert queue.get(job_id)["status"] == "done"
+    assert client.sorted_sets["autodev:jobs:leases"] == {}
+
+
+def test_failed_job_is_retried_with_backoff_then_succeeds(flaky_handler: list[int]) -> None:
+    """Each failure schedules a delayed retry; the job only becomes runnable once it is due."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(
+        client=client, start_worker=False, max_attempts=3, retry_backoff_seconds=60.0
+    )
+    job_id = queue.enqueue("unit_test_flaky", {})
+    key = f"autodev:jobs:{job_id}"
+
+    for attempt in (1, 2):
+        queue.run_pending_once()
+        assert queue.get(job_id)["status"] == "pending"
+        assert list(client.sorted_sets["autodev:jobs:scheduled"]) == [job_id]
+        retry_at = client.sorted_sets["autodev:jobs:scheduled"][job_id]
+        assert retry_at - time.time() > 60 * 2 ** (attempt - 1) - 5
+        assert queue.reclaim_expired() == 0  # not due yet
+        client.sorted_sets["autodev:jobs:scheduled"][job_id] = time.time() - 1
+        assert queue.reclaim_expired() == 1
+
+    queue.run_pending_once()
+    assert queue.get(job_id) == {
+        "job_id": job_id,
+        "job_type": "unit_test_flaky",
+        "status": "done",
+        "result": {"calls": 3},
+        "error": None,
+    }
+    assert "otel_traceparent" not in client.hashes[key]
+
+
+def test_job_is_dead_lettered_after_max_attempts(flaky_handler: list[int]) -> None:
+    """The last allowed failure is terminal and lands the id in the dead-letter list."""
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(
+        client=client, start_worker=False, max_attempts=2, retry_backoff_seconds=0.0
+    )
+    job_id = queue.enqueue("unit_test_flaky", {})
+
+    queue.run_pending_once()
+    queue.reclaim_expired()
+    queue.run_pending_once()
+
+    record = queue.get(job_id)
+    assert record["status"] == "error"
+    assert record["error"] == "transient failure 2"
+    assert client.queues["autodev:jobs:dead"] == [job_id]
+    assert client.hashes[f"autodev:jobs:{job_id}"]["attempts"] == "2"
+
+
+def test_worker_pool_runs_jobs_concurrently() -> None:
+    """``workers=N`` starts N claim loops, so one slow job does not hold up the rest."""
+    release = threading.Event()
+    _HANDLERS["unit_test_slow"] = lambda _payload: release.wait(timeout=5)
+    client = FakeRedisListClient()
+    queue = RedisJobQueue(client=client, workers=3, blpop_timeout=0.05)
+    try:
+        slow = queue.enqueue("unit_test_slow", {})
+        fast = [queue.enqueue("echo", {"n": n}) for n in range(3)]
+        deadline = time.monotonic() + 5
+        while any(queue.get(j)["status"] != "done" for j in fast):
+            assert time.monotonic() < deadline, "fast jobs stuck behind the slow one"
+            time.sleep(0.01)
+
+        assert queue.stats().workers == 3
+        assert queue.get(slow)["status"] == "running"
+    finally:
+        release.set()
+        queue.close()
+        _HANDLERS.pop("unit_test_slow", None)
@@ -117,6 +117,26 @@ def test_index_emits_span_with_counts_and_no_paths(tmp_path: Path) -> None:
     assert reindex_spans[0].parent.span_id == index_spans[0].context.span_id
 
 
+def test_reindex_span_reports_per_stage_throughput(tmp_path: Path) -> None:
+    """The reindex span carries worker count, produced chunks, and files/s + chunks/s rates."""
+    exporter = InMemorySpanExporter()
+    configure_tracing(span_exporter=exporter)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "mod.py").write_text(_PY_SAMPLE, encoding="utf-8")
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'index.db'}")
+
+    indexing.index(repo, store=store, workers=1)
+
+    attributes = dict(_spans_named(exporter, "autodev.repository.reindex")[-1].attributes or {})
+    assert attributes["autodev.index.workers"] == 1
+    assert attributes["autodev.index.chunks_produced"] >= 1
+    assert attributes["autodev.index.files_per_second"] > 0
+    assert attributes["autodev.index.chunks_per_second"] > 0
+    assert attributes["autodev.index.chunk_files_per_second"] > 0
+    assert attributes["autodev.index.persist_chunks_per_second"] > 0
+
+
 def test_reindex_span_counts_deleted_chunks(tmp_path: Path) -> None:
     """Reindexing a vanished file reports the chunk rows it removed."""
     exporter = InMemorySpanExporter()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import sqlite3
 from typing import Any, Callable
 
+from backend.persistence.pool import ConnectionCheckout
 from backend.persistence.sqlite_adapter import SQLiteStore
 
 from backend.tests.unit.persistence.test_postgres_adapter import ScriptedConnection
@@ -30,11 +31,11 @@ class StatementCounter:
         """
         original = target.connect
 
-        def counting_connect() -> sqlite3.Connection:
-            conn = original()
+        def counting_connect() -> ConnectionCheckout[sqlite3.Connection]:
+            checkout = original()
             self.connections += 1
-            conn.set_trace_callback(self._record)
-            return conn
+            checkout.connection.set_trace_callback(self._record)
+            return checkout
 
         target.connect = counting_connect  # type: ignore[method-assign]
 
@@ -73,19 +74,22 @@ def rows_written(target: SQLiteStore, action: Callable[[], Any]) -> int:
         action: A zero-argument callable performing the writes.
 
     Returns:
-        The total number of rows written across every connection opened.
+        The total number of rows written across every connection used.
     """
     original = target.connect
-    opened: list[sqlite3.Connection] = []
+    # Pooled connections are reused, and ``total_changes`` counts over a
+    # connection's whole life: measure each one from its first checkout here.
+    opened: dict[int, tuple[sqlite3.Connection, int]] = {}
 
-    def counting_connect() -> sqlite3.Connection:
-        conn = original()
-        opened.append(conn)
-        return conn
+    def counting_connect() -> ConnectionCheckout[sqlite3.Connection]:
+        checkout = original()
+        conn = checkout.connection
+        opened.setdefault(id(conn), (conn, conn.total_changes))
+        return checkout
 
     target.connect = counting_connect  # type: ignore[method-assign]
     try:
         action()
     finally:
         target.connect = original  # type: ignore[method-assign]
-    return sum(conn.total_changes for conn in opened)
+    return sum(conn.total_changes - baseline for conn, baseline in opened.values())
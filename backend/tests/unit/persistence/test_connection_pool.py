@@ -0,0 +1,285 @@
+"""Tests for the SQLite and PostgreSQL connection pools behind ``store.connect()``."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from opentelemetry.sdk.metrics.export import NumberDataPoint
+
+from backend.config.settings import reset_settings_cache
+from backend.observability.db_pool_metrics import register_db_pool_observables
+from backend.observability.metrics import (
+    ConnectionPoolSnapshot,
+    NoopMetricSink,
+    get_metric_sink,
+    set_metric_sink,
+)
+from backend.persistence.pool import ConnectionPoolTimeout, SQLitePool, pool_settings
+from backend.persistence.postgres_adapter.pool import PostgresPool
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.tests.observability_helpers import capture_observability
+
+
+class _RecordingSink(NoopMetricSink):
+    """Metric sink that keeps every pool-wait observation."""
+
+    def __init__(self) -> None:
+        self.waits: list[tuple[str, str]] = []
+
+    def record_db_pool_wait(self, *, backend: str, outcome: str, duration_seconds: float) -> None:
+        self.waits.append((backend, outcome))
+
+
+@pytest.fixture
+def sink() -> Any:
+    """Install a recording metric sink for the duration of one test."""
+    previous = get_metric_sink()
+    recording = _RecordingSink()
+    set_metric_sink(recording)
+    yield recording
+    set_metric_sink(previous)
+
+
+class _FakePgConnection:
+    """Minimal psycopg-like connection with a settable transaction status."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.info = type("Info", (), {"transaction_status": 0})()
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        if self.closed:
+            raise RuntimeError("connection is closed")
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.info.transaction_status = 0
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _pg_pool(**kwargs: Any) -> tuple[PostgresPool, list[_FakePgConnection]]:
+    opened: list[_FakePgConnection] = []
+
+    def connect() -> _FakePgConnection:
+        opened.append(_FakePgConnection())
+        return opened[-1]
+
+    return PostgresPool(connect, **kwargs), opened
+
+
+def test_sqlite_pool_reuses_a_thread_connection_with_pragmas_applied(tmp_path: Path) -> None:
+    """A released connection is handed back to the same thread, still WAL-tuned."""
+    pool = SQLitePool(tmp_path / "pool.db")
+
+    first = pool.connect()
+    first.close()
+    second = pool.connect()
+
+    conn = second.connection
+    assert conn is first.connection
+    assert isinstance(conn, sqlite3.Connection)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 15000
+    second.close()
+    pool.close()
+
+
+def test_sqlite_pool_rolls_back_uncommitted_work_on_release(tmp_path: Path) -> None:
+    """Work left uncommitted by one holder never leaks to the next checkout."""
+    pool = SQLitePool(tmp_path / "pool.db")
+    with pool.connect() as conn:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+
+    checkout = pool.connect()
+    checkout.connection.execute("INSERT INTO t VALUES (1)")
+    checkout.close()
+
+    with pool.connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    pool.close()
+
+
+def test_sqlite_pool_does_not_share_connections_across_threads(tmp_path: Path) -> None:
+    """Each thread gets its own connection; idle ones stay with their thread."""
+    pool = SQLitePool(tmp_path / "pool.db")
+    main = pool.connect()
+    main.close()
+    seen: list[Any] = []
+
+    def worker() -> None:
+        checkout = pool.connect()
+        seen.append(checkout.connection)
+        checkout.close()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen and seen[0] is not main.connection
+    assert pool.snapshot().in_use == 0
+
+
+def test_sqlite_store_connect_goes_through_the_pool(tmp_path: Path) -> None:
+    """``SQLiteStore.connect()`` keeps its contract while reusing connections."""
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'store.db'}")
+
+    with store.connect() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS t (v INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+    with store.connect() as again:
+        assert again.execute("SELECT v FROM t").fetchone()["v"] == 1
+
+    assert again is conn
+    assert store.pool is not None and store.pool.snapshot().in_use == 0
+
+
+def test_pool_size_zero_disables_pooling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``AUTODEV_DB_POOL_SIZE=0`` restores a fresh connection per ``connect()``."""
+    monkeypatch.setenv("AUTODEV_DB_POOL_SIZE", "0")
+    reset_settings_cache()
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'store.db'}")
+
+    first = store.connect()
+    first.close()
+
+    assert pool_settings().size == 0
+    assert store.pool is None
+    assert store.connect().connection is not first.connection
+
+
+def test_postgres_pool_reuses_and_bounds_checkouts(sink: _RecordingSink) -> None:
+    """At ``max_size`` in use a checkout waits, then times out with a metric."""
+    pool, opened = _pg_pool(max_size=1, timeout_seconds=0.05)
+
+    held = pool.connect()
+    with pytest.raises(ConnectionPoolTimeout):
+        pool.connect()
+    held.close()
+    again = pool.connect()
+
+    assert len(opened) == 1
+    assert again.connection is opened[0]
+    assert pool.snapshot() == ConnectionPoolSnapshot(in_use=1, idle=0, max_size=1, waiting=0)
+    assert sink.waits == [
+        ("postgres", "acquired"),
+        ("postgres", "timeout"),
+        ("postgres", "acquired"),
+    ]
+
+
+def test_postgres_pool_wakes_a_waiting_checkout_on_release() -> None:
+    """A blocked checkout proceeds as soon as another caller returns its connection."""
+    pool, opened = _pg_pool(max_size=1, timeout_seconds=5.0)
+    held = pool.connect()
+    acquired: list[Any] = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.connect()))
+    waiter.start()
+
+    held.close()
+    waiter.join(timeout=5.0)
+
+    assert acquired and acquired[0].connection is opened[0]
+
+
+def test_postgres_pool_rolls_back_open_transactions_and_drops_broken_connections() -> None:
+    """Released connections are reset; failed ones are closed instead of reused."""
+    pool, opened = _pg_pool(max_size=2)
+
+    checkout = pool.connect()
+    checkout.connection.info.transaction_status = 2  # INTRANS
+    checkout.close()
+    assert opened[0].rollbacks == 1
+    assert pool.snapshot().idle == 1
+
+    checkout = pool.connect()
+    checkout.connection.info.transaction_status = 3  # INERROR
+    checkout.close()
+    assert opened[0].closed
+    assert pool.snapshot().idle == 0
+
+
+def test_checkout_keeps_the_connections_own_with_semantics(tmp_path: Path) -> None:
+    """A nested ``with conn:`` only scopes a transaction; the checkout releases."""
+    pool = SQLitePool(tmp_path / "pool.db")
+
+    with pool.connect() as conn:
+        with conn:
+            conn.execute("CREATE TABLE t (v INTEGER)")
+        with conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+        assert pool.snapshot().in_use == 1
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+    assert pool.snapshot() == ConnectionPoolSnapshot(in_use=0, idle=1, max_size=0, waiting=0)
+    pool.close()
+
+
+def test_checkout_commits_on_clean_exit_and_rolls_back_on_error() -> None:
+    """``with pool.connect()`` commits or rolls back, then returns the connection."""
+    pool, opened = _pg_pool(max_size=1)
+
+    with pool.connect():
+        pass
+    with pytest.raises(RuntimeError), pool.connect():
+        raise RuntimeError("boom")
+
+    assert opened[0].commits == 1
+    assert opened[0].rollbacks == 1
+    assert pool.snapshot().idle == 1
+
+
+def test_postgres_pool_recycles_connections_past_their_lifetime() -> None:
+    """A connection older than ``max_lifetime_seconds`` is closed, not reused."""
+    pool, opened = _pg_pool(max_lifetime_seconds=0.0)
+
+    pool.connect().close()
+    pool.connect().close()
+
+    assert len(opened) == 2
+    assert opened[0].closed
+
+
+def test_db_pool_gauges_report_usage_per_backend(tmp_path: Path) -> None:
+    """The connection and utilization gauges read every pool's snapshot."""
+    pg_pool, _ = _pg_pool(max_size=4)
+    held = pg_pool.connect()
+    sqlite_pool = SQLitePool(tmp_path / "pool.db")
+    sqlite_pool.connect().close()
+
+    with capture_observability() as capture:
+        register_db_pool_observables(
+            meter=capture.runtime.meter_provider.get_meter("test.pool"),
+            pools=lambda: [pg_pool, sqlite_pool],
+        )
+        capture.runtime.force_flush()
+        metrics_data = capture.metric_reader.get_metrics_data()
+    held.close()
+
+    assert metrics_data is not None
+    points = {
+        (metric.name, tuple(sorted((point.attributes or {}).items()))): point.value
+        for resource in metrics_data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+        for point in metric.data.data_points
+        if isinstance(point, NumberDataPoint)
+    }
+    assert points[
+        ("autodev.db.pool.connections", (("backend", "postgres"), ("state", "in_use")))
+    ] == 1
+    assert points[("autodev.db.pool.connections", (("backend", "sqlite"), ("state", "idle")))] == 1
+    assert points[("autodev.db.pool.utilization", (("backend", "postgres"),))] == 0.25
+    assert ("autodev.db.pool.utilization", (("backend", "sqlite"),)) not in points
@@ -50,6 +50,7 @@ class ScriptedCursor:
     def execute(self, sql: str, params: Any = None) -> "ScriptedCursor":
         """Record the executed statement and return self for chaining."""
         self.conn.executed.append((sql, params))
+        self.conn.in_transaction = True
         return self
 
     def executemany(self, sql: str, params_seq: Any) -> "ScriptedCursor":
@@ -60,6 +61,7 @@ class ScriptedCursor:
         round trip — the E44-S2 contract.
         """
         self.conn.executed_many.append((sql, list(params_seq)))
+        self.conn.in_transaction = True
         return self
 
     def fetchone(self) -> Any:
@@ -90,6 +92,7 @@ class ScriptedConnection:
         self.executed: list[tuple[str, Any]] = []
         self.executed_many: list[tuple[str, list[Any]]] = []
         self.commits = 0
+        self.in_transaction = False
         self.fetchone_queue: list[Any] = []
         self.fetchall_queue: list[list[Any]] = []
 
@@ -112,8 +115,10 @@ class ScriptedConnection:
         return cursor
 
     def commit(self) -> None:
-        """Record that a commit occurred."""
-        self.commits += 1
+        """Record a commit that ends a transaction; like psycopg, an idle commit sends nothing."""
+        if self.in_transaction:
+            self.commits += 1
+            self.in_transaction = False
 
 
 def install_scripted_psycopg(monkeypatch: pytest.MonkeyPatch) -> ScriptedConnection:
@@ -9,8 +9,13 @@ from typing import Any
 import pytest
 
 from backend.agents.registry_v2 import AgentRegistry
+from backend.config.settings import reset_settings_cache
 from backend.persistence.database import DurableStore
-from backend.plugins.registry_core import VersionedExtensionRegistryCore, version_matches
+from backend.plugins.registry_core import (
+    ResolutionCache,
+    VersionedExtensionRegistryCore,
+    version_matches,
+)
 from backend.skills.registry_v2 import SkillRegistry
 
 
@@ -75,15 +80,7 @@ def _decode_widget(raw: dict[str, Any]) -> _WidgetRef:
     )
 
 
-@pytest.fixture()
-def widget_core(tmp_path: Path) -> VersionedExtensionRegistryCore[_WidgetRef, _WidgetManifest]:
-    """A core instance over a throwaway ``widget_registry`` table.
-
-    Exercises the core in isolation from both concrete registries, proving its
-    register/resolve/deprecate/activate/catalog/list semantics are generic and
-    do not depend on agent- or skill-specific manifest shapes.
-    """
-    store = DurableStore(f"sqlite:///{tmp_path / 'widgets.db'}")
+def _widget_core(store: Any) -> VersionedExtensionRegistryCore[_WidgetRef, _WidgetManifest]:
     return VersionedExtensionRegistryCore(
         store,
         table="widget_registry",
@@ -95,6 +92,17 @@ def widget_core(tmp_path: Path) -> VersionedExtensionRegistryCore[_WidgetRef, _W
     )
 
 
+@pytest.fixture()
+def widget_core(tmp_path: Path) -> VersionedExtensionRegistryCore[_WidgetRef, _WidgetManifest]:
+    """A core instance over a throwaway ``widget_registry`` table.
+
+    Exercises the core in isolation from both concrete registries, proving its
+    register/resolve/deprecate/activate/catalog/list semantics are generic and
+    do not depend on agent- or skill-specific manifest shapes.
+    """
+    return _widget_core(DurableStore(f"sqlite:///{tmp_path / 'widgets.db'}"))
+
+
 def test_core_register_resolve_and_list(
     widget_core: VersionedExtensionRegistryCore[_WidgetRef, _WidgetManifest],
 ) -> None:
@@ -150,3 +158,50 @@ def test_core_sync_from_plugin_store_is_a_noop_with_no_registered_plugins(
         register=lambda manifest, *, plugin_id: calls.append(plugin_id),
     )
     assert calls == []
+
+
+def test_core_resolutions_are_shared_and_invalidated_across_instances(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Registries over one database share resolutions; any write drops them."""
+    store = DurableStore(f"sqlite:///{tmp_path / 'widgets.db'}")
+    first, second = _widget_core(store), _widget_core(store)
+    first.upsert(_WidgetManifest("acme/gizmo", "1.0.0", {}), plugin_id="acme/plugin")
+    resolved = first.resolve("acme/gizmo", "*")
+    monkeypatch.setattr(
+        second, "list_all", lambda **_: pytest.fail("resolution was not cached")
+    )
+
+    assert second.resolve("acme/gizmo", "*") is resolved
+
+    first.deprecate("acme/gizmo", "1.0.0", "superseded")
+    monkeypatch.undo()
+    assert second.resolve("acme/gizmo", "*").deprecated is True
+
+
+def test_core_resolution_cache_can_be_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``AUTODEV_REGISTRY_RESOLVE_CACHE_SECONDS=0`` reads the store every time."""
+    monkeypatch.setenv("AUTODEV_REGISTRY_RESOLVE_CACHE_SECONDS", "0")
+    reset_settings_cache()
+    try:
+        core = _widget_core(DurableStore(f"sqlite:///{tmp_path / 'widgets.db'}"))
+        core.upsert(_WidgetManifest("acme/gizmo", "1.0.0", {}), plugin_id="acme/plugin")
+        assert core.resolve("acme/gizmo", "*") is not core.resolve("acme/gizmo", "*")
+    finally:
+        monkeypatch.undo()
+        reset_settings_cache()
+
+
+def test_resolution_cache_drops_results_computed_across_a_write() -> None:
+    """A resolution that raced an invalidation is never cached."""
+    cache: ResolutionCache[str] = ResolutionCache()
+    generation = cache.generation
+    cache.invalidate()
+    cache.put(("acme/gizmo", "*"), "stale", generation)
+
+    assert cache.get(("acme/gizmo", "*"), ttl_seconds=60.0) is None
+    cache.put(("acme/gizmo", "*"), "fresh", cache.generation)
+    assert cache.get(("acme/gizmo", "*"), ttl_seconds=60.0) == "fresh"
+    assert cache.get(("acme/gizmo", "*"), ttl_seconds=0.0) is None
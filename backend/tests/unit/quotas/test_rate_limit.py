@@ -0,0 +1,170 @@
+"""Tests for token-bucket request-rate admission and its durable reconcile."""
+
+from __future__ import annotations
+
+import importlib.util
+import sqlite3
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from backend.config.settings import Settings
+from backend.quotas import rate_limit
+from backend.quotas.rate_limit import (
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+)
+from backend.quotas.store import QuotaStore
+
+ROOT = Path(__file__).resolve().parents[4]
+BENCHMARK = ROOT / "scripts" / "benchmark_rate_limit.py"
+
+
+class _Clock:
+    """Deterministic stand-in for the module's ``time``."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def _stored_counts(store: QuotaStore) -> dict[tuple[str, int], int]:
+    with sqlite3.connect(store.db_path) as conn:
+        rows = conn.execute(
+            "SELECT credential_id, window_start, count FROM request_rate_buckets"
+        ).fetchall()
+    return {(credential, window): count for credential, window, count in rows}
+
+
+def test_bucket_admits_a_burst_of_the_limit_then_refills(clock: _Clock) -> None:
+    """A full bucket holds one second's allowance and refills at the limit's rate."""
+    limiter = TokenBucketRateLimiter()
+
+    admitted = [limiter.admit(credential_id="cred-1", requests_per_second=3) for _ in range(4)]
+    assert admitted == [True, True, True, False]
+    assert limiter.admit(credential_id="cred-2", requests_per_second=3) is True
+
+    clock.now += 0.34
+    assert limiter.admit(credential_id="cred-1", requests_per_second=3) is True
+    assert limiter.admit(credential_id="cred-1", requests_per_second=3) is False
+
+
+def test_admitted_counts_reach_the_store_only_when_reconciled(
+    tmp_path: Path, clock: _Clock
+) -> None:
+    """Admission writes nothing; the interval's first admission after the deadline flushes."""
+    store = QuotaStore(db_path=tmp_path / "quotas.db")
+    limiter = TokenBucketRateLimiter(store, reconcile_interval_seconds=5.0)
+
+    for _ in range(3):
+        limiter.admit(credential_id="cred-1", requests_per_second=2)
+    assert _stored_counts(store) == {}
+
+    clock.now += 5.0
+    limiter.admit(credential_id="cred-1", requests_per_second=2)
+    assert _stored_counts(store) == {("cred-1", 1_000): 2, ("cred-1", 1_005): 1}
+    limiter.admit(credential_id="cred-1", requests_per_second=2)
+    limiter.reconcile()
+    assert _stored_counts(store)[("cred-1", 1_005)] == 2
+
+
+def test_failed_reconcile_keeps_the_counts(
+    tmp_path: Path, clock: _Clock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Counts that could not be written are retried on the next reconcile."""
+    store = QuotaStore(db_path=tmp_path / "quotas.db")
+    limiter = TokenBucketRateLimiter(store)
+    limiter.admit(credential_id="cred-1", requests_per_second=5)
+
+    def _fail(_counts: Any) -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "record_request_counts", _fail)
+        assert limiter.reconcile() == 0
+    assert limiter.reconcile() == 1
+    assert _stored_counts(store) == {("cred-1", 1_000): 1}
+
+
+class _FakeScriptClient:
+    """Registers the bucket script and answers from a scripted list of results."""
+
+    def __init__(self, results: list[Any]) -> None:
+        self.results = results
+        self.calls: list[tuple[list[str], list[Any]]] = []
+
+    def register_script(self, script: str) -> Any:
+        assert "redis.call('TIME')" in script
+
+        def _run(*, keys: list[str], args: list[Any]) -> Any:
+            self.calls.append((keys, args))
+            result = self.results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return _run
+
+
+def test_redis_limiter_runs_the_script_per_credential_and_falls_back_locally() -> None:
+    """The script decides while Redis answers; a Redis error falls back to a local bucket."""
+    client = _FakeScriptClient([1, 0, ConnectionError("redis down")])
+    limiter = RedisTokenBucketRateLimiter(client)
+
+    assert limiter.admit(credential_id="cred-1", requests_per_second=7) is True
+    assert limiter.admit(credential_id="cred-1", requests_per_second=7) is False
+    assert limiter.admit(credential_id="cred-1", requests_per_second=7) is True
+    assert client.calls[0] == (["autodev:ratelimit:cred-1"], [7])
+
+
+def test_limiters_are_shared_per_database(tmp_path: Path) -> None:
+    """Per-request services share one limiter per store path, so buckets persist."""
+    settings = Settings()
+    first = QuotaStore(db_path=tmp_path / "a.db")
+
+    limiter = get_rate_limiter(settings, first)
+    assert get_rate_limiter(settings, QuotaStore(db_path=tmp_path / "a.db")) is limiter
+    assert get_rate_limiter(settings, QuotaStore(db_path=tmp_path / "b.db")) is not limiter
+    with pytest.raises(RuntimeError, match="AUTODEV_REDIS_URL"):
+        get_rate_limiter(
+            Settings.model_construct(autodev_rate_limit_backend="redis", autodev_redis_url=""),
+            first,
+        )
+
+
+def _load_benchmark() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("benchmark_rate_limit", BENCHMARK)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_reports_every_admission_path() -> None:
+    """The benchmark script measures the durable slot, the bucket and the service side by side."""
+    result = _load_benchmark().run_benchmark(seconds=0.05, threads=2, credentials=2)
+
+    assert result["sqlite_slot_admitted_per_second"] > 0
+    assert result["token_bucket_admitted_per_second"] > 0
+    assert result["quota_service_admitted_per_second"] > 0
+    assert result["speedup"] == pytest.approx(
+        result["token_bucket_admitted_per_second"] / result["sqlite_slot_admitted_per_second"]
+    )
+
@@ -117,6 +117,42 @@ class TestRateLimit:
         with pytest.raises(QuotaExceededError):
             service.check_rate_limit(tenant_id="acme", credential_id="cred-1")
 
+    def test_policy_is_read_once_per_ttl_and_reread_after_set_policy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = QuotaStore(db_path=tmp_path / "quotas.db")
+        service = QuotaService(store=store, settings=Settings())
+        reads: list[str] = []
+        get_policy = store.get_policy
+
+        def _counting_get_policy(tenant_id: str) -> TenantQuotaPolicy | None:
+            reads.append(tenant_id)
+            return get_policy(tenant_id)
+
+        monkeypatch.setattr(store, "get_policy", _counting_get_policy)
+        for credential in ("cred-1", "cred-2", "cred-3"):
+            QuotaService(store=store, settings=Settings()).check_rate_limit(
+                tenant_id="acme", credential_id=credential
+            )
+        assert reads == ["acme"]
+
+        service.set_policy(
+            TenantQuotaPolicy(
+                tenant_id="acme",
+                max_concurrent_runs=1,
+                max_storage_bytes=1,
+                monthly_token_limit=1,
+                monthly_cost_microusd=1,
+                requests_per_second=1,
+                default_run_budget=RunBudgetLimits(),
+            )
+        )
+        reads.clear()
+        service.check_rate_limit(tenant_id="acme", credential_id="cred-4")
+        with pytest.raises(QuotaExceededError):
+            service.check_rate_limit(tenant_id="acme", credential_id="cred-4")
+        assert reads == ["acme"]
+
 
 class TestMonthlyUsageEventing:
     """Warning/exceeded events fire exactly once per crossing."""
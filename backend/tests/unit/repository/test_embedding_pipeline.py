@@ -0,0 +1,200 @@
+"""Tests for the batched, concurrent, cached embedding pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.config.settings import reset_settings_cache
+from backend.persistence.database import get_store, reset_store_cache
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.repository.embeddings import (
+    EmbeddingPipeline,
+    EmbeddingProvider,
+    InMemoryEmbeddingCache,
+    StoreEmbeddingCache,
+    StubEmbeddingProvider,
+    get_embedding_pipeline,
+)
+from backend.repository.embeddings.sqlite_store import upsert_embeddings
+
+
+class _RecordingProvider:
+    """Stub provider that records every batch it is asked to embed."""
+
+    def __init__(self, dimension: int = 8, delay: float = 0.0, fail_on: str | None = None) -> None:
+        self._stub = StubEmbeddingProvider(dimension=dimension)
+        self._delay = delay
+        self._fail_on = fail_on
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def dimension(self) -> int:
+        return self._stub.dimension
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.batches.append(list(texts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self._delay)
+            if self._fail_on is not None and self._fail_on in texts:
+                raise RuntimeError("provider unavailable")
+            return self._stub.embed(texts)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_pipeline_is_an_embedding_provider_returning_provider_vectors_in_order() -> None:
+    """The pipeline satisfies the Protocol and returns exactly what the provider would."""
+    provider = _RecordingProvider()
+    pipeline = EmbeddingPipeline(provider, max_batch_texts=2)
+    texts = ["alpha", "beta", "gamma", "alpha", "delta"]
+
+    vectors = pipeline.embed(texts)
+
+    assert isinstance(pipeline, EmbeddingProvider)
+    assert vectors == StubEmbeddingProvider(dimension=8).embed(texts)
+    assert sorted(len(batch) for batch in provider.batches) == [2, 2]
+    assert pipeline.stats.texts_embedded == 4  # "alpha" embedded once
+    assert pipeline.stats.cache_hits == 1
+
+
+def test_pipeline_bounds_batches_by_estimated_tokens() -> None:
+    """A batch closes before its estimated token count would exceed the bound."""
+    provider = _RecordingProvider()
+    pipeline = EmbeddingPipeline(provider, max_batch_texts=100, max_batch_tokens=10, max_concurrency=1)
+
+    pipeline.embed(["a" * 24, "b" * 24, "c" * 200])
+
+    assert [len(batch) for batch in provider.batches] == [1, 1, 1]
+
+
+def test_pipeline_runs_batches_concurrently_up_to_the_limit() -> None:
+    """Batches overlap on worker threads, never beyond max_concurrency."""
+    provider = _RecordingProvider(delay=0.05)
+    pipeline = EmbeddingPipeline(provider, max_batch_texts=1, max_concurrency=3)
+
+    pipeline.embed([f"text {i}" for i in range(9)])
+
+    assert provider.max_in_flight == 3
+
+
+def test_pipeline_rate_limit_spaces_provider_calls() -> None:
+    """max_requests_per_second spaces provider calls evenly."""
+    provider = _RecordingProvider()
+    pipeline = EmbeddingPipeline(provider, max_batch_texts=1, max_requests_per_second=50)
+
+    started = time.monotonic()
+    pipeline.embed([f"text {i}" for i in range(6)])
+
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+def test_cached_content_costs_zero_provider_calls() -> None:
+    """A second embed of the same content is served entirely from the cache."""
+    provider = _RecordingProvider()
+    cache = InMemoryEmbeddingCache()
+    first = EmbeddingPipeline(provider, cache=cache, model="m").embed(["x", "y"])
+    calls = len(provider.batches)
+
+    second = EmbeddingPipeline(provider, cache=cache, model="m").embed(["y", "x"])
+
+    assert len(provider.batches) == calls
+    assert second == [first[1], first[0]]
+
+
+def test_cache_is_keyed_by_model_and_dimension() -> None:
+    """Vectors cached under one model or dimension are never served for another."""
+    cache = InMemoryEmbeddingCache()
+    EmbeddingPipeline(_RecordingProvider(dimension=8), cache=cache, model="m").embed(["x"])
+
+    other_model = _RecordingProvider(dimension=8)
+    EmbeddingPipeline(other_model, cache=cache, model="n").embed(["x"])
+    other_dimension = _RecordingProvider(dimension=4)
+    vectors = EmbeddingPipeline(other_dimension, cache=cache, model="m").embed(["x"])
+
+    assert len(other_model.batches) == len(other_dimension.batches) == 1
+    assert len(vectors[0]) == 4
+
+
+def test_failed_batch_raises_but_successful_batches_are_cached() -> None:
+    """A provider error surfaces; a retry only embeds the batch that failed."""
+    cache = InMemoryEmbeddingCache()
+    failing = _RecordingProvider(fail_on="bad")
+    with pytest.raises(RuntimeError, match="provider unavailable"):
+        EmbeddingPipeline(failing, cache=cache, model="m", max_batch_texts=1).embed(["ok", "bad"])
+
+    retry = _RecordingProvider()
+    EmbeddingPipeline(retry, cache=cache, model="m", max_batch_texts=1).embed(["ok", "bad"])
+
+    assert retry.batches == [["bad"]]
+
+
+def test_in_memory_cache_evicts_least_recently_used() -> None:
+    """The LRU bound drops the entry touched longest ago."""
+    cache = InMemoryEmbeddingCache(max_entries=2)
+    cache.put_many("m", 1, {"a": [1.0], "b": [2.0]})
+    cache.get_many("m", 1, ["a"])
+    cache.put_many("m", 1, {"c": [3.0]})
+
+    assert set(cache.get_many("m", 1, ["a", "b", "c"])) == {"a", "c"}
+
+
+def test_store_cache_makes_a_fork_in_another_tenant_free_to_embed(tmp_path: Path) -> None:
+    """Chunks another tenant already embedded cost zero provider calls via embedding_cache."""
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'autodev.db'}")
+    provider = _RecordingProvider()
+    rows = [(1, "def a(): pass", "h1"), (2, "def b(): pass", "h2")]
+    fork_rows = [(3, "def a(): pass", "h1"), (4, "def b(): pass", "h2")]
+
+    with store.connect() as conn:
+        upsert_embeddings(
+            conn, rows, EmbeddingPipeline(provider, cache=StoreEmbeddingCache(store)), tenant_id="acme"
+        )
+    calls = len(provider.batches)
+    with store.connect() as conn:
+        written = upsert_embeddings(
+            conn,
+            fork_rows,
+            EmbeddingPipeline(provider, cache=StoreEmbeddingCache(store)),
+            tenant_id="fork",
+        )
+        stored = conn.execute(
+            "SELECT COUNT(*) FROM code_embeddings WHERE tenant_id = 'fork'"
+        ).fetchone()[0]
+
+    assert calls == 1
+    assert len(provider.batches) == calls
+    assert written == stored == 2
+
+
+def test_default_pipeline_caches_into_the_configured_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """get_embedding_pipeline writes through to embedding_cache and follows DATABASE_URL."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'first.db'}")
+    reset_settings_cache()
+    reset_store_cache()
+    try:
+        pipeline = get_embedding_pipeline()
+        assert get_embedding_pipeline() is pipeline
+        pipeline.embed(["def a(): pass"])
+        with get_store().connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0] == 1
+
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'second.db'}")
+        reset_settings_cache()
+        reset_store_cache()
+        assert get_embedding_pipeline() is not pipeline
+    finally:
+        reset_settings_cache()
+        reset_store_cache()
@@ -0,0 +1,129 @@
+"""Tests for git-diff driven incremental indexing."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.repository import git_indexing, indexing
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run git in *repo* with a fixed identity and return its stdout."""
+    result = subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, message: str) -> str:
+    """Stage everything in *repo*, commit, and return the new commit SHA."""
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A git repository with three Python files and one non-indexed file."""
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    _git(root, "init", "-q")
+    (root / "pkg" / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (root / "pkg" / "b.py").write_text("def b():\n    return 2\n", encoding="utf-8")
+    (root / "pkg" / "c.py").write_text("def c():\n    return 3\n", encoding="utf-8")
+    (root / "README.md").write_text("# repo\n", encoding="utf-8")
+    _commit(root, "initial")
+    return root
+
+
+def _chunk_ids(store: SQLiteStore) -> dict[str, list[int]]:
+    """Return chunk row ids grouped by stored file path."""
+    grouped: dict[str, list[int]] = {}
+    with store.connect() as conn:
+        for file_path, chunk_id in conn.execute(
+            "SELECT file_path, id FROM code_chunks ORDER BY id"
+        ).fetchall():
+            grouped.setdefault(file_path, []).append(chunk_id)
+    return grouped
+
+
+def test_diff_name_status_reports_renames_with_both_paths(repo: Path) -> None:
+    """A rename is one entry carrying old and new path, not a delete plus an add."""
+    base = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "mv", "pkg/a.py", "pkg/renamed.py")
+    (repo / "pkg" / "b.py").write_text("def b():\n    return 20\n", encoding="utf-8")
+    (repo / "pkg" / "c.py").unlink()
+    head = _commit(repo, "change")
+
+    changes = {change.path: change for change in git_indexing.diff_name_status(repo, base, head)}
+
+    assert changes["pkg/renamed.py"].status == "R"
+    assert changes["pkg/renamed.py"].old_path == "pkg/a.py"
+    assert changes["pkg/b.py"].status == "M"
+    assert changes["pkg/c.py"].status == "D"
+
+
+def test_first_commit_range_falls_back_to_full_index_and_records_head(
+    repo: Path, tmp_path: Path
+) -> None:
+    """With no recorded base, a full index runs and HEAD becomes the last indexed commit."""
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'index.db'}")
+
+    result = git_indexing.index_commit_range(repo, store=store)
+
+    assert result.base is None
+    assert result.chunks_written > 0
+    assert git_indexing.last_indexed_commit(str(repo.resolve()), store=store) == result.head
+
+
+def test_commit_range_reindexes_only_the_diff_and_moves_renamed_chunks(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only diffed paths are reindexed; a pure rename keeps its chunk rows and writes nothing."""
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'index.db'}")
+    git_indexing.index_commit_range(repo, store=store)
+    before = _chunk_ids(store)
+
+    _git(repo, "mv", "pkg/a.py", "pkg/renamed.py")
+    (repo / "pkg" / "b.py").write_text("def b():\n    return 20\n", encoding="utf-8")
+    (repo / "pkg" / "c.py").unlink()
+    (repo / "README.md").write_text("# changed\n", encoding="utf-8")
+    head = _commit(repo, "change")
+
+    reindexed: list[list[str]] = []
+    original_reindex = indexing.reindex
+
+    def _recording_reindex(paths, **kwargs):
+        reindexed.append(sorted(paths))
+        return original_reindex(paths, **kwargs)
+
+    monkeypatch.setattr(indexing, "reindex", _recording_reindex)
+    result = git_indexing.index_commit_range(repo, store=store)
+
+    assert reindexed == [["pkg/b.py", "pkg/c.py", "pkg/renamed.py"]]
+    assert result.files_renamed == 1
+    assert result.chunks_written == 1  # only pkg/b.py's edited function
+    after = _chunk_ids(store)
+    assert after["pkg/renamed.py"] == before["pkg/a.py"]
+    assert "pkg/a.py" not in after
+    assert "pkg/c.py" not in after
+    assert git_indexing.last_indexed_commit(str(repo.resolve()), store=store) == head
+
+
+def test_unknown_revision_raises_git_diff_error(repo: Path, tmp_path: Path) -> None:
+    """An unresolvable base fails loudly instead of silently indexing nothing."""
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'index.db'}")
+
+    with pytest.raises(git_indexing.GitDiffError):
+        git_indexing.index_commit_range(repo, base="does-not-exist", store=store)
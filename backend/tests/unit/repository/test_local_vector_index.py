@@ -0,0 +1,227 @@
+"""Tests for local-first retrieval: the embedded IVF index and SQLite vector/lexical backends."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.config.settings import reset_settings_cache
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.repository import indexing
+from backend.repository.embeddings import local_index, sqlite_store, vector_store
+from backend.repository.embeddings.local_index import LocalVectorIndex
+from backend.repository.embeddings.provider import StubEmbeddingProvider
+from backend.repository.retrieval import lexical
+from backend.repository.retrieval.retriever import RetrievalFilters, retrieve
+
+
+def _clustered_vectors(count: int, dimension: int, seed: int = 7) -> np.ndarray:
+    """Return *count* vectors drawn around a few hundred random centers."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(200, dimension))
+    return (centers[rng.integers(0, 200, count)] + 0.3 * rng.normal(size=(count, dimension))).astype(
+        np.float32
+    )
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    """Brute-force cosine top-*k* ids (ids are row numbers)."""
+    scores = local_index.normalize(vectors) @ local_index.normalize(query)
+    return [int(i) for i in np.argsort(-scores)[:k]]
+
+
+def test_small_index_is_an_exact_flat_scan() -> None:
+    """Below the IVF threshold there is one cluster and results equal brute force."""
+    vectors = _clustered_vectors(500, 32)
+    index = LocalVectorIndex.build(np.arange(500), vectors, max_seq=500)
+
+    hits = index.search(vectors[42], 5)
+
+    assert len(index.offsets) == 2
+    assert [chunk_id for chunk_id, _ in hits] == _exact(vectors, vectors[42], 5)
+    assert hits[0] == (42, pytest.approx(0.0, abs=1e-5))
+
+
+def test_ivf_index_probes_a_fraction_of_clusters_with_high_recall() -> None:
+    """Above the threshold vectors are clustered; probing finds the true neighbors."""
+    vectors = _clustered_vectors(20_000, 32)
+    index = LocalVectorIndex.build(np.arange(20_000), vectors, max_seq=20_000)
+    rng = np.random.default_rng(3)
+    queries = vectors[rng.integers(0, 20_000, 20)]
+
+    recall = np.mean(
+        [
+            len({cid for cid, _ in index.search(query, 10)} & set(_exact(vectors, query, 10))) / 10
+            for query in queries
+        ]
+    )
+
+    assert len(index.offsets) - 1 >= 16
+    assert recall >= 0.9
+
+
+def test_snapshot_round_trips_through_disk_memory_mapped(tmp_path: Path) -> None:
+    """save() then load() returns a memory-mapped snapshot with identical results."""
+    vectors = _clustered_vectors(300, 16)
+    index = LocalVectorIndex.build(np.arange(300), vectors, max_seq=300)
+
+    index.save(tmp_path / "tenant")
+    loaded = LocalVectorIndex.load(tmp_path / "tenant")
+
+    assert loaded is not None
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.max_seq == 300
+    assert loaded.search(vectors[9], 3) == index.search(vectors[9], 3)
+    assert LocalVectorIndex.load(tmp_path / "missing") is None
+
+
+def test_save_never_moves_current_back_or_deletes_newer_snapshots(tmp_path: Path) -> None:
+    """A lower max_seq leaves CURRENT alone; cleanup keeps snapshots at or above it."""
+    root = tmp_path / "tenant"
+    vectors = _clustered_vectors(50, 8)
+    LocalVectorIndex.build(np.arange(50), vectors, max_seq=20).save(root)
+    pending = root / "snapshot-30-99999"  # another writer's, not yet current
+    pending.mkdir()
+
+    LocalVectorIndex.build(np.arange(50), vectors, max_seq=10).save(root)
+    loaded = LocalVectorIndex.load(root)
+    assert loaded is not None and loaded.max_seq == 20
+    assert not list(root.glob("snapshot-10-*"))
+    assert pending.is_dir()
+
+    LocalVectorIndex.build(np.arange(50), vectors, max_seq=25).save(root)
+    loaded = LocalVectorIndex.load(root)
+    assert loaded is not None and loaded.max_seq == 25
+    assert sorted(path.name.split("-")[1] for path in root.glob("snapshot-*")) == ["25", "30"]
+
+
+def _indexed_store(tmp_path: Path) -> tuple[SQLiteStore, Path]:
+    """Index a small mixed repository into a fresh SQLiteStore."""
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "manifest.py").write_text(
+        "def parse_manifest(path):\n    return open(path).read()\n\n\n"
+        "def validate_manifest(data):\n    return bool(data)\n",
+        encoding="utf-8",
+    )
+    (repo / "pkg" / "server.go").write_text(
+        "package pkg\n\nfunc Serve() {}\n", encoding="utf-8"
+    )
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'autodev.db'}")
+    indexing.index(repo, store=store)
+    return store, repo
+
+
+def _embed_all(store: SQLiteStore, provider: StubEmbeddingProvider) -> int:
+    """Embed every stored chunk through the backend-agnostic entry point."""
+    with store.connect() as conn:
+        rows = [
+            (row[0], row[1], row[2])
+            for row in conn.execute("SELECT id, content, content_hash FROM code_chunks").fetchall()
+        ]
+        return vector_store.upsert_embeddings(conn, rows, provider, tenant_id="default")
+
+
+def test_sqlite_upsert_skips_unchanged_hashes_and_persists_a_snapshot(tmp_path: Path) -> None:
+    """Re-embedding unchanged chunks is a no-op; the first query writes the on-disk snapshot."""
+    store, _repo = _indexed_store(tmp_path)
+    provider = StubEmbeddingProvider(dimension=32)
+
+    written = _embed_all(store, provider)
+    assert written > 0
+    assert _embed_all(store, provider) == 0
+
+    with store.connect() as conn:
+        hits = vector_store.query_top_k(
+            conn, provider.embed(["x"])[0], tenant_id="default", k=2
+        )
+    assert len(hits) == 2
+    assert (tmp_path / "autodev.db.vectors" / "default" / "CURRENT").exists()
+
+
+def test_sqlite_query_sees_new_writes_and_never_returns_deleted_chunks(tmp_path: Path) -> None:
+    """Rows written after the snapshot are searched exactly; deleted chunks are dropped."""
+    store, repo = _indexed_store(tmp_path)
+    provider = StubEmbeddingProvider(dimension=32)
+    _embed_all(store, provider)
+    with store.connect() as conn:
+        target = conn.execute(
+            "SELECT id, content FROM code_chunks WHERE symbol = 'validate_manifest'"
+        ).fetchone()
+        # First query builds the snapshot.
+        assert vector_store.query_top_k(conn, provider.embed([target[1]])[0], tenant_id="default", k=1)[
+            0
+        ][0] == target[0]
+
+    (repo / "pkg" / "extra.py").write_text("def added():\n    return 1\n", encoding="utf-8")
+    (repo / "pkg" / "server.go").unlink()
+    indexing.index(repo, store=store)
+    _embed_all(store, provider)
+
+    with store.connect() as conn:
+        added = conn.execute("SELECT id, content FROM code_chunks WHERE symbol = 'added'").fetchone()
+        hits = sqlite_store.query_top_k(conn, provider.embed([added[1]])[0], tenant_id="default", k=10)
+        live_ids = {row[0] for row in conn.execute("SELECT id FROM code_chunks").fetchall()}
+    assert hits[0][0] == added[0]
+    assert {chunk_id for chunk_id, _ in hits} <= live_ids
+
+
+def test_sqlite_snapshot_cache_is_bounded_and_follows_the_configured_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached snapshots are evicted LRU; ``AUTODEV_VECTOR_INDEX_DIR`` moves them."""
+    store, _repo = _indexed_store(tmp_path)
+    provider = StubEmbeddingProvider(dimension=32)
+    _embed_all(store, provider)
+    monkeypatch.setattr(sqlite_store, "_MAX_CACHED_SNAPSHOTS", 1)
+    monkeypatch.setattr(sqlite_store, "_slots", sqlite_store.OrderedDict())
+    query = provider.embed(["x"])[0]
+
+    for directory in ("first", "second"):
+        monkeypatch.setenv("AUTODEV_VECTOR_INDEX_DIR", str(tmp_path / directory))
+        reset_settings_cache()
+        with store.connect() as conn:
+            assert vector_store.query_top_k(conn, query, tenant_id="default", k=1)
+
+    assert (tmp_path / "second" / "default" / "CURRENT").exists()
+    assert list(sqlite_store._slots) == [(str(tmp_path / "second" / "default"), "default")]
+
+
+def test_sqlite_lexical_search_ranks_symbol_hits_and_filters_language(tmp_path: Path) -> None:
+    """FTS5 serves lexical search on SQLite, with symbol matches ranked first."""
+    store, _repo = _indexed_store(tmp_path)
+
+    with store.connect() as conn:
+        hits = lexical.search(conn, "manifest", tenant_id="default", limit=5)
+        symbols = [
+            conn.execute("SELECT symbol FROM code_chunks WHERE id = ?", (chunk_id,)).fetchone()[0]
+            for chunk_id, _rank in hits
+        ]
+        go_only = lexical.search(conn, "manifest", tenant_id="default", language="go")
+
+    assert set(symbols) == {"parse_manifest", "validate_manifest"}
+    assert go_only == []
+
+
+def test_hybrid_retrieve_works_against_sqlite_store(tmp_path: Path) -> None:
+    """retrieve(mode="hybrid") fuses FTS5 and the local vector index on a SQLiteStore."""
+    store, _repo = _indexed_store(tmp_path)
+    provider = StubEmbeddingProvider(dimension=32)
+    _embed_all(store, provider)
+
+    with store.connect() as conn:
+        snippets = retrieve(
+            conn,
+            "parse manifest",
+            tenant_id="default",
+            mode="hybrid",
+            embedding_provider=provider,
+            filters=RetrievalFilters(language="python"),
+        )
+
+    assert snippets
+    assert snippets[0].symbol == "parse_manifest"
+    assert snippets[0].source == "hybrid"
+    assert all(snippet.file_path.endswith(".py") for snippet in snippets)
@@ -0,0 +1,147 @@
+"""Tests for multi-language chunking: the extension registry, per-language grammars, and the language column."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.repository import chunking, indexing
+from backend.repository.providers import treesitter_provider
+from backend.repository.providers.treesitter_provider import TreeSitterProvider
+
+_TS_SAMPLE = """\
+import { helper } from "./helper";
+
+export class Service {
+  run(): number {
+    return helper();
+  }
+}
+
+export interface Options {
+  verbose: boolean;
+}
+
+export function build(): Service {
+  return new Service();
+}
+"""
+
+_GO_SAMPLE = """\
+package store
+
+import "fmt"
+
+type Store struct{}
+
+func (s Store) Get(key string) string {
+\treturn fmt.Sprint(key)
+}
+
+func New() Store {
+\treturn Store{}
+}
+"""
+
+_TF_SAMPLE = """\
+resource "aws_s3_bucket" "logs" {
+  bucket = "logs"
+
+  lifecycle {
+    prevent_destroy = true
+  }
+}
+
+variable "region" {
+  default = "eu-west-1"
+}
+"""
+
+
+def test_language_for_path_maps_extensions_and_rejects_unknown() -> None:
+    """Extensions resolve to registry languages; anything else is not indexed."""
+    assert chunking.language_for_path("pkg/mod.py") == "python"
+    assert chunking.language_for_path("web/app.tsx") == "tsx"
+    assert chunking.language_for_path("cmd/main.go") == "go"
+    assert chunking.language_for_path("infra/main.tf") == "hcl"
+    assert chunking.language_for_path("README.md") is None
+
+
+def test_typescript_spans_cover_classes_methods_interfaces_and_functions() -> None:
+    """TypeScript definitions and import sources come from a real parse."""
+    pytest.importorskip("tree_sitter_typescript")
+    provider = TreeSitterProvider()
+
+    spans = {span.name: span.kind for span in provider.extract_symbol_spans(_TS_SAMPLE, "typescript")}
+    symbols = provider.extract_symbols(_TS_SAMPLE, "typescript")
+
+    assert spans == {"Service": "class", "run": "method", "Options": "interface", "build": "function"}
+    assert "./helper" in symbols
+
+
+def test_go_spans_cover_types_methods_and_functions() -> None:
+    """Go type specs, methods, and functions each become a span."""
+    pytest.importorskip("tree_sitter_go")
+    provider = TreeSitterProvider()
+
+    spans = {span.name: span.kind for span in provider.extract_symbol_spans(_GO_SAMPLE, "go")}
+
+    assert spans == {"Store": "type", "Get": "method", "New": "function"}
+    assert "fmt" in provider.extract_symbols(_GO_SAMPLE, "go")
+
+
+def test_terraform_spans_are_top_level_blocks_named_by_labels() -> None:
+    """HCL blocks are named type.label..., and nested blocks are not separate symbols."""
+    pytest.importorskip("tree_sitter_hcl")
+    provider = TreeSitterProvider()
+
+    spans = [span.name for span in provider.extract_symbol_spans(_TF_SAMPLE, "hcl")]
+
+    assert spans == ["resource.aws_s3_bucket.logs", "variable.region"]
+
+
+def test_grammar_is_loaded_once_per_language(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The grammar cache serves every provider instance, including a missing grammar."""
+    calls: list[str] = []
+
+    def _missing_grammar() -> object:
+        calls.append("load")
+        raise ImportError("no grammar")
+
+    monkeypatch.setitem(treesitter_provider._LANGUAGE_REGISTRY, "fortran", _missing_grammar)
+    treesitter_provider._load_language.cache_clear()
+    try:
+        for _ in range(3):
+            assert TreeSitterProvider().extract_symbol_spans("program p\nend\n", "fortran") == []
+    finally:
+        treesitter_provider._load_language.cache_clear()
+
+    assert calls == ["load"]
+
+
+def test_index_records_each_chunks_language(tmp_path: Path) -> None:
+    """index() walks every registered extension and persists the language per chunk."""
+    repo = tmp_path / "repo"
+    (repo / "web").mkdir(parents=True)
+    (repo / "infra").mkdir()
+    (repo / "app.py").write_text("def main():\n    pass\n", encoding="utf-8")
+    (repo / "web" / "service.ts").write_text(_TS_SAMPLE, encoding="utf-8")
+    (repo / "store.go").write_text(_GO_SAMPLE, encoding="utf-8")
+    (repo / "infra" / "main.tf").write_text(_TF_SAMPLE, encoding="utf-8")
+    (repo / "notes.txt").write_text("not indexed\n", encoding="utf-8")
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'index.db'}")
+
+    indexing.index(repo, store=store)
+
+    with store.connect() as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT file_path, language FROM code_chunks ORDER BY file_path"
+        ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("app.py", "python"),
+        ("infra/main.tf", "hcl"),
+        ("store.go", "go"),
+        ("web/service.ts", "typescript"),
+    ]
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import sys
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from backend.config.settings import reset_settings_cache
 from backend.jobs.queue import InProcessJobQueue, RedisJobQueue
 from backend.persistence.sqlite_adapter import SQLiteStore
-from backend.repository import chunking, indexing
+from backend.repository import (
+    chunk_stage,
+    chunking,
+    file_manifest,
+    indexing,
+    source_files,
+)
 from backend.repository.providers.lexical_provider import LexicalProvider
 from backend.repository.providers.treesitter_provider import TreeSitterProvider
 
@@ -217,6 +226,133 @@ def test_index_scopes_chunks_by_tenant(tmp_path: Path) -> None:
     assert tenants["tenant-a"] > 0
 
 
+# ---------------------------------------------------------------------------
+# File fingerprint manifest
+# ---------------------------------------------------------------------------
+
+
+def test_index_records_a_fingerprint_per_file(tmp_path: Path) -> None:
+    """Every indexed file gets a manifest row matching its stat and whole-file hash."""
+    repo = _make_fixture_repo(tmp_path)
+    store = _make_store(tmp_path)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    with store.connect() as conn:
+        manifest = file_manifest.load_manifest(conn, "?", "default", str(repo.resolve()))
+    assert set(manifest) == {"pkg/mod_a.py", "pkg/mod_b.py", "top_level.py"}
+    top_level = repo / "top_level.py"
+    assert manifest["top_level.py"].stat_key == file_manifest.stat_key(top_level.stat())
+    assert manifest["top_level.py"].file_hash == hashlib.sha256(top_level.read_bytes()).hexdigest()
+
+
+def test_noop_index_reads_no_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second index of an untouched tree never reads or chunks a file."""
+    repo = _make_fixture_repo(tmp_path)
+    store = _make_store(tmp_path)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("unchanged file was read")
+
+    monkeypatch.setattr(chunk_stage, "read_and_chunk", _fail)
+    assert indexing.index(repo, tenant_id="default", store=store) == 0
+
+
+def test_index_rechunks_only_files_whose_fingerprint_moved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A touched-but-identical file is re-fingerprinted without chunking; an edited one is chunked."""
+    repo = _make_fixture_repo(tmp_path)
+    store = _make_store(tmp_path)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    mod_a = repo / "pkg" / "mod_a.py"
+    stat_a = mod_a.stat()
+    os.utime(mod_a, ns=(stat_a.st_atime_ns, stat_a.st_mtime_ns + 1_000_000_000))
+    mod_b = repo / "pkg" / "mod_b.py"
+    mod_b.write_text(_PY_SAMPLE_B + "\n\ndef extra():\n    return 1\n", encoding="utf-8")
+
+    chunked: list[str] = []
+    original = chunk_stage.chunk_source
+
+    def _recording_chunk_source(file_path: str, *args: Any, **kwargs: Any) -> Any:
+        chunked.append(file_path)
+        return original(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(chunk_stage, "chunk_source", _recording_chunk_source)
+    written = indexing.index(repo, tenant_id="default", store=store)
+
+    assert written >= 1
+    assert chunked == ["pkg/mod_b.py"]
+    with store.connect() as conn:
+        manifest = file_manifest.load_manifest(
+            conn, "?", "default", str(repo.resolve()), ["pkg/mod_a.py"]
+        )
+    assert manifest["pkg/mod_a.py"].stat_key == file_manifest.stat_key(mod_a.stat())
+
+
+def test_index_deletes_chunks_and_fingerprint_of_vanished_file(tmp_path: Path) -> None:
+    """A file removed between two index runs loses its chunks and its manifest row."""
+    repo = _make_fixture_repo(tmp_path)
+    store = _make_store(tmp_path)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    (repo / "top_level.py").unlink()
+    indexing.index(repo, tenant_id="default", store=store)
+
+    with store.connect() as conn:
+        chunk_count = conn.execute(
+            "SELECT COUNT(*) FROM code_chunks WHERE file_path = 'top_level.py'"
+        ).fetchone()[0]
+        manifest = file_manifest.load_manifest(conn, "?", "default", str(repo.resolve()))
+    assert chunk_count == 0
+    assert "top_level.py" not in manifest
+    assert "pkg/mod_a.py" in manifest
+
+
+def test_index_of_another_root_keeps_the_first_roots_files(tmp_path: Path) -> None:
+    """Manifests are per root: indexing repo B never treats repo A's files as vanished."""
+    repo_a = tmp_path / "repo_a"
+    repo_a.mkdir()
+    (repo_a / "alpha.py").write_text(_PY_SAMPLE_A, encoding="utf-8")
+    repo_b = tmp_path / "repo_b"
+    repo_b.mkdir()
+    (repo_b / "beta.py").write_text(_PY_SAMPLE_B, encoding="utf-8")
+    store = _make_store(tmp_path)
+    indexing.index(repo_a, tenant_id="default", store=store)
+
+    indexing.index(repo_b, tenant_id="default", store=store)
+
+    with store.connect() as conn:
+        paths = {row[0] for row in conn.execute("SELECT file_path FROM code_chunks")}
+        manifest_a = file_manifest.load_manifest(conn, "?", "default", str(repo_a.resolve()))
+    assert paths == {"alpha.py", "beta.py"}
+    assert set(manifest_a) == {"alpha.py"}
+
+
+def test_chunker_version_change_rechunks_unmoved_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rows recorded under another chunker or grammar version never count as unchanged."""
+    repo = _make_fixture_repo(tmp_path)
+    store = _make_store(tmp_path)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    chunked: list[str] = []
+    original = chunk_stage.chunk_source
+
+    def _recording_chunk_source(file_path: str, *args: Any, **kwargs: Any) -> Any:
+        chunked.append(file_path)
+        return original(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(chunk_stage, "chunk_source", _recording_chunk_source)
+    monkeypatch.setattr(file_manifest, "chunker_version", lambda: "upgraded")
+    indexing.index(repo, tenant_id="default", store=store)
+    indexing.index(repo, tenant_id="default", store=store)
+
+    assert sorted(chunked) == ["pkg/mod_a.py", "pkg/mod_b.py", "top_level.py"]
+
+
 # ---------------------------------------------------------------------------
 # Traversal pruning and batched persistence (E45-S5)
 # ---------------------------------------------------------------------------
@@ -235,7 +371,7 @@ def test_iter_source_files_never_descends_into_permission_trapped_ignored_dir(
     (trapped / "lib.py").write_text("y = 2\n", encoding="utf-8")
     trapped.chmod(0o000)
     try:
-        found = {str(p.relative_to(repo)) for p in indexing._iter_source_files(repo)}
+        found = {str(p.relative_to(repo)) for p in source_files.iter_source_files(repo)}
     finally:
         trapped.chmod(0o755)
 
@@ -322,42 +458,104 @@ def test_persist_chunks_issues_one_executemany_batch_for_a_multi_chunk_file(
     assert conn.executemany_batch_sizes == [len(chunks)]
 
 
+def test_index_with_worker_pool_persists_the_same_rows_as_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Parallel chunking fans out over processes yet stores exactly what a serial run does."""
+    monkeypatch.setattr(indexing, "_REINDEX_BATCH_SIZE", 2)
+    monkeypatch.setattr(chunk_stage.os, "cpu_count", lambda: 4)
+    repo = _make_fixture_repo(tmp_path)
+    serial_store = SQLiteStore(f"sqlite:///{tmp_path / 'serial.db'}")
+    parallel_store = SQLiteStore(f"sqlite:///{tmp_path / 'parallel.db'}")
+
+    serial_written = indexing.index(repo, store=serial_store, workers=1)
+    parallel_written = indexing.index(repo, store=parallel_store, workers=2)
+
+    query = (
+        "SELECT file_path, symbol, start_line, end_line, content_hash FROM code_chunks "
+        "ORDER BY file_path, start_line, symbol"
+    )
+    with serial_store.connect() as conn:
+        serial_rows = [tuple(row) for row in conn.execute(query).fetchall()]
+    with parallel_store.connect() as conn:
+        parallel_rows = [tuple(row) for row in conn.execute(query).fetchall()]
+    assert parallel_written == serial_written
+    assert parallel_rows == serial_rows
+
+
+def test_resolve_worker_count_is_bounded_by_cpus_files_and_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The pool never exceeds the CPU count or the file count; the env var supplies the default."""
+    monkeypatch.setattr(chunk_stage.os, "cpu_count", lambda: 4)
+    monkeypatch.delenv("AUTODEV_INDEX_WORKERS", raising=False)
+    assert chunk_stage.resolve_worker_count(None, 100) == 1
+    assert chunk_stage.resolve_worker_count(16, 100) == 4
+    assert chunk_stage.resolve_worker_count(16, 3) == 3
+    assert chunk_stage.resolve_worker_count(0, 100) == 1
+    monkeypatch.setenv("AUTODEV_INDEX_WORKERS", "2")
+    reset_settings_cache()
+    assert chunk_stage.resolve_worker_count(None, 100) == 2
+
+
 # ---------------------------------------------------------------------------
 # Incremental reindex job wiring (E7-S1-T3)
 # ---------------------------------------------------------------------------
 
 
 class _FakeRedisClient:
-    """Minimal stand-in for a redis-py client, recording hset/rpush calls (no live server)."""
+    """Minimal stand-in for a redis-py client, recording hset/rpush/zadd calls (no live server)."""
 
     def __init__(self) -> None:
         self.hset_calls: list[tuple[str, dict]] = []
         self.rpush_calls: list[tuple[str, str]] = []
+        self.zadd_calls: list[tuple[str, dict[str, float]]] = []
+        self.strings: dict[str, str] = {}
 
     def ping(self) -> bool:
         return True
 
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.strings:
+            return False
+        self.strings[key] = value
+        return True
+
+    def get(self, key: str) -> str | None:
+        return self.strings.get(key)
+
     def hset(self, key: str, mapping: dict) -> None:
         self.hset_calls.append((key, mapping))
 
     def rpush(self, key: str, value: str) -> None:
         self.rpush_calls.append((key, value))
 
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zadd_calls.append((key, mapping))
+
 
 def test_enqueue_file_changed_calls_redis_queue_enqueue_with_expected_job(monkeypatch) -> None:
-    """enqueue_file_changed() drives RedisJobQueue.enqueue with the right job_type/payload."""
+    """enqueue_file_changed() queues the payload and one delayed low-lane drain job for the burst."""
     fake_client = _FakeRedisClient()
     redis_queue = RedisJobQueue(client=fake_client, start_worker=False)
     monkeypatch.setattr(indexing, "get_queue", lambda: redis_queue)
 
     job_id = indexing.enqueue_file_changed("pkg/mod_a.py", repo_root="/repo", tenant_id="acme")
-
-    assert fake_client.rpush_calls == [(RedisJobQueue._pending_key, job_id)]
+    again = indexing.enqueue_file_changed("pkg/mod_b.py", repo_root="/repo", tenant_id="acme")
+
+    assert again == job_id
+    first_item, second_item = fake_client.rpush_calls
+    [(drain_key, drain)] = fake_client.zadd_calls
+    assert (drain_key, list(drain)) == ("autodev:jobs:scheduled", [job_id])
+    assert first_item[0] == second_item[0] == "autodev:jobs:batch:repo.index.reindex_file"
+    assert json.loads(first_item[1]) == {
+        "path": "pkg/mod_a.py", "repo_root": "/repo", "tenant_id": "acme"
+    }
+    assert json.loads(second_item[1])["path"] == "pkg/mod_b.py"
     assert len(fake_client.hset_calls) == 1
     _key, mapping = fake_client.hset_calls[0]
     assert mapping["job_type"] == "repo.index.reindex_file"
-    payload = json.loads(mapping["payload"])
-    assert payload == {"path": "pkg/mod_a.py", "repo_root": "/repo", "tenant_id": "acme"}
+    assert (mapping["lane"], mapping["batch"]) == ("low", "1")
 
 
 def test_reindex_file_job_handler_runs_via_inprocess_queue(tmp_path: Path, monkeypatch) -> None:
@@ -386,3 +584,24 @@ def test_reindex_file_job_handler_runs_via_inprocess_queue(tmp_path: Path, monke
             "SELECT COUNT(*) FROM code_chunks WHERE file_path = 'top_level.py'"
         ).fetchone()[0]
     assert count >= 1
+
+
+def test_enqueue_files_changed_enqueues_one_deduplicated_batch_job(monkeypatch) -> None:
+    """enqueue_files_changed() enqueues a single repo.index.reindex_files job for all paths."""
+    fake_client = _FakeRedisClient()
+    redis_queue = RedisJobQueue(client=fake_client, start_worker=False)
+    monkeypatch.setattr(indexing, "get_queue", lambda: redis_queue)
+
+    indexing.enqueue_files_changed(
+        ["pkg/mod_a.py", "top_level.py", "pkg/mod_a.py"], repo_root="/repo", tenant_id="acme"
+    )
+
+    assert len(fake_client.hset_calls) == 1
+    _key, mapping = fake_client.hset_calls[0]
+    assert mapping["job_type"] == "repo.index.reindex_files"
+    payload = json.loads(mapping["payload"])
+    assert payload == {
+        "paths": ["pkg/mod_a.py", "top_level.py"],
+        "repo_root": "/repo",
+        "tenant_id": "acme",
+    }
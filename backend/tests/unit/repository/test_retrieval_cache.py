@@ -0,0 +1,166 @@
+"""Tests for the retrieval result / query-vector cache and the index generation it keys on."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from backend.config.settings import reset_settings_cache
+from backend.coordination.redis import LocalCache
+from backend.persistence.sqlite_adapter import SQLiteStore
+from backend.repository import index_generation, indexing
+from backend.repository.embeddings import vector_store
+from backend.repository.embeddings.provider import StubEmbeddingProvider
+from backend.repository.retrieval import cache as cache_module
+from backend.repository.retrieval import retriever as retriever_module
+from backend.repository.retrieval.cache import RetrievalCache, get_retrieval_cache
+from backend.repository.retrieval.retriever import RetrievalFilters, retrieve
+
+
+class _CountingProvider(StubEmbeddingProvider):
+    """Stub provider that counts embed() calls."""
+
+    def __init__(self) -> None:
+        super().__init__(dimension=16)
+        self.calls = 0
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        return super().embed(texts)
+
+
+@pytest.fixture()
+def indexed(tmp_path: Path) -> tuple[SQLiteStore, Path]:
+    """A SQLiteStore holding an indexed two-function repository."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "manifest.py").write_text(
+        "def parse_manifest(path):\n    return path\n\n\ndef load_manifest(path):\n    return path\n",
+        encoding="utf-8",
+    )
+    store = SQLiteStore(f"sqlite:///{tmp_path / 'autodev.db'}")
+    indexing.index(repo, store=store)
+    return store, repo
+
+
+def _count_searches(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Wrap the lexical and vector legs with call counters."""
+    counts = {"lexical": 0, "vector": 0}
+    real_search, real_top_k = retriever_module.lexical.search, retriever_module.query_top_k
+
+    def search(*args, **kwargs):
+        counts["lexical"] += 1
+        return real_search(*args, **kwargs)
+
+    def top_k(*args, **kwargs):
+        counts["vector"] += 1
+        return real_top_k(*args, **kwargs)
+
+    monkeypatch.setattr(retriever_module.lexical, "search", search)
+    monkeypatch.setattr(retriever_module, "query_top_k", top_k)
+    return counts
+
+
+def test_repeated_query_is_served_from_the_cache(
+    indexed: tuple[SQLiteStore, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The second identical request neither searches nor embeds."""
+    store, _repo = indexed
+    counts = _count_searches(monkeypatch)
+    provider = _CountingProvider()
+    cache = RetrievalCache(LocalCache())
+
+    with store.connect() as conn:
+        first = retrieve(conn, "manifest", tenant_id="default", embedding_provider=provider, cache=cache)
+        second = retrieve(conn, "manifest", tenant_id="default", embedding_provider=provider, cache=cache)
+
+    assert first == second and first
+    assert counts == {"lexical": 1, "vector": 1}
+    assert provider.calls == 1
+
+
+def test_cache_key_separates_filters_and_tenants(
+    indexed: tuple[SQLiteStore, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A different filter or tenant is a different entry."""
+    store, _repo = indexed
+    counts = _count_searches(monkeypatch)
+    cache = RetrievalCache(LocalCache())
+
+    with store.connect() as conn:
+        retrieve(conn, "manifest", tenant_id="default", mode="lexical", cache=cache)
+        narrowed = retrieve(
+            conn,
+            "manifest",
+            tenant_id="default",
+            mode="lexical",
+            filters=RetrievalFilters(symbol="load_manifest"),
+            cache=cache,
+        )
+        other_tenant = retrieve(conn, "manifest", tenant_id="acme", mode="lexical", cache=cache)
+
+    assert counts["lexical"] == 3
+    assert [snippet.symbol for snippet in narrowed] == ["load_manifest"]
+    assert other_tenant == []
+
+
+def test_reindex_bumps_the_generation_and_invalidates_results(
+    indexed: tuple[SQLiteStore, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A reindex that changes chunks makes the next request search again; the query vector stays cached."""
+    store, repo = indexed
+    counts = _count_searches(monkeypatch)
+    provider = _CountingProvider()
+    cache = RetrievalCache(LocalCache())
+    with store.connect() as conn:
+        before_generation = index_generation.current_generation(conn, "?", "default")
+        before = retrieve(conn, "manifest", tenant_id="default", embedding_provider=provider, cache=cache)
+
+    (repo / "manifest.py").write_text(
+        "def parse_manifest(path):\n    return path\n\n\ndef dump_manifest(path):\n    return path\n",
+        encoding="utf-8",
+    )
+    indexing.index(repo, store=store)
+
+    with store.connect() as conn:
+        after_generation = index_generation.current_generation(conn, "?", "default")
+        after = retrieve(conn, "manifest", tenant_id="default", embedding_provider=provider, cache=cache)
+
+    assert after_generation > before_generation
+    assert counts["lexical"] == 2
+    assert provider.calls == 1
+    assert "load_manifest" in {snippet.symbol for snippet in before}
+    assert {snippet.symbol for snippet in after} == {"parse_manifest", "dump_manifest"}
+
+
+def test_noop_index_and_embedding_upserts_handle_the_generation(
+    indexed: tuple[SQLiteStore, Path],
+) -> None:
+    """An unchanged tree leaves the generation alone; writing embeddings bumps it."""
+    store, repo = indexed
+    with store.connect() as conn:
+        start = index_generation.current_generation(conn, "?", "default")
+
+    indexing.index(repo, store=store)
+    with store.connect() as conn:
+        assert index_generation.current_generation(conn, "?", "default") == start
+        rows = [tuple(row) for row in conn.execute("SELECT id, content, content_hash FROM code_chunks")]
+        vector_store.upsert_embeddings(conn, rows, StubEmbeddingProvider(16), tenant_id="default")
+        assert index_generation.current_generation(conn, "?", "default") == start + 1
+
+
+def test_get_retrieval_cache_honors_ttl_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A zero TTL disables the process-wide cache; otherwise one instance is shared."""
+    cache_module._reset_retrieval_cache()
+    monkeypatch.setenv("AUTODEV_RETRIEVAL_CACHE_TTL_SECONDS", "0")
+    reset_settings_cache()
+    assert get_retrieval_cache() is None
+
+    cache_module._reset_retrieval_cache()
+    monkeypatch.setenv("AUTODEV_RETRIEVAL_CACHE_TTL_SECONDS", "60")
+    reset_settings_cache()
+    try:
+        assert get_retrieval_cache() is get_retrieval_cache() is not None
+    finally:
+        cache_module._reset_retrieval_cache()
@@ -0,0 +1,75 @@
+"""Tests for backend.repository.retrieval.lexical: the stored search-vector query shape.
+
+No live PostgreSQL here — a recording connection captures the SQL so the
+tests pin that lexical search reads the stored ``search_vector`` column
+rather than re-tokenizing ``content`` per row.
+"""
+
+from __future__ import annotations
+
+from backend.persistence.migrations import code_index_versions
+from backend.persistence.migrations.postgres_versions import POSTGRES_STORE_MIGRATIONS
+from backend.repository.retrieval import lexical
+
+
+class _RecordingConnection:
+    """Records every ``execute`` and returns fixed rows."""
+
+    def __init__(self, rows: list[tuple] | None = None) -> None:
+        self.executed: list[tuple[str, tuple]] = []
+        self._rows = rows or []
+
+    def execute(self, sql: str, params: tuple = ()) -> _RecordingConnection:
+        self.executed.append((" ".join(sql.split()), params))
+        return self
+
+    def fetchall(self) -> list[tuple]:
+        return self._rows
+
+
+def test_search_matches_and_ranks_on_the_stored_search_vector() -> None:
+    """The query never calls to_tsvector: both the filter and ts_rank read search_vector."""
+    conn = _RecordingConnection(rows=[(7, 0.9), (3, 0.2)])
+
+    results = lexical.search(conn, "parseManifest", tenant_id="acme", limit=5)
+
+    assert results == [(7, 0.9), (3, 0.2)]
+    (sql, params), = conn.executed
+    assert "to_tsvector" not in sql
+    assert "search_vector @@ tsq" in sql
+    assert "ts_rank('{0.1, 0.2, 0.4, 1.0}'::real[], search_vector, tsq)" in sql
+    assert "plainto_tsquery('english', code_identifier_split(%s))" in sql
+    assert params == ("parseManifest", "acme", 5)
+
+
+def test_search_appends_filters_in_placeholder_order() -> None:
+    """Path, symbol, and language filters bind after the query text and tenant."""
+    conn = _RecordingConnection()
+
+    lexical.search(
+        conn, "load", tenant_id="acme", limit=3, path_prefix="pkg/", symbol="load", language="go"
+    )
+
+    (sql, params), = conn.executed
+    assert "file_path LIKE %s AND symbol = %s AND language = %s" in sql
+    assert params == ("load", "acme", "pkg/%", "load", "go", 3)
+
+
+def test_search_vector_migration_weights_identifiers_and_replaces_expression_index() -> None:
+    """The migration defines the splitter, a weighted generated column, and its GIN index."""
+    conn = _RecordingConnection()
+
+    code_index_versions.pg_add_search_vector_to_code_chunks(conn)
+
+    ddl = "\n".join(sql for sql, _params in conn.executed)
+    assert "CREATE OR REPLACE FUNCTION code_identifier_split(value text)" in ddl
+    assert "IMMUTABLE" in ddl
+    assert "GENERATED ALWAYS AS" in ddl and "STORED" in ddl
+    assert "code_identifier_split(symbol)), 'A')" in ddl
+    assert "code_identifier_split(file_path)), 'B')" in ddl
+    assert "code_identifier_split(content)), 'D')" in ddl
+    assert "USING GIN (search_vector)" in ddl
+    assert "DROP INDEX IF EXISTS idx_pg_code_chunks_fts" in ddl
+    assert "add_search_vector_to_code_chunks" in {
+        getattr(entry, "name", None) for entry in POSTGRES_STORE_MIGRATIONS
+    }
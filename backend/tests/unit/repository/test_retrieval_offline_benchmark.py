@@ -0,0 +1,164 @@
+"""Tests for the offline retrieval benchmark corpus and its baseline gate.
+
+The last test is the regression gate itself: it indexes the corpus shipped in
+``evals/retrieval/offline`` into a temporary SQLite store and fails when
+recall@k or MRR in any mode drops below the recorded ``baseline.json``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from backend.repository.retrieval.benchmark import BenchmarkReport, ModeMetrics
+from backend.repository.retrieval.offline_benchmark import (
+    DEFAULT_CORPUS_DIR,
+    LabeledQuery,
+    build_corpus,
+    compare_to_baseline,
+    load_corpus,
+    run_offline_benchmark,
+    save_corpus,
+)
+from scripts.benchmark_retrieval import main
+
+_REPO_ROOT = Path(__file__).resolve().parents[4]
+
+_SOURCE = '''"""Module docstring is not a label."""
+
+
+def parse_manifest(text):
+    """Parse a :class:`~pkg.Manifest` from ``text``.
+
+    Longer explanation that is not part of the query.
+    """
+    return text
+
+
+def undocumented():
+    return 1
+
+
+def short():
+    """Too short."""
+
+
+class TokenBucket:
+    """Limit the request rate per tenant. Refills continuously."""
+
+    def take(self):
+        """Methods are covered by their class chunk, not labeled."""
+'''
+
+
+def _report(recall: float, mrr: float, *, cases: int = 10, k: int = 10) -> BenchmarkReport:
+    """Build a single-mode (hybrid) report with the given quality numbers."""
+    return BenchmarkReport(
+        k=k,
+        modes=(
+            ModeMetrics(
+                mode="hybrid",
+                case_count=cases,
+                recall_at_k=recall,
+                mean_reciprocal_rank=mrr,
+                latency_p50_ms=1.0,
+                latency_p95_ms=2.0,
+                error_count=0,
+            ),
+        ),
+    )
+
+
+def test_build_corpus_labels_top_level_docstring_summaries(tmp_path: Path) -> None:
+    """Each documented top-level def/class yields keywords of its first sentence."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text(_SOURCE, encoding="utf-8")
+
+    corpus = build_corpus(tmp_path, ("pkg",))
+
+    assert set(corpus.files) == {"pkg/mod.py"}
+    assert corpus.cases == (
+        LabeledQuery("parse manifest text", frozenset({("pkg/mod.py", "parse_manifest")})),
+        LabeledQuery("limit request rate", frozenset({("pkg/mod.py", "TokenBucket")})),
+    )
+
+
+def test_build_corpus_strips_top_level_docstrings_from_the_snapshot(tmp_path: Path) -> None:
+    """A query never matches the docstring it came from; method docstrings stay."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text(_SOURCE, encoding="utf-8")
+
+    snapshot = build_corpus(tmp_path, ("pkg",)).files["pkg/mod.py"]
+
+    assert "Parse a" not in snapshot and "Limit the request rate" not in snapshot
+    assert "Too short" not in snapshot and "def short():\n    ...\n" in snapshot
+    assert "Module docstring is not a label" in snapshot
+    assert "Methods are covered by their class chunk" in snapshot
+
+
+def test_build_corpus_drops_queries_that_label_two_definitions(tmp_path: Path) -> None:
+    """A summary shared by two definitions cannot be labeled reliably."""
+    duplicate = 'def {name}():\n    """Return the shared value here."""\n'
+    (tmp_path / "a.py").write_text(duplicate.format(name="first"), encoding="utf-8")
+    (tmp_path / "b.py").write_text(duplicate.format(name="second"), encoding="utf-8")
+
+    assert build_corpus(tmp_path, ("a.py", "b.py")).cases == ()
+
+
+def test_save_and_load_corpus_round_trip(tmp_path: Path) -> None:
+    """The gzip snapshot is byte-stable and loads back to the same corpus."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text(_SOURCE, encoding="utf-8")
+    corpus = build_corpus(tmp_path, ("pkg",))
+
+    save_corpus(corpus, tmp_path / "out")
+    first = (tmp_path / "out" / "corpus.json.gz").read_bytes()
+    save_corpus(corpus, tmp_path / "out")
+
+    assert (tmp_path / "out" / "corpus.json.gz").read_bytes() == first
+    assert load_corpus(tmp_path / "out") == corpus
+
+
+def test_compare_to_baseline_flags_only_drops_beyond_tolerance() -> None:
+    """Small noise and improvements pass; a real drop is reported."""
+    baseline = _report(0.9, 0.8).to_dict()
+
+    assert compare_to_baseline(_report(0.895, 0.95), baseline) == []
+    assert compare_to_baseline(_report(0.8, 0.8), baseline) == [
+        "hybrid recallAtK 0.800 below baseline 0.900"
+    ]
+
+
+def test_compare_to_baseline_flags_changed_case_count_and_cut_off() -> None:
+    """A different case set or k makes the numbers incomparable."""
+    baseline = _report(0.9, 0.8).to_dict()
+
+    assert compare_to_baseline(_report(0.9, 0.8, cases=9), baseline) == [
+        "hybrid: 9 cases vs 10 in the baseline"
+    ]
+    assert compare_to_baseline(_report(0.9, 0.8, k=5), baseline) == [
+        "cut-off changed: k=5 vs baseline k=10"
+    ]
+
+
+def test_offline_cli_writes_then_passes_its_own_baseline(tmp_path: Path) -> None:
+    """``--write-baseline`` records a run the next run compares clean against."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text(_SOURCE, encoding="utf-8")
+    save_corpus(build_corpus(tmp_path, ("pkg",)), tmp_path / "corpus")
+    arguments = ["--offline", "--corpus-dir", str(tmp_path / "corpus"), "--modes", "lexical"]
+
+    assert main([*arguments, "--write-baseline"]) == 0
+    baseline = json.loads((tmp_path / "corpus" / "baseline.json").read_text(encoding="utf-8"))
+    assert baseline["modes"][0]["caseCount"] == 2
+    assert main(arguments) == 0
+
+
+def test_shipped_corpus_does_not_regress_against_its_baseline() -> None:
+    """Recall@k and MRR on the shipped corpus stay at or above the recorded baseline."""
+    corpus_dir = _REPO_ROOT / DEFAULT_CORPUS_DIR
+    baseline = json.loads((corpus_dir / "baseline.json").read_text(encoding="utf-8"))
+
+    report = run_offline_benchmark(load_corpus(corpus_dir))
+
+    assert compare_to_baseline(report, baseline) == []
@@ -7,6 +7,12 @@ combination/truncation logic in isolation.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import Any
+
 import pytest
 
 from backend.repository.retrieval import retriever as retriever_module
@@ -68,9 +74,10 @@ def test_invalid_mode_raises_value_error() -> None:
 def test_filters_are_forwarded_to_lexical_search(monkeypatch: pytest.MonkeyPatch) -> None:
     captured: dict[str, object] = {}
 
-    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol):  # noqa: ANN001, ARG001
+    def fake_search(conn, query, *, tenant_id, limit, path_prefix, symbol, language):
         captured["path_prefix"] = path_prefix
         captured["symbol"] = symbol
+        captured["language"] = language
         return []
 
     monkeypatch.setattr(retriever_module.lexical, "search", fake_search)
@@ -81,10 +88,30 @@ def test_filters_are_forwarded_to_lexical_search(monkeypatch: pytest.MonkeyPatch
         "add",
         tenant_id="default",
         mode="lexical",
-        filters=RetrievalFilters(path_prefix="pkg/", symbol="foo"),
+        filters=RetrievalFilters(path_prefix="pkg/", symbol="foo", language="go"),
+    )
+
+    assert captured == {"path_prefix": "pkg/", "symbol": "foo", "language": "go"}
+
+
+def test_language_filter_is_forwarded_to_vector_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_query_top_k(conn, query_vector, *, tenant_id, k, language):
+        captured["language"] = language
+        return []
+
+    monkeypatch.setattr(retriever_module, "query_top_k", fake_query_top_k)
+
+    retrieve(
+        object(),
+        "add",
+        tenant_id="default",
+        mode="vector",
+        filters=RetrievalFilters(language="typescript"),
     )
 
-    assert captured == {"path_prefix": "pkg/", "symbol": "foo"}
+    assert captured == {"language": "typescript"}
 
 
 def test_budget_truncates_least_relevant_first(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -113,3 +140,82 @@ def test_no_results_from_either_backend_returns_empty_list(monkeypatch: pytest.M
     _patch_backends(monkeypatch, [], [])
 
     assert retrieve(object(), "add", tenant_id="default", mode="hybrid") == []
+
+
+def _leg_connections() -> tuple[list[object], Callable[[], Any]]:
+    """Return a list recording every connection handed out, and a ``connect`` factory."""
+    opened: list[object] = []
+
+    def connect() -> Any:
+        conn = object()
+        opened.append(conn)
+        return nullcontext(conn)
+
+    return opened, connect
+
+
+def test_hybrid_with_connect_runs_legs_concurrently_on_their_own_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each leg gets a fresh connection and both are in flight at the same time."""
+    _patch_backends(monkeypatch, [], [])
+    barrier = threading.Barrier(2, timeout=2)
+    seen: dict[str, object] = {}
+
+    def lexical_search(conn, *a, **k):
+        seen["lexical"] = conn
+        barrier.wait()  # would time out if the legs ran back to back
+        return [(1, 0.9)]
+
+    def vector_top_k(conn, *a, **k):
+        seen["vector"] = conn
+        barrier.wait()
+        return [(2, 0.1)]
+
+    monkeypatch.setattr(retriever_module.lexical, "search", lexical_search)
+    monkeypatch.setattr(retriever_module, "query_top_k", vector_top_k)
+    opened, connect = _leg_connections()
+    main_conn = object()
+
+    snippets = retrieve(main_conn, "add", tenant_id="default", connect=connect)
+
+    assert {snippet.chunk_id for snippet in snippets} == {1, 2}
+    assert set(seen.values()) == set(opened) and len(opened) == 2
+    assert main_conn not in opened
+
+
+def test_slow_vector_leg_degrades_to_lexical_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A vector leg past the deadline is dropped; lexical results come back on time."""
+    _patch_backends(monkeypatch, [(1, 0.9), (2, 0.5)], [])
+    release = threading.Event()
+
+    def slow_top_k(*a, **k):
+        release.wait(timeout=5)
+        return [(3, 0.1)]
+
+    monkeypatch.setattr(retriever_module, "query_top_k", slow_top_k)
+    _opened, connect = _leg_connections()
+
+    started = time.monotonic()
+    try:
+        snippets = retrieve(object(), "add", tenant_id="default", connect=connect, leg_timeout=0.05)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1
+    assert [snippet.chunk_id for snippet in snippets] == [1, 2]
+    assert all(snippet.source == "lexical" for snippet in snippets)
+
+
+def test_leg_errors_propagate_from_the_concurrent_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A leg that fails (rather than times out) surfaces its error."""
+    _patch_backends(monkeypatch, [(1, 0.9)], [])
+
+    def broken_top_k(*a, **k):
+        raise RuntimeError("ann unavailable")
+
+    monkeypatch.setattr(retriever_module, "query_top_k", broken_top_k)
+    _opened, connect = _leg_connections()
+
+    with pytest.raises(RuntimeError, match="ann unavailable"):
+        retrieve(object(), "add", tenant_id="default", connect=connect, leg_timeout=1)
@@ -0,0 +1,192 @@
+"""Compare ``map`` fan-out wall time for CPU-bound branches: threads vs. processes.
+
+``executor: process`` needs the cross-process event bus
+(``AUTODEV_EVENT_BUS=redis``, ``AUTODEV_EVENT_BUS_CROSS_PROCESS=true`` and
+``AUTODEV_REDIS_URL``); without it the process run fails closed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+# Worker processes unpickle :func:`bench_engine` by this module's name.
+SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from backend.flows.engine import FlowEngine  # noqa: E402
+from backend.flows.handlers import CallableRegistry, build_default_handlers  # noqa: E402
+from backend.persistence.sqlite_adapter import SQLiteStore  # noqa: E402
+
+DEFAULT_ITEMS = 8
+DEFAULT_WORKERS = 4
+DEFAULT_ROUNDS = 2_000_000
+
+CHILD_FLOW: dict[str, Any] = {
+    "schemaVersion": "1",
+    "id": "autodev/flow-bench-child",
+    "version": "1.0.0",
+    "hostApi": ">=2.0 <3.0",
+    "nodes": [
+        {
+            "id": "burn",
+            "type": "skill",
+            "ref": "autodev/skill-burn",
+            "input": {"rounds": "{{ flow.input.rounds }}"},
+        }
+    ],
+    "edges": [],
+}
+
+
+def burn(payload: dict[str, Any]) -> dict[str, Any]:
+    """Pure-Python CPU work that holds the GIL throughout.
+
+    Args:
+        payload: ``{"rounds": N}``.
+
+    Returns:
+        ``{"digest": ...}``.
+    """
+    digest = 0
+    for index in range(int(payload["rounds"])):
+        digest = (digest * 31 + index) % 1_000_003
+    return {"digest": digest}
+
+
+def bench_engine(database_url: str) -> FlowEngine:
+    """Build an engine whose ``autodev/skill-burn`` runs :func:`burn`.
+
+    Used both in the benchmark process and, as the process engine factory,
+    in every worker.
+
+    Args:
+        database_url: Database the engine stores runs in.
+
+    Returns:
+        The engine.
+    """
+    store = SQLiteStore(database_url)
+    callables = CallableRegistry()
+    callables.register("autodev/skill-burn", burn)
+    return FlowEngine(
+        store=store,
+        handlers=build_default_handlers(store=store, callables=callables),
+        process_engine_factory=bench_engine,
+    )
+
+
+def _map_flow(executor: str, workers: int) -> dict[str, Any]:
+    """A parent flow fanning the burn child out on *executor*."""
+    return {
+        "schemaVersion": "1",
+        "id": f"autodev/flow-bench-{executor}",
+        "version": "1.0.0",
+        "hostApi": ">=2.0 <3.0",
+        "budgets": {"maxCostUsd": 1, "maxWallClockSec": 3600, "maxTokens": 1000},
+        "nodes": [
+            {
+                "id": "fan",
+                "type": "map",
+                "ref": CHILD_FLOW["id"],
+                "over": "{{ flow.input.items }}",
+                "input": {"rounds": "{{ item }}"},
+                "maxParallel": workers,
+                "executor": executor,
+            }
+        ],
+        "edges": [],
+    }
+
+
+def measure_map_seconds(
+    engine: FlowEngine, executor: str, *, items: int, rounds: int
+) -> float:
+    """Run the burn fan-out once on *executor* and return its wall time.
+
+    Args:
+        engine: Engine with both bench flows registered.
+        executor: ``thread`` or ``process``.
+        items: Branches to fan out.
+        rounds: Loop iterations per branch.
+
+    Returns:
+        Seconds from start to the run's completion.
+
+    Raises:
+        RuntimeError: If the run does not complete.
+    """
+    started = time.perf_counter()
+    run = engine.start_run(
+        f"autodev/flow-bench-{executor}", input={"items": [rounds] * items}
+    )
+    elapsed = time.perf_counter() - started
+    if run.status != "completed":
+        raise RuntimeError(f"{executor} run ended {run.status}: {run.stop_reason}")
+    return elapsed
+
+
+def run_benchmark(
+    *,
+    items: int = DEFAULT_ITEMS,
+    workers: int = DEFAULT_WORKERS,
+    rounds: int = DEFAULT_ROUNDS,
+) -> dict[str, float]:
+    """Time the same CPU-bound fan-out on both executors over a throwaway database.
+
+    Worker pools are shared across ``map`` activations, so one untimed
+    process fan-out starts the pool first; the process timing is then the
+    steady-state cost of an activation, as every one after the first sees.
+
+    Args:
+        items: Branches to fan out.
+        workers: ``maxParallel`` of the map node.
+        rounds: Loop iterations per branch.
+
+    Returns:
+        Wall seconds per executor, the speedup, and the CPUs available.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = bench_engine(f"sqlite:///{Path(tmp) / 'flows.db'}")
+        engine.registry.register_raw(CHILD_FLOW)
+        for executor in ("thread", "process"):
+            engine.registry.register_raw(_map_flow(executor, workers))
+        threads = measure_map_seconds(engine, "thread", items=items, rounds=rounds)
+        measure_map_seconds(engine, "process", items=workers, rounds=1)
+        processes = measure_map_seconds(engine, "process", items=items, rounds=rounds)
+    return {
+        "thread_seconds": threads,
+        "process_seconds": processes,
+        "speedup": threads / processes if processes else float("inf"),
+        "cpu_count": float(os.cpu_count() or 1),
+    }
+
+
+def main() -> int:
+    """Run the benchmark and print its JSON result.
+
+    Returns:
+        Zero.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEMS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    args = parser.parse_args()
+    result = run_benchmark(items=args.items, workers=args.workers, rounds=args.rounds)
+    print(json.dumps({**result, **vars(args)}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
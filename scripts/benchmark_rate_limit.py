@@ -0,0 +1,173 @@
+"""Compare request-rate admission throughput: durable SQLite slots vs. token buckets.
+
+Besides the bare limiter, the end-to-end ``QuotaService.check_rate_limit``
+path (policy resolution plus bucket admission, as run per API request) is
+measured against ``QuotaStore.consume_request_slot``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.config.settings import Settings
+from backend.quotas.contracts import RunBudgetLimits, TenantQuotaPolicy
+from backend.quotas.rate_limit import TokenBucketRateLimiter
+from backend.quotas.service import QuotaService
+from backend.quotas.store import QuotaStore
+
+DEFAULT_SECONDS = 2.0
+DEFAULT_THREADS = 8
+DEFAULT_CREDENTIALS = 16
+#: High enough that no path denies: the benchmark measures admission cost.
+_REQUESTS_PER_SECOND = 10_000_000
+_TENANT_ID = "benchmark"
+
+
+def measure_admissions_per_second(
+    admit: Callable[[str], bool], *, seconds: float, threads: int, credentials: int
+) -> float:
+    """Run *admit* from *threads* threads for *seconds* and return admitted calls per second.
+
+    Args:
+        admit: Admission check taking a credential id.
+        seconds: Measurement duration.
+        threads: Concurrent callers, like concurrent API requests.
+        credentials: Distinct credentials the callers rotate through.
+
+    Returns:
+        Admitted requests per second across all threads.
+    """
+    admitted = [0] * threads
+    deadline = time.perf_counter() + seconds
+    start = threading.Barrier(threads)
+
+    def _caller(index: int) -> None:
+        start.wait()
+        count = 0
+        call = 0
+        while time.perf_counter() < deadline:
+            call += 1
+            if admit(f"cred-{(index + call) % credentials}"):
+                count += 1
+        admitted[index] = count
+
+    workers = [threading.Thread(target=_caller, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(admitted) / (time.perf_counter() - started)
+
+
+def run_benchmark(
+    *,
+    seconds: float = DEFAULT_SECONDS,
+    threads: int = DEFAULT_THREADS,
+    credentials: int = DEFAULT_CREDENTIALS,
+) -> dict[str, float]:
+    """Measure every admission path against one throwaway database.
+
+    Args:
+        seconds: Measurement duration per path.
+        threads: Concurrent callers.
+        credentials: Distinct credentials.
+
+    Returns:
+        Admitted requests per second per path, the bucket's speedup over
+        the durable slot, and the end-to-end service's speedup over it.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QuotaStore(db_path=Path(tmp) / "quotas.db")
+        limiter = TokenBucketRateLimiter(store, reconcile_interval_seconds=1.0)
+        durable = measure_admissions_per_second(
+            lambda credential: store.consume_request_slot(
+                credential_id=credential, requests_per_second=_REQUESTS_PER_SECOND
+            ),
+            seconds=seconds,
+            threads=threads,
+            credentials=credentials,
+        )
+        bucket = measure_admissions_per_second(
+            lambda credential: limiter.admit(
+                credential_id=credential, requests_per_second=_REQUESTS_PER_SECOND
+            ),
+            seconds=seconds,
+            threads=threads,
+            credentials=credentials,
+        )
+        limiter.reconcile()
+        service = _service(store)
+        end_to_end = measure_admissions_per_second(
+            lambda credential: _check(service, credential),
+            seconds=seconds,
+            threads=threads,
+            credentials=credentials,
+        )
+    return {
+        "sqlite_slot_admitted_per_second": durable,
+        "token_bucket_admitted_per_second": bucket,
+        "quota_service_admitted_per_second": end_to_end,
+        "speedup": bucket / durable if durable else float("inf"),
+        "quota_service_speedup": end_to_end / durable if durable else float("inf"),
+    }
+
+
+def _service(store: QuotaStore) -> QuotaService:
+    """Build a service over *store* whose benchmark tenant is never rate limited."""
+    service = QuotaService(
+        store=store,
+        settings=Settings(),
+        rate_limiter=TokenBucketRateLimiter(store, reconcile_interval_seconds=1.0),
+    )
+    service.set_policy(
+        TenantQuotaPolicy(
+            tenant_id=_TENANT_ID,
+            max_concurrent_runs=1,
+            max_storage_bytes=1,
+            monthly_token_limit=1,
+            monthly_cost_microusd=1,
+            requests_per_second=_REQUESTS_PER_SECOND,
+            default_run_budget=RunBudgetLimits(),
+        )
+    )
+    return service
+
+
+def _check(service: QuotaService, credential: str) -> bool:
+    """Admit one request through :meth:`QuotaService.check_rate_limit`."""
+    service.check_rate_limit(tenant_id=_TENANT_ID, credential_id=credential)
+    return True
+
+
+def main() -> int:
+    """Run the benchmark and print its JSON result.
+
+    Returns:
+        Zero.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS)
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS)
+    parser.add_argument("--credentials", type=int, default=DEFAULT_CREDENTIALS)
+    args = parser.parse_args()
+    result = run_benchmark(
+        seconds=args.seconds, threads=args.threads, credentials=args.credentials
+    )
+    print(json.dumps({**result, **vars(args)}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())